@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Compare cache hit ratios of the LRU and TinyLFU admission policies.
+
+Replays a synthetic workload through a bounded InMemoryCache: lookups for
+popular cities drawn from a Zipf distribution, mixed with a scan of one-off
+keys (a bot walking a city list, single-use coordinates). A miss stores the
+observation, as the weather use case does.
+
+Usage:
+    python scripts/benchmark_cache_admission.py [--requests 200000] [--scan-share 0.3]
+
+Requirements:
+    - Run from the repository root
+"""
+
+import argparse
+import sys
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Literal
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.entities import WeatherData  # noqa: E402
+from src.domain.value_objects import Coordinates, UnitSystem  # noqa: E402
+from src.infrastructure.cache import InMemoryCache  # noqa: E402
+
+OBSERVATION = WeatherData(
+    city_name="London",
+    country="GB",
+    coordinates=Coordinates(latitude=51.5074, longitude=-0.1278),
+    temperature=15.2,
+    feels_like=14.8,
+    humidity=72,
+    wind_speed=4.5,
+    pressure=1013,
+    visibility=10000,
+    description="scattered clouds",
+    icon_code="03d",
+    units=UnitSystem.METRIC,
+    timestamp=datetime.now(UTC),
+)
+
+
+def workload(requests: int, cities: int, scan_share: float, seed: int) -> list[str]:
+    """Return the cache keys of a Zipf workload interleaved with a scan."""
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, cities + 1) ** 0.9
+    popular = rng.choice(cities, size=requests, p=weights / weights.sum())
+    scanning = rng.random(requests) < scan_share
+    return [
+        f"weather:scan-{index}:metric" if scan else f"weather:city-{city}:metric"
+        for index, (city, scan) in enumerate(zip(popular, scanning, strict=True))
+    ]
+
+
+def replay(
+    keys: list[str], max_entries: int, admission: Literal["lru", "tinylfu"]
+) -> InMemoryCache:
+    """Run the workload through a cache and return it with its counters."""
+    cache = InMemoryCache(max_entries=max_entries, admission=admission)
+    for key in keys:
+        if cache.get(key) is None:
+            cache.set(key, OBSERVATION, ttl_seconds=3600)
+    return cache
+
+
+def main() -> None:
+    """Run the benchmark and print the hit ratio of each policy."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200_000)
+    parser.add_argument("--cities", type=int, default=20_000)
+    parser.add_argument("--max-entries", type=int, default=1_000)
+    parser.add_argument("--scan-share", type=float, default=0.3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    keys = workload(args.requests, args.cities, args.scan_share, args.seed)
+    print(
+        f"Requests: {args.requests:,}  cities: {args.cities:,}  "
+        f"cache: {args.max_entries:,}  scan share: {args.scan_share:.0%}"
+    )
+    policies: tuple[Literal["lru", "tinylfu"], ...] = ("lru", "tinylfu")
+    for admission in policies:
+        cache = replay(keys, args.max_entries, admission)
+        print(
+            f"{admission:>8}: hit ratio {cache.hit_ratio:6.2%}  "
+            f"rejected writes {cache.rejections:,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Measure the memory used per cached weather entry.
+
+Fills an InMemoryCache with observations parsed from OpenWeatherMap-style
+JSON, the way the app does, and reports the traced allocations per entry
+with every entry decoded (hot) and with every entry packed (cold). The
+baseline repeats the hot run with ``__dict__``-backed copies of the entities
+and without string interning, as entries were stored before both changes.
+
+Usage:
+    python scripts/benchmark_cache_memory.py [--entries 100000]
+
+Requirements:
+    - Run from the repository root
+"""
+
+import argparse
+import dataclasses
+import gc
+import json
+import sys
+import tracemalloc
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.domain.value_objects import UnitSystem  # noqa: E402
+from src.infrastructure import cache as cache_module  # noqa: E402
+from src.infrastructure import weather_provider  # noqa: E402
+from src.infrastructure.cache import InMemoryCache  # noqa: E402
+from src.infrastructure.weather_provider import OpenWeatherMapClient  # noqa: E402
+
+COUNTRIES = ["GB", "US", "FR", "DE", "JP", "BR", "IN", "AU", "CA", "ES", "IT", "MX"]
+CONDITIONS = [
+    ("clear sky", "01d"),
+    ("few clouds", "02d"),
+    ("scattered clouds", "03d"),
+    ("broken clouds", "04d"),
+    ("overcast clouds", "04n"),
+    ("light rain", "10d"),
+    ("moderate rain", "10n"),
+    ("thunderstorm", "11d"),
+    ("snow", "13d"),
+    ("mist", "50d"),
+]
+
+
+def payload(index: int) -> str:
+    """Return the JSON body OpenWeatherMap would send for one location."""
+    description, icon = CONDITIONS[index % len(CONDITIONS)]
+    return json.dumps(
+        {
+            "name": f"City {index}",
+            "sys": {"country": COUNTRIES[index % len(COUNTRIES)]},
+            "coord": {"lat": (index % 1800) / 10 - 90, "lon": (index % 3600) / 10 - 180},
+            "main": {
+                "temp": 10.0 + index % 25,
+                "feels_like": 9.5 + index % 25,
+                "humidity": index % 100,
+                "pressure": 1000 + index % 40,
+            },
+            "wind": {"speed": (index % 150) / 10},
+            "visibility": 10000,
+            "weather": [{"description": description, "icon": icon}],
+        }
+    )
+
+
+def unslotted(cls: Any) -> Any:
+    """Return a copy of a slotted dataclass that keeps its fields in ``__dict__``."""
+    return dataclasses.make_dataclass(
+        cls.__name__,
+        [(field.name, field.type) for field in dataclasses.fields(cls)],
+        frozen=cls.__dataclass_params__.frozen,
+    )
+
+
+def baseline() -> ExitStack:
+    """Swap in unslotted entities and disable interning until the stack closes."""
+    stack = ExitStack()
+    for module, name in (
+        (weather_provider, "WeatherData"),
+        (weather_provider, "Coordinates"),
+        (cache_module, "CacheEntry"),
+    ):
+        stack.enter_context(mock.patch.object(module, name, unslotted(getattr(module, name))))
+    stack.enter_context(mock.patch.object(weather_provider.sys, "intern", lambda text: text))
+    return stack
+
+
+def measure(entries: int, hot_entries: int | None) -> float:
+    """Return traced bytes per entry of a cache filled with ``entries`` observations."""
+    client = OpenWeatherMapClient(api_key="benchmark")
+    bodies = [payload(i) for i in range(entries)]
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    cache = InMemoryCache(hot_entries=hot_entries)
+    for index, body in enumerate(bodies):
+        data = client._parse_response(json.loads(body), UnitSystem.METRIC)
+        cache.set(f"weather:city {index}:metric", data, ttl_seconds=900)
+    gc.collect()
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    assert cache.size == entries
+    return used / entries
+
+
+def main() -> None:
+    """Run the benchmark and print bytes per entry."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--entries", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"Entries: {args.entries:,}")
+    with baseline():
+        print(f"Baseline (hot):  {measure(args.entries, None):7.0f} bytes/entry")
+    print(f"Decoded (hot):   {measure(args.entries, None):7.0f} bytes/entry")
+    print(f"Packed (cold):   {measure(args.entries, 0):7.0f} bytes/entry")
+
+
+if __name__ == "__main__":
+    main()
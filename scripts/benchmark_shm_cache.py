@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Compare the per-process cache with the shared-memory cache across workers.
+
+Starts several worker processes, as ``uvicorn --workers`` does, and replays
+a Zipf workload of city lookups in each. A miss counts as an upstream fetch
+and stores the observation, as the weather use case does. With per-process
+caches every worker fetches each city itself; with the shared-memory tier
+under each worker's in-memory cache, a city is fetched once per host. Also
+reports the cost of a single hit in each cache.
+
+Usage:
+    python scripts/benchmark_shm_cache.py [--workers 4] [--requests 50000]
+
+Requirements:
+    - Run from the repository root on Linux or macOS
+"""
+
+import argparse
+import multiprocessing
+import sys
+import time
+import uuid
+from datetime import UTC, datetime
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.application.interfaces import SyncCachePort  # noqa: E402
+from src.domain.entities import WeatherData  # noqa: E402
+from src.domain.value_objects import Coordinates, UnitSystem  # noqa: E402
+from src.infrastructure.cache import InMemoryCache  # noqa: E402
+from src.infrastructure.shm_cache import SharedMemoryCache  # noqa: E402
+from src.infrastructure.tiered_cache import TieredCache  # noqa: E402
+
+OBSERVATION = WeatherData(
+    city_name="London",
+    country="GB",
+    coordinates=Coordinates(latitude=51.5074, longitude=-0.1278),
+    temperature=15.2,
+    feels_like=14.8,
+    humidity=72,
+    wind_speed=4.5,
+    pressure=1013,
+    visibility=10000,
+    description="scattered clouds",
+    icon_code="03d",
+    units=UnitSystem.METRIC,
+    timestamp=datetime.now(UTC),
+)
+
+
+def workload(requests: int, cities: int, seed: int) -> list[str]:
+    """Return the cache keys of a Zipf workload."""
+    rng = np.random.default_rng(seed)
+    weights = 1.0 / np.arange(1, cities + 1) ** 0.9
+    popular = rng.choice(cities, size=requests, p=weights / weights.sum())
+    return [f"weather:city-{city}:metric" for city in popular]
+
+
+def worker(shm_name: str | None, slots: int, keys: list[str]) -> tuple[int, float]:
+    """Replay keys through this process's cache; return fetches and seconds."""
+    cache: SyncCachePort = InMemoryCache(max_entries=1_000)
+    if shm_name is not None:
+        cache = TieredCache(cache, SharedMemoryCache(shm_name, slots=slots))
+    fetches = 0
+    started = time.perf_counter()
+    for key in keys:
+        if cache.get(key) is None:
+            fetches += 1
+            cache.set(key, OBSERVATION, ttl_seconds=3600)
+    return fetches, time.perf_counter() - started
+
+
+def run(workers: int, shm_name: str | None, slots: int, args: argparse.Namespace) -> None:
+    """Run one worker per process and print the combined upstream fetches."""
+    jobs = [
+        (shm_name, slots, workload(args.requests, args.cities, args.seed + index))
+        for index in range(workers)
+    ]
+    with multiprocessing.get_context("fork").Pool(workers) as pool:
+        results = pool.starmap(worker, jobs)
+    fetches = sum(result[0] for result in results)
+    seconds = max(result[1] for result in results)
+    label = "shared memory" if shm_name is not None else "per process"
+    print(
+        f"{label:>14}: upstream fetches {fetches:>7,}  "
+        f"throughput {workers * args.requests / seconds:>10,.0f} lookups/s"
+    )
+
+
+def time_hits(cache: SyncCachePort, key: str, rounds: int) -> float:
+    """Return the mean time of one cache hit in microseconds."""
+    started = time.perf_counter()
+    for _ in range(rounds):
+        cache.get(key)
+    return (time.perf_counter() - started) / rounds * 1e6
+
+
+def main() -> None:
+    """Run the benchmark and print fetches, throughput and hit latency."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--requests", type=int, default=50_000)
+    parser.add_argument("--cities", type=int, default=20_000)
+    parser.add_argument("--slots", type=int, default=65_536)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    print(
+        f"Workers: {args.workers}  requests per worker: {args.requests:,}  "
+        f"cities: {args.cities:,}  L1 per worker: 1,000"
+    )
+    shm = SharedMemoryCache(f"benchmark-{uuid.uuid4().hex[:12]}", slots=args.slots)
+    try:
+        run(args.workers, None, args.slots, args)
+        run(args.workers, shm.name, args.slots, args)
+
+        key = "weather:london:metric"
+        memory = InMemoryCache()
+        memory.set(key, OBSERVATION, ttl_seconds=3600)
+        shm.set(key, OBSERVATION, ttl_seconds=3600)
+        print("Single hit:")
+        print(f"{'in-memory':>14}: {time_hits(memory, key, 100_000):6.2f} us")
+        print(f"{'shared memory':>14}: {time_hits(shm, key, 100_000):6.2f} us")
+    finally:
+        shm.close()
+        shm.unlink()
+
+
+if __name__ == "__main__":
+    main()
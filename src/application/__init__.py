@@ -1,13 +1,67 @@
 """Application layer exports."""
 
-from src.application.dto import WeatherResult
-from src.application.interfaces import CachePort, LoggerPort, WeatherProviderPort
-from src.application.use_cases import GetWeatherUseCase
+from src.application.alerts import AlertEngine
+from src.application.autocomplete import CityAutocompleteIndex
+from src.application.cache_warmup import CacheWarmup
+from src.application.dto import (
+    CityComparison,
+    ComparedCity,
+    ForecastDay,
+    RouteSegment,
+    RouteWeather,
+    WeatherGrid,
+    WeatherResult,
+)
+from src.application.forecast_series import ForecastSeries
+from src.application.inflight import DrainReport, InFlightTracker
+from src.application.interfaces import (
+    CachePort,
+    CityLocatorPort,
+    LoggerPort,
+    SyncCachePort,
+    WeatherObserverPort,
+    WeatherProviderPort,
+)
+from src.application.nearest_city import NearestCityIndex
+from src.application.use_cases import (
+    CompareWeatherUseCase,
+    GetForecastUseCase,
+    GetRouteWeatherUseCase,
+    GetWeatherGridUseCase,
+    GetWeatherUseCase,
+    InterpolationMethod,
+    RankingMetric,
+)
+from src.application.weather_updates import WeatherUpdate, WeatherUpdateHub
 
 __all__ = [
+    "AlertEngine",
     "CachePort",
+    "CacheWarmup",
+    "CityAutocompleteIndex",
+    "CityComparison",
+    "CityLocatorPort",
+    "ComparedCity",
+    "CompareWeatherUseCase",
+    "DrainReport",
+    "ForecastDay",
+    "ForecastSeries",
+    "GetForecastUseCase",
+    "GetRouteWeatherUseCase",
+    "GetWeatherGridUseCase",
     "GetWeatherUseCase",
+    "InFlightTracker",
+    "InterpolationMethod",
     "LoggerPort",
+    "NearestCityIndex",
+    "RankingMetric",
+    "RouteSegment",
+    "RouteWeather",
+    "SyncCachePort",
+    "WeatherGrid",
+    "WeatherObserverPort",
     "WeatherProviderPort",
     "WeatherResult",
+    "WeatherUpdate",
+    "WeatherUpdateHub",
 ]
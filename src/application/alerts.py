@@ -0,0 +1,238 @@
+"""Threshold alert rules evaluated incrementally as observations arrive."""
+
+import threading
+import uuid
+from bisect import bisect_left, bisect_right
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+from src.application.interfaces import LoggerPort, WeatherObserverPort
+from src.domain.entities import AlertEvent, AlertRule, WeatherData, WeatherRequest
+from src.domain.exceptions import AlertRuleNotFoundError
+from src.domain.value_objects import AlertDirection, WeatherMetric
+
+AlertListener = Callable[[list[AlertEvent]], None]
+
+
+@dataclass
+class _ThresholdIndex:
+    """Rules of one location, metric and direction, sorted by threshold."""
+
+    thresholds: list[float] = field(default_factory=list)
+    rule_ids: list[str] = field(default_factory=list)
+
+    def add(self, threshold: float, rule_id: str) -> None:
+        position = bisect_right(self.thresholds, threshold)
+        self.thresholds.insert(position, threshold)
+        self.rule_ids.insert(position, rule_id)
+
+    def remove(self, threshold: float, rule_id: str) -> None:
+        lo = bisect_left(self.thresholds, threshold)
+        hi = bisect_right(self.thresholds, threshold)
+        position = self.rule_ids.index(rule_id, lo, hi)
+        del self.thresholds[position]
+        del self.rule_ids[position]
+
+
+class AlertEngine(WeatherObserverPort):
+    """Registry of threshold rules indexed for O(log n + k) evaluation.
+
+    Rules are grouped by location (cache key), metric and direction into
+    sorted threshold arrays. When a location is refreshed, the rules crossed
+    between the previous and the new value form one contiguous slice of each
+    array, found with two binary searches; untouched rules are never visited.
+
+    A rule fires when the value moves onto its triggering side of the
+    threshold. The first observation of a location since startup counts as a
+    crossing from "no value".
+    """
+
+    def __init__(self, logger: LoggerPort, history_size: int = 20) -> None:
+        """Initialize the engine.
+
+        Args:
+            logger: The logger implementation.
+            history_size: Number of recent events kept per rule.
+        """
+        self._logger = logger
+        self._history_size = history_size
+        self._rules: dict[str, AlertRule] = {}
+        self._indexes: dict[tuple[str, WeatherMetric, AlertDirection], _ThresholdIndex] = {}
+        self._metrics: dict[str, set[WeatherMetric]] = {}
+        self._last_data: dict[str, WeatherData] = {}
+        self._events: dict[str, deque[AlertEvent]] = {}
+        self._listeners: list[AlertListener] = []
+        self._lock = threading.Lock()
+
+    def add_rule(
+        self,
+        request: WeatherRequest,
+        metric: WeatherMetric,
+        direction: AlertDirection,
+        threshold: float,
+        webhook_url: str | None = None,
+    ) -> AlertRule:
+        """Register a new rule.
+
+        Args:
+            request: Location (and unit system) the rule watches.
+            metric: Observed metric.
+            direction: Whether the rule fires above or below the threshold.
+            threshold: Threshold, in the units of ``request``.
+            webhook_url: URL notified when the rule fires.
+
+        Returns:
+            The registered rule.
+        """
+        rule = AlertRule(
+            id=uuid.uuid4().hex,
+            request=request,
+            metric=metric,
+            direction=direction,
+            threshold=threshold,
+            created_at=datetime.now(UTC),
+            webhook_url=webhook_url,
+        )
+        cache_key = request.cache_key
+        with self._lock:
+            self._rules[rule.id] = rule
+            self._events[rule.id] = deque(maxlen=self._history_size)
+            index = self._indexes.setdefault((cache_key, metric, direction), _ThresholdIndex())
+            index.add(threshold, rule.id)
+            self._metrics.setdefault(cache_key, set()).add(metric)
+        self._logger.info(
+            "Alert rule registered",
+            rule_id=rule.id,
+            cache_key=cache_key,
+            metric=metric.value,
+            direction=direction.value,
+            threshold=threshold,
+        )
+        return rule
+
+    def remove_rule(self, rule_id: str) -> None:
+        """Unregister a rule.
+
+        Raises:
+            AlertRuleNotFoundError: If the rule does not exist.
+        """
+        with self._lock:
+            rule = self._rules.pop(rule_id, None)
+            if rule is None:
+                raise AlertRuleNotFoundError(rule_id)
+            del self._events[rule_id]
+            cache_key = rule.request.cache_key
+            key = (cache_key, rule.metric, rule.direction)
+            index = self._indexes[key]
+            index.remove(rule.threshold, rule_id)
+            if not index.thresholds:
+                del self._indexes[key]
+                self._prune_location(cache_key, rule.metric)
+        self._logger.info("Alert rule removed", rule_id=rule_id)
+
+    def get_rule(self, rule_id: str) -> AlertRule:
+        """Return a rule by id.
+
+        Raises:
+            AlertRuleNotFoundError: If the rule does not exist.
+        """
+        rule = self._rules.get(rule_id)
+        if rule is None:
+            raise AlertRuleNotFoundError(rule_id)
+        return rule
+
+    def list_rules(self) -> list[AlertRule]:
+        """Return all rules, oldest first."""
+        return sorted(self._rules.values(), key=lambda rule: rule.created_at)
+
+    def events(self, rule_id: str) -> list[AlertEvent]:
+        """Return the recent events of a rule, newest first.
+
+        Raises:
+            AlertRuleNotFoundError: If the rule does not exist.
+        """
+        history = self._events.get(rule_id)
+        if history is None:
+            raise AlertRuleNotFoundError(rule_id)
+        return list(reversed(history))
+
+    def add_listener(self, listener: AlertListener) -> None:
+        """Register a callback receiving each batch of triggered events."""
+        self._listeners.append(listener)
+
+    @property
+    def rule_count(self) -> int:
+        """Return the number of registered rules."""
+        return len(self._rules)
+
+    def on_weather_refreshed(self, cache_key: str, weather_data: WeatherData) -> None:
+        """Fire the rules crossed between the previous and the new observation."""
+        with self._lock:
+            previous = self._last_data.get(cache_key)
+            metrics = self._metrics.get(cache_key)
+            if not metrics:
+                self._last_data.pop(cache_key, None)
+                return
+            self._last_data[cache_key] = weather_data
+
+            triggered: list[AlertEvent] = []
+            now = datetime.now(UTC)
+            for metric in metrics:
+                value = weather_data.metric(metric)
+                previous_value = previous.metric(metric) if previous is not None else None
+                for direction in AlertDirection:
+                    index = self._indexes.get((cache_key, metric, direction))
+                    if index is None:
+                        continue
+                    for rule_id in _crossed(index, direction, previous_value, value):
+                        event = AlertEvent(
+                            rule=self._rules[rule_id],
+                            value=value,
+                            previous_value=previous_value,
+                            weather_data=weather_data,
+                            triggered_at=now,
+                        )
+                        self._events[rule_id].append(event)
+                        triggered.append(event)
+
+        if not triggered:
+            return
+        self._logger.info("Alert rules triggered", cache_key=cache_key, count=len(triggered))
+        for listener in self._listeners:
+            try:
+                listener(triggered)
+            except Exception as e:
+                self._logger.error("Alert listener failed", error=str(e))
+
+    def _prune_location(self, cache_key: str, metric: WeatherMetric) -> None:
+        """Drop per-location state once no rule watches it any more."""
+        if any((cache_key, metric, direction) in self._indexes for direction in AlertDirection):
+            return
+        metrics = self._metrics[cache_key]
+        metrics.discard(metric)
+        if not metrics:
+            del self._metrics[cache_key]
+            self._last_data.pop(cache_key, None)
+
+
+def _crossed(
+    index: _ThresholdIndex,
+    direction: AlertDirection,
+    previous: float | None,
+    current: float,
+) -> list[str]:
+    """Return the ids of rules whose threshold lies between two values.
+
+    ABOVE rules fire for thresholds in ``[previous, current)`` and BELOW rules
+    for thresholds in ``(current, previous]``, matching ``AlertRule.is_met``.
+    """
+    thresholds = index.thresholds
+    if direction == AlertDirection.ABOVE:
+        lo = 0 if previous is None else bisect_left(thresholds, previous)
+        hi = bisect_left(thresholds, current)
+    else:
+        lo = bisect_right(thresholds, current)
+        hi = len(thresholds) if previous is None else bisect_right(thresholds, previous)
+    return index.rule_ids[lo:hi] if lo < hi else []
@@ -0,0 +1,164 @@
+"""In-memory prefix index for city-name autocomplete."""
+
+import heapq
+import math
+import threading
+import unicodedata
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Iterable
+
+from src.application.interfaces import WeatherObserverPort
+from src.domain.entities import City, WeatherData
+
+# Sorts after every character a normalized key can contain
+_PREFIX_END = "\U0010ffff"
+
+
+def normalize_name(name: str) -> str:
+    """Fold a place name to its search key.
+
+    Accents are stripped, case is folded and punctuation collapses to single
+    spaces, so "São Paulo", "sao paulo" and "Sao-Paulo" share one key.
+    """
+    decomposed = unicodedata.normalize("NFKD", name)
+    folded = "".join(c for c in decomposed if not unicodedata.combining(c)).casefold()
+    return " ".join("".join(c if c.isalnum() else " " for c in folded).split())
+
+
+class CityAutocompleteIndex(WeatherObserverPort):
+    """Rank city names matching a typed prefix.
+
+    Every city contributes its normalized full name plus each later word
+    start ("york" for "New York") to one sorted list of keys with a parallel
+    list of city ids. A lookup is two binary searches bounding the keys that
+    start with the prefix, followed by a top-k selection on a score mixing
+    population with how often the city was fetched.
+
+    Gazetteer cities are fixed; names learned from provider responses are
+    kept in an LRU bounded by ``max_learned`` so memory stays flat however
+    many distinct places users look up.
+    """
+
+    def __init__(self, cities: Iterable[City], max_learned: int = 10_000) -> None:
+        """Initialize the index.
+
+        Args:
+            cities: Bundled gazetteer entries.
+            max_learned: Number of names learned from provider responses to keep.
+        """
+        self._max_learned = max_learned
+        self._keys: list[str] = []
+        self._ids: list[int] = []
+        self._cities: dict[int, City] = {}
+        self._hits: dict[int, int] = {}
+        self._by_name: dict[tuple[str, str], int] = {}
+        self._learned: OrderedDict[int, None] = OrderedDict()
+        self._next_id = 0
+        self._lock = threading.Lock()
+
+        entries: list[tuple[str, int]] = []
+        for city in cities:
+            city_id = self._register(city)
+            if city_id is not None:
+                entries.extend((key, city_id) for key in self._index_keys(city.name))
+        entries.sort()
+        self._keys = [key for key, _ in entries]
+        self._ids = [city_id for _, city_id in entries]
+
+    def __len__(self) -> int:
+        """Return the number of indexed cities."""
+        return len(self._cities)
+
+    def search(self, prefix: str, limit: int = 10) -> list[City]:
+        """Return the best-ranked cities whose name has a word starting with ``prefix``.
+
+        Args:
+            prefix: Text typed so far.
+            limit: Maximum number of suggestions.
+
+        Returns:
+            Matching cities, best first (empty for a blank prefix).
+        """
+        key = normalize_name(prefix)
+        if not key:
+            return []
+        with self._lock:
+            lo = bisect_left(self._keys, key)
+            hi = bisect_left(self._keys, key + _PREFIX_END, lo)
+            candidates = set(self._ids[lo:hi])
+            best = heapq.nlargest(limit, candidates, key=self._score)
+            return [self._cities[city_id] for city_id in best]
+
+    def learn(self, city: City) -> None:
+        """Record a city seen in a provider response.
+
+        Known cities gain popularity; new names are indexed, evicting the
+        least recently seen learned name once ``max_learned`` is reached.
+        """
+        name_key = (normalize_name(city.name), city.country.upper())
+        if not name_key[0]:
+            return
+        with self._lock:
+            city_id = self._by_name.get(name_key)
+            if city_id is None:
+                city_id = self._register(city)
+                if city_id is None:
+                    return
+                for key in self._index_keys(city.name):
+                    position = bisect_left(self._keys, key)
+                    self._keys.insert(position, key)
+                    self._ids.insert(position, city_id)
+                self._learned[city_id] = None
+                if len(self._learned) > self._max_learned:
+                    evicted, _ = self._learned.popitem(last=False)
+                    self._forget(evicted)
+            elif city_id in self._learned:
+                self._learned.move_to_end(city_id)
+            self._hits[city_id] += 1
+
+    def on_weather_refreshed(self, _cache_key: str, weather_data: WeatherData) -> None:
+        """Learn the city name of a fresh provider response."""
+        self.learn(
+            City(
+                name=weather_data.city_name,
+                country=weather_data.country,
+                coordinates=weather_data.coordinates,
+            )
+        )
+
+    def _register(self, city: City) -> int | None:
+        """Assign an id to a city unless its name is already known."""
+        name_key = (normalize_name(city.name), city.country.upper())
+        if not name_key[0] or name_key in self._by_name:
+            return None
+        city_id = self._next_id
+        self._next_id += 1
+        self._cities[city_id] = city
+        self._hits[city_id] = 0
+        self._by_name[name_key] = city_id
+        return city_id
+
+    def _forget(self, city_id: int) -> None:
+        """Drop a learned city and its keys."""
+        city = self._cities.pop(city_id)
+        del self._hits[city_id]
+        del self._by_name[(normalize_name(city.name), city.country.upper())]
+        for key in self._index_keys(city.name):
+            position = bisect_left(self._keys, key)
+            while self._ids[position] != city_id:
+                position += 1
+            del self._keys[position]
+            del self._ids[position]
+
+    def _score(self, city_id: int) -> float:
+        """Rank by order of magnitude of population plus popularity."""
+        return math.log10(self._cities[city_id].population + 10) + math.log2(
+            1 + self._hits[city_id]
+        )
+
+    @staticmethod
+    def _index_keys(name: str) -> list[str]:
+        """Return the full normalized name and each suffix starting at a word."""
+        words = normalize_name(name).split(" ")
+        return list(dict.fromkeys(" ".join(words[i:]) for i in range(len(words)) if words[i]))
@@ -0,0 +1,129 @@
+"""Startup pre-population of the weather cache for known popular locations."""
+
+import asyncio
+import contextlib
+import time
+from collections import Counter
+from collections.abc import Sequence
+
+from src.application.interfaces import LoggerPort
+from src.application.use_cases.get_weather import GetWeatherUseCase
+from src.domain.entities import WeatherRequest
+from src.domain.exceptions import WeatherAppError
+
+
+class CacheWarmup:
+    """Load a list of locations into the cache in the background.
+
+    Every location goes through GetWeatherUseCase, so entries already cached
+    (restored from a snapshot or a peer) cost nothing, and fetches draw on
+    the shared upstream budget like any request. At most ``max_concurrency``
+    locations are fetched at once, leaving budget for live traffic.
+    """
+
+    def __init__(
+        self, use_case: GetWeatherUseCase, logger: LoggerPort, max_concurrency: int = 4
+    ) -> None:
+        """Initialize the warm-up.
+
+        Args:
+            use_case: Use case used to read (and fill) the cache.
+            logger: The logger implementation.
+            max_concurrency: Maximum number of locations fetched at once.
+        """
+        self._use_case = use_case
+        self._logger = logger
+        self._max_concurrency = max_concurrency
+        self._task: asyncio.Task[None] | None = None
+        self._progress = asyncio.Event()
+        self.total = 0
+        self.loaded = 0
+        self.failures: Counter[str] = Counter()
+
+    @property
+    def failed(self) -> int:
+        """Return the number of locations that could not be loaded."""
+        return sum(self.failures.values())
+
+    @property
+    def done(self) -> bool:
+        """Return whether every location has been attempted."""
+        return self.loaded + self.failed >= self.total
+
+    async def start(self, requests: Sequence[WeatherRequest]) -> None:
+        """Start loading the locations in the background.
+
+        Args:
+            requests: The locations to load, most important first.
+        """
+        if self._task is not None:
+            return
+        self.total = len(requests)
+        self._task = asyncio.create_task(self._run(requests))
+
+    async def wait_ready(self, fraction: float, timeout_seconds: float) -> bool:
+        """Wait until a share of the locations is loaded, or the warm-up ends.
+
+        Args:
+            fraction: Share of the locations that must be loaded, 0 to 1.
+            timeout_seconds: Longest wait.
+
+        Returns:
+            Whether ``fraction`` of the locations were loaded in time.
+        """
+        deadline = time.monotonic() + timeout_seconds
+        while self.loaded < fraction * self.total and not self.done:
+            self._progress.clear()
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._progress.wait(), remaining)
+        ready = self.loaded >= fraction * self.total
+        if not ready:
+            self._logger.warning(
+                "Cache warm-up not ready in time, serving anyway",
+                loaded=self.loaded,
+                total=self.total,
+                required_fraction=fraction,
+            )
+        return ready
+
+    async def close(self) -> None:
+        """Stop loading."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _run(self, requests: Sequence[WeatherRequest]) -> None:
+        """Load every location with bounded concurrency, then log the outcome."""
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def load(request: WeatherRequest) -> None:
+            async with semaphore:
+                try:
+                    await self._use_case.execute(request)
+                except Exception as e:
+                    # One bad location must not stop the rest of the warm-up
+                    self.failures[
+                        e.code if isinstance(e, WeatherAppError) else type(e).__name__
+                    ] += 1
+                    self._logger.debug(
+                        "Cache warm-up location failed", city=request.city, error=str(e)
+                    )
+                else:
+                    self.loaded += 1
+                self._progress.set()
+
+        await asyncio.gather(*(load(request) for request in requests))
+        self._logger.info(
+            "Cache warm-up finished",
+            total=self.total,
+            loaded=self.loaded,
+            failed=self.failed,
+            failures=dict(self.failures),
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
@@ -1,8 +1,14 @@
 """Application layer Data Transfer Objects (DTOs)."""
 
 from dataclasses import dataclass
+from datetime import date
+
+import numpy as np
+import numpy.typing as npt
 
 from src.domain.entities import WeatherData
+from src.domain.exceptions import WeatherAppError
+from src.domain.value_objects import Coordinates, UnitSystem, WeatherMetric
 
 
 @dataclass(frozen=True)
@@ -11,3 +17,79 @@ class WeatherResult:
 
     weather_data: WeatherData
     easter_egg: str | None = None
+
+
+@dataclass(frozen=True)
+class WeatherGrid:
+    """Application DTO holding a dense interpolated weather field.
+
+    Rows run north to south and columns west to east, matching image layout.
+    """
+
+    metric: WeatherMetric
+    units: UnitSystem
+    method: str
+    latitudes: npt.NDArray[np.float64]
+    longitudes: npt.NDArray[np.float64]
+    values: npt.NDArray[np.float32]
+    anchors: tuple[WeatherData, ...]
+
+
+@dataclass(frozen=True)
+class RouteSegment:
+    """Stretch of a route whose samples share one cache cell."""
+
+    start_km: float
+    end_km: float
+    start: Coordinates
+    end: Coordinates
+    outcome: WeatherResult | WeatherAppError
+
+
+@dataclass(frozen=True)
+class RouteWeather:
+    """Application DTO describing conditions along a route."""
+
+    units: UnitSystem
+    length_km: float
+    sample_count: int
+    segments: tuple[RouteSegment, ...]
+
+
+@dataclass(frozen=True)
+class ComparedCity:
+    """A city's conditions and derived metrics within a comparison."""
+
+    rank: int
+    result: WeatherResult
+    temperature: float
+    feels_like: float
+    wind_speed: float
+    heat_index: float
+    wind_chill: float
+    comfort_score: float
+
+
+@dataclass(frozen=True)
+class CityComparison:
+    """Application DTO holding ranked cities and the ones that failed."""
+
+    units: UnitSystem
+    rank_by: str
+    ranked: tuple[ComparedCity, ...]
+    failures: tuple[tuple[str, WeatherAppError], ...]
+
+
+@dataclass(frozen=True)
+class ForecastDay:
+    """Application DTO summarizing one local day of a forecast."""
+
+    date: date
+    temperature_min: float
+    temperature_max: float
+    humidity_mean: float
+    wind_speed_max: float
+    precipitation_probability_max: float
+    description: str
+    icon_code: str
+    steps: int
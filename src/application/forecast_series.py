@@ -0,0 +1,178 @@
+"""Compact, time-indexed forecast storage answering queries by slicing."""
+
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+
+import numpy as np
+import numpy.typing as npt
+
+from src.application.dto import ForecastDay
+from src.domain.entities import Forecast, ForecastPoint
+from src.domain.value_objects import Coordinates, UnitSystem
+
+# Column order of ForecastSeries.values
+FORECAST_FIELDS = (
+    "temperature",
+    "feels_like",
+    "humidity",
+    "wind_speed",
+    "pressure",
+    "precipitation_probability",
+)
+_T, _FEELS, _HUMIDITY, _WIND, _PRESSURE, _POP = range(len(FORECAST_FIELDS))
+
+_SECONDS_PER_DAY = 86_400
+
+
+@dataclass(frozen=True)
+class ForecastSeries:
+    """A location's forecast as parallel arrays indexed by time.
+
+    Numeric fields live in one ``(steps, fields)`` float32 array and the
+    condition text is stored once per distinct condition, so a 5-day forecast
+    takes about a kilobyte. Every query is a binary search on ``timestamps``
+    followed by a slice, which returns views rather than copies.
+    """
+
+    city_name: str
+    country: str
+    coordinates: Coordinates
+    units: UnitSystem
+    utc_offset_seconds: int
+    timestamps: npt.NDArray[np.int64]
+    values: npt.NDArray[np.float32]
+    condition_codes: npt.NDArray[np.uint8]
+    conditions: tuple[tuple[str, str], ...]
+
+    @classmethod
+    def from_forecast(cls, forecast: Forecast) -> "ForecastSeries":
+        """Pack a provider forecast into arrays."""
+        conditions: dict[tuple[str, str], int] = {}
+        codes = [
+            conditions.setdefault((point.description, point.icon_code), len(conditions))
+            for point in forecast.points
+        ]
+        values = np.array(
+            [[getattr(point, name) for name in FORECAST_FIELDS] for point in forecast.points],
+            dtype=np.float32,
+        ).reshape(len(forecast.points), len(FORECAST_FIELDS))
+        return cls(
+            city_name=forecast.city_name,
+            country=forecast.country,
+            coordinates=forecast.coordinates,
+            units=forecast.units,
+            utc_offset_seconds=forecast.utc_offset_seconds,
+            timestamps=np.array(
+                [int(point.timestamp.timestamp()) for point in forecast.points], dtype=np.int64
+            ),
+            values=values,
+            condition_codes=np.array(codes, dtype=np.uint8),
+            conditions=tuple(conditions),
+        )
+
+    def __len__(self) -> int:
+        """Return the number of forecast steps."""
+        return int(self.timestamps.size)
+
+    def next_hours(self, now: datetime, hours: int) -> "ForecastSeries":
+        """Return the step in effect at ``now`` and those of the next ``hours``."""
+        current = int(np.searchsorted(self.timestamps, now.timestamp(), side="right")) - 1
+        hi = int(
+            np.searchsorted(
+                self.timestamps, (now + timedelta(hours=hours)).timestamp(), side="right"
+            )
+        )
+        return self._slice(max(current, 0), hi)
+
+    def at(self, when: datetime) -> ForecastPoint | None:
+        """Return the conditions at a moment, interpolated between steps.
+
+        Returns:
+            The interpolated point, or None if ``when`` is outside the forecast.
+        """
+        ts = when.timestamp()
+        if not len(self) or ts < self.timestamps[0] or ts > self.timestamps[-1]:
+            return None
+        upper = int(np.searchsorted(self.timestamps, ts, side="left"))
+        lower = max(upper - 1, 0)
+        span = float(self.timestamps[upper] - self.timestamps[lower])
+        fraction = (ts - float(self.timestamps[lower])) / span if span else 1.0
+        values = (1 - fraction) * self.values[lower] + fraction * self.values[upper]
+        nearest = upper if fraction >= 0.5 else lower
+        return self._point(when.astimezone(UTC), values, int(self.condition_codes[nearest]))
+
+    def points(self) -> list[ForecastPoint]:
+        """Return every step as a ForecastPoint."""
+        return [
+            self._point(
+                datetime.fromtimestamp(int(ts), UTC), self.values[i], int(self.condition_codes[i])
+            )
+            for i, ts in enumerate(self.timestamps)
+        ]
+
+    def days(self) -> list[ForecastDay]:
+        """Summarize the forecast per local calendar day.
+
+        Days are cut at local midnight using the location's UTC offset, and
+        every statistic is a ``reduceat`` over the contiguous steps of a day.
+        """
+        if not len(self):
+            return []
+        day_numbers = (self.timestamps + self.utc_offset_seconds) // _SECONDS_PER_DAY
+        starts = np.concatenate((np.zeros(1, np.intp), np.flatnonzero(np.diff(day_numbers)) + 1))
+        counts = np.diff(np.append(starts, day_numbers.size))
+        t_min = np.minimum.reduceat(self.values[:, _T], starts)
+        t_max = np.maximum.reduceat(self.values[:, _T], starts)
+        humidity = np.add.reduceat(self.values[:, _HUMIDITY], starts) / counts
+        wind_max = np.maximum.reduceat(self.values[:, _WIND], starts)
+        pop_max = np.maximum.reduceat(self.values[:, _POP], starts)
+
+        summaries = []
+        for i, (start, count) in enumerate(zip(starts, counts, strict=True)):
+            codes = self.condition_codes[start : start + count]
+            description, icon_code = self.conditions[int(np.bincount(codes).argmax())]
+            summaries.append(
+                ForecastDay(
+                    date=date.fromordinal(date(1970, 1, 1).toordinal() + int(day_numbers[start])),
+                    temperature_min=float(t_min[i]),
+                    temperature_max=float(t_max[i]),
+                    humidity_mean=float(humidity[i]),
+                    wind_speed_max=float(wind_max[i]),
+                    precipitation_probability_max=float(pop_max[i]),
+                    description=description,
+                    icon_code=icon_code,
+                    steps=int(count),
+                )
+            )
+        return summaries
+
+    def _slice(self, lo: int, hi: int) -> "ForecastSeries":
+        """Return a view of steps ``lo:hi`` sharing this series' buffers."""
+        return ForecastSeries(
+            city_name=self.city_name,
+            country=self.country,
+            coordinates=self.coordinates,
+            units=self.units,
+            utc_offset_seconds=self.utc_offset_seconds,
+            timestamps=self.timestamps[lo:hi],
+            values=self.values[lo:hi],
+            condition_codes=self.condition_codes[lo:hi],
+            conditions=self.conditions,
+        )
+
+    def _point(
+        self, timestamp: datetime, values: npt.NDArray[np.float32], code: int
+    ) -> ForecastPoint:
+        """Build a ForecastPoint from one row of values."""
+        description, icon_code = self.conditions[code]
+        return ForecastPoint(
+            timestamp=timestamp,
+            temperature=round(float(values[_T]), 2),
+            feels_like=round(float(values[_FEELS]), 2),
+            humidity=round(float(values[_HUMIDITY])),
+            wind_speed=round(float(values[_WIND]), 2),
+            pressure=round(float(values[_PRESSURE])),
+            precipitation_probability=round(float(values[_POP]), 2),
+            description=description,
+            icon_code=icon_code,
+        )
@@ -0,0 +1,77 @@
+"""Tracking of background work that should finish before the process exits."""
+
+import asyncio
+import time
+from collections.abc import Coroutine
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class DrainReport:
+    """Outcome of draining in-flight work at shutdown."""
+
+    drained: int
+    abandoned: int
+    duration_ms: float
+
+
+class InFlightTracker:
+    """Keep track of tasks whose results are lost if they are cancelled.
+
+    Upstream fetches run as tracked tasks that outlive the request awaiting
+    them, so a request cut off during a rollout still lets its fetch finish
+    and be cached. At shutdown, ``drain`` waits for the tracked tasks up to
+    a deadline and cancels whatever is still running.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty tracker."""
+        self._tasks: set[asyncio.Task[Any]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Return the number of tracked tasks still running."""
+        return len(self._tasks)
+
+    def track(self, coroutine: Coroutine[Any, Any, _T]) -> "asyncio.Task[_T]":
+        """Run a coroutine as a tracked task.
+
+        Args:
+            coroutine: The work to run.
+
+        Returns:
+            The task; await it through ``asyncio.shield`` so that cancelling
+            the caller does not cancel the work.
+        """
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def drain(self, timeout_seconds: float) -> DrainReport:
+        """Wait for the tracked tasks, including any they start, then cancel the rest.
+
+        Args:
+            timeout_seconds: Longest wait for the tasks to finish.
+
+        Returns:
+            How many tasks finished and how many were cancelled.
+        """
+        started = time.monotonic()
+        deadline = started + timeout_seconds
+        drained = 0
+        while self._tasks and (remaining := deadline - time.monotonic()) > 0:
+            done, _ = await asyncio.wait(set(self._tasks), timeout=remaining)
+            drained += len(done)
+        abandoned = list(self._tasks)
+        for task in abandoned:
+            task.cancel()
+        await asyncio.gather(*abandoned, return_exceptions=True)
+        return DrainReport(
+            drained=drained,
+            abandoned=len(abandoned),
+            duration_ms=round((time.monotonic() - started) * 1000, 1),
+        )
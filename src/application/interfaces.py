@@ -1,9 +1,11 @@
 """Application layer interfaces (ports)."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Mapping, Sequence
 from typing import Any
 
-from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.entities import City, Forecast, WeatherData, WeatherRequest
+from src.domain.value_objects import Coordinates
 
 
 class WeatherProviderPort(ABC):
@@ -26,9 +28,98 @@ class WeatherProviderPort(ABC):
         """
         ...
 
+    @abstractmethod
+    async def get_forecast(self, request: WeatherRequest) -> Forecast:
+        """Fetch the multi-day forecast for a city or coordinates.
+
+        Args:
+            request: The weather request containing location and units.
+
+        Returns:
+            Forecast entity with time-ordered points.
+
+        Raises:
+            CityNotFoundError: If the city cannot be found.
+            WeatherProviderError: If the provider fails.
+            RateLimitExceededError: If rate limit is exceeded.
+        """
+        ...
+
 
 class CachePort(ABC):
-    """Port for caching weather data."""
+    """Port for caching weather data.
+
+    Every operation is awaitable so that backends reached over the network or
+    on disk never block the event loop, and the bulk operations let them
+    serve many keys in one round trip.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> WeatherData | None:
+        """Retrieve cached weather data.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData or None if not found/expired.
+        """
+        ...
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> dict[str, WeatherData]:
+        """Retrieve cached weather data for several keys at once.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData of each key that was found and not expired.
+        """
+        ...
+
+    @abstractmethod
+    async def set(self, key: str, value: WeatherData, ttl_seconds: int) -> None:
+        """Store weather data in cache.
+
+        Args:
+            key: The cache key.
+            value: The WeatherData to cache.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        ...
+
+    @abstractmethod
+    async def set_many(self, items: Mapping[str, WeatherData], ttl_seconds: int) -> None:
+        """Store several entries with the same TTL at once.
+
+        Args:
+            items: WeatherData to cache by cache key.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        ...
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove an entry from cache.
+
+        Args:
+            key: The cache key to delete.
+        """
+        ...
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Clear all cached entries."""
+        ...
+
+
+class SyncCachePort(ABC):
+    """Port for cache backends whose operations return immediately.
+
+    In-process backends implement this and are exposed to the application
+    through an adapter implementing ``CachePort``.
+    """
 
     @abstractmethod
     def get(self, key: str) -> WeatherData | None:
@@ -42,6 +133,22 @@ class CachePort(ABC):
         """
         ...
 
+    @abstractmethod
+    def get_with_ttl(self, key: str) -> tuple[WeatherData, float] | None:
+        """Retrieve cached weather data with its remaining time-to-live.
+
+        Lets a cache tier copy an entry into another without extending its
+        lifetime.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            The cached WeatherData and its remaining seconds, or None if not
+            found/expired.
+        """
+        ...
+
     @abstractmethod
     def set(self, key: str, value: WeatherData, ttl_seconds: int) -> None:
         """Store weather data in cache.
@@ -67,6 +174,84 @@ class CachePort(ABC):
         """Clear all cached entries."""
         ...
 
+    def get_many(self, keys: Sequence[str]) -> dict[str, WeatherData]:
+        """Retrieve cached weather data for several keys.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData of each key that was found and not expired.
+        """
+        return {key: value for key, (value, _) in self.get_many_with_ttl(keys).items()}
+
+    def get_many_with_ttl(self, keys: Sequence[str]) -> dict[str, tuple[WeatherData, float]]:
+        """Retrieve cached weather data and remaining TTLs for several keys.
+
+        Backends that can look keys up together override this; the default
+        calls ``get_with_ttl`` once per key.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData and remaining seconds of each key that was
+            found and not expired.
+        """
+        found = {}
+        for key in keys:
+            hit = self.get_with_ttl(key)
+            if hit is not None:
+                found[key] = hit
+        return found
+
+    def set_many(self, items: Mapping[str, WeatherData], ttl_seconds: int) -> None:
+        """Store several entries with the same TTL.
+
+        Backends that can write keys together override this; the default
+        calls ``set`` once per key.
+
+        Args:
+            items: WeatherData to cache by cache key.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        for key, value in items.items():
+            self.set(key, value, ttl_seconds)
+
+
+class WeatherObserverPort(ABC):
+    """Port notified whenever fresh weather data is fetched and cached."""
+
+    @abstractmethod
+    def on_weather_refreshed(self, cache_key: str, weather_data: WeatherData) -> None:
+        """Handle a freshly fetched observation.
+
+        Called inline on the request path, so implementations must be cheap
+        and must not block.
+
+        Args:
+            cache_key: The cache key the observation was stored under.
+            weather_data: The new observation.
+        """
+        ...
+
+
+class CityLocatorPort(ABC):
+    """Port resolving coordinates to a nearby known city."""
+
+    @abstractmethod
+    def nearest(self, coordinates: Coordinates, max_distance_km: float) -> City | None:
+        """Find the closest city to a point.
+
+        Args:
+            coordinates: The point to resolve.
+            max_distance_km: Largest great-circle distance accepted.
+
+        Returns:
+            The nearest city within ``max_distance_km``, or None.
+        """
+        ...
+
 
 class LoggerPort(ABC):
     """Port for structured logging."""
@@ -0,0 +1,159 @@
+"""Vectorized spatial interpolation of sparse weather observations."""
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+
+# Mean Earth radius, used to turn degree offsets into comparable distances
+_EARTH_RADIUS_KM = 6371.0088
+# Cap on point x anchor matrix elements per step, keeping temporaries to about 1 MiB each
+_CHUNK_ELEMENTS = 1 << 17
+
+
+def inverse_distance_points(
+    anchor_lats: FloatArray,
+    anchor_lons: FloatArray,
+    anchor_values: FloatArray,
+    lats: FloatArray,
+    lons: FloatArray,
+    power: float = 2.0,
+) -> FloatArray:
+    """Interpolate scattered anchors at arbitrary points with inverse distance weighting.
+
+    Distances use an equirectangular projection, which is accurate enough at the
+    scale of a single map view and keeps the computation to a few array ops.
+    Points are processed in chunks, so memory stays bounded for large grids
+    with many anchors.
+
+    Args:
+        anchor_lats: Anchor latitudes, shape ``(n,)``.
+        anchor_lons: Anchor longitudes, shape ``(n,)``.
+        anchor_values: Anchor values, shape ``(n,)``.
+        lats: Target latitudes, shape ``(p,)``.
+        lons: Target longitudes, shape ``(p,)``.
+        power: Distance weighting exponent.
+
+    Returns:
+        Interpolated values with shape ``(p,)``.
+    """
+    values = np.empty(lats.size, dtype=np.float64)
+    step = max(1, _CHUNK_ELEMENTS // max(1, anchor_lats.size))
+    for start in range(0, lats.size, step):
+        end = start + step
+        values[start:end] = _inverse_distance_chunk(
+            anchor_lats, anchor_lons, anchor_values, lats[start:end], lons[start:end], power
+        )
+    return values
+
+
+def _inverse_distance_chunk(
+    anchor_lats: FloatArray,
+    anchor_lons: FloatArray,
+    anchor_values: FloatArray,
+    lats: FloatArray,
+    lons: FloatArray,
+    power: float,
+) -> FloatArray:
+    """Interpolate one chunk of points; see ``inverse_distance_points``."""
+    lat_rad = np.radians(lats)[:, None]
+    lon_rad = np.radians(lons)[:, None]
+    anchor_lat_rad = np.radians(anchor_lats)[None, :]
+    anchor_lon_rad = np.radians(anchor_lons)[None, :]
+
+    x = (lon_rad - anchor_lon_rad) * np.cos((lat_rad + anchor_lat_rad) / 2)
+    y = lat_rad - anchor_lat_rad
+    distances = np.hypot(x, y) * _EARTH_RADIUS_KM
+
+    exact = distances < 1e-9
+    with np.errstate(divide="ignore"):
+        weights = np.where(exact, 0.0, distances ** (-power))
+    with np.errstate(invalid="ignore"):
+        values: FloatArray = (weights @ anchor_values) / weights.sum(axis=1)
+
+    # Points sitting on an anchor take the anchor value directly
+    hit_points, hit_anchors = np.nonzero(exact)
+    values[hit_points] = anchor_values[hit_anchors]
+    return values
+
+
+def inverse_distance_grid(
+    anchor_lats: FloatArray,
+    anchor_lons: FloatArray,
+    anchor_values: FloatArray,
+    grid_lats: FloatArray,
+    grid_lons: FloatArray,
+    power: float = 2.0,
+) -> FloatArray:
+    """Interpolate scattered anchors onto a regular grid with inverse distance weighting.
+
+    Args:
+        anchor_lats: Anchor latitudes, shape ``(n,)``.
+        anchor_lons: Anchor longitudes, shape ``(n,)``.
+        anchor_values: Anchor values, shape ``(n,)``.
+        grid_lats: Grid row latitudes, shape ``(rows,)``.
+        grid_lons: Grid column longitudes, shape ``(cols,)``.
+        power: Distance weighting exponent.
+
+    Returns:
+        Interpolated values with shape ``(rows, cols)``.
+    """
+    rows, cols = grid_lats.size, grid_lons.size
+    values = inverse_distance_points(
+        anchor_lats,
+        anchor_lons,
+        anchor_values,
+        np.repeat(grid_lats, cols),
+        np.tile(grid_lons, rows),
+        power=power,
+    )
+    return values.reshape(rows, cols)
+
+
+def bilinear_grid(
+    lattice_lats: FloatArray,
+    lattice_lons: FloatArray,
+    lattice_values: FloatArray,
+    grid_lats: FloatArray,
+    grid_lons: FloatArray,
+) -> FloatArray:
+    """Bilinearly interpolate a rectilinear anchor lattice onto a regular grid.
+
+    Points outside the lattice are clamped to its edge.
+
+    Args:
+        lattice_lats: Ascending lattice latitudes, shape ``(k,)`` with ``k >= 2``.
+        lattice_lons: Ascending lattice longitudes, shape ``(m,)`` with ``m >= 2``.
+        lattice_values: Values at the lattice nodes, shape ``(k, m)``.
+        grid_lats: Grid row latitudes, shape ``(rows,)``.
+        grid_lons: Grid column longitudes, shape ``(cols,)``.
+
+    Returns:
+        Interpolated values with shape ``(rows, cols)``.
+    """
+    i0, t = _cell_positions(lattice_lats, grid_lats)
+    j0, u = _cell_positions(lattice_lons, grid_lons)
+    t = t[:, None]
+    u = u[None, :]
+
+    v00 = lattice_values[np.ix_(i0, j0)]
+    v01 = lattice_values[np.ix_(i0, j0 + 1)]
+    v10 = lattice_values[np.ix_(i0 + 1, j0)]
+    v11 = lattice_values[np.ix_(i0 + 1, j0 + 1)]
+    result: FloatArray = (1 - t) * ((1 - u) * v00 + u * v01) + t * ((1 - u) * v10 + u * v11)
+    return result
+
+
+def _cell_positions(
+    axis: FloatArray, points: FloatArray
+) -> tuple[npt.NDArray[np.intp], FloatArray]:
+    """Locate points on a 1-D lattice axis.
+
+    Returns:
+        The index of the lower lattice node for each point and the fractional
+        offset (0..1) towards the next node.
+    """
+    lower = np.clip(np.searchsorted(axis, points, side="right") - 1, 0, axis.size - 2)
+    span = axis[lower + 1] - axis[lower]
+    fraction = np.clip((points - axis[lower]) / span, 0.0, 1.0)
+    return lower, fraction
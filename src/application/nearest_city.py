@@ -0,0 +1,61 @@
+"""Array-backed spatial index resolving coordinates to the nearest city."""
+
+from collections.abc import Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from src.application.interfaces import CityLocatorPort
+from src.domain.entities import City
+from src.domain.value_objects import Coordinates
+
+EARTH_RADIUS_KM = 6371.0
+
+
+class NearestCityIndex(CityLocatorPort):
+    """Find the closest gazetteer city to a point.
+
+    Cities are stored as float32 latitude and longitude arrays (in radians)
+    sorted by latitude. A lookup binary searches the latitude band that can
+    hold a city within the accepted distance and computes haversine
+    distances for that band only, so it never scans the whole gazetteer.
+    """
+
+    def __init__(self, cities: Iterable[City]) -> None:
+        """Build the index.
+
+        Args:
+            cities: Gazetteer entries.
+        """
+        self._cities = sorted(cities, key=lambda city: city.coordinates.latitude)
+        self._lats: npt.NDArray[np.float32] = np.radians(
+            [city.coordinates.latitude for city in self._cities], dtype=np.float32
+        )
+        self._lons: npt.NDArray[np.float32] = np.radians(
+            [city.coordinates.longitude for city in self._cities], dtype=np.float32
+        )
+
+    def __len__(self) -> int:
+        """Return the number of indexed cities."""
+        return len(self._cities)
+
+    def nearest(self, coordinates: Coordinates, max_distance_km: float) -> City | None:
+        """Return the closest city within ``max_distance_km`` of a point."""
+        if max_distance_km <= 0 or not self._cities:
+            return None
+        lat = np.radians(coordinates.latitude)
+        lon = np.radians(coordinates.longitude)
+        band = max_distance_km / EARTH_RADIUS_KM
+        lo = int(np.searchsorted(self._lats, lat - band, side="left"))
+        hi = int(np.searchsorted(self._lats, lat + band, side="right"))
+        if lo == hi:
+            return None
+
+        lats, lons = self._lats[lo:hi], self._lons[lo:hi]
+        h = (
+            np.sin((lats - lat) / 2) ** 2
+            + np.cos(lat) * np.cos(lats) * np.sin((lons - lon) / 2) ** 2
+        )
+        best = int(np.argmin(h))
+        distance = 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(min(float(h[best]), 1.0)))
+        return self._cities[lo + best] if distance <= max_distance_km else None
@@ -1,5 +1,17 @@
 """Application use cases."""
 
+from src.application.use_cases.compare_weather import CompareWeatherUseCase, RankingMetric
+from src.application.use_cases.get_forecast import GetForecastUseCase
+from src.application.use_cases.get_route_weather import GetRouteWeatherUseCase
 from src.application.use_cases.get_weather import GetWeatherUseCase
+from src.application.use_cases.get_weather_grid import GetWeatherGridUseCase, InterpolationMethod
 
-__all__ = ["GetWeatherUseCase"]
+__all__ = [
+    "CompareWeatherUseCase",
+    "GetForecastUseCase",
+    "GetRouteWeatherUseCase",
+    "GetWeatherGridUseCase",
+    "GetWeatherUseCase",
+    "InterpolationMethod",
+    "RankingMetric",
+]
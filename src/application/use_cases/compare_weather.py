@@ -0,0 +1,152 @@
+"""Compare Weather use case implementation."""
+
+from collections.abc import Sequence
+from enum import StrEnum
+
+import numpy as np
+
+from src.application.dto import CityComparison, ComparedCity, WeatherResult
+from src.application.interfaces import LoggerPort
+from src.application.use_cases.get_weather import GetWeatherUseCase
+from src.application.weather_metrics import (
+    celsius_to_fahrenheit,
+    comfort_score,
+    fahrenheit_to_celsius,
+    heat_index_f,
+    ms_to_mph,
+    wind_chill_f,
+)
+from src.domain.entities import WeatherRequest
+from src.domain.exceptions import WeatherAppError
+from src.domain.value_objects import UnitSystem
+
+
+class RankingMetric(StrEnum):
+    """Fields cities can be ranked by."""
+
+    COMFORT_SCORE = "comfort_score"
+    TEMPERATURE = "temperature"
+    FEELS_LIKE = "feels_like"
+    HEAT_INDEX = "heat_index"
+    WIND_CHILL = "wind_chill"
+    HUMIDITY = "humidity"
+    WIND_SPEED = "wind_speed"
+    PRESSURE = "pressure"
+
+
+class CompareWeatherUseCase:
+    """Use case for ranking many cities by current or derived conditions."""
+
+    def __init__(
+        self,
+        weather_use_case: GetWeatherUseCase,
+        logger: LoggerPort,
+        max_concurrency: int = 8,
+    ) -> None:
+        """Initialize the use case.
+
+        Args:
+            weather_use_case: Use case resolving each city.
+            logger: The logger implementation.
+            max_concurrency: Maximum concurrent lookups.
+        """
+        self._weather = weather_use_case
+        self._logger = logger
+        self._max_concurrency = max_concurrency
+
+    async def execute(
+        self,
+        cities: Sequence[str],
+        units: UnitSystem = UnitSystem.METRIC,
+        rank_by: RankingMetric = RankingMetric.COMFORT_SCORE,
+        descending: bool = True,
+    ) -> CityComparison:
+        """Execute the compare weather use case.
+
+        Cities are always looked up in metric units, so every comparison shares
+        the same cache entries; conversion to the requested units happens here
+        on whole arrays.
+
+        Args:
+            cities: City names to compare.
+            units: Unit system of the returned values.
+            rank_by: The field to rank by.
+            descending: Whether higher values rank first.
+
+        Returns:
+            CityComparison with ranked cities and per-city failures.
+
+        Raises:
+            WeatherAppError: If no city could be resolved.
+        """
+        requests = [WeatherRequest(city=city, units=UnitSystem.METRIC) for city in cities]
+        outcomes = await self._weather.execute_many(requests, self._max_concurrency)
+
+        results = [outcome for outcome in outcomes if isinstance(outcome, WeatherResult)]
+        failures = tuple(
+            (city, outcome)
+            for city, outcome in zip(cities, outcomes, strict=True)
+            if isinstance(outcome, WeatherAppError)
+        )
+        if not results:
+            raise failures[0][1]
+
+        columns = np.array(
+            [
+                (
+                    result.weather_data.temperature,
+                    result.weather_data.feels_like,
+                    result.weather_data.humidity,
+                    result.weather_data.wind_speed,
+                    result.weather_data.pressure,
+                )
+                for result in results
+            ],
+            dtype=np.float64,
+        )
+        temp_c, feels_c, humidity, wind_ms, pressure = columns.T
+        temp_f = celsius_to_fahrenheit(temp_c)
+        wind_mph = ms_to_mph(wind_ms)
+
+        heat_f = heat_index_f(temp_f, humidity)
+        chill_f = wind_chill_f(temp_f, wind_mph)
+        comfort = comfort_score(feels_c, humidity, wind_ms)
+
+        if units == UnitSystem.IMPERIAL:
+            temperature, feels_like, wind = temp_f, celsius_to_fahrenheit(feels_c), wind_mph
+            heat_index, wind_chill = heat_f, chill_f
+        else:
+            temperature, feels_like, wind = temp_c, feels_c, wind_ms
+            heat_index = fahrenheit_to_celsius(heat_f)
+            wind_chill = fahrenheit_to_celsius(chill_f)
+
+        keys = {
+            RankingMetric.COMFORT_SCORE: comfort,
+            RankingMetric.TEMPERATURE: temperature,
+            RankingMetric.FEELS_LIKE: feels_like,
+            RankingMetric.HEAT_INDEX: heat_index,
+            RankingMetric.WIND_CHILL: wind_chill,
+            RankingMetric.HUMIDITY: humidity,
+            RankingMetric.WIND_SPEED: wind,
+            RankingMetric.PRESSURE: pressure,
+        }
+        key = keys[rank_by]
+        order = np.argsort(-key if descending else key, kind="stable")
+
+        ranked = tuple(
+            ComparedCity(
+                rank=rank,
+                result=results[index],
+                temperature=float(temperature[index]),
+                feels_like=float(feels_like[index]),
+                wind_speed=float(wind[index]),
+                heat_index=float(heat_index[index]),
+                wind_chill=float(wind_chill[index]),
+                comfort_score=float(comfort[index]),
+            )
+            for rank, index in enumerate(order.tolist(), start=1)
+        )
+        self._logger.debug(
+            "Cities compared", requested=len(cities), ranked=len(ranked), failed=len(failures)
+        )
+        return CityComparison(units=units, rank_by=rank_by, ranked=ranked, failures=failures)
@@ -0,0 +1,117 @@
+"""Get Forecast use case implementation."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import UTC, date, datetime
+
+from src.application.dto import ForecastDay
+from src.application.forecast_series import ForecastSeries
+from src.application.interfaces import LoggerPort, WeatherProviderPort
+from src.domain.entities import ForecastPoint, WeatherRequest
+
+
+class GetForecastUseCase:
+    """Use case answering forecast questions from one cached upstream forecast.
+
+    Each location's forecast is fetched once per TTL and kept as a compact
+    ForecastSeries; hourly, point-in-time and daily questions are all answered
+    by slicing it. Concurrent misses for the same location share one upstream
+    call.
+    """
+
+    def __init__(
+        self,
+        weather_provider: WeatherProviderPort,
+        logger: LoggerPort,
+        cache_ttl_seconds: int = 1800,
+        max_entries: int = 1000,
+    ) -> None:
+        """Initialize the use case.
+
+        Args:
+            weather_provider: The weather data provider.
+            logger: The logger implementation.
+            cache_ttl_seconds: How long a fetched forecast is reused.
+            max_entries: Maximum number of locations kept cached.
+        """
+        self._provider = weather_provider
+        self._logger = logger
+        self._ttl = cache_ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[ForecastSeries, float]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[ForecastSeries]] = {}
+
+    async def execute(self, request: WeatherRequest) -> ForecastSeries:
+        """Return the full forecast series for a location.
+
+        Raises:
+            CityNotFoundError: If city not found.
+            WeatherProviderError: If provider fails.
+            RateLimitExceededError: If rate limited.
+        """
+        cache_key = f"forecast:{request.cache_key}"
+        entry = self._entries.get(cache_key)
+        if entry is not None and entry[1] > time.monotonic():
+            self._entries.move_to_end(cache_key)
+            self._logger.debug("Forecast cache hit", cache_key=cache_key)
+            return entry[0]
+
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(cache_key, request))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(cache_key, None))
+        return await asyncio.shield(task)
+
+    async def hourly(self, request: WeatherRequest, hours: int) -> ForecastSeries:
+        """Return the forecast steps covering the next ``hours`` hours."""
+        series = await self.execute(request)
+        return series.next_hours(datetime.now(UTC), hours)
+
+    async def at(self, request: WeatherRequest, when: datetime) -> ForecastPoint:
+        """Return the forecast conditions at a moment.
+
+        Raises:
+            ValueError: If ``when`` is outside the forecast range.
+        """
+        series = await self.execute(request)
+        point = series.at(when)
+        if point is None:
+            msg = "Requested time is outside the forecast range"
+            raise ValueError(msg)
+        return point
+
+    async def daily(self, request: WeatherRequest, day: date | None = None) -> list[ForecastDay]:
+        """Return per-day summaries, or only the one for ``day``.
+
+        Raises:
+            ValueError: If ``day`` is not covered by the forecast.
+        """
+        days = (await self.execute(request)).days()
+        if day is None:
+            return days
+        matching = [summary for summary in days if summary.date == day]
+        if not matching:
+            msg = f"No forecast available for {day.isoformat()}"
+            raise ValueError(msg)
+        return matching
+
+    async def _fetch(self, cache_key: str, request: WeatherRequest) -> ForecastSeries:
+        """Fetch, pack and cache a forecast."""
+        self._logger.debug("Forecast cache miss, fetching from provider", cache_key=cache_key)
+        forecast = await self._provider.get_forecast(request)
+        series = ForecastSeries.from_forecast(forecast)
+
+        self._entries[cache_key] = (series, time.monotonic() + self._ttl)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+        self._logger.info(
+            "Forecast fetched and cached",
+            city=forecast.city_name,
+            country=forecast.country,
+            steps=len(series),
+            cache_ttl=self._ttl,
+        )
+        return series
@@ -0,0 +1,113 @@
+"""Get Route Weather use case implementation."""
+
+from src.application.dto import RouteSegment, RouteWeather, WeatherResult
+from src.application.interfaces import LoggerPort
+from src.application.use_cases.get_weather import GetWeatherUseCase
+from src.domain.entities import WeatherRequest
+from src.domain.geo import count_polyline_samples, decode_polyline, sample_polyline
+from src.domain.value_objects import UnitSystem
+
+
+class GetRouteWeatherUseCase:
+    """Use case for retrieving conditions sampled along an encoded polyline."""
+
+    def __init__(
+        self,
+        weather_use_case: GetWeatherUseCase,
+        logger: LoggerPort,
+        max_concurrency: int = 8,
+        max_samples: int = 500,
+    ) -> None:
+        """Initialize the use case.
+
+        Args:
+            weather_use_case: Use case resolving individual sample locations.
+            logger: The logger implementation.
+            max_concurrency: Maximum concurrent lookups.
+            max_samples: Maximum number of samples a single route may produce.
+        """
+        self._weather = weather_use_case
+        self._logger = logger
+        self._max_concurrency = max_concurrency
+        self._max_samples = max_samples
+
+    async def execute(
+        self,
+        polyline: str,
+        spacing_km: float,
+        units: UnitSystem = UnitSystem.METRIC,
+        precision: int = 5,
+    ) -> RouteWeather:
+        """Execute the get route weather use case.
+
+        Consecutive samples falling into the same cache cell are collapsed into
+        one segment, and each distinct cell is looked up only once.
+
+        Args:
+            polyline: Encoded polyline describing the route.
+            spacing_km: Distance between samples along the route.
+            units: The unit system.
+            precision: Polyline precision (5 for Google, 6 for OSRM/Valhalla).
+
+        Returns:
+            RouteWeather with one entry per segment.
+
+        Raises:
+            ValueError: If the polyline is invalid or yields too many samples.
+            WeatherAppError: If no segment could be resolved.
+        """
+        points = decode_polyline(polyline, precision=precision)
+        if not points:
+            msg = "Polyline contains no points"
+            raise ValueError(msg)
+        # Size the route before sampling it, so an oversized one costs no allocation
+        sample_count = count_polyline_samples(points, spacing_km)
+        if sample_count > self._max_samples:
+            msg = (
+                f"Route produces {sample_count} samples, more than the maximum of "
+                f"{self._max_samples}; increase spacing_km"
+            )
+            raise ValueError(msg)
+        samples = sample_polyline(points, spacing_km)
+
+        # Group consecutive samples by cache cell: [(request, first, last), ...]
+        groups: list[tuple[WeatherRequest, int, int]] = []
+        for index, (_, point) in enumerate(samples):
+            request = WeatherRequest(units=units, coordinates=point)
+            if groups and groups[-1][0].cache_key == request.cache_key:
+                groups[-1] = (groups[-1][0], groups[-1][1], index)
+            else:
+                groups.append((request, index, index))
+
+        outcomes = await self._weather.execute_many(
+            [request for request, _, _ in groups], self._max_concurrency
+        )
+        if not any(isinstance(outcome, WeatherResult) for outcome in outcomes):
+            raise next(outcome for outcome in outcomes if not isinstance(outcome, WeatherResult))
+
+        segments = []
+        for position, ((_, first, last), outcome) in enumerate(zip(groups, outcomes, strict=True)):
+            # A segment runs until the next one starts, or to the route's end
+            end_index = groups[position + 1][1] if position + 1 < len(groups) else last
+            segments.append(
+                RouteSegment(
+                    start_km=samples[first][0],
+                    end_km=samples[end_index][0],
+                    start=samples[first][1],
+                    end=samples[end_index][1],
+                    outcome=outcome,
+                )
+            )
+
+        self._logger.debug(
+            "Route weather resolved",
+            samples=len(samples),
+            segments=len(segments),
+            unique_cells=len({request.cache_key for request, _, _ in groups}),
+        )
+        return RouteWeather(
+            units=units,
+            length_km=samples[-1][0],
+            sample_count=len(samples),
+            segments=tuple(segments),
+        )
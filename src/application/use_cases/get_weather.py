@@ -1,8 +1,19 @@
 """Get Weather use case implementation."""
 
+import asyncio
+from collections.abc import Sequence
+
 from src.application.dto import WeatherResult
-from src.application.interfaces import CachePort, LoggerPort, WeatherProviderPort
-from src.domain.entities import WeatherRequest
+from src.application.inflight import InFlightTracker
+from src.application.interfaces import (
+    CachePort,
+    CityLocatorPort,
+    LoggerPort,
+    WeatherObserverPort,
+    WeatherProviderPort,
+)
+from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.exceptions import WeatherAppError
 
 
 class GetWeatherUseCase:
@@ -14,6 +25,10 @@ class GetWeatherUseCase:
         cache: CachePort,
         logger: LoggerPort,
         cache_ttl_seconds: int = 900,
+        observers: Sequence[WeatherObserverPort] = (),
+        city_locator: CityLocatorPort | None = None,
+        snap_max_distance_km: float = 0.0,
+        tracker: InFlightTracker | None = None,
     ) -> None:
         """Initialize the use case.
 
@@ -22,11 +37,21 @@ class GetWeatherUseCase:
             cache: The cache implementation.
             logger: The logger implementation.
             cache_ttl_seconds: Cache TTL in seconds (default 15 minutes).
+            observers: Observers notified of every freshly fetched observation.
+            city_locator: Resolves coordinate requests to a nearby known city.
+            snap_max_distance_km: Coordinate requests within this distance of a
+                city are served from that city's entry; 0 disables snapping.
+            tracker: Runs cache-miss fetches as tracked tasks that finish and
+                are cached even if the request awaiting them is cancelled.
         """
         self._provider = weather_provider
         self._cache = cache
         self._logger = logger
         self._cache_ttl = cache_ttl_seconds
+        self._observers = tuple(observers)
+        self._locator = city_locator
+        self._snap_distance = snap_max_distance_km
+        self._tracker = tracker
 
     async def execute(self, request: WeatherRequest) -> WeatherResult:
         """Execute the get weather use case.
@@ -42,10 +67,11 @@ class GetWeatherUseCase:
             WeatherProviderError: If provider fails.
             RateLimitExceededError: If rate limited.
         """
+        request = self.snap(request)
         cache_key = request.cache_key
 
         # Try cache first
-        cached_data = self._cache.get(cache_key)
+        cached_data = await self._cache.get(cache_key)
         if cached_data is not None:
             self._logger.debug(
                 "Cache hit",
@@ -53,29 +79,147 @@ class GetWeatherUseCase:
                 units=request.units.value,
                 cache_key=cache_key,
             )
-            weather_data = cached_data
-        else:
-            self._logger.debug(
-                "Cache miss, fetching from provider",
-                city=request.city,
-                units=request.units.value,
-            )
+            return self._result(cached_data)
 
-            # Fetch from provider
-            weather_data = await self._provider.get_weather(request)
-
-            # Cache the result
-            self._cache.set(cache_key, weather_data, self._cache_ttl)
-            self._logger.info(
-                "Weather data fetched and cached",
-                city=weather_data.city_name,
-                country=weather_data.country,
-                temperature=weather_data.temperature,
-                units=weather_data.units.value,
-                cache_ttl=self._cache_ttl,
-            )
+        if self._tracker is None:
+            return self._result(await self._fetch_and_cache(request))
+        task = self._tracker.track(self._fetch_and_cache(request))
+        return self._result(await asyncio.shield(task))
+
+    def snap(self, request: WeatherRequest) -> WeatherRequest:
+        """Move a coordinate request onto the nearest known city.
+
+        Nearby points then share the city's cache entry, which bounds the
+        number of distinct coordinate keys.
+
+        Args:
+            request: The weather request.
+
+        Returns:
+            A request for the city's coordinates, or ``request`` unchanged if
+            it names a city or no city is close enough.
+        """
+        if request.coordinates is None or self._locator is None or self._snap_distance <= 0:
+            return request
+        city = self._locator.nearest(request.coordinates, self._snap_distance)
+        if city is None or city.coordinates == request.coordinates:
+            return request
+        self._logger.debug(
+            "Coordinates snapped to city",
+            latitude=request.coordinates.latitude,
+            longitude=request.coordinates.longitude,
+            city=city.location_display,
+        )
+        return WeatherRequest(units=request.units, coordinates=city.coordinates)
+
+    async def _fetch_and_cache(self, request: WeatherRequest) -> WeatherData:
+        """Fetch an observation after a cache miss, cache it and notify the observers."""
+        weather_data = await self._fetch(request)
+        await self._cache.set(request.cache_key, weather_data, self._cache_ttl)
+        self._log_cached(weather_data)
+        self._notify(request.cache_key, weather_data)
+        return weather_data
 
+    async def _fetch_and_cache_many(
+        self, requests: list[WeatherRequest], max_concurrency: int
+    ) -> list[WeatherData | WeatherAppError]:
+        """Fetch many misses, cache them in one bulk write and notify the observers."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def fetch(request: WeatherRequest) -> WeatherData | WeatherAppError:
+            async with semaphore:
+                try:
+                    return await self._fetch(request)
+                except WeatherAppError as e:
+                    return e
+
+        outcomes = await asyncio.gather(*(fetch(request) for request in requests))
+        fetched = {
+            request.cache_key: outcome
+            for request, outcome in zip(requests, outcomes, strict=True)
+            if isinstance(outcome, WeatherData)
+        }
+        if fetched:
+            await self._cache.set_many(fetched, self._cache_ttl)
+        for key, weather_data in fetched.items():
+            self._log_cached(weather_data)
+            self._notify(key, weather_data)
+        return outcomes
+
+    async def _fetch(self, request: WeatherRequest) -> WeatherData:
+        """Fetch an observation from the provider after a cache miss."""
+        self._logger.debug(
+            "Cache miss, fetching from provider",
+            city=request.city,
+            units=request.units.value,
+        )
+        return await self._provider.get_weather(request)
+
+    def _log_cached(self, weather_data: WeatherData) -> None:
+        """Log a freshly fetched observation that was cached."""
+        self._logger.info(
+            "Weather data fetched and cached",
+            city=weather_data.city_name,
+            country=weather_data.country,
+            temperature=weather_data.temperature,
+            units=weather_data.units.value,
+            cache_ttl=self._cache_ttl,
+        )
+
+    @staticmethod
+    def _result(weather_data: WeatherData) -> WeatherResult:
+        """Wrap an observation with its easter egg identifier."""
         country_code = (weather_data.country or "").strip().upper()
         easter_egg = "zidane" if country_code == "FR" else None
-
         return WeatherResult(weather_data=weather_data, easter_egg=easter_egg)
+
+    def _notify(self, cache_key: str, weather_data: WeatherData) -> None:
+        """Hand a fresh observation to the observers without failing the request."""
+        for observer in self._observers:
+            try:
+                observer.on_weather_refreshed(cache_key, weather_data)
+            except Exception as e:
+                self._logger.error(
+                    "Weather observer failed",
+                    observer=type(observer).__name__,
+                    cache_key=cache_key,
+                    error=str(e),
+                )
+
+    async def execute_many(
+        self, requests: Sequence[WeatherRequest], max_concurrency: int = 8
+    ) -> list[WeatherResult | WeatherAppError]:
+        """Execute the use case for many locations concurrently.
+
+        Requests sharing a cache key are resolved once. The cache is read
+        for all of them in one bulk lookup, at most ``max_concurrency`` misses
+        are fetched from the provider at the same time, and the fetched
+        observations are cached in one bulk write.
+
+        Args:
+            requests: The weather requests.
+            max_concurrency: Maximum number of concurrent provider fetches.
+
+        Returns:
+            One entry per request, in order: the WeatherResult, or the
+            WeatherAppError raised while resolving that request.
+        """
+        snapped = [self.snap(request) for request in requests]
+        unique = {request.cache_key: request for request in reversed(snapped)}
+        cached = await self._cache.get_many(list(unique))
+        by_key: dict[str, WeatherResult | WeatherAppError] = {
+            key: self._result(weather_data) for key, weather_data in cached.items()
+        }
+
+        missing = [unique[key] for key in unique if key not in cached]
+        if missing:
+            resolve = self._fetch_and_cache_many(missing, max_concurrency)
+            if self._tracker is None:
+                outcomes = await resolve
+            else:
+                outcomes = await asyncio.shield(self._tracker.track(resolve))
+            for request, outcome in zip(missing, outcomes, strict=True):
+                by_key[request.cache_key] = (
+                    self._result(outcome) if isinstance(outcome, WeatherData) else outcome
+                )
+        return [by_key[request.cache_key] for request in snapped]
@@ -0,0 +1,151 @@
+"""Get Weather Grid use case implementation."""
+
+from enum import StrEnum
+
+import numpy as np
+
+from src.application.dto import WeatherGrid, WeatherResult
+from src.application.interfaces import LoggerPort
+from src.application.interpolation import (
+    bilinear_grid,
+    inverse_distance_grid,
+    inverse_distance_points,
+)
+from src.application.use_cases.get_weather import GetWeatherUseCase
+from src.domain.entities import WeatherRequest
+from src.domain.value_objects import BoundingBox, Coordinates, UnitSystem, WeatherMetric
+
+
+class InterpolationMethod(StrEnum):
+    """Supported grid interpolation methods."""
+
+    IDW = "idw"  # Inverse distance weighting over the anchors
+    BILINEAR = "bilinear"  # Bilinear over the anchor lattice
+
+
+class GetWeatherGridUseCase:
+    """Use case for computing a dense weather field from sparse cached anchors."""
+
+    def __init__(
+        self,
+        weather_use_case: GetWeatherUseCase,
+        logger: LoggerPort,
+        max_concurrency: int = 8,
+    ) -> None:
+        """Initialize the use case.
+
+        Args:
+            weather_use_case: Use case resolving individual anchor observations.
+            logger: The logger implementation.
+            max_concurrency: Maximum concurrent anchor lookups.
+        """
+        self._weather = weather_use_case
+        self._logger = logger
+        self._max_concurrency = max_concurrency
+
+    async def execute(
+        self,
+        bbox: BoundingBox,
+        rows: int,
+        cols: int,
+        metric: WeatherMetric = WeatherMetric.TEMPERATURE,
+        units: UnitSystem = UnitSystem.METRIC,
+        method: InterpolationMethod = InterpolationMethod.IDW,
+        anchors_per_side: int = 4,
+    ) -> WeatherGrid:
+        """Execute the get weather grid use case.
+
+        Anchors form a lattice over the box and are snapped to the cache's
+        0.01 degree cells, so overlapping or repeated grids reuse cached entries.
+
+        Args:
+            bbox: Area to cover.
+            rows: Number of grid rows (north to south).
+            cols: Number of grid columns (west to east).
+            metric: The observation to interpolate.
+            units: The unit system.
+            method: The interpolation method.
+            anchors_per_side: Anchor lattice size along each axis.
+
+        Returns:
+            WeatherGrid with ``rows x cols`` float32 values.
+
+        Raises:
+            WeatherAppError: If no anchor could be resolved.
+        """
+        lattice_lats = np.unique(np.round(np.linspace(bbox.south, bbox.north, anchors_per_side), 2))
+        lattice_lons = np.unique(np.round(np.linspace(bbox.west, bbox.east, anchors_per_side), 2))
+        requests = [
+            WeatherRequest(
+                units=units,
+                coordinates=Coordinates(latitude=float(lat), longitude=float(lon)),
+            )
+            for lat in lattice_lats
+            for lon in lattice_lons
+        ]
+        outcomes = await self._weather.execute_many(requests, self._max_concurrency)
+
+        results = [outcome for outcome in outcomes if isinstance(outcome, WeatherResult)]
+        if not results:
+            raise next(outcome for outcome in outcomes if not isinstance(outcome, WeatherResult))
+        if len(results) < len(outcomes):
+            self._logger.warning(
+                "Weather grid anchors missing",
+                resolved=len(results),
+                requested=len(outcomes),
+            )
+
+        present = np.array([isinstance(outcome, WeatherResult) for outcome in outcomes])
+        lattice_values = np.array(
+            [
+                outcome.weather_data.metric(metric)
+                if isinstance(outcome, WeatherResult)
+                else np.nan
+                for outcome in outcomes
+            ]
+        )
+        node_lats = np.repeat(lattice_lats, lattice_lons.size)
+        node_lons = np.tile(lattice_lons, lattice_lats.size)
+        grid_lats = np.linspace(bbox.north, bbox.south, rows)
+        grid_lons = np.linspace(bbox.west, bbox.east, cols)
+
+        use_lattice = (
+            method == InterpolationMethod.BILINEAR
+            and lattice_lats.size >= 2
+            and lattice_lons.size >= 2
+        )
+        if use_lattice:
+            if not present.all():
+                # Fill holes in the lattice from the anchors that did resolve
+                lattice_values[~present] = inverse_distance_points(
+                    node_lats[present],
+                    node_lons[present],
+                    lattice_values[present],
+                    node_lats[~present],
+                    node_lons[~present],
+                )
+            values = bilinear_grid(
+                lattice_lats,
+                lattice_lons,
+                lattice_values.reshape(lattice_lats.size, lattice_lons.size),
+                grid_lats,
+                grid_lons,
+            )
+        else:
+            values = inverse_distance_grid(
+                node_lats[present],
+                node_lons[present],
+                lattice_values[present],
+                grid_lats,
+                grid_lons,
+            )
+
+        return WeatherGrid(
+            metric=metric,
+            units=units,
+            method=InterpolationMethod.BILINEAR if use_lattice else InterpolationMethod.IDW,
+            latitudes=grid_lats,
+            longitudes=grid_lons,
+            values=values.astype(np.float32),
+            anchors=tuple(result.weather_data for result in results),
+        )
@@ -0,0 +1,107 @@
+"""Vectorized unit conversions and derived comfort metrics."""
+
+import numpy as np
+import numpy.typing as npt
+
+FloatArray = npt.NDArray[np.float64]
+
+# Metres per second in one mile per hour
+_MS_PER_MPH = 0.44704
+
+
+def celsius_to_fahrenheit(celsius: FloatArray) -> FloatArray:
+    """Convert temperatures from °C to °F."""
+    return celsius * 9 / 5 + 32
+
+
+def fahrenheit_to_celsius(fahrenheit: FloatArray) -> FloatArray:
+    """Convert temperatures from °F to °C."""
+    return (fahrenheit - 32) * 5 / 9
+
+
+def ms_to_mph(speed_ms: FloatArray) -> FloatArray:
+    """Convert speeds from m/s to mph."""
+    return speed_ms / _MS_PER_MPH
+
+
+def mph_to_ms(speed_mph: FloatArray) -> FloatArray:
+    """Convert speeds from mph to m/s."""
+    return speed_mph * _MS_PER_MPH
+
+
+def heat_index_f(temp_f: FloatArray, humidity: FloatArray) -> FloatArray:
+    """Compute the NWS heat index in °F.
+
+    Uses Steadman's simple formula and switches to the Rothfusz regression
+    (with the NWS low/high humidity adjustments) where the result reaches 80°F.
+
+    Args:
+        temp_f: Air temperatures in °F.
+        humidity: Relative humidity in percent.
+
+    Returns:
+        Heat index values in °F.
+    """
+    t, rh = temp_f, humidity
+    simple = 0.5 * (t + 61.0 + (t - 68.0) * 1.2 + rh * 0.094)
+
+    full = (
+        -42.379
+        + 2.04901523 * t
+        + 10.14333127 * rh
+        - 0.22475541 * t * rh
+        - 6.83783e-3 * t**2
+        - 5.481717e-2 * rh**2
+        + 1.22874e-3 * t**2 * rh
+        + 8.5282e-4 * t * rh**2
+        - 1.99e-6 * t**2 * rh**2
+    )
+    dry = (rh < 13) & (t >= 80) & (t <= 112)
+    with np.errstate(invalid="ignore"):
+        dry_adjustment = ((13 - rh) / 4) * np.sqrt(np.clip((17 - np.abs(t - 95.0)) / 17, 0, None))
+    full = np.where(dry, full - dry_adjustment, full)
+    humid = (rh > 85) & (t >= 80) & (t <= 87)
+    full = np.where(humid, full + ((rh - 85) / 10) * ((87 - t) / 5), full)
+
+    result: FloatArray = np.where((simple + t) / 2 >= 80, full, simple)
+    return result
+
+
+def wind_chill_f(temp_f: FloatArray, wind_mph: FloatArray) -> FloatArray:
+    """Compute the NWS wind chill in °F.
+
+    The formula is only defined at or below 50°F with winds of at least 3 mph;
+    elsewhere the air temperature is returned unchanged.
+
+    Args:
+        temp_f: Air temperatures in °F.
+        wind_mph: Wind speeds in mph.
+
+    Returns:
+        Wind chill values in °F.
+    """
+    v = np.power(np.maximum(wind_mph, 0.0), 0.16)
+    chill = 35.74 + 0.6215 * temp_f - 35.75 * v + 0.4275 * temp_f * v
+    result: FloatArray = np.where((temp_f <= 50) & (wind_mph >= 3), chill, temp_f)
+    return result
+
+
+def comfort_score(temp_c: FloatArray, humidity: FloatArray, wind_ms: FloatArray) -> FloatArray:
+    """Score how pleasant conditions are outdoors, from 0 (awful) to 100 (ideal).
+
+    The score peaks for an apparent temperature around 21°C, moderate humidity
+    and a light breeze, and decays smoothly away from them.
+
+    Args:
+        temp_c: Apparent (feels-like) temperatures in °C.
+        humidity: Relative humidity in percent.
+        wind_ms: Wind speeds in m/s.
+
+    Returns:
+        Comfort scores in the range 0..100.
+    """
+    temperature_term = np.exp(-(((temp_c - 21.0) / 8.0) ** 2))
+    humidity_term = 1.0 - np.clip(np.abs(humidity - 45.0) / 55.0, 0.0, 1.0) ** 2
+    wind_term = np.exp(-((np.maximum(wind_ms - 3.0, 0.0) / 8.0) ** 2))
+    result: FloatArray = 100.0 * temperature_term * (0.7 + 0.3 * humidity_term) * wind_term
+    return result
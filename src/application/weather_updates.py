@@ -0,0 +1,169 @@
+"""Shared live weather update channels."""
+
+import asyncio
+import contextlib
+import contextvars
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from itertools import count
+
+from src.application.dto import WeatherResult
+from src.application.interfaces import LoggerPort
+from src.application.use_cases.get_weather import GetWeatherUseCase
+from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.exceptions import WeatherAppError
+
+
+@dataclass(frozen=True)
+class WeatherUpdate:
+    """A published change of the weather data for a location."""
+
+    event_id: int
+    result: WeatherResult
+
+
+@dataclass
+class _Channel:
+    """Per-location state shared by all of its subscribers."""
+
+    request: WeatherRequest
+    history: deque[WeatherUpdate]
+    subscribers: set["asyncio.Queue[WeatherUpdate]"] = field(default_factory=set)
+    last_data: WeatherData | None = None
+    task: "asyncio.Task[None] | None" = None
+
+
+class WeatherUpdateHub:
+    """Fan out weather changes to subscribers with one refresh loop per location.
+
+    Every subscribed location gets a single polling task, no matter how many
+    listeners it has. Polls go through GetWeatherUseCase, so they are served
+    from cache and only reach the provider once the cached entry expires.
+    """
+
+    def __init__(
+        self,
+        use_case: GetWeatherUseCase,
+        logger: LoggerPort,
+        poll_interval_seconds: float = 30.0,
+        replay_size: int = 16,
+        queue_size: int = 16,
+    ) -> None:
+        """Initialize the hub.
+
+        Args:
+            use_case: Use case used to read (and refresh) weather data.
+            logger: The logger implementation.
+            poll_interval_seconds: Delay between two cache checks per location.
+            replay_size: Number of past updates kept per location for resume.
+            queue_size: Maximum pending updates per subscriber.
+        """
+        self._use_case = use_case
+        self._logger = logger
+        self._poll_interval = poll_interval_seconds
+        self._replay_size = replay_size
+        self._queue_size = queue_size
+        self._channels: dict[str, _Channel] = {}
+        self._event_ids = count(1)
+
+    @contextlib.asynccontextmanager
+    async def subscribe(
+        self, request: WeatherRequest, last_event_id: int | None = None
+    ) -> AsyncIterator["asyncio.Queue[WeatherUpdate]"]:
+        """Subscribe to weather changes for a location.
+
+        The returned queue is primed with the updates the caller missed since
+        ``last_event_id`` or, without one, with the latest known update.
+
+        Args:
+            request: The location to follow.
+            last_event_id: Last event id the client received, if resuming.
+
+        Yields:
+            Queue receiving WeatherUpdate items for the location.
+        """
+        # Nearby points resolve to one location, so they share its channel
+        request = self._use_case.snap(request)
+        channel = self._channels.get(request.cache_key)
+        if channel is None:
+            channel = _Channel(request=request, history=deque(maxlen=self._replay_size))
+            self._channels[request.cache_key] = channel
+            # The loop outlives this subscriber, so it must not inherit the request's
+            # context (and with it the client its fetches would be charged to)
+            channel.task = asyncio.create_task(
+                self._refresh_loop(channel), context=contextvars.Context()
+            )
+
+        queue: asyncio.Queue[WeatherUpdate] = asyncio.Queue(maxsize=self._queue_size)
+        for update in self._backlog(channel, last_event_id):
+            self._offer(queue, update)
+        channel.subscribers.add(queue)
+        try:
+            yield queue
+        finally:
+            channel.subscribers.discard(queue)
+            if not channel.subscribers:
+                await self._close_channel(request.cache_key)
+
+    @property
+    def channel_count(self) -> int:
+        """Return the number of locations with active subscribers."""
+        return len(self._channels)
+
+    async def close(self) -> None:
+        """Stop all refresh loops."""
+        for key in list(self._channels):
+            await self._close_channel(key)
+
+    def _backlog(self, channel: _Channel, last_event_id: int | None) -> list[WeatherUpdate]:
+        """Return the updates a new subscriber should receive first."""
+        if not channel.history:
+            return []
+        # Event ids restart with the process, so an id beyond the newest one was
+        # issued by an earlier process or another replica: resend the current state.
+        if last_event_id is None or last_event_id > channel.history[-1].event_id:
+            return [channel.history[-1]]
+        # Updates older than the replay window are gone; what is retained still
+        # ends with the current state, so the client converges either way.
+        return [update for update in channel.history if update.event_id > last_event_id]
+
+    async def _refresh_loop(self, channel: _Channel) -> None:
+        """Poll the use case and publish whenever the weather data changes."""
+        while True:
+            try:
+                result = await self._use_case.execute(channel.request)
+            except WeatherAppError as e:
+                self._logger.warning(
+                    "Live update refresh failed",
+                    cache_key=channel.request.cache_key,
+                    code=e.code,
+                    error=e.message,
+                )
+            else:
+                if result.weather_data != channel.last_data:
+                    channel.last_data = result.weather_data
+                    self._publish(channel, WeatherUpdate(next(self._event_ids), result))
+            await asyncio.sleep(self._poll_interval)
+
+    def _publish(self, channel: _Channel, update: WeatherUpdate) -> None:
+        """Record an update and hand it to every subscriber."""
+        channel.history.append(update)
+        for queue in channel.subscribers:
+            self._offer(queue, update)
+
+    @staticmethod
+    def _offer(queue: "asyncio.Queue[WeatherUpdate]", update: WeatherUpdate) -> None:
+        """Enqueue an update, dropping the oldest one for slow consumers."""
+        if queue.full():
+            queue.get_nowait()
+        queue.put_nowait(update)
+
+    async def _close_channel(self, key: str) -> None:
+        """Cancel a location's refresh loop and forget its state."""
+        channel = self._channels.pop(key, None)
+        if channel is None or channel.task is None:
+            return
+        channel.task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await channel.task
@@ -1,25 +1,51 @@
 """Domain layer exports."""
 
-from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.entities import (
+    AlertEvent,
+    AlertRule,
+    City,
+    Forecast,
+    ForecastPoint,
+    WeatherData,
+    WeatherRequest,
+)
 from src.domain.exceptions import (
+    AlertRuleNotFoundError,
     CacheError,
     CityNotFoundError,
     InvalidCityNameError,
+    JobNotFoundError,
     RateLimitExceededError,
     WeatherAppError,
     WeatherProviderError,
 )
-from src.domain.value_objects import Coordinates, UnitSystem
+from src.domain.value_objects import (
+    AlertDirection,
+    BoundingBox,
+    Coordinates,
+    UnitSystem,
+    WeatherMetric,
+)
 
 __all__ = [
+    "AlertDirection",
+    "AlertEvent",
+    "AlertRule",
+    "AlertRuleNotFoundError",
+    "BoundingBox",
     "CacheError",
+    "City",
     "CityNotFoundError",
+    "Forecast",
+    "ForecastPoint",
     "Coordinates",
     "InvalidCityNameError",
+    "JobNotFoundError",
     "RateLimitExceededError",
     "UnitSystem",
     "WeatherAppError",
     "WeatherData",
+    "WeatherMetric",
     "WeatherProviderError",
     "WeatherRequest",
 ]
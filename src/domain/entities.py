@@ -3,10 +3,10 @@
 from dataclasses import dataclass
 from datetime import datetime
 
-from src.domain.value_objects import Coordinates, UnitSystem
+from src.domain.value_objects import AlertDirection, Coordinates, UnitSystem, WeatherMetric
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeatherData:
     """Weather data entity representing current weather conditions."""
 
@@ -41,6 +41,10 @@ class WeatherData:
         """Return formatted location string."""
         return f"{self.city_name}, {self.country}"
 
+    def metric(self, metric: WeatherMetric) -> float:
+        """Return the value of a numeric observation."""
+        return float(getattr(self, metric.value))
+
     @property
     def easter_egg(self) -> str | None:
         """Easter-egg indicator derived from the provider's country code.
@@ -50,7 +54,49 @@ class WeatherData:
         return "zidane" if self.country == "FR" else None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
+class ForecastPoint:
+    """Forecast conditions for one time step."""
+
+    timestamp: datetime
+    temperature: float
+    feels_like: float
+    humidity: int
+    wind_speed: float
+    pressure: int
+    precipitation_probability: float
+    description: str
+    icon_code: str
+
+
+@dataclass(frozen=True, slots=True)
+class Forecast:
+    """Multi-day forecast for a location, ordered by time."""
+
+    city_name: str
+    country: str
+    coordinates: Coordinates
+    units: UnitSystem
+    utc_offset_seconds: int
+    points: tuple[ForecastPoint, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class City:
+    """A named populated place."""
+
+    name: str
+    country: str
+    coordinates: Coordinates
+    population: int = 0
+
+    @property
+    def location_display(self) -> str:
+        """Return formatted location string."""
+        return f"{self.name}, {self.country}"
+
+
+@dataclass(frozen=True, slots=True)
 class WeatherRequest:
     """Request entity for weather queries."""
 
@@ -78,3 +124,33 @@ class WeatherRequest:
             return f"weather:coords:{lat},{lon}:{self.units.value}"
         normalized_city = self.city.strip().lower()
         return f"weather:{normalized_city}:{self.units.value}"
+
+
+@dataclass(frozen=True, slots=True)
+class AlertRule:
+    """Threshold rule watching one metric at one location."""
+
+    id: str
+    request: WeatherRequest
+    metric: WeatherMetric
+    direction: AlertDirection
+    threshold: float
+    created_at: datetime
+    webhook_url: str | None = None
+
+    def is_met(self, value: float) -> bool:
+        """Return whether a value is on the triggering side of the threshold."""
+        if self.direction == AlertDirection.ABOVE:
+            return value > self.threshold
+        return value < self.threshold
+
+
+@dataclass(frozen=True, slots=True)
+class AlertEvent:
+    """Record of an alert rule firing."""
+
+    rule: AlertRule
+    value: float
+    previous_value: float | None
+    weather_data: WeatherData
+    triggered_at: datetime
@@ -64,3 +64,38 @@ class CacheError(WeatherAppError):
             message=f"Cache {operation} failed: {message}",
             code="CACHE_ERROR",
         )
+
+
+class JobNotFoundError(WeatherAppError):
+    """Raised when a bulk job id is unknown or has expired."""
+
+    def __init__(self, job_id: str) -> None:
+        self.job_id = job_id
+        super().__init__(
+            message=f"Job not found: {job_id}",
+            code="JOB_NOT_FOUND",
+        )
+
+
+class JobQueueFullError(WeatherAppError):
+    """Raised when too many bulk jobs are already queued or running."""
+
+    def __init__(self, max_jobs: int, retry_after_seconds: int = 30) -> None:
+        self.max_jobs = max_jobs
+        self.retry_after_seconds = retry_after_seconds
+        super().__init__(
+            message=f"Too many bulk jobs in progress (maximum {max_jobs}). "
+            f"Retry after {retry_after_seconds} seconds.",
+            code="JOB_QUEUE_FULL",
+        )
+
+
+class AlertRuleNotFoundError(WeatherAppError):
+    """Raised when an alert rule id is unknown."""
+
+    def __init__(self, rule_id: str) -> None:
+        self.rule_id = rule_id
+        super().__init__(
+            message=f"Alert rule not found: {rule_id}",
+            code="ALERT_RULE_NOT_FOUND",
+        )
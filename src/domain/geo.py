@@ -0,0 +1,146 @@
+"""Geodesic helpers for the Weather App domain."""
+
+import math
+
+from src.domain.value_objects import Coordinates
+
+# Mean Earth radius in kilometres
+EARTH_RADIUS_KM = 6371.0088
+
+
+def haversine_km(a: Coordinates, b: Coordinates) -> float:
+    """Return the great-circle distance between two points in kilometres."""
+    lat1, lat2 = math.radians(a.latitude), math.radians(b.latitude)
+    d_lat = lat2 - lat1
+    d_lon = math.radians(b.longitude - a.longitude)
+    h = math.sin(d_lat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(d_lon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(h)))
+
+
+def decode_polyline(encoded: str, precision: int = 5) -> list[Coordinates]:
+    """Decode an encoded polyline (Google polyline algorithm).
+
+    Args:
+        encoded: The encoded polyline string.
+        precision: Number of decimal places encoded (5 for Google, 6 for OSRM).
+
+    Returns:
+        The decoded points.
+
+    Raises:
+        ValueError: If the string is not a valid encoded polyline.
+    """
+    factor = 10**precision
+    points: list[Coordinates] = []
+    index = lat = lon = 0
+    while index < len(encoded):
+        deltas = []
+        for _ in range(2):
+            shift = result = 0
+            while True:
+                if index >= len(encoded):
+                    msg = "Truncated polyline"
+                    raise ValueError(msg)
+                byte = ord(encoded[index]) - 63
+                index += 1
+                if not 0 <= byte < 64:
+                    msg = f"Invalid polyline character at position {index - 1}"
+                    raise ValueError(msg)
+                result |= (byte & 0x1F) << shift
+                shift += 5
+                if byte < 0x20:
+                    break
+            deltas.append(~(result >> 1) if result & 1 else result >> 1)
+        lat += deltas[0]
+        lon += deltas[1]
+        points.append(Coordinates(latitude=lat / factor, longitude=lon / factor))
+    return points
+
+
+def encode_polyline(points: list[Coordinates], precision: int = 5) -> str:
+    """Encode points as a polyline string (Google polyline algorithm).
+
+    Args:
+        points: The points to encode.
+        precision: Number of decimal places to encode.
+
+    Returns:
+        The encoded polyline.
+    """
+    factor = 10**precision
+    chunks: list[str] = []
+    prev_lat = prev_lon = 0
+    for point in points:
+        lat = round(point.latitude * factor)
+        lon = round(point.longitude * factor)
+        for delta in (lat - prev_lat, lon - prev_lon):
+            value = ~(delta << 1) if delta < 0 else delta << 1
+            while value >= 0x20:
+                chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+                value >>= 5
+            chunks.append(chr(value + 63))
+        prev_lat, prev_lon = lat, lon
+    return "".join(chunks)
+
+
+def polyline_length_km(points: list[Coordinates]) -> float:
+    """Return the length of a polyline in kilometres."""
+    return sum(haversine_km(start, end) for start, end in zip(points, points[1:], strict=False))
+
+
+def count_polyline_samples(points: list[Coordinates], spacing_km: float) -> int:
+    """Return how many samples ``sample_polyline`` would produce, without building them.
+
+    Args:
+        points: The polyline vertices.
+        spacing_km: Distance between consecutive samples.
+
+    Returns:
+        The number of samples.
+    """
+    if not points:
+        return 0
+    length = polyline_length_km(points)
+    regular = math.floor(length / spacing_km) + 1
+    return regular + 1 if length > (regular - 1) * spacing_km else regular
+
+
+def sample_polyline(
+    points: list[Coordinates], spacing_km: float
+) -> list[tuple[float, Coordinates]]:
+    """Sample points along a polyline at a fixed spacing.
+
+    The first and last vertices are always included. Check the size with
+    ``count_polyline_samples`` first: a long line at a small spacing yields
+    a very large number of samples.
+
+    Args:
+        points: The polyline vertices.
+        spacing_km: Distance between consecutive samples.
+
+    Returns:
+        ``(distance_km, point)`` pairs ordered along the line.
+    """
+    if not points:
+        return []
+    samples = [(0.0, points[0])]
+    travelled = 0.0
+    step = 1
+    for start, end in zip(points, points[1:], strict=False):
+        length = haversine_km(start, end)
+        while length > 0 and step * spacing_km <= travelled + length:
+            fraction = (step * spacing_km - travelled) / length
+            samples.append((step * spacing_km, _interpolate(start, end, fraction)))
+            step += 1
+        travelled += length
+    if travelled > samples[-1][0]:
+        samples.append((travelled, points[-1]))
+    return samples
+
+
+def _interpolate(start: Coordinates, end: Coordinates, fraction: float) -> Coordinates:
+    """Linearly interpolate between two nearby points."""
+    return Coordinates(
+        latitude=start.latitude + (end.latitude - start.latitude) * fraction,
+        longitude=start.longitude + (end.longitude - start.longitude) * fraction,
+    )
@@ -11,7 +11,25 @@ class UnitSystem(StrEnum):
     IMPERIAL = "imperial"  # Fahrenheit
 
 
-@dataclass(frozen=True)
+class WeatherMetric(StrEnum):
+    """Numeric weather observations that can be compared or aggregated."""
+
+    TEMPERATURE = "temperature"
+    FEELS_LIKE = "feels_like"
+    HUMIDITY = "humidity"
+    WIND_SPEED = "wind_speed"
+    PRESSURE = "pressure"
+    VISIBILITY = "visibility"
+
+
+class AlertDirection(StrEnum):
+    """Direction in which an alert threshold must be crossed."""
+
+    ABOVE = "above"  # Fires when the value rises above the threshold
+    BELOW = "below"  # Fires when the value drops below the threshold
+
+
+@dataclass(frozen=True, slots=True)
 class Coordinates:
     """Geographic coordinates value object."""
 
@@ -30,3 +48,25 @@ class Coordinates:
     def __str__(self) -> str:
         """Return human-readable coordinate string."""
         return f"({self.latitude:.4f}, {self.longitude:.4f})"
+
+
+@dataclass(frozen=True, slots=True)
+class BoundingBox:
+    """Geographic bounding box value object."""
+
+    south: float
+    west: float
+    north: float
+    east: float
+
+    def __post_init__(self) -> None:
+        """Validate the box corners."""
+        # Reuse the coordinate range checks for both corners
+        Coordinates(latitude=self.south, longitude=self.west)
+        Coordinates(latitude=self.north, longitude=self.east)
+        if self.south >= self.north:
+            msg = f"South ({self.south}) must be less than north ({self.north})"
+            raise ValueError(msg)
+        if self.west >= self.east:
+            msg = f"West ({self.west}) must be less than east ({self.east})"
+            raise ValueError(msg)
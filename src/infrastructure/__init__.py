@@ -1,15 +1,63 @@
 """Infrastructure layer exports."""
 
-from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.async_cache import AsyncCacheAdapter
+from src.infrastructure.cache import InMemoryCache, SnapshotStreamReader
+from src.infrastructure.cache_snapshot import CacheSnapshotter
 from src.infrastructure.config import Settings, get_settings
+from src.infrastructure.frequency_sketch import FrequencySketch
+from src.infrastructure.gazetteer import load_city_list, load_gazetteer
+from src.infrastructure.history import (
+    AggregatedSeries,
+    ObservationHistoryStore,
+    ObservationSeries,
+)
+from src.infrastructure.jobs import BulkJob, BulkWeatherJobManager, JobStatus
 from src.infrastructure.logging import StructlogAdapter, configure_logging
+from src.infrastructure.peers import ConsistentHashRing, PeerCacheWarmer, PeerWeatherProvider
+from src.infrastructure.rate_limit import (
+    ClientBudgetedWeatherProvider,
+    RateLimitedWeatherProvider,
+    SlidingWindowLimiter,
+    TokenBucket,
+)
+from src.infrastructure.redis_cache import RedisCache
+from src.infrastructure.shm_cache import SharedMemoryCache
+from src.infrastructure.sqlite_cache import SQLiteCache
+from src.infrastructure.tiered_cache import SharedTieredCache, TieredCache
 from src.infrastructure.weather_provider import OpenWeatherMapClient
+from src.infrastructure.webhooks import WebhookBatch, WebhookDispatcher
 
 __all__ = [
+    "AggregatedSeries",
+    "AsyncCacheAdapter",
+    "BulkJob",
+    "BulkWeatherJobManager",
+    "CacheSnapshotter",
+    "ClientBudgetedWeatherProvider",
+    "ConsistentHashRing",
+    "FrequencySketch",
     "InMemoryCache",
+    "JobStatus",
+    "ObservationHistoryStore",
+    "ObservationSeries",
     "OpenWeatherMapClient",
+    "PeerCacheWarmer",
+    "PeerWeatherProvider",
+    "RateLimitedWeatherProvider",
+    "RedisCache",
+    "SQLiteCache",
     "Settings",
+    "SharedMemoryCache",
+    "SharedTieredCache",
+    "SlidingWindowLimiter",
+    "SnapshotStreamReader",
     "StructlogAdapter",
+    "TieredCache",
+    "TokenBucket",
+    "WebhookBatch",
+    "WebhookDispatcher",
     "configure_logging",
     "get_settings",
+    "load_city_list",
+    "load_gazetteer",
 ]
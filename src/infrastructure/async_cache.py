@@ -0,0 +1,90 @@
+"""Adapter exposing a synchronous cache backend through the async CachePort."""
+
+import asyncio
+from collections.abc import Callable, Mapping, Sequence
+from typing import ParamSpec, TypeVar
+
+from src.application.interfaces import CachePort, SyncCachePort
+from src.domain.entities import WeatherData
+
+_P = ParamSpec("_P")
+_T = TypeVar("_T")
+
+
+class AsyncCacheAdapter(CachePort):
+    """Serve ``CachePort`` calls from a ``SyncCachePort`` backend.
+
+    Purely in-memory backends answer in microseconds and are called inline;
+    a thread hop would cost more than the lookup. Backends that may touch
+    disk or the network are run in the default thread pool with
+    ``offload=True`` so a slow call never stalls other requests.
+    """
+
+    def __init__(self, cache: SyncCachePort, offload: bool = False) -> None:
+        """Initialize the adapter.
+
+        Args:
+            cache: The synchronous backend.
+            offload: Run backend calls in a worker thread instead of inline.
+        """
+        self._cache = cache
+        self._offload = offload
+
+    async def get(self, key: str) -> WeatherData | None:
+        """Retrieve cached weather data.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData or None if not found/expired.
+        """
+        return await self._call(self._cache.get, key)
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, WeatherData]:
+        """Retrieve cached weather data for several keys at once.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData of each key that was found and not expired.
+        """
+        return await self._call(self._cache.get_many, keys)
+
+    async def set(self, key: str, value: WeatherData, ttl_seconds: int) -> None:
+        """Store weather data in cache.
+
+        Args:
+            key: The cache key.
+            value: The WeatherData to cache.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        await self._call(self._cache.set, key, value, ttl_seconds)
+
+    async def set_many(self, items: Mapping[str, WeatherData], ttl_seconds: int) -> None:
+        """Store several entries with the same TTL at once.
+
+        Args:
+            items: WeatherData to cache by cache key.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        await self._call(self._cache.set_many, items, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry from cache.
+
+        Args:
+            key: The cache key to delete.
+        """
+        await self._call(self._cache.delete, key)
+
+    async def clear(self) -> None:
+        """Clear all cached entries."""
+        await self._call(self._cache.clear)
+
+    async def _call(self, func: Callable[_P, _T], *args: _P.args, **kwargs: _P.kwargs) -> _T:
+        """Run a backend call inline or in a worker thread."""
+        if self._offload:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        return func(*args, **kwargs)
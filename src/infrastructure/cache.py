@@ -1,14 +1,31 @@
 """In-memory TTL cache implementation."""
 
+import mmap
+import os
+import struct
+from collections import OrderedDict
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
+from pathlib import Path
 from threading import Lock
+from typing import Literal
 
-from src.application.interfaces import CachePort
+from src.application.interfaces import SyncCachePort
 from src.domain.entities import WeatherData
+from src.infrastructure.cache_codec import decode_entry, encode_entry, entry_expiry
+from src.infrastructure.frequency_sketch import FrequencySketch
 
+_SNAPSHOT_MAGIC = b"WXCACHE2"
+# Magic, entry count
+_SNAPSHOT_HEADER = struct.Struct("<8sI")
+# Key length, cold record length (cold records are ``encode_entry`` output)
+_RECORD_HEADER = struct.Struct("<HI")
+# Small caches still get enough sketch counters to keep collisions rare
+_MIN_SKETCH_WIDTH = 1024
 
-@dataclass
+
+@dataclass(slots=True)
 class CacheEntry:
     """Cache entry with expiration time."""
 
@@ -16,13 +33,59 @@ class CacheEntry:
     expires_at: datetime
 
 
-class InMemoryCache(CachePort):
-    """Thread-safe in-memory cache with TTL support."""
+class InMemoryCache(SyncCachePort):
+    """Thread-safe in-memory cache with TTL support.
 
-    def __init__(self) -> None:
-        """Initialize the cache."""
-        self._store: dict[str, CacheEntry] = {}
+    Entries live in one of two segments. The hot segment holds recently used
+    entries as WeatherData objects. Once it grows past ``hot_entries``, the
+    least recently used entries are demoted to the cold segment, where each
+    is a single bytes object of its expiry and packed fields (about 140 bytes
+    instead of roughly 800 for the objects). A cold entry is decoded back
+    into the hot segment when it is read.
+
+    Snapshots store cold records as they are, and restored entries start
+    out cold, so a restart never decodes entries nobody asks for.
+
+    With the ``tinylfu`` admission policy, a full cache records every lookup
+    in a frequency sketch and only stores a new key if it has been requested
+    more often than the entry it would evict. One-off keys from scans then
+    cannot push popular locations out.
+    """
+
+    def __init__(
+        self,
+        max_entries: int | None = None,
+        hot_entries: int | None = None,
+        admission: Literal["lru", "tinylfu"] = "lru",
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Entries kept in total before the least recently used
+                is evicted; unbounded by default.
+            hot_entries: Entries kept decoded before the least recently used
+                are packed into the cold segment; all by default.
+            admission: ``lru`` admits every new key; ``tinylfu`` admits a new
+                key into a full cache only if it is estimated to be requested
+                more often than the eviction victim. Needs ``max_entries``.
+        """
+        self._max_entries = max_entries
+        self._hot_entries = hot_entries
+        self._store: OrderedDict[str, CacheEntry] = OrderedDict()
+        # Ordered by demotion or restore time, oldest first
+        self._cold: dict[str, bytes] = {}
         self._lock = Lock()
+        self._sketch = (
+            FrequencySketch(max(max_entries, _MIN_SKETCH_WIDTH))
+            if admission == "tinylfu" and max_entries is not None
+            else None
+        )
+        self.admission = admission
+        self.demotions = 0
+        self.promotions = 0
+        self.hits = 0
+        self.misses = 0
+        self.rejections = 0
 
     def get(self, key: str) -> WeatherData | None:
         """Retrieve cached weather data if not expired.
@@ -33,17 +96,39 @@ class InMemoryCache(CachePort):
         Returns:
             Cached WeatherData or None if not found/expired.
         """
+        hit = self.get_with_ttl(key)
+        return hit[0] if hit is not None else None
+
+    def get_with_ttl(self, key: str) -> tuple[WeatherData, float] | None:
+        """Retrieve cached weather data and its remaining TTL if not expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData and remaining seconds, or None if not found/expired.
+        """
         with self._lock:
-            entry = self._store.get(key)
-            if entry is None:
-                return None
+            return self._lookup(key, datetime.now(UTC))
 
-            if datetime.now(UTC) > entry.expires_at:
-                # Entry expired, remove it
-                del self._store[key]
-                return None
+    def get_many_with_ttl(self, keys: Sequence[str]) -> dict[str, tuple[WeatherData, float]]:
+        """Retrieve cached weather data and remaining TTLs for several keys.
 
-            return entry.value
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData and remaining seconds of each key that was
+            found and not expired.
+        """
+        found = {}
+        with self._lock:
+            now = datetime.now(UTC)
+            for key in keys:
+                hit = self._lookup(key, now)
+                if hit is not None:
+                    found[key] = hit
+        return found
 
     def set(self, key: str, value: WeatherData, ttl_seconds: int) -> None:
         """Store weather data with TTL.
@@ -53,9 +138,20 @@ class InMemoryCache(CachePort):
             value: The WeatherData to cache.
             ttl_seconds: Time-to-live in seconds.
         """
+        with self._lock:
+            self._store_entry(key, value, datetime.now(UTC) + timedelta(seconds=ttl_seconds))
+
+    def set_many(self, items: Mapping[str, WeatherData], ttl_seconds: int) -> None:
+        """Store several entries with the same TTL.
+
+        Args:
+            items: WeatherData to cache by cache key.
+            ttl_seconds: Time-to-live in seconds.
+        """
         with self._lock:
             expires_at = datetime.now(UTC) + timedelta(seconds=ttl_seconds)
-            self._store[key] = CacheEntry(value=value, expires_at=expires_at)
+            for key, value in items.items():
+                self._store_entry(key, value, expires_at)
 
     def delete(self, key: str) -> None:
         """Remove an entry from cache.
@@ -65,11 +161,13 @@ class InMemoryCache(CachePort):
         """
         with self._lock:
             self._store.pop(key, None)
+            self._cold.pop(key, None)
 
     def clear(self) -> None:
         """Clear all cached entries."""
         with self._lock:
             self._store.clear()
+            self._cold.clear()
 
     def cleanup_expired(self) -> int:
         """Remove all expired entries.
@@ -82,10 +180,313 @@ class InMemoryCache(CachePort):
             expired_keys = [key for key, entry in self._store.items() if now > entry.expires_at]
             for key in expired_keys:
                 del self._store[key]
-            return len(expired_keys)
+            timestamp = now.timestamp()
+            expired_cold = [
+                key for key, record in self._cold.items() if timestamp > entry_expiry(record)
+            ]
+            for key in expired_cold:
+                del self._cold[key]
+            return len(expired_keys) + len(expired_cold)
+
+    def save_snapshot(self, path: Path) -> int:
+        """Write every unexpired entry to a binary snapshot file.
+
+        The file is written next to ``path`` and moved into place, so a crash
+        mid-write never leaves a truncated snapshot behind.
+
+        Args:
+            path: Destination file.
+
+        Returns:
+            Number of entries written.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Per-process name, so concurrent writers never interleave in one file
+        tmp_path = path.with_suffix(f"{path.suffix}.{os.getpid()}.tmp")
+        chunks = self.snapshot_chunks()
+        with tmp_path.open("wb") as f:
+            header = next(chunks)
+            f.write(header)
+            for chunk in chunks:
+                f.write(chunk)
+        tmp_path.replace(path)
+        return int(_SNAPSHOT_HEADER.unpack(header)[1])
+
+    def snapshot_chunks(self, chunk_size: int = 65_536) -> Iterator[bytes]:
+        """Yield a snapshot of every unexpired entry in chunks of about ``chunk_size``.
+
+        The entries are collected under the lock once; encoding and yielding
+        happen outside it, so the snapshot can be streamed to a slow reader.
+        The first chunk is the snapshot header.
+
+        Args:
+            chunk_size: Bytes to gather before yielding a chunk.
+
+        Yields:
+            The snapshot, in the format ``load_snapshot`` reads.
+        """
+        now = datetime.now(UTC)
+        timestamp = now.timestamp()
+        with self._lock:
+            hot = [(key, entry) for key, entry in self._store.items() if entry.expires_at > now]
+            cold = [
+                (key, record)
+                for key, record in self._cold.items()
+                if entry_expiry(record) > timestamp
+            ]
+
+        yield _SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, len(hot) + len(cold))
+        chunk = bytearray()
+        for key, record in [*((key, _pack(entry)) for key, entry in hot), *cold]:
+            encoded_key = key.encode("utf-8")
+            chunk += _RECORD_HEADER.pack(len(encoded_key), len(record))
+            chunk += encoded_key
+            chunk += record
+            if len(chunk) >= chunk_size:
+                yield bytes(chunk)
+                chunk.clear()
+        if chunk:
+            yield bytes(chunk)
+
+    def load_snapshot(self, path: Path) -> int:
+        """Restore entries from a snapshot written by ``save_snapshot``.
+
+        The file is memory-mapped and walked record by record. Expired
+        records are skipped after reading their expiry, the others are copied
+        into the cold segment as they are, and keys already present in the
+        cache are kept.
+
+        Args:
+            path: Snapshot file.
+
+        Returns:
+            Number of entries restored.
+
+        Raises:
+            ValueError: If the file is not a valid snapshot.
+        """
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            try:
+                restored = self._read_snapshot(mapped)
+            except struct.error as e:
+                msg = f"Truncated cache snapshot: {path}"
+                raise ValueError(msg) from e
+        return self.restore_records(restored.items())
+
+    def restore_records(self, records: Iterable[tuple[str, bytes]]) -> int:
+        """Add snapshot records to the cold segment, keeping keys already cached.
+
+        Args:
+            records: Keys and their ``encode_entry`` records, e.g. from a
+                ``SnapshotStreamReader``.
+
+        Returns:
+            Number of entries added.
+        """
+        with self._lock:
+            added = 0
+            for key, record in records:
+                if key not in self._store and key not in self._cold:
+                    self._cold[key] = record
+                    added += 1
+            self._rebalance()
+        return added
 
     @property
     def size(self) -> int:
         """Return the number of entries in cache."""
+        with self._lock:
+            return len(self._store) + len(self._cold)
+
+    @property
+    def hit_ratio(self) -> float:
+        """Return the share of lookups served from cache, 0 before any lookup."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def hot_size(self) -> int:
+        """Return the number of decoded entries."""
         with self._lock:
             return len(self._store)
+
+    @property
+    def cold_size(self) -> int:
+        """Return the number of packed entries."""
+        with self._lock:
+            return len(self._cold)
+
+    @staticmethod
+    def _read_snapshot(buffer: mmap.mmap) -> dict[str, bytes]:
+        """Return the unexpired cold records of a snapshot by key."""
+        if len(buffer) < _SNAPSHOT_HEADER.size:
+            msg = "Cache snapshot is too short"
+            raise ValueError(msg)
+        magic, count = _SNAPSHOT_HEADER.unpack_from(buffer)
+        if magic != _SNAPSHOT_MAGIC:
+            msg = "Not a cache snapshot"
+            raise ValueError(msg)
+
+        now = datetime.now(UTC).timestamp()
+        restored: dict[str, bytes] = {}
+        offset = _SNAPSHOT_HEADER.size
+        for _ in range(count):
+            key_length, record_length = _RECORD_HEADER.unpack_from(buffer, offset)
+            offset += _RECORD_HEADER.size
+            record_offset = offset + key_length
+            end = record_offset + record_length
+            if end > len(buffer):
+                msg = "Truncated cache snapshot record"
+                raise ValueError(msg)
+            if entry_expiry(buffer, record_offset) > now:
+                key = buffer[offset:record_offset].decode("utf-8")
+                restored[key] = buffer[record_offset:end]
+            offset = end
+        return restored
+
+    def _lookup(self, key: str, now: datetime) -> tuple[WeatherData, float] | None:
+        """Return an unexpired entry and its remaining TTL, counting the lookup."""
+        if self._sketch is not None:
+            self._sketch.increment(key)
+        entry = self._store.get(key)
+        if entry is None:
+            entry = self._promote(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+        remaining = (entry.expires_at - now).total_seconds()
+        if remaining < 0:
+            # Entry expired, remove it
+            del self._store[key]
+            self.misses += 1
+            return None
+
+        self._store.move_to_end(key)
+        self.hits += 1
+        return entry.value, remaining
+
+    def _store_entry(self, key: str, value: WeatherData, expires_at: datetime) -> None:
+        """Insert or replace a hot entry unless the admission policy refuses it."""
+        if not self._admit(key):
+            self.rejections += 1
+            return
+        self._store[key] = CacheEntry(value=value, expires_at=expires_at)
+        self._store.move_to_end(key)
+        self._cold.pop(key, None)
+        self._rebalance()
+
+    def _admit(self, key: str) -> bool:
+        """Return whether a write of ``key`` may displace the next eviction victim."""
+        if (
+            self._sketch is None
+            or self._max_entries is None
+            or key in self._store
+            or key in self._cold
+            or len(self._store) + len(self._cold) < self._max_entries
+        ):
+            return True
+        if self._cold:
+            victim = next(iter(self._cold))
+            if entry_expiry(self._cold[victim]) < datetime.now(UTC).timestamp():
+                return True
+        else:
+            victim = next(iter(self._store))
+            if self._store[victim].expires_at < datetime.now(UTC):
+                return True
+        return self._sketch.estimate(key) > self._sketch.estimate(victim)
+
+    def _rebalance(self) -> None:
+        """Demote hot entries past ``hot_entries`` and evict past ``max_entries``."""
+        if self._hot_entries is not None:
+            while len(self._store) > self._hot_entries:
+                key, entry = self._store.popitem(last=False)
+                self._cold[key] = _pack(entry)
+                self.demotions += 1
+        if self._max_entries is not None:
+            while len(self._store) + len(self._cold) > self._max_entries:
+                if self._cold:
+                    del self._cold[next(iter(self._cold))]
+                else:
+                    self._store.popitem(last=False)
+
+    def _promote(self, key: str) -> CacheEntry | None:
+        """Decode a cold entry into the hot segment."""
+        record = self._cold.pop(key, None)
+        if record is None:
+            return None
+        try:
+            data, expires_at = decode_entry(record)
+        except (struct.error, ValueError):
+            return None
+        entry = CacheEntry(value=data, expires_at=datetime.fromtimestamp(expires_at, UTC))
+        self._store[key] = entry
+        self.promotions += 1
+        self._rebalance()
+        return entry
+
+
+class SnapshotStreamReader:
+    """Parse a snapshot incrementally, as its bytes arrive over a stream.
+
+    Lets a replica restore a peer's cache while it is still downloading,
+    without holding the whole snapshot in memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the reader before the snapshot header."""
+        self._buffer = bytearray()
+        self._remaining: int | None = None
+
+    @property
+    def finished(self) -> bool:
+        """Return whether every record announced by the header has been read."""
+        return self._remaining == 0
+
+    def feed(self, data: bytes) -> list[tuple[str, bytes]]:
+        """Consume the next bytes of the snapshot.
+
+        Args:
+            data: The next chunk of the stream.
+
+        Returns:
+            The unexpired records completed by this chunk, by key.
+
+        Raises:
+            ValueError: If the stream is not a snapshot or has extra bytes.
+        """
+        buffer = self._buffer
+        buffer += data
+        offset = 0
+        if self._remaining is None:
+            if len(buffer) < _SNAPSHOT_HEADER.size:
+                return []
+            magic, self._remaining = _SNAPSHOT_HEADER.unpack_from(buffer)
+            if magic != _SNAPSHOT_MAGIC:
+                msg = "Not a cache snapshot"
+                raise ValueError(msg)
+            offset = _SNAPSHOT_HEADER.size
+
+        now = datetime.now(UTC).timestamp()
+        records = []
+        while self._remaining and len(buffer) - offset >= _RECORD_HEADER.size:
+            key_length, record_length = _RECORD_HEADER.unpack_from(buffer, offset)
+            record_offset = offset + _RECORD_HEADER.size + key_length
+            end = record_offset + record_length
+            if end > len(buffer):
+                break
+            if entry_expiry(buffer, record_offset) > now:
+                key = buffer[offset + _RECORD_HEADER.size : record_offset].decode("utf-8")
+                records.append((key, bytes(buffer[record_offset:end])))
+            offset = end
+            self._remaining -= 1
+        del buffer[:offset]
+        if self._remaining == 0 and buffer:
+            msg = "Unexpected bytes after the last snapshot record"
+            raise ValueError(msg)
+        return records
+
+
+def _pack(entry: CacheEntry) -> bytes:
+    """Encode an entry as a cold record."""
+    return encode_entry(entry.value, entry.expires_at.timestamp())
@@ -0,0 +1,168 @@
+"""Compact binary encoding of cached weather observations."""
+
+import mmap
+import struct
+from datetime import UTC, datetime
+
+from src.domain.entities import WeatherData
+from src.domain.value_objects import Coordinates, UnitSystem
+
+# timestamp, latitude, longitude, temperature, feels_like, wind_speed,
+# humidity, pressure, visibility, units, then four string lengths
+_FIXED = struct.Struct("<6d3iB4H")
+# An entry is its expiry (Unix seconds) followed by the encoded observation
+_EXPIRY = struct.Struct("<d")
+_UNITS = tuple(UnitSystem)
+_UNIT_CODES = {unit: code for code, unit in enumerate(_UNITS)}
+
+
+def encode_weather(data: WeatherData) -> bytes:
+    """Serialize an observation to bytes.
+
+    The numeric fields are packed in one fixed-width struct followed by the
+    UTF-8 strings, so a typical entry takes about 100 bytes.
+
+    Args:
+        data: The observation.
+
+    Returns:
+        The encoded observation.
+    """
+    strings = [
+        data.city_name.encode("utf-8"),
+        data.country.encode("utf-8"),
+        data.description.encode("utf-8"),
+        data.icon_code.encode("utf-8"),
+    ]
+    return _FIXED.pack(
+        data.timestamp.timestamp(),
+        data.coordinates.latitude,
+        data.coordinates.longitude,
+        data.temperature,
+        data.feels_like,
+        data.wind_speed,
+        data.humidity,
+        data.pressure,
+        data.visibility,
+        _UNIT_CODES[data.units],
+        *(len(s) for s in strings),
+    ) + b"".join(strings)
+
+
+def decode_weather(
+    buffer: bytes | memoryview, offset: int = 0, strings: dict[bytes, str] | None = None
+) -> tuple[WeatherData, int]:
+    """Deserialize an observation written by ``encode_weather``.
+
+    Args:
+        buffer: Bytes holding the encoded observation.
+        offset: Position of the observation in ``buffer``.
+        strings: Optional memo of already decoded strings. Sharing one memo
+            across many records decodes each distinct name once and makes
+            the records share the string objects.
+
+    Returns:
+        The observation and the offset just past it.
+
+    Raises:
+        struct.error: If the buffer is truncated.
+        ValueError: If the bytes are not a valid observation.
+    """
+    (
+        timestamp,
+        latitude,
+        longitude,
+        temperature,
+        feels_like,
+        wind_speed,
+        humidity,
+        pressure,
+        visibility,
+        units,
+        *lengths,
+    ) = _FIXED.unpack_from(buffer, offset)
+    offset += _FIXED.size
+    if units >= len(_UNITS):
+        msg = f"Unknown unit system code {units}"
+        raise ValueError(msg)
+    end = offset + sum(lengths)
+    if end > len(buffer):
+        msg = "Truncated weather record"
+        raise ValueError(msg)
+    raw = bytes(buffer[offset:end])
+    memo = {} if strings is None else strings
+    fields = []
+    position = 0
+    for length in lengths:
+        value = raw[position : position + length]
+        text = memo.get(value)
+        if text is None:
+            text = memo[value] = value.decode("utf-8")
+        fields.append(text)
+        position += length
+    city_name, country, description, icon_code = fields
+    return (
+        WeatherData(
+            city_name=city_name,
+            country=country,
+            coordinates=Coordinates(latitude=latitude, longitude=longitude),
+            temperature=temperature,
+            feels_like=feels_like,
+            humidity=humidity,
+            wind_speed=wind_speed,
+            pressure=pressure,
+            visibility=visibility,
+            description=description,
+            icon_code=icon_code,
+            units=_UNITS[units],
+            timestamp=datetime.fromtimestamp(timestamp, UTC),
+        ),
+        end,
+    )
+
+
+def encode_entry(data: WeatherData, expires_at: float) -> bytes:
+    """Serialize a cache entry: its expiry followed by the observation.
+
+    Args:
+        data: The observation.
+        expires_at: Expiry as a Unix timestamp.
+
+    Returns:
+        The encoded entry.
+    """
+    return _EXPIRY.pack(expires_at) + encode_weather(data)
+
+
+def entry_expiry(buffer: bytes | memoryview | mmap.mmap, offset: int = 0) -> float:
+    """Read the expiry of an entry written by ``encode_entry`` without decoding it.
+
+    Args:
+        buffer: Bytes holding the encoded entry.
+        offset: Position of the entry in ``buffer``.
+
+    Returns:
+        Expiry as a Unix timestamp.
+
+    Raises:
+        struct.error: If the buffer is truncated.
+    """
+    expires_at: float = _EXPIRY.unpack_from(buffer, offset)[0]
+    return expires_at
+
+
+def decode_entry(buffer: bytes | memoryview) -> tuple[WeatherData, float]:
+    """Deserialize an entry written by ``encode_entry``.
+
+    Args:
+        buffer: Bytes holding exactly one encoded entry.
+
+    Returns:
+        The observation and its expiry as a Unix timestamp.
+
+    Raises:
+        struct.error: If the buffer is truncated.
+        ValueError: If the bytes are not a valid entry.
+    """
+    data, _ = decode_weather(buffer, _EXPIRY.size)
+    return data, entry_expiry(buffer)
@@ -0,0 +1,98 @@
+"""Periodic persistence of the in-memory cache across restarts."""
+
+import asyncio
+import contextlib
+import time
+from pathlib import Path
+
+from src.application.interfaces import LoggerPort
+from src.infrastructure.cache import InMemoryCache
+
+
+class CacheSnapshotter:
+    """Save the cache to disk periodically and on shutdown, and reload it on startup.
+
+    A new replica then starts with the entries its predecessor fetched
+    instead of sending every first request upstream.
+    """
+
+    def __init__(
+        self,
+        cache: InMemoryCache,
+        logger: LoggerPort,
+        path: Path,
+        interval_seconds: float = 300.0,
+    ) -> None:
+        """Initialize the snapshotter.
+
+        Args:
+            cache: The cache to persist.
+            logger: The logger implementation.
+            path: Snapshot file.
+            interval_seconds: Time between periodic snapshots; 0 only saves on close.
+        """
+        self._cache = cache
+        self._logger = logger
+        self._path = path
+        self._interval = interval_seconds
+        self._task: asyncio.Task[None] | None = None
+
+    def restore(self) -> int:
+        """Load the last snapshot into the cache.
+
+        A missing or unreadable snapshot leaves the cache as it is.
+
+        Returns:
+            Number of entries restored.
+        """
+        if not self._path.exists():
+            return 0
+        started = time.perf_counter()
+        try:
+            restored = self._cache.load_snapshot(self._path)
+        except (OSError, ValueError) as e:
+            self._logger.warning(
+                "Cache snapshot could not be restored", path=str(self._path), error=str(e)
+            )
+            return 0
+        self._logger.info(
+            "Cache snapshot restored",
+            entries=restored,
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        return restored
+
+    async def start(self) -> None:
+        """Restore the last snapshot and start saving periodically."""
+        self.restore()
+        if self._interval > 0 and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def save(self) -> int:
+        """Write a snapshot now without blocking the event loop.
+
+        Returns:
+            Number of entries written, or 0 if the write failed.
+        """
+        try:
+            saved = await asyncio.to_thread(self._cache.save_snapshot, self._path)
+        except OSError as e:
+            self._logger.error("Cache snapshot failed", path=str(self._path), error=str(e))
+            return 0
+        self._logger.debug("Cache snapshot saved", entries=saved)
+        return saved
+
+    async def close(self) -> None:
+        """Stop the periodic task and write a final snapshot."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.save()
+
+    async def _run(self) -> None:
+        """Save a snapshot every interval."""
+        while True:
+            await asyncio.sleep(self._interval)
+            await self.save()
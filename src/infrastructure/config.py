@@ -1,9 +1,10 @@
 """Application configuration using pydantic-settings."""
 
 from functools import lru_cache
+from pathlib import Path
 from typing import Literal
 
-from pydantic import Field
+from pydantic import Field, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -34,6 +35,387 @@ class Settings(BaseSettings):
         le=3600,
         description="Cache TTL in seconds (15 minutes default)",
     )
+    cache_max_entries: int | None = Field(
+        default=100_000,
+        ge=1,
+        description="Entries kept in the in-memory cache before the least recently used "
+        "is evicted; unbounded if unset, which requires the lru admission policy",
+    )
+    cache_hot_entries: int | None = Field(
+        default=10_000,
+        ge=1,
+        description="Recently used cache entries kept decoded; the rest are packed "
+        "into a compact cold segment until read. All are kept decoded if unset",
+    )
+    cache_admission: Literal["lru", "tinylfu"] = Field(
+        default="tinylfu",
+        description="Admission policy of a full in-memory cache: lru admits every new "
+        "key, tinylfu only keys requested more often than the entry they would evict",
+    )
+
+    # Cache second tier
+    cache_l2_backend: Literal["none", "sqlite", "shm", "redis"] = Field(
+        default="none",
+        description="Second cache tier consulted on in-memory misses: a local SQLite "
+        "database, shared memory used by every worker on the host, or a Redis server "
+        "shared by every replica",
+    )
+    cache_l2_sqlite_path: Path | None = Field(
+        default=None,
+        description="Database file of the SQLite cache tier; <data_dir>/cache.sqlite3 if unset",
+    )
+    cache_l2_batch_size: int = Field(
+        default=500,
+        ge=1,
+        le=100_000,
+        description="Buffered L2 writes that trigger an immediate commit",
+    )
+    cache_l2_flush_interval_seconds: float = Field(
+        default=0.5,
+        ge=0.01,
+        le=60.0,
+        description="Longest an L2 write waits before it is committed",
+    )
+    cache_l2_cleanup_interval_seconds: float = Field(
+        default=300.0,
+        ge=1.0,
+        le=86400.0,
+        description="Time between deletions of expired L2 entries",
+    )
+    cache_l2_shm_name: str = Field(
+        default="weatherapp-cache",
+        description="Name of the shared-memory segment of the shm cache tier",
+    )
+    cache_l2_shm_slots: int = Field(
+        default=65_536,
+        ge=1,
+        le=16_777_216,
+        description="Entries the shared-memory cache tier can hold",
+    )
+    cache_l2_shm_slot_size: int = Field(
+        default=256,
+        ge=64,
+        le=65_536,
+        description="Bytes per shared-memory slot, key and packed observation included",
+    )
+    cache_l2_redis_url: str = Field(
+        default="redis://localhost:6379/0",
+        description="URL of the Redis cache tier, redis://[:password@]host[:port][/db]",
+    )
+    cache_l2_redis_pool_size: int = Field(
+        default=10,
+        ge=1,
+        le=1000,
+        description="Maximum open connections to the Redis cache tier",
+    )
+    cache_l2_redis_timeout_seconds: float = Field(
+        default=0.25,
+        gt=0,
+        le=30.0,
+        description="Longest wait for a Redis round trip before it counts as a miss",
+    )
+    cache_l2_redis_key_prefix: str = Field(
+        default="weatherapp:",
+        description="Prefix of every key written to the Redis cache tier",
+    )
+
+    # Cache snapshots
+    cache_snapshot_enabled: bool = Field(
+        default=True,
+        description="Save the cache periodically and on shutdown, and restore it on startup",
+    )
+    cache_snapshot_path: Path | None = Field(
+        default=None,
+        description="File the cache is saved to and restored from across restarts; "
+        "<data_dir>/cache.snapshot if unset",
+    )
+    cache_snapshot_interval_seconds: float = Field(
+        default=300.0,
+        ge=0.0,
+        le=86400.0,
+        description="Time between periodic cache snapshots; 0 only saves on shutdown",
+    )
+
+    # Cache warm-up
+    cache_warmup_cities: list[str] = Field(
+        default_factory=list,
+        description="Cities loaded into the cache on startup, as a JSON list",
+    )
+    cache_warmup_file: Path | None = Field(
+        default=None,
+        description="File of cities loaded into the cache on startup, one per line, "
+        "after cache_warmup_cities",
+    )
+    cache_warmup_units: Literal["metric", "imperial"] = Field(
+        default="metric",
+        description="Unit system of the warmed cache entries",
+    )
+    cache_warmup_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Warm-up cities fetched at the same time",
+    )
+    cache_warmup_ready_fraction: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=1.0,
+        description="Share of warm-up cities loaded before serving traffic; 0 warms "
+        "in the background",
+    )
+    cache_warmup_timeout_seconds: float = Field(
+        default=60.0,
+        gt=0,
+        le=3600.0,
+        description="Longest startup waits for the ready fraction",
+    )
+
+    # Upstream budget
+    upstream_requests_per_minute: int = Field(
+        default=60,
+        ge=1,
+        le=100_000,
+        description="Sustained OpenWeatherMap call budget shared by all requests",
+    )
+    upstream_burst: int = Field(
+        default=10,
+        ge=1,
+        le=10_000,
+        description="Upstream calls allowed in a burst above the sustained rate",
+    )
+    upstream_max_wait_seconds: float = Field(
+        default=5.0,
+        ge=0.0,
+        le=60.0,
+        description="Longest a request may queue for upstream budget before a 429",
+    )
+
+    # Inbound per-client budgets
+    client_requests_per_minute: int = Field(
+        default=600,
+        ge=0,
+        le=65_535,
+        description="API requests one client may make per sliding minute; 0 disables",
+    )
+    client_misses_per_minute: int = Field(
+        default=60,
+        ge=0,
+        le=65_535,
+        description="Cache misses (upstream fetches) one client may cause per sliding "
+        "minute; 0 disables",
+    )
+    client_api_key_header: str = Field(
+        default="X-API-Key",
+        description="Header identifying a client by one of client_api_keys",
+    )
+    client_api_keys: list[str] = Field(
+        default_factory=list,
+        description="API keys given a budget of their own, as a JSON list; requests "
+        "without one of them (or with none configured) are keyed by IP",
+    )
+    client_proxy_hops: int = Field(
+        default=0,
+        ge=0,
+        le=10,
+        description="Trusted proxies appending to X-Forwarded-For; the client IP is "
+        "read that many entries from the end (0 uses the connection's address)",
+    )
+
+    # Gazetteer, autocomplete and coordinate snapping
+    gazetteer_path: Path | None = Field(
+        default=None,
+        description="CSV of cities (name,country,latitude,longitude,population); "
+        "the bundled gazetteer by default",
+    )
+    autocomplete_max_learned: int = Field(
+        default=10_000,
+        ge=0,
+        le=1_000_000,
+        description="City names learned from provider responses kept for autocomplete",
+    )
+    coordinate_snap_max_distance_km: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=200.0,
+        description="Coordinate requests within this distance of a gazetteer city are "
+        "served from that city's cache entry; 0 disables snapping",
+    )
+
+    # Batch lookups (grids, routes, comparisons)
+    batch_max_concurrency: int = Field(
+        default=8,
+        ge=1,
+        le=64,
+        description="Maximum concurrent lookups issued by a single batch request",
+    )
+    route_max_samples: int = Field(
+        default=500,
+        ge=2,
+        le=5000,
+        description="Maximum number of samples a single route request may produce",
+    )
+
+    # Forecasts
+    forecast_cache_ttl_seconds: int = Field(
+        default=1800,
+        ge=60,
+        le=86400,
+        description="How long one upstream forecast per location is reused",
+    )
+    forecast_cache_max_entries: int = Field(
+        default=1000,
+        ge=1,
+        le=1_000_000,
+        description="Maximum number of locations whose forecast is cached",
+    )
+
+    # Durable data
+    data_dir: Path = Field(
+        default=Path("data"),
+        description="Directory for data that must survive restarts: bulk jobs, "
+        "observation history, the webhook spool, the cache snapshot and the SQLite "
+        "cache tier, unless given their own paths",
+    )
+
+    # Bulk jobs
+    jobs_dir: Path | None = Field(
+        default=None,
+        description="Directory where bulk job uploads and results are stored; "
+        "<data_dir>/jobs if unset",
+    )
+    jobs_workers: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Concurrent rows processed per bulk job",
+    )
+    jobs_max_rows: int = Field(
+        default=100_000,
+        ge=1,
+        le=1_000_000,
+        description="Maximum data rows accepted in one bulk job upload",
+    )
+    jobs_retention_seconds: int = Field(
+        default=86_400,
+        ge=60,
+        description="How long finished bulk job results remain downloadable",
+    )
+    jobs_max_active: int = Field(
+        default=4,
+        ge=1,
+        le=256,
+        description="Bulk jobs allowed to be queued or running at once; further uploads get 503",
+    )
+
+    # Live updates (Server-Sent Events)
+    sse_poll_interval_seconds: float = Field(
+        default=30.0,
+        ge=1.0,
+        le=900.0,
+        description="Delay between cache checks for each streamed location",
+    )
+    sse_heartbeat_seconds: float = Field(
+        default=15.0,
+        ge=1.0,
+        le=120.0,
+        description="Idle time after which a heartbeat comment is sent to SSE clients",
+    )
+
+    # Alerts
+    alert_history_size: int = Field(
+        default=20,
+        ge=1,
+        le=1000,
+        description="Number of recent events kept per alert rule",
+    )
+
+    # Observation history
+    history_dir: Path | None = Field(
+        default=None,
+        description="Directory holding the per-location observation history files; "
+        "<data_dir>/history if unset",
+    )
+    history_capacity: int = Field(
+        default=4096,
+        ge=16,
+        le=1_000_000,
+        description="Observations kept per location before the oldest is overwritten",
+    )
+    history_max_open_files: int = Field(
+        default=256,
+        ge=1,
+        le=65536,
+        description="Observation history files kept memory-mapped at once",
+    )
+
+    # Webhooks
+    webhook_spool_dir: Path | None = Field(
+        default=None,
+        description="Directory persisting undelivered webhook batches across restarts; "
+        "<data_dir>/webhooks if unset",
+    )
+    webhook_batch_size: int = Field(
+        default=50,
+        ge=1,
+        le=1000,
+        description="Maximum events per webhook POST",
+    )
+    webhook_batch_interval_seconds: float = Field(
+        default=1.0,
+        ge=0.0,
+        le=60.0,
+        description="Longest an event waits for its webhook batch to fill",
+    )
+    webhook_max_connections: int = Field(
+        default=100,
+        ge=1,
+        le=1000,
+        description="Connection pool size shared by all webhook destinations",
+    )
+    webhook_max_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=64,
+        description="Concurrent webhook POSTs per destination URL",
+    )
+    webhook_max_attempts: int = Field(
+        default=8,
+        ge=1,
+        le=50,
+        description="Delivery attempts before a webhook batch is dead-lettered",
+    )
+
+    # Peer cache
+    peer_urls: list[str] = Field(
+        default_factory=list,
+        description="Base URLs of every replica, this one included, as a JSON list; "
+        "each location is then fetched upstream only by the replica that owns it",
+    )
+    peer_self_url: str | None = Field(
+        default=None,
+        description="This replica's base URL, exactly as listed in peer_urls",
+    )
+    peer_token: str | None = Field(
+        default=None,
+        description="Shared secret authenticating requests between peers",
+    )
+    peer_timeout_seconds: float = Field(
+        default=1.0,
+        gt=0,
+        le=30.0,
+        description="Longest wait for a peer before fetching upstream instead",
+    )
+    peer_warmup_url: str | None = Field(
+        default=None,
+        description="Base URL of a running replica whose cache is copied on startup, "
+        "before this one serves traffic",
+    )
+    peer_warmup_timeout_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        le=600.0,
+        description="Longest the startup cache copy may take",
+    )
 
     # Logging
     log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = Field(
@@ -41,6 +423,61 @@ class Settings(BaseSettings):
         description="Logging level",
     )
 
+    # Server (production launcher)
+    server_host: str = Field(
+        default="0.0.0.0",
+        description="Interface the production server listens on",
+    )
+    server_port: int = Field(
+        default=8000,
+        ge=1,
+        le=65_535,
+        description="Port the production server listens on",
+    )
+    server_workers: int = Field(
+        default=1,
+        ge=0,
+        le=256,
+        description="Worker processes forked by the production server; 0 uses one per "
+        "CPU allowed by the container's cgroup quota. Bulk jobs, alerts, live updates, "
+        "the webhook spool, observation history and rate limits are per process, so "
+        "they need a single worker",
+    )
+    server_backlog: int = Field(
+        default=2048,
+        ge=64,
+        le=65_535,
+        description="Listen backlog of the shared socket, absorbing connection bursts",
+    )
+    server_keepalive_seconds: float = Field(
+        default=65.0,
+        ge=1.0,
+        le=600.0,
+        description="Idle keep-alive timeout; keep above the load balancer's idle timeout",
+    )
+    server_gc_threshold: int = Field(
+        default=10_000,
+        ge=700,
+        le=1_000_000,
+        description="Allocations between young-generation garbage collections in workers",
+    )
+    server_graceful_timeout_seconds: int = Field(
+        default=10,
+        ge=1,
+        le=300,
+        description="Longest a worker waits for open requests to complete on shutdown "
+        "before cancelling them",
+    )
+
+    # Shutdown
+    shutdown_drain_timeout_seconds: float = Field(
+        default=10.0,
+        ge=0.0,
+        le=300.0,
+        description="Longest shutdown waits for in-flight upstream fetches to finish "
+        "and be cached before abandoning them",
+    )
+
     # HTTP Client
     http_timeout_seconds: float = Field(
         default=10.0,
@@ -61,6 +498,14 @@ class Settings(BaseSettings):
         description="API version prefix",
     )
 
+    @model_validator(mode="after")
+    def _check_cache_admission(self) -> "Settings":
+        """Reject tinylfu admission on a cache that never evicts."""
+        if self.cache_admission == "tinylfu" and self.cache_max_entries is None:
+            msg = "cache_admission 'tinylfu' requires cache_max_entries to be set"
+            raise ValueError(msg)
+        return self
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,86 @@
+"""Count-min sketch estimating how often cache keys are requested."""
+
+from collections.abc import Hashable
+
+# Counters saturate here, as in TinyLFU's 4-bit counters
+_MAX_COUNT = 15
+# Translation table halving every byte, used to age all counters at once
+_HALVE = bytes(value >> 1 for value in range(256))
+_HASH_MASK = (1 << 64) - 1
+
+
+class FrequencySketch:
+    """Approximate request counts of recently seen keys in fixed memory.
+
+    Each key maps to one counter in each of ``depth`` rows, and its estimate
+    is the smallest of those counters, so collisions can only overestimate.
+    After ``sample_size`` increments every counter is halved, which ages out
+    keys that were popular once but no longer are.
+    """
+
+    def __init__(self, width: int, depth: int = 4, sample_size: int | None = None) -> None:
+        """Initialize the sketch.
+
+        Args:
+            width: Counters per row; rounded up to a power of two. Use about
+                the number of entries the cache holds.
+            depth: Number of rows (independent hash functions).
+            sample_size: Increments between agings; ten times the width by default.
+
+        Raises:
+            ValueError: If width or depth is not positive.
+        """
+        if width < 1 or depth < 1:
+            msg = f"Sketch width and depth must be positive, got {width}x{depth}"
+            raise ValueError(msg)
+        self._width = 1 << max(width - 1, 1).bit_length()
+        self._mask = self._width - 1
+        self._depth = depth
+        self._table = bytearray(self._width * depth)
+        self._sample_size = sample_size or 10 * self._width
+        self._additions = 0
+        self.agings = 0
+
+    def increment(self, key: Hashable) -> None:
+        """Record one request for a key.
+
+        Args:
+            key: The requested key.
+        """
+        table = self._table
+        added = False
+        for index in self._indexes(key):
+            if table[index] < _MAX_COUNT:
+                table[index] += 1
+                added = True
+        if added:
+            self._additions += 1
+            if self._additions >= self._sample_size:
+                self._age()
+
+    def estimate(self, key: Hashable) -> int:
+        """Return the estimated recent request count of a key.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            Estimated count, at most 15.
+        """
+        table = self._table
+        return min(table[index] for index in self._indexes(key))
+
+    def _indexes(self, key: Hashable) -> list[int]:
+        """Return the counter of the key in each row (double hashing)."""
+        hashed = hash(key) & _HASH_MASK
+        low = hashed & 0xFFFF_FFFF
+        # Odd, so the rows probe distinct columns
+        high = (hashed >> 32) | 1
+        width, mask = self._width, self._mask
+        return [row * width + ((low + row * high) & mask) for row in range(self._depth)]
+
+    def _age(self) -> None:
+        """Halve every counter."""
+        self._table = bytearray(self._table.translate(_HALVE))
+        self._additions //= 2
+        self.agings += 1
@@ -0,0 +1,66 @@
+"""Loaders for the bundled city gazetteer and plain city lists."""
+
+import csv
+from pathlib import Path
+
+from src.domain.entities import City
+from src.domain.value_objects import Coordinates
+
+BUNDLED_GAZETTEER = Path(__file__).parent / "data" / "cities.csv"
+
+
+def load_gazetteer(path: Path | None = None) -> list[City]:
+    """Read cities from a gazetteer CSV.
+
+    The file has a header row and the columns ``name``, ``country``,
+    ``latitude``, ``longitude`` and ``population``.
+
+    Args:
+        path: CSV to read; the bundled gazetteer by default.
+
+    Returns:
+        The cities in file order.
+
+    Raises:
+        ValueError: If a row has a missing or malformed field.
+    """
+    path = path or BUNDLED_GAZETTEER
+    cities = []
+    with path.open(newline="", encoding="utf-8") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            try:
+                cities.append(
+                    City(
+                        name=row["name"].strip(),
+                        country=row["country"].strip().upper(),
+                        coordinates=Coordinates(
+                            latitude=float(row["latitude"]), longitude=float(row["longitude"])
+                        ),
+                        population=int(row["population"] or 0),
+                    )
+                )
+            except (KeyError, TypeError, ValueError) as e:
+                msg = f"Invalid gazetteer row {line} in {path}: {e}"
+                raise ValueError(msg) from e
+    return cities
+
+
+def load_city_list(path: Path) -> list[str]:
+    """Read a plain list of city names, one per line.
+
+    Blank lines and lines starting with ``#`` are skipped. A name may carry
+    a country code the way the provider accepts it, e.g. ``London,GB``.
+
+    Args:
+        path: Text file to read.
+
+    Returns:
+        The city names in file order, without duplicates.
+    """
+    names = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            name = line.strip()
+            if name and not name.startswith("#"):
+                names.append(name)
+    return list(dict.fromkeys(names))
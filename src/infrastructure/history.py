@@ -0,0 +1,318 @@
+"""Memory-mapped columnar history of fetched observations."""
+
+import hashlib
+import struct
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from src.application.interfaces import LoggerPort, WeatherObserverPort
+from src.domain.entities import WeatherData
+from src.domain.value_objects import WeatherMetric
+
+# Fixed-width on-disk type of every column; the timestamp is Unix seconds
+COLUMN_DTYPES: dict[str, str] = {
+    "timestamp": "<i8",
+    WeatherMetric.TEMPERATURE.value: "<f4",
+    WeatherMetric.FEELS_LIKE.value: "<f4",
+    WeatherMetric.HUMIDITY.value: "<i2",
+    WeatherMetric.WIND_SPEED.value: "<f4",
+    WeatherMetric.PRESSURE.value: "<i4",
+    WeatherMetric.VISIBILITY.value: "<i4",
+}
+
+_MAGIC = b"WXHIST01"
+# Magic, capacity, reserved, total appended count, label length
+_HEADER = struct.Struct("<8sIIQH")
+_HEADER_SIZE = 256
+_LABEL_OFFSET = _HEADER.size
+_MAX_LABEL_BYTES = _HEADER_SIZE - _LABEL_OFFSET
+_COUNT_OFFSET = 16
+_LABEL_LENGTH_OFFSET = 24
+
+_Array = npt.NDArray[Any]
+
+
+@dataclass(frozen=True)
+class ObservationSeries:
+    """Observations of one location in a time range, oldest first."""
+
+    location: str
+    timestamps: npt.NDArray[np.int64]
+    columns: dict[WeatherMetric, npt.NDArray[np.float64]]
+
+
+@dataclass(frozen=True)
+class AggregatedSeries:
+    """Observations reduced to fixed-width time buckets."""
+
+    location: str
+    bucket_seconds: int
+    bucket_starts: npt.NDArray[np.int64]
+    counts: npt.NDArray[np.int64]
+    minimum: dict[WeatherMetric, npt.NDArray[np.float64]]
+    maximum: dict[WeatherMetric, npt.NDArray[np.float64]]
+    mean: dict[WeatherMetric, npt.NDArray[np.float64]]
+
+
+class _RingFile:
+    """Fixed-capacity columnar ring buffer stored in one memory-mapped file.
+
+    Layout: a 256-byte header followed by one contiguous array per column,
+    each ``capacity`` entries long.
+    """
+
+    def __init__(self, path: Path, capacity: int) -> None:
+        if not path.exists():
+            self._create(path, capacity)
+        self._map = np.memmap(path, dtype=np.uint8, mode="r+")
+        magic, capacity, _, _, _ = _HEADER.unpack(bytes(self._map[: _HEADER.size]))
+        if magic != _MAGIC:
+            msg = f"Not an observation history file: {path}"
+            raise ValueError(msg)
+        self.capacity: int = capacity
+        self._count = self._map[_COUNT_OFFSET : _COUNT_OFFSET + 8].view("<u8")
+        self._label_length = self._map[_LABEL_LENGTH_OFFSET : _LABEL_LENGTH_OFFSET + 2].view("<u2")
+        self.columns: dict[str, _Array] = {}
+        offset = _HEADER_SIZE
+        for name, dtype in COLUMN_DTYPES.items():
+            size = capacity * np.dtype(dtype).itemsize
+            self.columns[name] = self._map[offset : offset + size].view(dtype)
+            offset += size
+
+    @staticmethod
+    def _create(path: Path, capacity: int) -> None:
+        """Write an empty, zero-filled file."""
+        size = _HEADER_SIZE + sum(capacity * np.dtype(t).itemsize for t in COLUMN_DTYPES.values())
+        tmp_path = path.with_suffix(".tmp")
+        with tmp_path.open("wb") as f:
+            f.write(_HEADER.pack(_MAGIC, capacity, 0, 0, 0))
+            f.truncate(size)
+        tmp_path.replace(path)
+
+    @property
+    def count(self) -> int:
+        """Return the number of observations ever appended."""
+        return int(self._count[0])
+
+    @property
+    def label(self) -> str:
+        """Return the human-readable location name."""
+        length = int(self._label_length[0])
+        return bytes(self._map[_LABEL_OFFSET : _LABEL_OFFSET + length]).decode("utf-8")
+
+    def append(self, weather_data: WeatherData) -> bool:
+        """Append an observation unless it is not newer than the last one."""
+        timestamp = int(weather_data.timestamp.timestamp())
+        count = self.count
+        timestamps = self.columns["timestamp"]
+        if count and timestamp <= timestamps[(count - 1) % self.capacity]:
+            return False
+
+        position = count % self.capacity
+        timestamps[position] = timestamp
+        for metric in WeatherMetric:
+            self.columns[metric.value][position] = weather_data.metric(metric)
+        self._set_label(weather_data.location_display)
+        # Publish the row only once every column has been written
+        self._count[0] = count + 1
+        return True
+
+    def read(self, start: int, end: int) -> tuple[_Array, dict[str, _Array]]:
+        """Return the rows with ``start <= timestamp <= end``, oldest first.
+
+        Each sorted segment of the ring is binary searched on the timestamp
+        column, so only the pages holding the selected rows are touched.
+        """
+        count, capacity = self.count, self.capacity
+        head = count % capacity
+        segments = [(0, count)] if count <= capacity else [(head, capacity), (0, head)]
+
+        slices: list[slice] = []
+        timestamps = self.columns["timestamp"]
+        for lo, hi in segments:
+            segment = timestamps[lo:hi]
+            first = lo + int(np.searchsorted(segment, start, side="left"))
+            last = lo + int(np.searchsorted(segment, end, side="right"))
+            if first < last:
+                slices.append(slice(first, last))
+
+        def gather(column: _Array) -> _Array:
+            if not slices:
+                return np.empty(0, dtype=column.dtype)
+            return np.concatenate([column[s] for s in slices])
+
+        return gather(timestamps), {
+            name: gather(column) for name, column in self.columns.items() if name != "timestamp"
+        }
+
+    def flush(self) -> None:
+        """Write dirty pages back to disk."""
+        self._map.flush()
+
+    def _set_label(self, label: str) -> None:
+        """Store the location name if it changed."""
+        encoded = label.encode("utf-8")[:_MAX_LABEL_BYTES]
+        if encoded == self.label.encode("utf-8"):
+            return
+        self._map[_LABEL_OFFSET : _LABEL_OFFSET + len(encoded)] = np.frombuffer(
+            encoded, dtype=np.uint8
+        )
+        self._label_length[0] = len(encoded)
+
+
+class ObservationHistoryStore(WeatherObserverPort):
+    """Keep every fetched observation in per-location ring buffers on disk.
+
+    Each location (cache key) gets one memory-mapped file of fixed-width
+    columns, so appends are a handful of memory writes and range queries
+    binary search the timestamp column instead of loading the file. Only the
+    most recently used files stay mapped.
+    """
+
+    def __init__(
+        self,
+        logger: LoggerPort,
+        history_dir: Path,
+        capacity: int = 4096,
+        max_open_files: int = 256,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            logger: The logger implementation.
+            history_dir: Directory holding one file per location.
+            capacity: Observations kept per location before the oldest is overwritten.
+            max_open_files: Number of location files kept mapped at once.
+        """
+        self._logger = logger
+        self._dir = history_dir
+        self._capacity = capacity
+        self._max_open = max_open_files
+        self._files: OrderedDict[str, _RingFile] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def on_weather_refreshed(self, cache_key: str, weather_data: WeatherData) -> None:
+        """Append a fresh observation to its location's history."""
+        with self._lock:
+            ring = self._open(cache_key, create=True)
+            if ring is not None:
+                ring.append(weather_data)
+
+    def query(
+        self,
+        cache_key: str,
+        start: datetime,
+        end: datetime,
+        metrics: list[WeatherMetric] | None = None,
+    ) -> ObservationSeries:
+        """Return the raw observations of a location in a time range.
+
+        Args:
+            cache_key: The location's cache key.
+            start: Inclusive range start.
+            end: Inclusive range end.
+            metrics: Columns to return; all metrics by default.
+
+        Returns:
+            The observations, oldest first (empty if the location is unknown).
+        """
+        metrics = metrics or list(WeatherMetric)
+        with self._lock:
+            ring = self._open(cache_key, create=False)
+            if ring is None:
+                return ObservationSeries(
+                    location="",
+                    timestamps=np.empty(0, dtype=np.int64),
+                    columns={metric: np.empty(0) for metric in metrics},
+                )
+            timestamps, columns = ring.read(int(start.timestamp()), int(end.timestamp()))
+            label = ring.label
+        return ObservationSeries(
+            location=label,
+            timestamps=timestamps.astype(np.int64),
+            columns={metric: columns[metric.value].astype(np.float64) for metric in metrics},
+        )
+
+    def aggregate(
+        self,
+        cache_key: str,
+        start: datetime,
+        end: datetime,
+        bucket_seconds: int,
+        metrics: list[WeatherMetric] | None = None,
+    ) -> AggregatedSeries:
+        """Return min, max and mean per time bucket for a location.
+
+        Buckets are aligned on ``start``; empty buckets are omitted.
+
+        Args:
+            cache_key: The location's cache key.
+            start: Inclusive range start.
+            end: Inclusive range end.
+            bucket_seconds: Bucket width.
+            metrics: Columns to aggregate; all metrics by default.
+
+        Returns:
+            The aggregated series.
+        """
+        series = self.query(cache_key, start, end, metrics)
+        bucket_ids = (series.timestamps - int(start.timestamp())) // bucket_seconds
+        # Rows are time-ordered, so each bucket is one contiguous run
+        boundaries = np.flatnonzero(np.diff(bucket_ids)) + 1
+        starts = (
+            np.concatenate((np.zeros(1, np.intp), boundaries)) if bucket_ids.size else boundaries
+        )
+        counts = np.diff(np.append(starts, bucket_ids.size))
+
+        def reduce(ufunc: np.ufunc, values: _Array) -> npt.NDArray[np.float64]:
+            if not starts.size:
+                return np.empty(0)
+            result: npt.NDArray[np.float64] = ufunc.reduceat(values, starts)
+            return result
+
+        return AggregatedSeries(
+            location=series.location,
+            bucket_seconds=bucket_seconds,
+            bucket_starts=int(start.timestamp()) + bucket_ids[starts] * bucket_seconds,
+            counts=counts.astype(np.int64),
+            minimum={m: reduce(np.minimum, v) for m, v in series.columns.items()},
+            maximum={m: reduce(np.maximum, v) for m, v in series.columns.items()},
+            mean={m: reduce(np.add, v) / counts for m, v in series.columns.items()},
+        )
+
+    def close(self) -> None:
+        """Flush and unmap every open file."""
+        with self._lock:
+            for ring in self._files.values():
+                ring.flush()
+            self._files.clear()
+
+    def _open(self, cache_key: str, create: bool) -> _RingFile | None:
+        """Return the mapped file of a location, evicting the least recently used."""
+        ring = self._files.get(cache_key)
+        if ring is not None:
+            self._files.move_to_end(cache_key)
+            return ring
+
+        path = self._dir / f"{hashlib.sha1(cache_key.encode()).hexdigest()}.obs"
+        if not create and not path.exists():
+            return None
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            ring = _RingFile(path, self._capacity)
+        except (OSError, ValueError) as e:
+            self._logger.error("Cannot open observation history", path=str(path), error=str(e))
+            return None
+
+        self._files[cache_key] = ring
+        if len(self._files) > self._max_open:
+            _, evicted = self._files.popitem(last=False)
+            evicted.flush()
+        return ring
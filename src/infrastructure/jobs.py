@@ -0,0 +1,511 @@
+"""Disk-backed bulk weather lookup jobs."""
+
+import asyncio
+import contextlib
+import contextvars
+import csv
+import io
+import itertools
+import json
+import shutil
+import time
+import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from enum import StrEnum
+from pathlib import Path
+from typing import Any, TextIO
+
+from src.application.interfaces import LoggerPort
+from src.application.use_cases import GetWeatherUseCase
+from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.exceptions import (
+    JobNotFoundError,
+    JobQueueFullError,
+    RateLimitExceededError,
+    WeatherAppError,
+)
+from src.domain.value_objects import Coordinates, UnitSystem
+
+# Columns of the CSV result export, in order
+RESULT_COLUMNS = (
+    "row",
+    "id",
+    "status",
+    "error_code",
+    "error_message",
+    "city",
+    "country",
+    "latitude",
+    "longitude",
+    "temperature",
+    "feels_like",
+    "humidity",
+    "wind_speed",
+    "pressure",
+    "visibility",
+    "description",
+    "icon_code",
+    "units",
+    "timestamp",
+)
+
+_READ_CHUNK_BYTES = 64 * 1024
+# Upload rows read per trip to a worker thread
+_READ_BATCH_ROWS = 512
+# Longest CSV line accepted; bounds the buffer holding a partial line during upload
+_MAX_LINE_BYTES = 64 * 1024
+
+
+class JobStatus(StrEnum):
+    """Lifecycle states of a bulk job."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+@dataclass
+class BulkJob:
+    """Progress of a bulk weather job."""
+
+    id: str
+    units: UnitSystem
+    total_rows: int
+    directory: Path
+    status: JobStatus = JobStatus.PENDING
+    processed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    created_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    finished_at: datetime | None = None
+    error: str | None = None
+
+    @property
+    def input_path(self) -> Path:
+        """Return the path of the uploaded CSV."""
+        return self.directory / "input.csv"
+
+    @property
+    def output_path(self) -> Path:
+        """Return the path of the NDJSON results file."""
+        return self.directory / "results.ndjson"
+
+
+class BulkWeatherJobManager:
+    """Run large CSV location lists through GetWeatherUseCase in the background.
+
+    Uploads are streamed to disk, rows are read lazily by a fixed pool of
+    workers, and every result is appended to an NDJSON file as soon as it is
+    known, so memory use does not depend on the job size. File reads and
+    writes run in worker threads, so a large job does not stall the event
+    loop for other requests. Upstream pacing is left to the provider's token
+    bucket; rate-limited rows are retried.
+    """
+
+    def __init__(
+        self,
+        use_case: GetWeatherUseCase,
+        logger: LoggerPort,
+        jobs_dir: Path,
+        workers: int = 4,
+        max_rows: int = 100_000,
+        max_attempts: int = 5,
+        retention_seconds: float = 86_400,
+        max_active_jobs: int = 4,
+    ) -> None:
+        """Initialize the manager.
+
+        Args:
+            use_case: Use case resolving each row.
+            logger: The logger implementation.
+            jobs_dir: Directory holding one sub-directory per job.
+            workers: Concurrent rows per job.
+            max_rows: Maximum data rows accepted per upload.
+            max_attempts: Attempts per row when the upstream budget is exhausted.
+            retention_seconds: How long finished jobs stay downloadable.
+            max_active_jobs: Jobs allowed to be pending or running at once.
+        """
+        self._use_case = use_case
+        self._logger = logger
+        self._jobs_dir = jobs_dir
+        self._workers = workers
+        self._max_rows = max_rows
+        self._max_attempts = max_attempts
+        self._retention = retention_seconds
+        self._max_active = max_active_jobs
+        self._uploading = 0
+        self._jobs: dict[str, BulkJob] = {}
+        self._tasks: dict[str, asyncio.Task[None]] = {}
+
+    async def create_job(
+        self, chunks: AsyncIterable[bytes], units: UnitSystem = UnitSystem.METRIC
+    ) -> BulkJob:
+        """Store an uploaded CSV and start processing it.
+
+        Args:
+            chunks: The raw CSV upload, streamed.
+            units: Default unit system for rows without a ``units`` column value.
+
+        Returns:
+            The created job.
+
+        Raises:
+            ValueError: If the CSV header is unusable or the upload has too many rows.
+            JobQueueFullError: If ``max_active_jobs`` jobs are already in progress.
+        """
+        self._prune_finished()
+        # Uploads still streaming count too, so concurrent submissions cannot overshoot
+        active = self._uploading + sum(
+            job.status in (JobStatus.PENDING, JobStatus.RUNNING) for job in self._jobs.values()
+        )
+        if active >= self._max_active:
+            raise JobQueueFullError(self._max_active)
+        job_id = uuid.uuid4().hex
+        directory = self._jobs_dir / job_id
+        directory.mkdir(parents=True)
+        self._uploading += 1
+        try:
+            total_rows = await self._store_upload(chunks, directory / "input.csv")
+        except BaseException:
+            shutil.rmtree(directory, ignore_errors=True)
+            raise
+        finally:
+            self._uploading -= 1
+
+        job = BulkJob(id=job_id, units=units, total_rows=total_rows, directory=directory)
+        job.output_path.touch()
+        self._jobs[job_id] = job
+        # Rows are background work, not the uploader's requests: start the job in a
+        # fresh context so its fetches are not charged to the uploading client
+        self._tasks[job_id] = asyncio.create_task(self._run(job), context=contextvars.Context())
+        self._logger.info("Bulk job created", job_id=job_id, rows=total_rows)
+        return job
+
+    def get(self, job_id: str) -> BulkJob:
+        """Return a job by id.
+
+        Raises:
+            JobNotFoundError: If the job does not exist or has expired.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundError(job_id)
+        return job
+
+    async def wait(self, job_id: str) -> BulkJob:
+        """Wait until a job stops running and return it."""
+        job = self.get(job_id)
+        task = self._tasks.get(job_id)
+        if task is not None:
+            with contextlib.suppress(asyncio.CancelledError):
+                await asyncio.shield(task)
+        return job
+
+    async def iter_results(self, job_id: str, fmt: str = "ndjson") -> AsyncIterator[bytes]:
+        """Stream the results written so far.
+
+        Args:
+            job_id: The job id.
+            fmt: ``ndjson`` for the raw result lines or ``csv`` for a flat table.
+
+        Yields:
+            Encoded result chunks.
+
+        Raises:
+            JobNotFoundError: If the job does not exist.
+        """
+        job = self.get(job_id)
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=RESULT_COLUMNS, extrasaction="ignore")
+        if fmt == "csv":
+            writer.writeheader()
+        with job.output_path.open("r", encoding="utf-8") as source:
+            while lines := await asyncio.to_thread(source.readlines, _READ_CHUNK_BYTES):
+                partial = not lines[-1].endswith("\n")
+                if partial:
+                    # Still being written by the job; it will be in the next download
+                    lines.pop()
+                for line in lines:
+                    if fmt == "csv":
+                        writer.writerow(_flatten(json.loads(line)))
+                    else:
+                        buffer.write(line)
+                yield buffer.getvalue().encode()
+                buffer.seek(0)
+                buffer.truncate()
+                if partial:
+                    break
+        if buffer.tell():
+            yield buffer.getvalue().encode()
+
+    async def close(self) -> None:
+        """Cancel running jobs."""
+        for task in self._tasks.values():
+            task.cancel()
+        for task in list(self._tasks.values()):
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks.clear()
+        for job in self._jobs.values():
+            if job.status in (JobStatus.PENDING, JobStatus.RUNNING):
+                job.status = JobStatus.CANCELLED
+                job.finished_at = job.finished_at or datetime.now(UTC)
+
+    async def _store_upload(self, chunks: AsyncIterable[bytes], path: Path) -> int:
+        """Write an upload to disk, validating its header and counting data rows."""
+        rows = 0
+        header_checked = False
+        pending = b""
+        with path.open("wb") as target:
+            async for chunk in chunks:
+                await asyncio.to_thread(target.write, chunk)
+                pending += chunk
+                *lines, pending = pending.split(b"\n")
+                for line in lines:
+                    if not line.strip():
+                        continue
+                    if not header_checked:
+                        _validate_header(line)
+                        header_checked = True
+                        continue
+                    rows += 1
+                if rows > self._max_rows:
+                    msg = f"Upload exceeds the maximum of {self._max_rows} rows"
+                    raise ValueError(msg)
+                if len(pending) > _MAX_LINE_BYTES:
+                    msg = f"Upload has a line longer than {_MAX_LINE_BYTES} bytes"
+                    raise ValueError(msg)
+        if pending.strip():
+            if header_checked:
+                rows += 1
+            else:
+                _validate_header(pending)
+                header_checked = True
+        if not header_checked:
+            msg = "Upload is empty"
+            raise ValueError(msg)
+        if rows > self._max_rows:
+            msg = f"Upload exceeds the maximum of {self._max_rows} rows"
+            raise ValueError(msg)
+        return rows
+
+    async def _run(self, job: BulkJob) -> None:
+        """Process a job and record how it ended."""
+        job.status = JobStatus.RUNNING
+        started = time.perf_counter()
+        try:
+            await self._process(job)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # An unreadable upload or a bug must not leave the job running forever
+            job.status = JobStatus.FAILED
+            job.error = str(e) or type(e).__name__
+            self._logger.error(
+                "Bulk job failed",
+                job_id=job.id,
+                processed=job.processed,
+                error_type=type(e).__name__,
+                error=job.error,
+            )
+            return
+        finally:
+            job.finished_at = datetime.now(UTC)
+
+        job.status = JobStatus.COMPLETED
+        self._logger.info(
+            "Bulk job completed",
+            job_id=job.id,
+            rows=job.total_rows,
+            succeeded=job.succeeded,
+            failed=job.failed,
+            duration_s=round(time.perf_counter() - started, 2),
+        )
+
+    async def _process(self, job: BulkJob) -> None:
+        """Feed rows to the worker pool until every row has a result.
+
+        Rows are read in batches and results written by a single writer task,
+        both through ``asyncio.to_thread``.
+        """
+        rows: asyncio.Queue[tuple[int, dict[str, str]] | None] = asyncio.Queue(
+            maxsize=self._workers * 2
+        )
+        results: asyncio.Queue[str | None] = asyncio.Queue()
+        with job.input_path.open(newline="", encoding="utf-8-sig") as source, job.output_path.open(
+            "a", encoding="utf-8"
+        ) as output:
+            writer = asyncio.create_task(_write_results(results, output))
+            workers = [
+                asyncio.create_task(self._worker(job, rows, results)) for _ in range(self._workers)
+            ]
+            reader = _read_rows(source)
+            try:
+                while batch := await asyncio.to_thread(_next_batch, reader):
+                    for item in batch:
+                        await rows.put(item)
+                for _ in workers:
+                    await rows.put(None)
+                await asyncio.gather(*workers)
+            except BaseException:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+            finally:
+                # Let the writer store every finished row before the file is closed
+                results.put_nowait(None)
+                await writer
+
+    async def _worker(
+        self,
+        job: BulkJob,
+        rows: "asyncio.Queue[tuple[int, dict[str, str]] | None]",
+        results: "asyncio.Queue[str | None]",
+    ) -> None:
+        """Resolve queued rows and hand their result lines to the writer."""
+        while (item := await rows.get()) is not None:
+            index, row = item
+            record: dict[str, Any] = {"row": index, "id": row.get("id") or None}
+            try:
+                weather_data = await self._resolve(_row_request(row, job.units))
+            except ValueError as e:
+                record.update(status="error", error={"code": "INVALID_ROW", "message": str(e)})
+            except WeatherAppError as e:
+                record.update(status="error", error={"code": e.code, "message": e.message})
+            except Exception as e:
+                self._logger.error(
+                    "Bulk job row failed",
+                    job_id=job.id,
+                    row=index,
+                    error_type=type(e).__name__,
+                    error=str(e),
+                )
+                record.update(
+                    status="error",
+                    error={"code": "INTERNAL_ERROR", "message": "Unexpected error resolving row"},
+                )
+            else:
+                record.update(status="ok", weather=_weather_record(weather_data))
+
+            results.put_nowait(json.dumps(record, separators=(",", ":")) + "\n")
+            job.processed += 1
+            if record["status"] == "ok":
+                job.succeeded += 1
+            else:
+                job.failed += 1
+
+    async def _resolve(self, request: WeatherRequest) -> WeatherData:
+        """Run the use case, backing off while the upstream budget is exhausted."""
+        for attempt in range(1, self._max_attempts + 1):
+            try:
+                result = await self._use_case.execute(request)
+            except RateLimitExceededError as e:
+                if attempt == self._max_attempts:
+                    raise
+                await asyncio.sleep(e.retry_after_seconds)
+            else:
+                return result.weather_data
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def _prune_finished(self) -> None:
+        """Forget finished jobs older than the retention period and delete their files."""
+        now = datetime.now(UTC)
+        for job_id, job in list(self._jobs.items()):
+            if job.finished_at and (now - job.finished_at).total_seconds() > self._retention:
+                del self._jobs[job_id]
+                self._tasks.pop(job_id, None)
+                shutil.rmtree(job.directory, ignore_errors=True)
+
+
+def _validate_header(line: bytes) -> None:
+    """Check that a CSV header names a location column."""
+    columns = {column.strip().lower() for column in next(csv.reader([line.decode("utf-8-sig")]))}
+    if "city" not in columns and not {"lat", "lon"} <= columns:
+        msg = "CSV header must contain a 'city' column or 'lat' and 'lon' columns"
+        raise ValueError(msg)
+
+
+def _read_rows(source: TextIO) -> Iterator[tuple[int, dict[str, str]]]:
+    """Yield ``(row_number, row)`` pairs with lower-cased column names."""
+    reader = csv.reader(source)
+    header = [column.strip().lower() for column in next(row for row in reader if row)]
+    for index, values in enumerate(reader, start=1):
+        if any(value.strip() for value in values):
+            yield index, dict(zip(header, (value.strip() for value in values), strict=False))
+
+
+def _next_batch(
+    reader: Iterator[tuple[int, dict[str, str]]],
+) -> list[tuple[int, dict[str, str]]]:
+    """Return up to ``_READ_BATCH_ROWS`` rows; an empty list once the upload is read."""
+    return list(itertools.islice(reader, _READ_BATCH_ROWS))
+
+
+async def _write_results(results: "asyncio.Queue[str | None]", output: TextIO) -> None:
+    """Append queued result lines to ``output`` until ``None`` is queued."""
+    done = False
+    while not done:
+        lines = [await results.get()]
+        while not results.empty():
+            lines.append(results.get_nowait())
+        done = lines[-1] is None
+        text = "".join(line for line in lines if line is not None)
+        if text:
+            await asyncio.to_thread(_append, output, text)
+
+
+def _append(output: TextIO, text: str) -> None:
+    """Write and flush result lines, making them visible to downloads."""
+    output.write(text)
+    output.flush()
+
+
+def _row_request(row: dict[str, str], default_units: UnitSystem) -> WeatherRequest:
+    """Build a WeatherRequest from a CSV row.
+
+    Raises:
+        ValueError: If the row has no usable location or an unknown unit system.
+    """
+    units = UnitSystem(row["units"].lower()) if row.get("units") else default_units
+    if row.get("lat") and row.get("lon"):
+        coordinates = Coordinates(latitude=float(row["lat"]), longitude=float(row["lon"]))
+        return WeatherRequest(units=units, coordinates=coordinates)
+    return WeatherRequest(city=row.get("city", ""), units=units)
+
+
+def _weather_record(data: WeatherData) -> dict[str, Any]:
+    """Serialize weather data into a flat JSON-compatible mapping."""
+    return {
+        "city": data.city_name,
+        "country": data.country,
+        "latitude": data.coordinates.latitude,
+        "longitude": data.coordinates.longitude,
+        "temperature": data.temperature,
+        "feels_like": data.feels_like,
+        "humidity": data.humidity,
+        "wind_speed": data.wind_speed,
+        "pressure": data.pressure,
+        "visibility": data.visibility,
+        "description": data.description,
+        "icon_code": data.icon_code,
+        "units": data.units.value,
+        "timestamp": data.timestamp.isoformat(),
+    }
+
+
+def _flatten(record: dict[str, Any]) -> dict[str, Any]:
+    """Flatten an NDJSON result record into a CSV row."""
+    error = record.get("error") or {}
+    return {
+        "row": record["row"],
+        "id": record.get("id") or "",
+        "status": record["status"],
+        "error_code": error.get("code", ""),
+        "error_message": error.get("message", ""),
+        **(record.get("weather") or {}),
+    }
@@ -0,0 +1,314 @@
+"""Peer-to-peer weather cache: each location is fetched upstream by one owner replica."""
+
+import asyncio
+import bisect
+import hashlib
+import struct
+import time
+from collections.abc import Callable, Coroutine, Sequence
+from typing import Any
+
+import httpx
+
+from src.application.interfaces import LoggerPort, WeatherProviderPort
+from src.domain.entities import Forecast, WeatherData, WeatherRequest
+from src.domain.exceptions import CityNotFoundError, RateLimitExceededError
+from src.infrastructure.cache import InMemoryCache, SnapshotStreamReader
+from src.infrastructure.cache_codec import decode_weather
+
+PEER_TOKEN_HEADER = "X-Peer-Token"
+PEER_WEATHER_PATH = "/internal/peer/weather"
+PEER_CACHE_PATH = "/internal/peer/cache"
+# Streamed records restored per lock acquisition
+_RESTORE_BATCH = 1000
+
+
+class ConsistentHashRing:
+    """Map keys to nodes so that adding or removing a node moves few keys.
+
+    Each node is placed at ``virtual_nodes`` points on a 64-bit ring and a
+    key belongs to the first point at or after its hash. Every replica that
+    builds a ring from the same node list agrees on each key's owner, and a
+    change of one node only reassigns about ``1 / len(nodes)`` of the keys.
+    """
+
+    def __init__(self, nodes: Sequence[str], virtual_nodes: int = 160) -> None:
+        """Build the ring.
+
+        Args:
+            nodes: Node names, here the peers' base URLs.
+            virtual_nodes: Points per node; more points spread keys more evenly.
+
+        Raises:
+            ValueError: If there are no nodes or virtual_nodes is not positive.
+        """
+        if not nodes or virtual_nodes < 1:
+            msg = "A hash ring needs at least one node and one point per node"
+            raise ValueError(msg)
+        points = sorted(
+            (_hash(f"{node}#{index}"), node)
+            for node in set(nodes)
+            for index in range(virtual_nodes)
+        )
+        self._hashes = [point for point, _ in points]
+        self._owners = [node for _, node in points]
+        self.nodes = tuple(sorted(set(nodes)))
+
+    def owner(self, key: str) -> str:
+        """Return the node that owns a key.
+
+        Args:
+            key: The key, here a cache key.
+
+        Returns:
+            The owning node.
+        """
+        index = bisect.bisect_left(self._hashes, _hash(key))
+        return self._owners[index % len(self._owners)]
+
+
+class PeerWeatherProvider(WeatherProviderPort):
+    """Route observation fetches to the replica that owns each location.
+
+    The owner of a request's cache key is chosen on a consistent hash ring
+    over every replica's URL. Keys this replica owns are fetched from the
+    wrapped (upstream) provider; other keys are requested from their owner's
+    internal endpoint, which serves them from its cache or fetches them once.
+    Upstream calls per location therefore stay constant as the fleet grows.
+
+    Concurrent fetches of one key share a single call. If the owner cannot
+    be reached, the observation is fetched upstream here instead, so a dead
+    peer costs upstream budget rather than failed requests. Forecasts are not
+    shared and always come from the wrapped provider.
+    """
+
+    def __init__(
+        self,
+        provider: WeatherProviderPort,
+        peers: Sequence[str],
+        self_url: str,
+        token: str,
+        logger: LoggerPort,
+        timeout_seconds: float = 1.0,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            provider: Upstream provider used for the keys this replica owns.
+            peers: Base URLs of every replica, this one included.
+            self_url: This replica's base URL, as listed in ``peers``.
+            token: Shared secret sent to peers in the ``X-Peer-Token`` header.
+            logger: The logger implementation.
+            timeout_seconds: Longest wait for a peer's answer.
+            client: HTTP client for peer requests; one is created if omitted.
+
+        Raises:
+            ValueError: If ``self_url`` is not one of ``peers``.
+        """
+        urls = [url.rstrip("/") for url in peers]
+        self._self_url = self_url.rstrip("/")
+        if self._self_url not in urls:
+            msg = f"This replica's URL {self_url} is not in the peer list"
+            raise ValueError(msg)
+        self._provider = provider
+        self._ring = ConsistentHashRing(urls)
+        self._headers = {PEER_TOKEN_HEADER: token}
+        self._logger = logger
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(timeout=timeout_seconds)
+        self._inflight: dict[str, asyncio.Task[WeatherData]] = {}
+        self.owned = _OwnedWeatherProvider(self)
+
+    def owner(self, request: WeatherRequest) -> str:
+        """Return the base URL of the replica that owns a request's location."""
+        return self._ring.owner(request.cache_key)
+
+    async def get_weather(self, request: WeatherRequest) -> WeatherData:
+        """Fetch weather data from this replica's upstream or from the owner.
+
+        Raises:
+            CityNotFoundError: If the city cannot be found.
+            WeatherProviderError: If the provider fails.
+            RateLimitExceededError: If the owner's or this replica's budget is exhausted.
+        """
+        owner = self.owner(request)
+        if owner == self._self_url:
+            return await self.get_owned_weather(request)
+        return await self._coalesced(request, lambda: self._fetch_from_peer(owner, request))
+
+    async def get_owned_weather(self, request: WeatherRequest) -> WeatherData:
+        """Fetch weather data from upstream, sharing the call with concurrent fetches.
+
+        Raises:
+            CityNotFoundError: If the city cannot be found.
+            WeatherProviderError: If the provider fails.
+            RateLimitExceededError: If rate limit is exceeded.
+        """
+        return await self._coalesced(request, lambda: self._provider.get_weather(request))
+
+    async def get_forecast(self, request: WeatherRequest) -> Forecast:
+        """Fetch a forecast from the wrapped provider."""
+        return await self._provider.get_forecast(request)
+
+    async def close(self) -> None:
+        """Close the HTTP client if this provider created it."""
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def _coalesced(
+        self, request: WeatherRequest, fetch: Callable[[], Coroutine[Any, Any, WeatherData]]
+    ) -> WeatherData:
+        """Run a fetch, or join the one already running for the same key."""
+        key = request.cache_key
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_from_peer(self, owner: str, request: WeatherRequest) -> WeatherData:
+        """Ask the owner for an observation, falling back to upstream if it fails."""
+        params: dict[str, str | float] = {"units": request.units.value}
+        if request.coordinates is not None:
+            params["lat"] = request.coordinates.latitude
+            params["lon"] = request.coordinates.longitude
+        else:
+            params["city"] = request.city
+        try:
+            response = await self._client.get(
+                f"{owner}{PEER_WEATHER_PATH}", params=params, headers=self._headers
+            )
+        except httpx.HTTPError as e:
+            return await self._fallback(owner, request, str(e) or type(e).__name__)
+        if response.status_code == 404:
+            raise CityNotFoundError(request.city or request.cache_key)
+        if response.status_code == 429:
+            retry_after = response.headers.get("Retry-After", "")
+            raise RateLimitExceededError(int(retry_after) if retry_after.isdigit() else 60)
+        if response.status_code != 200:
+            return await self._fallback(owner, request, f"HTTP {response.status_code}")
+        try:
+            data, _ = decode_weather(response.content)
+        except (struct.error, ValueError) as e:
+            return await self._fallback(owner, request, str(e))
+        return data
+
+    async def _fallback(self, owner: str, request: WeatherRequest, error: str) -> WeatherData:
+        """Fetch upstream after the owner failed to answer."""
+        self._logger.warning(
+            "Peer fetch failed, fetching upstream",
+            peer=owner,
+            cache_key=request.cache_key,
+            error=error,
+        )
+        return await self._provider.get_weather(request)
+
+
+class _OwnedWeatherProvider(WeatherProviderPort):
+    """View of a PeerWeatherProvider that fetches every key upstream itself.
+
+    Serves the internal peer endpoint, so a request forwarded by a peer is
+    never forwarded again, even while the replicas' peer lists disagree.
+    """
+
+    def __init__(self, peers: PeerWeatherProvider) -> None:
+        self._peers = peers
+
+    async def get_weather(self, request: WeatherRequest) -> WeatherData:
+        """Fetch weather data from upstream, sharing concurrent calls."""
+        return await self._peers.get_owned_weather(request)
+
+    async def get_forecast(self, request: WeatherRequest) -> Forecast:
+        """Fetch a forecast from upstream."""
+        return await self._peers.get_forecast(request)
+
+
+class PeerCacheWarmer:
+    """Fill a new replica's cache from a running peer before it serves traffic.
+
+    Streams the peer's live entries from its internal cache endpoint in the
+    snapshot format and restores them while downloading, so a replica added
+    during scale-out joins with a hot cache instead of a burst of misses.
+    """
+
+    def __init__(
+        self,
+        cache: InMemoryCache,
+        peer_url: str,
+        token: str,
+        logger: LoggerPort,
+        timeout_seconds: float = 30.0,
+        client: httpx.AsyncClient | None = None,
+    ) -> None:
+        """Initialize the warmer.
+
+        Args:
+            cache: The cache to fill.
+            peer_url: Base URL of the replica to copy.
+            token: Shared secret sent in the ``X-Peer-Token`` header.
+            logger: The logger implementation.
+            timeout_seconds: Longest the whole transfer may take.
+            client: HTTP client for the transfer; one is created if omitted.
+        """
+        self._cache = cache
+        self._url = f"{peer_url.rstrip('/')}{PEER_CACHE_PATH}"
+        self._headers = {PEER_TOKEN_HEADER: token}
+        self._logger = logger
+        self._timeout = timeout_seconds
+        self._client = client
+
+    async def warm(self) -> int:
+        """Copy the peer's cache; a failed transfer keeps what arrived and is logged.
+
+        Returns:
+            Number of entries added to the cache.
+        """
+        started = time.perf_counter()
+        reader = SnapshotStreamReader()
+        progress = {"added": 0, "bytes": 0}
+        try:
+            await asyncio.wait_for(self._transfer(reader, progress), self._timeout)
+        except (httpx.HTTPError, TimeoutError, ValueError) as e:
+            self._logger.warning(
+                "Cache warm-up from peer failed",
+                url=self._url,
+                entries=progress["added"],
+                error=str(e) or type(e).__name__,
+            )
+            return progress["added"]
+        self._logger.info(
+            "Cache warmed from peer",
+            url=self._url,
+            entries=progress["added"],
+            bytes=progress["bytes"],
+            duration_ms=round((time.perf_counter() - started) * 1000, 1),
+        )
+        return progress["added"]
+
+    async def _transfer(self, reader: SnapshotStreamReader, progress: dict[str, int]) -> None:
+        """Stream the snapshot and restore it in batches as it arrives."""
+        client = self._client or httpx.AsyncClient(timeout=self._timeout)
+        try:
+            async with client.stream("GET", self._url, headers=self._headers) as response:
+                response.raise_for_status()
+                batch: list[tuple[str, bytes]] = []
+                async for chunk in response.aiter_bytes():
+                    progress["bytes"] += len(chunk)
+                    batch.extend(reader.feed(chunk))
+                    if len(batch) >= _RESTORE_BATCH:
+                        progress["added"] += self._cache.restore_records(batch)
+                        batch = []
+                progress["added"] += self._cache.restore_records(batch)
+        finally:
+            if self._client is None:
+                await client.aclose()
+        if not reader.finished:
+            msg = "Peer cache stream ended early"
+            raise ValueError(msg)
+
+
+def _hash(value: str) -> int:
+    """Return a process-independent 64-bit hash."""
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "little")
@@ -0,0 +1,245 @@
+"""Request budgeting: the shared upstream budget and per-client inbound budgets."""
+
+import asyncio
+import math
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+
+from src.application.interfaces import WeatherProviderPort
+from src.domain.entities import Forecast, WeatherData, WeatherRequest
+from src.domain.exceptions import RateLimitExceededError
+
+# Identity of the client whose request is being served, set by the inbound rate limiter
+current_client: ContextVar[str | None] = ContextVar("current_client", default=None)
+
+# Per-client state is packed into one int: window index, previous and current counts
+_COUNT_BITS = 16
+_COUNT_MASK = (1 << _COUNT_BITS) - 1
+
+
+class TokenBucket:
+    """Async token bucket that paces callers instead of rejecting them outright."""
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        capacity: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the bucket full.
+
+        Args:
+            rate_per_second: Sustained refill rate.
+            capacity: Maximum burst size.
+            clock: Monotonic clock, injectable for tests.
+        """
+        self._rate = rate_per_second
+        self._capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    async def acquire(self, max_wait_seconds: float | None = None) -> None:
+        """Take one token, sleeping until it is available.
+
+        Tokens are reserved before sleeping, so concurrent callers queue up in
+        arrival order without a lock.
+
+        Args:
+            max_wait_seconds: Longest acceptable wait; None waits indefinitely.
+
+        Raises:
+            RateLimitExceededError: If the wait would exceed ``max_wait_seconds``.
+        """
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+        self._tokens -= 1
+        if self._tokens >= 0:
+            return
+        wait = -self._tokens / self._rate
+        if max_wait_seconds is not None and wait > max_wait_seconds:
+            self._tokens += 1
+            raise RateLimitExceededError(retry_after_seconds=math.ceil(wait))
+        await asyncio.sleep(wait)
+
+    @property
+    def available(self) -> float:
+        """Return the number of tokens currently available (may be negative)."""
+        elapsed = self._clock() - self._updated
+        return min(self._capacity, self._tokens + elapsed * self._rate)
+
+
+class RateLimitedWeatherProvider(WeatherProviderPort):
+    """Weather provider decorator enforcing the upstream request budget."""
+
+    def __init__(
+        self,
+        provider: WeatherProviderPort,
+        bucket: TokenBucket,
+        max_wait_seconds: float | None = 5.0,
+    ) -> None:
+        """Initialize the decorator.
+
+        Args:
+            provider: The provider to protect.
+            bucket: Token bucket shared by every upstream call.
+            max_wait_seconds: Longest a call may queue for budget.
+        """
+        self._provider = provider
+        self._bucket = bucket
+        self._max_wait = max_wait_seconds
+
+    async def get_weather(self, request: WeatherRequest) -> WeatherData:
+        """Fetch weather data once the upstream budget allows it.
+
+        Raises:
+            RateLimitExceededError: If no budget frees up within the wait limit.
+        """
+        await self._bucket.acquire(self._max_wait)
+        return await self._provider.get_weather(request)
+
+    async def get_forecast(self, request: WeatherRequest) -> Forecast:
+        """Fetch a forecast once the upstream budget allows it.
+
+        Raises:
+            RateLimitExceededError: If no budget frees up within the wait limit.
+        """
+        await self._bucket.acquire(self._max_wait)
+        return await self._provider.get_forecast(request)
+
+
+class SlidingWindowLimiter:
+    """Per-key request limit over a sliding window, with compact per-key state.
+
+    Uses the sliding window counter approximation: a key's rate is its count
+    in the current fixed window plus its previous window's count weighted by
+    the share of that window still inside the sliding one. Each key costs a
+    single packed int (window index and both counts), so tracking every
+    client of a busy replica stays cheap, and once per window keys idle for
+    two windows (whose counts no longer matter) are dropped.
+    """
+
+    def __init__(
+        self,
+        limit: int,
+        window_seconds: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            limit: Requests allowed per key in any window.
+            window_seconds: Length of the sliding window.
+            clock: Monotonic clock, injectable for tests.
+
+        Raises:
+            ValueError: If ``limit`` is not between 1 and 65535.
+        """
+        if not 1 <= limit <= _COUNT_MASK:
+            msg = f"Limit must be between 1 and {_COUNT_MASK}"
+            raise ValueError(msg)
+        self._limit = limit
+        self._window = window_seconds
+        self._clock = clock
+        self._clients: dict[str, int] = {}
+        self._swept = int(clock() // window_seconds)
+
+    @property
+    def clients(self) -> int:
+        """Return the number of keys currently tracked."""
+        return len(self._clients)
+
+    def hit(self, key: str) -> None:
+        """Count one request for a key.
+
+        Args:
+            key: The client identity.
+
+        Raises:
+            RateLimitExceededError: If the key is over its limit; the request is not counted.
+        """
+        position = self._clock() / self._window
+        window = int(position)
+        if window != self._swept:
+            self._sweep(window)
+        state = self._clients.get(key, 0)
+        previous = (state >> _COUNT_BITS) & _COUNT_MASK
+        current = state & _COUNT_MASK
+        if state >> 2 * _COUNT_BITS != window:
+            previous = current if state >> 2 * _COUNT_BITS == window - 1 else 0
+            current = 0
+        elapsed = position - window
+        if previous * (1 - elapsed) + current >= self._limit:
+            self._clients[key] = self._pack(window, previous, current)
+            raise RateLimitExceededError(self._retry_after(previous, current, elapsed))
+        self._clients[key] = self._pack(window, previous, current + 1)
+
+    def _retry_after(self, previous: int, current: int, elapsed: float) -> int:
+        """Return the whole seconds until a rejected key is under its limit again."""
+        if current < self._limit:
+            # The previous window's weight must decay until there is room for one more
+            wait = 1 - (self._limit - current) / previous - elapsed
+        else:
+            wait = 1 - elapsed + 1 - self._limit / current
+        return max(1, math.ceil(wait * self._window))
+
+    def _sweep(self, window: int) -> None:
+        """Drop keys with no requests in the current or previous window."""
+        self._swept = window
+        self._clients = {
+            key: state
+            for key, state in self._clients.items()
+            if state >> 2 * _COUNT_BITS >= window - 1
+        }
+
+    @staticmethod
+    def _pack(window: int, previous: int, current: int) -> int:
+        """Pack a key's window index and counts into one int."""
+        return (window << 2 * _COUNT_BITS) | (previous << _COUNT_BITS) | current
+
+
+class ClientBudgetedWeatherProvider(WeatherProviderPort):
+    """Weather provider decorator charging each fetch to the requesting client.
+
+    Sits under the cache, so only requests that miss it (and would spend the
+    shared upstream budget) count against the client's miss budget. Fetches
+    made outside a client request, such as the cache warm-up, live update
+    refreshes and bulk job rows, are not charged.
+    """
+
+    def __init__(self, provider: WeatherProviderPort, limiter: SlidingWindowLimiter) -> None:
+        """Initialize the decorator.
+
+        Args:
+            provider: The provider to protect.
+            limiter: Per-client budget of fetches.
+        """
+        self._provider = provider
+        self._limiter = limiter
+
+    async def get_weather(self, request: WeatherRequest) -> WeatherData:
+        """Fetch weather data if the client has miss budget left.
+
+        Raises:
+            RateLimitExceededError: If the client's miss budget is exhausted.
+        """
+        self._charge()
+        return await self._provider.get_weather(request)
+
+    async def get_forecast(self, request: WeatherRequest) -> Forecast:
+        """Fetch a forecast if the client has miss budget left.
+
+        Raises:
+            RateLimitExceededError: If the client's miss budget is exhausted.
+        """
+        self._charge()
+        return await self._provider.get_forecast(request)
+
+    def _charge(self) -> None:
+        """Count a fetch against the current client, if there is one."""
+        client = current_client.get()
+        if client is not None:
+            self._limiter.hit(client)
@@ -0,0 +1,330 @@
+"""Shared weather cache stored in a Redis-compatible server."""
+
+import asyncio
+import contextlib
+import struct
+import time
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import TypeAlias
+from urllib.parse import unquote, urlsplit
+
+from src.application.interfaces import CachePort, LoggerPort
+from src.domain.entities import WeatherData
+from src.infrastructure.cache_codec import decode_entry, encode_entry
+
+# Keys per MGET, so one huge batch never monopolizes a connection
+_MGET_CHUNK = 500
+_SCAN_COUNT = b"1000"
+
+
+class RedisError(Exception):
+    """Raised when the server answers a command with an error."""
+
+
+# A reply: simple string, integer, bulk string, nil, array, or a server error
+_Reply: TypeAlias = str | int | bytes | None | list["_Reply"] | RedisError
+# Connection refused or dropped (EOFError covers a closed stream), timeout, error reply
+_FAILURES = (OSError, EOFError, TimeoutError, RedisError)
+
+
+class _Connection:
+    """One connection speaking RESP, the Redis serialization protocol."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+
+    async def pipeline(self, commands: Sequence[Sequence[bytes]]) -> list[_Reply]:
+        """Send every command in one write, then read one reply per command."""
+        self._writer.write(b"".join(_encode_command(command) for command in commands))
+        await self._writer.drain()
+        return [await self._read_reply() for _ in commands]
+
+    def close(self) -> None:
+        """Close the socket."""
+        self._writer.close()
+
+    async def _read_reply(self) -> _Reply:
+        """Read one reply."""
+        line = await self._reader.readuntil(b"\r\n")
+        kind, payload = line[:1], line[1:-2]
+        if kind == b"+":
+            return payload.decode()
+        if kind == b"-":
+            return RedisError(payload.decode())
+        if kind == b":":
+            return int(payload)
+        if kind == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            return (await self._reader.readexactly(length + 2))[:-2]
+        if kind == b"*":
+            count = int(payload)
+            if count < 0:
+                return None
+            return [await self._read_reply() for _ in range(count)]
+        msg = f"Unexpected reply from Redis: {line!r}"
+        raise RedisError(msg)
+
+
+def _encode_command(command: Sequence[bytes]) -> bytes:
+    """Encode a command as a RESP array of bulk strings."""
+    parts = [b"*%d\r\n" % len(command)]
+    for argument in command:
+        parts.append(b"$%d\r\n%s\r\n" % (len(argument), argument))
+    return b"".join(parts)
+
+
+class _ConnectionPool:
+    """Bounded pool of connections to one server, opened on demand."""
+
+    def __init__(self, host: str, port: int, password: str | None, db: int, size: int) -> None:
+        self._host = host
+        self._port = port
+        self._password = password
+        self._db = db
+        self._idle: list[_Connection] = []
+        self._slots = asyncio.Semaphore(size)
+
+    @contextlib.asynccontextmanager
+    async def connection(self) -> AsyncIterator[_Connection]:
+        """Lend a connection; it is discarded if the caller fails mid-exchange."""
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._open()
+            try:
+                yield connection
+            except BaseException:
+                # Unread replies may be left on the socket
+                connection.close()
+                raise
+            self._idle.append(connection)
+
+    def close(self) -> None:
+        """Close every idle connection."""
+        while self._idle:
+            self._idle.pop().close()
+
+    async def _open(self) -> _Connection:
+        """Connect, authenticate and select the database."""
+        reader, writer = await asyncio.open_connection(self._host, self._port)
+        connection = _Connection(reader, writer)
+        setup = []
+        if self._password is not None:
+            setup.append([b"AUTH", self._password.encode()])
+        if self._db:
+            setup.append([b"SELECT", str(self._db).encode()])
+        if setup:
+            try:
+                replies = await connection.pipeline(setup)
+                errors = [reply for reply in replies if isinstance(reply, RedisError)]
+                if errors:
+                    raise errors[0]
+            except BaseException:
+                connection.close()
+                raise
+        return connection
+
+
+class RedisCache(CachePort):
+    """Weather cache shared by every replica through a Redis-compatible server.
+
+    Values are ``encode_entry`` records (the expiry followed by the packed
+    observation, about 100 bytes) stored with a matching ``PX`` expiry, so
+    Redis drops them on time and readers learn the remaining TTL without a
+    second command. Bulk reads use ``MGET`` and bulk writes send all their
+    ``SET`` commands in one pipelined round trip.
+
+    The cache is an optimization: if the server is unreachable or slow,
+    reads are treated as misses and writes are dropped, with a warning.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        logger: LoggerPort,
+        pool_size: int = 10,
+        timeout_seconds: float = 1.0,
+        key_prefix: str = "weatherapp:",
+    ) -> None:
+        """Initialize the cache; connections are opened on first use.
+
+        Args:
+            url: Server URL, ``redis://[:password@]host[:port][/db]``.
+            logger: The logger implementation.
+            pool_size: Maximum number of open connections.
+            timeout_seconds: Longest wait for a connection or a round trip.
+            key_prefix: Prepended to every key, so several apps can share a server.
+
+        Raises:
+            ValueError: If the URL is not a ``redis://`` URL.
+        """
+        parts = urlsplit(url)
+        if parts.scheme != "redis" or not parts.hostname:
+            msg = f"Unsupported Redis URL: {url}"
+            raise ValueError(msg)
+        db = parts.path.strip("/")
+        self._pool = _ConnectionPool(
+            host=parts.hostname,
+            port=parts.port or 6379,
+            password=unquote(parts.password) if parts.password is not None else None,
+            db=int(db) if db else 0,
+            size=pool_size,
+        )
+        self._logger = logger
+        self._timeout = timeout_seconds
+        self._prefix = key_prefix.encode()
+
+    async def get(self, key: str) -> WeatherData | None:
+        """Retrieve cached weather data.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData or None if not found/expired.
+        """
+        hit = await self.get_with_ttl(key)
+        return hit[0] if hit is not None else None
+
+    async def get_with_ttl(self, key: str) -> tuple[WeatherData, float] | None:
+        """Retrieve cached weather data and its remaining TTL.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData and remaining seconds, or None if not found/expired.
+        """
+        return (await self.get_many_with_ttl([key])).get(key)
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, WeatherData]:
+        """Retrieve cached weather data for several keys at once.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData of each key that was found and not expired.
+        """
+        return {key: value for key, (value, _) in (await self.get_many_with_ttl(keys)).items()}
+
+    async def get_many_with_ttl(self, keys: Sequence[str]) -> dict[str, tuple[WeatherData, float]]:
+        """Retrieve cached weather data and remaining TTLs with pipelined ``MGET``.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData and remaining seconds of each key that was
+            found and not expired.
+        """
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return {}
+        chunks = [unique[i : i + _MGET_CHUNK] for i in range(0, len(unique), _MGET_CHUNK)]
+        try:
+            replies = await self._execute(
+                [[b"MGET", *(self._key(key) for key in chunk)] for chunk in chunks]
+            )
+        except _FAILURES as e:
+            self._logger.warning("Redis cache read failed", keys=len(unique), error=str(e))
+            return {}
+
+        now = time.time()
+        found = {}
+        for chunk, values in zip(chunks, replies, strict=True):
+            if not isinstance(values, list):
+                continue
+            for key, value in zip(chunk, values, strict=True):
+                if not isinstance(value, bytes):
+                    continue
+                try:
+                    data, expires_at = decode_entry(value)
+                except (struct.error, ValueError) as e:
+                    self._logger.warning("Unreadable Redis cache entry", key=key, error=str(e))
+                    continue
+                if expires_at > now:
+                    found[key] = (data, expires_at - now)
+        return found
+
+    async def set(self, key: str, value: WeatherData, ttl_seconds: int) -> None:
+        """Store weather data in cache.
+
+        Args:
+            key: The cache key.
+            value: The WeatherData to cache.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        await self.set_many({key: value}, ttl_seconds)
+
+    async def set_many(self, items: Mapping[str, WeatherData], ttl_seconds: int) -> None:
+        """Store several entries in one pipelined round trip.
+
+        Args:
+            items: WeatherData to cache by cache key.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        if not items or ttl_seconds <= 0:
+            return
+        expires_at = time.time() + ttl_seconds
+        ttl_ms = str(ttl_seconds * 1000).encode()
+        commands = [
+            [b"SET", self._key(key), encode_entry(value, expires_at), b"PX", ttl_ms]
+            for key, value in items.items()
+        ]
+        try:
+            replies = await self._execute(commands)
+        except _FAILURES as e:
+            self._logger.warning("Redis cache write failed", keys=len(items), error=str(e))
+            return
+        errors = [reply for reply in replies if isinstance(reply, RedisError)]
+        if errors:
+            self._logger.warning("Redis cache write failed", keys=len(errors), error=str(errors[0]))
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry from cache.
+
+        Args:
+            key: The cache key to delete.
+        """
+        try:
+            await self._execute([[b"DEL", self._key(key)]])
+        except _FAILURES as e:
+            self._logger.warning("Redis cache delete failed", key=key, error=str(e))
+
+    async def clear(self) -> None:
+        """Delete every key under this cache's prefix."""
+        cursor = b"0"
+        try:
+            while True:
+                scan = [b"SCAN", cursor, b"MATCH", self._prefix + b"*", b"COUNT", _SCAN_COUNT]
+                (reply,) = await self._execute([scan])
+                if not isinstance(reply, list) or len(reply) != 2:
+                    msg = f"Unexpected SCAN reply: {reply!r}"
+                    raise RedisError(msg)
+                next_cursor, keys = reply
+                if isinstance(keys, list) and keys:
+                    await self._execute([[b"DEL", *(k for k in keys if isinstance(k, bytes))]])
+                if not isinstance(next_cursor, bytes) or next_cursor == b"0":
+                    return
+                cursor = next_cursor
+        except _FAILURES as e:
+            self._logger.warning("Redis cache clear failed", error=str(e))
+
+    async def close(self) -> None:
+        """Close the pooled connections."""
+        self._pool.close()
+
+    def _key(self, key: str) -> bytes:
+        """Return the prefixed server key."""
+        return self._prefix + key.encode("utf-8")
+
+    async def _execute(self, commands: Sequence[Sequence[bytes]]) -> list[_Reply]:
+        """Run commands as one pipeline on a pooled connection, within the timeout."""
+        return await asyncio.wait_for(self._pipeline(commands), self._timeout)
+
+    async def _pipeline(self, commands: Sequence[Sequence[bytes]]) -> list[_Reply]:
+        """Run commands as one pipeline on a pooled connection."""
+        async with self._pool.connection() as connection:
+            return await connection.pipeline(commands)
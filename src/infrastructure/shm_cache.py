@@ -0,0 +1,319 @@
+"""Weather cache in shared memory, shared by every worker process on a host."""
+
+import fcntl
+import hashlib
+import struct
+import tempfile
+import threading
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+
+from src.application.interfaces import SyncCachePort
+from src.domain.entities import WeatherData
+from src.infrastructure.cache_codec import decode_weather, encode_weather
+
+_MAGIC = b"WXSHM001"
+# Bump when the header, slot or cache_codec format changes
+_LAYOUT_VERSION = 2
+# Magic, layout version, slot count, slot size
+_HEADER = struct.Struct("<8sIII")
+_HEADER_SIZE = 64
+# Sequence number, key hash (0: empty), key length, value length, expiry
+_SLOT = struct.Struct("<IQHHd")
+_SEQUENCE = struct.Struct("<I")
+_KEY_HASH = struct.Struct("<Q")
+_READ_RETRIES = 16
+
+
+class SharedMemoryCache(SyncCachePort):
+    """Weather cache in a fixed-size slot table in ``multiprocessing.shared_memory``.
+
+    The first process to open a name creates the segment; later ones (other
+    uvicorn workers) attach to it, so an observation fetched by one worker
+    is served to all of them. The header records the layout version, slot
+    count and slot size; a segment left by a build or configuration with
+    another layout is unlinked and replaced by a fresh one. Processes still
+    attached to the old segment keep using it until they exit.
+
+    Keys hash (BLAKE2b, stable across processes) to a home slot and probe
+    the next ``probe_limit`` slots (open addressing). A write takes a
+    host-wide file lock and fills the key's slot, a free or expired slot,
+    or evicts the probed entry closest to expiry. Reads take no lock: each
+    slot carries a sequence number that writers make odd while writing, and
+    a reader retries until it copies the slot with the same even number
+    before and after (a seqlock).
+
+    Each slot holds the key and the packed observation; entries that do
+    not fit in ``slot_size`` are not cached.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slots: int = 65_536,
+        slot_size: int = 256,
+        probe_limit: int = 8,
+    ) -> None:
+        """Create or attach to the shared segment.
+
+        Args:
+            name: Segment name shared by every process on the host.
+            slots: Number of slots in the table.
+            slot_size: Bytes per slot, including a 24-byte slot header.
+            probe_limit: Slots examined per key, starting at its home slot.
+
+        Raises:
+            ValueError: If the sizes are invalid.
+        """
+        if slots < 1 or slot_size <= _SLOT.size or probe_limit < 1:
+            msg = f"Invalid shared cache layout: {slots} slots of {slot_size} bytes"
+            raise ValueError(msg)
+        self._slots = slots
+        self._slot_size = slot_size
+        self._probe_limit = min(probe_limit, slots)
+        self._thread_lock = threading.Lock()
+        self._lock_path = Path(tempfile.gettempdir()) / f"{name}.lock"
+        self._lock_file = self._lock_path.open("a+b")
+        # Under the writers' lock, so concurrent starts agree on one segment
+        with self._write_lock():
+            self._shm = self._open(name, _HEADER_SIZE + slots * slot_size)
+        self._buf = self._shm.buf
+
+    def get(self, key: str) -> WeatherData | None:
+        """Retrieve cached weather data if not expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData or None if not found/expired.
+        """
+        hit = self.get_with_ttl(key)
+        return hit[0] if hit is not None else None
+
+    def get_with_ttl(self, key: str) -> tuple[WeatherData, float] | None:
+        """Retrieve cached weather data and its remaining TTL if not expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData and remaining seconds, or None if not found/expired.
+        """
+        encoded_key = key.encode("utf-8")
+        key_hash = _hash(encoded_key)
+        for offset in self._probe(key_hash):
+            if _KEY_HASH.unpack_from(self._buf, offset + 4)[0] != key_hash:
+                continue
+            raw = self._read_slot(offset)
+            if raw is None:
+                continue
+            _, slot_hash, key_length, value_length, expires_at = _SLOT.unpack_from(raw)
+            start = _SLOT.size
+            if slot_hash != key_hash or raw[start : start + key_length] != encoded_key:
+                continue
+            remaining = expires_at - time.time()
+            if remaining < 0:
+                return None
+            try:
+                data, end = decode_weather(raw, start + key_length)
+            except (struct.error, ValueError):
+                return None
+            if end != start + key_length + value_length:
+                return None
+            return data, remaining
+        return None
+
+    def set(self, key: str, value: WeatherData, ttl_seconds: int) -> None:
+        """Store weather data with TTL.
+
+        Args:
+            key: The cache key.
+            value: The WeatherData to cache.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        self.set_many({key: value}, ttl_seconds)
+
+    def set_many(self, items: Mapping[str, WeatherData], ttl_seconds: int) -> None:
+        """Store several entries with the same TTL under one lock acquisition.
+
+        Args:
+            items: WeatherData to cache by cache key.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        expires_at = time.time() + ttl_seconds
+        records = []
+        for key, value in items.items():
+            encoded_key = key.encode("utf-8")
+            encoded_value = encode_weather(value)
+            if _SLOT.size + len(encoded_key) + len(encoded_value) <= self._slot_size:
+                records.append((encoded_key, encoded_value))
+        if not records:
+            return
+        with self._write_lock():
+            now = time.time()
+            for encoded_key, encoded_value in records:
+                key_hash = _hash(encoded_key)
+                offset = self._slot_for_write(key_hash, encoded_key, now)
+                self._write_slot(offset, key_hash, encoded_key, encoded_value, expires_at)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from cache.
+
+        Args:
+            key: The cache key to delete.
+        """
+        encoded_key = key.encode("utf-8")
+        key_hash = _hash(encoded_key)
+        with self._write_lock():
+            for offset in self._probe(key_hash):
+                if self._slot_key(offset) == (key_hash, encoded_key):
+                    self._write_slot(offset, 0, b"", b"", 0.0)
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        with self._write_lock():
+            for offset in self._probe_all():
+                if _KEY_HASH.unpack_from(self._buf, offset + 4)[0]:
+                    self._write_slot(offset, 0, b"", b"", 0.0)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the shared-memory segment."""
+        return self._shm.name
+
+    @property
+    def size(self) -> int:
+        """Return the number of unexpired entries (scans the whole table)."""
+        now = time.time()
+        count = 0
+        for offset in self._probe_all():
+            _, key_hash, _, _, expires_at = _SLOT.unpack_from(self._buf, offset)
+            if key_hash and expires_at > now:
+                count += 1
+        return count
+
+    def close(self) -> None:
+        """Detach from the segment; it stays available to other processes."""
+        self._buf = None  # type: ignore[assignment]
+        self._shm.close()
+        self._lock_file.close()
+
+    def unlink(self) -> None:
+        """Destroy the segment once every process has detached."""
+        # SharedMemory.unlink also unregisters the name from the resource tracker
+        resource_tracker.register(self._shm._name, "shared_memory")  # type: ignore[attr-defined]
+        self._shm.unlink()
+        self._lock_path.unlink(missing_ok=True)
+
+    def _open(self, name: str, size: int) -> SharedMemory:
+        """Attach to the segment, or create it if it is missing or has another layout."""
+        try:
+            shm = SharedMemory(name=name)
+        except FileNotFoundError:
+            shm = self._create(name, size)
+        else:
+            if not self._has_layout(shm, size):
+                # Processes attached to the old segment keep it until they exit
+                shm.unlink()
+                shm.close()
+                shm = self._create(name, size)
+        # The segment outlives any one worker: keep the resource tracker from
+        # unlinking it when the process that opened it exits
+        resource_tracker.unregister(shm._name, "shared_memory")  # type: ignore[attr-defined]
+        return shm
+
+    def _create(self, name: str, size: int) -> SharedMemory:
+        """Create the segment and write its header."""
+        shm = SharedMemory(name=name, create=True, size=size)
+        _HEADER.pack_into(shm.buf, 0, _MAGIC, _LAYOUT_VERSION, self._slots, self._slot_size)
+        return shm
+
+    def _has_layout(self, shm: SharedMemory, size: int) -> bool:
+        """Return whether an existing segment has this instance's layout."""
+        if shm.size < size:
+            return False
+        header = _HEADER.unpack_from(shm.buf, 0)
+        return header == (_MAGIC, _LAYOUT_VERSION, self._slots, self._slot_size)
+
+    def _probe(self, key_hash: int) -> Iterator[int]:
+        """Yield the byte offsets of the slots a key may occupy."""
+        home = key_hash % self._slots
+        for step in range(self._probe_limit):
+            yield _HEADER_SIZE + ((home + step) % self._slots) * self._slot_size
+
+    def _probe_all(self) -> Iterator[int]:
+        """Yield the byte offset of every slot."""
+        return iter(
+            range(_HEADER_SIZE, _HEADER_SIZE + self._slots * self._slot_size, self._slot_size)
+        )
+
+    def _read_slot(self, offset: int) -> bytes | None:
+        """Copy a slot that no writer modified during the copy, or None."""
+        end = offset + self._slot_size
+        for _ in range(_READ_RETRIES):
+            before = _SEQUENCE.unpack_from(self._buf, offset)[0]
+            if before & 1:
+                continue
+            raw = bytes(self._buf[offset:end])
+            if _SEQUENCE.unpack_from(self._buf, offset)[0] == before:
+                return raw
+        return None
+
+    def _slot_key(self, offset: int) -> tuple[int, bytes]:
+        """Return the key hash and key of a slot (writers only)."""
+        _, key_hash, key_length, _, _ = _SLOT.unpack_from(self._buf, offset)
+        start = offset + _SLOT.size
+        return key_hash, bytes(self._buf[start : start + key_length])
+
+    def _slot_for_write(self, key_hash: int, encoded_key: bytes, now: float) -> int:
+        """Pick the slot for a key: its own, a free or expired one, or the soonest to expire."""
+        free = None
+        victim, victim_expiry = -1, float("inf")
+        for offset in self._probe(key_hash):
+            _, slot_hash, _, _, expires_at = _SLOT.unpack_from(self._buf, offset)
+            if slot_hash == key_hash and self._slot_key(offset)[1] == encoded_key:
+                return offset
+            if free is None and (not slot_hash or expires_at <= now):
+                free = offset
+            if expires_at < victim_expiry:
+                victim, victim_expiry = offset, expires_at
+        return free if free is not None else victim
+
+    def _write_slot(
+        self, offset: int, key_hash: int, key: bytes, value: bytes, expires_at: float
+    ) -> None:
+        """Overwrite a slot, bracketed by an odd sequence number for readers."""
+        sequence = _SEQUENCE.unpack_from(self._buf, offset)[0]
+        _SEQUENCE.pack_into(self._buf, offset, (sequence + 1) & 0xFFFF_FFFF)
+        _SLOT.pack_into(
+            self._buf,
+            offset,
+            (sequence + 1) & 0xFFFF_FFFF,
+            key_hash,
+            len(key),
+            len(value),
+            expires_at,
+        )
+        start = offset + _SLOT.size
+        self._buf[start : start + len(key) + len(value)] = key + value
+        _SEQUENCE.pack_into(self._buf, offset, (sequence + 2) & 0xFFFF_FFFF)
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Serialize writers across threads and processes."""
+        with self._thread_lock:
+            fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+
+def _hash(key: bytes) -> int:
+    """Return a process-independent, non-zero 64-bit hash of a key."""
+    return int.from_bytes(hashlib.blake2b(key, digest_size=8).digest(), "little") | 1
@@ -0,0 +1,320 @@
+"""SQLite-backed cache tier for entries that do not fit in memory."""
+
+import sqlite3
+import struct
+import threading
+import time
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+
+from src.application.interfaces import LoggerPort, SyncCachePort
+from src.domain.entities import WeatherData
+from src.infrastructure.cache_codec import decode_weather, encode_weather
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS weather_cache (
+    key TEXT PRIMARY KEY,
+    expires_at REAL NOT NULL,
+    value BLOB NOT NULL
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS weather_cache_expires_at ON weather_cache (expires_at);
+"""
+_SELECT = "SELECT expires_at, value FROM weather_cache WHERE key = ?"
+_SELECT_MANY = "SELECT key, expires_at, value FROM weather_cache WHERE key IN ({})"
+# Keys per IN (...) query, below SQLite's default bound-parameter limit
+_SELECT_MANY_CHUNK = 500
+_UPSERT = "INSERT OR REPLACE INTO weather_cache (key, expires_at, value) VALUES (?, ?, ?)"
+_DELETE = "DELETE FROM weather_cache WHERE key = ?"
+_DELETE_EXPIRED = "DELETE FROM weather_cache WHERE expires_at < ?"
+_DELETE_ALL = "DELETE FROM weather_cache"
+
+# Pending change of one key: (expiry, encoded value), or None for a delete
+_Change = tuple[float, bytes] | None
+
+
+class SQLiteCache(SyncCachePort):
+    """Weather cache stored in a local SQLite database.
+
+    Reads go straight to the database (WAL mode lets them run alongside the
+    writer). Writes are buffered and committed in batches by one background
+    thread, so the request path never waits on disk; buffered changes stay
+    visible to reads until they are committed. The same thread periodically
+    deletes expired rows.
+
+    The SQL is a fixed set of statements, which ``sqlite3`` prepares once per
+    connection and reuses from its statement cache.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        logger: LoggerPort,
+        batch_size: int = 500,
+        flush_interval_seconds: float = 0.5,
+        cleanup_interval_seconds: float = 300.0,
+    ) -> None:
+        """Open the database and start the writer thread.
+
+        Args:
+            path: Database file; created if missing.
+            logger: The logger implementation.
+            batch_size: Buffered changes that trigger an immediate commit.
+            flush_interval_seconds: Longest a change waits before it is committed.
+            cleanup_interval_seconds: Time between deletions of expired rows.
+        """
+        self._path = path
+        self._logger = logger
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        self._cleanup_interval = cleanup_interval_seconds
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._reader = self._connect()
+        self._reader.executescript(_SCHEMA)
+        self._read_lock = threading.Lock()
+
+        self._pending: dict[str, _Change] = {}
+        self._inflight: dict[str, _Change] = {}
+        self._condition = threading.Condition()
+        self._flush_requested = False
+        self._closing = False
+        self._writer = threading.Thread(target=self._run, name="sqlite-cache-writer", daemon=True)
+        self._writer.start()
+
+    def get(self, key: str) -> WeatherData | None:
+        """Retrieve cached weather data if not expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData or None if not found/expired.
+        """
+        hit = self.get_with_ttl(key)
+        return hit[0] if hit is not None else None
+
+    def get_with_ttl(self, key: str) -> tuple[WeatherData, float] | None:
+        """Retrieve cached weather data and its remaining TTL if not expired.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData and remaining seconds, or None if not found/expired.
+        """
+        with self._condition:
+            buffered = key in self._pending or key in self._inflight
+            record = self._pending[key] if key in self._pending else self._inflight.get(key)
+        if not buffered:
+            record = self._read(key)
+        return self._decode(key, record, time.time())
+
+    def get_many_with_ttl(self, keys: Sequence[str]) -> dict[str, tuple[WeatherData, float]]:
+        """Retrieve cached weather data and remaining TTLs for several keys.
+
+        Keys without a buffered change are read with one query per 500 keys.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData and remaining seconds of each key that was
+            found and not expired.
+        """
+        records: dict[str, tuple[float, bytes] | None] = {}
+        with self._condition:
+            for key in keys:
+                if key in self._pending:
+                    records[key] = self._pending[key]
+                elif key in self._inflight:
+                    records[key] = self._inflight[key]
+        unbuffered = list(dict.fromkeys(key for key in keys if key not in records))
+        records.update(self._read_many(unbuffered))
+
+        now = time.time()
+        found = {}
+        for key, record in records.items():
+            hit = self._decode(key, record, now)
+            if hit is not None:
+                found[key] = hit
+        return found
+
+    def set(self, key: str, value: WeatherData, ttl_seconds: int) -> None:
+        """Buffer weather data for the next batch write.
+
+        Args:
+            key: The cache key.
+            value: The WeatherData to cache.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        self._change(key, (time.time() + ttl_seconds, encode_weather(value)))
+
+    def set_many(self, items: Mapping[str, WeatherData], ttl_seconds: int) -> None:
+        """Buffer several entries with the same TTL for the next batch write.
+
+        Args:
+            items: WeatherData to cache by cache key.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        expires_at = time.time() + ttl_seconds
+        encoded = {key: (expires_at, encode_weather(value)) for key, value in items.items()}
+        with self._condition:
+            if self._closing:
+                return
+            self._pending.update(encoded)
+            if len(self._pending) >= self._batch_size:
+                self._condition.notify_all()
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from cache.
+
+        Args:
+            key: The cache key to delete.
+        """
+        self._change(key, None)
+
+    def clear(self) -> None:
+        """Clear all cached entries."""
+        with self._condition:
+            self._pending.clear()
+            self._condition.wait_for(lambda: not self._inflight)
+            with self._read_lock:
+                self._reader.execute(_DELETE_ALL)
+
+    def flush(self, timeout: float | None = None) -> None:
+        """Wait until every buffered change is committed.
+
+        Args:
+            timeout: Longest time to wait, in seconds.
+        """
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: not self._pending and not self._inflight, timeout)
+
+    @property
+    def size(self) -> int:
+        """Return the number of committed rows, including expired ones."""
+        with self._read_lock:
+            row = self._reader.execute("SELECT COUNT(*) FROM weather_cache").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Commit buffered changes, stop the writer and close the database."""
+        with self._condition:
+            if self._closing:
+                return
+            self._closing = True
+            self._condition.notify_all()
+        self._writer.join()
+        with self._read_lock:
+            self._reader.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection in autocommit mode with WAL journaling."""
+        connection = sqlite3.connect(
+            self._path, timeout=5.0, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def _read(self, key: str) -> tuple[float, bytes] | None:
+        """Fetch a committed row."""
+        with self._read_lock:
+            row = self._reader.execute(_SELECT, (key,)).fetchone()
+        return (float(row[0]), bytes(row[1])) if row is not None else None
+
+    def _read_many(self, keys: list[str]) -> dict[str, tuple[float, bytes]]:
+        """Fetch the committed rows of several keys."""
+        rows = {}
+        for start in range(0, len(keys), _SELECT_MANY_CHUNK):
+            chunk = keys[start : start + _SELECT_MANY_CHUNK]
+            query = _SELECT_MANY.format(", ".join("?" * len(chunk)))
+            with self._read_lock:
+                for key, expires_at, value in self._reader.execute(query, chunk):
+                    rows[key] = (float(expires_at), bytes(value))
+        return rows
+
+    def _decode(
+        self, key: str, record: tuple[float, bytes] | None, now: float
+    ) -> tuple[WeatherData, float] | None:
+        """Return the observation and remaining TTL of a stored record if unexpired."""
+        if record is None:
+            return None
+        expires_at, value = record
+        remaining = expires_at - now
+        if remaining < 0:
+            return None
+        try:
+            data, _ = decode_weather(value)
+        except (struct.error, ValueError) as e:
+            self._logger.warning("Unreadable SQLite cache entry", key=key, error=str(e))
+            return None
+        return data, remaining
+
+    def _change(self, key: str, change: _Change) -> None:
+        """Buffer a change, waking the writer once a batch is full."""
+        with self._condition:
+            if self._closing:
+                return
+            self._pending[key] = change
+            if len(self._pending) >= self._batch_size:
+                self._condition.notify_all()
+
+    def _run(self) -> None:
+        """Commit buffered changes in batches until closed."""
+        connection = self._connect()
+        next_cleanup = time.monotonic() + self._cleanup_interval
+        try:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(
+                        lambda: (
+                            self._closing
+                            or self._flush_requested
+                            or len(self._pending) >= self._batch_size
+                        ),
+                        timeout=self._flush_interval,
+                    )
+                    self._flush_requested = False
+                    self._inflight, self._pending = self._pending, {}
+                    closing = self._closing
+
+                if self._inflight:
+                    self._write(connection, self._inflight)
+                with self._condition:
+                    self._inflight = {}
+                    self._condition.notify_all()
+
+                if time.monotonic() >= next_cleanup:
+                    self._cleanup(connection)
+                    next_cleanup = time.monotonic() + self._cleanup_interval
+                if closing:
+                    return
+        finally:
+            connection.close()
+
+    def _write(self, connection: sqlite3.Connection, batch: dict[str, _Change]) -> None:
+        """Apply a batch of changes in one transaction."""
+        upserts = [(key, c[0], c[1]) for key, c in batch.items() if c is not None]
+        deletes = [(key,) for key, c in batch.items() if c is None]
+        try:
+            connection.execute("BEGIN")
+            connection.executemany(_UPSERT, upserts)
+            connection.executemany(_DELETE, deletes)
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            if connection.in_transaction:
+                connection.execute("ROLLBACK")
+            self._logger.error("SQLite cache write failed", entries=len(batch), error=str(e))
+
+    def _cleanup(self, connection: sqlite3.Connection) -> None:
+        """Delete expired rows."""
+        try:
+            removed = connection.execute(_DELETE_EXPIRED, (time.time(),)).rowcount
+        except sqlite3.Error as e:
+            self._logger.error("SQLite cache cleanup failed", error=str(e))
+            return
+        if removed:
+            self._logger.debug("Expired SQLite cache entries removed", entries=removed)
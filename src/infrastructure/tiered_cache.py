@@ -0,0 +1,210 @@
+"""Two-level caches combining a fast L1 with a larger or shared L2."""
+
+from collections.abc import Mapping, Sequence
+
+from src.application.interfaces import CachePort, SyncCachePort
+from src.domain.entities import WeatherData
+from src.infrastructure.redis_cache import RedisCache
+
+
+class TieredCache(SyncCachePort):
+    """Look entries up in L1, then L2, promoting L2 hits into L1.
+
+    Writes go to both levels. A promoted entry keeps the TTL it has left in
+    L2, so promotion never extends an observation's lifetime.
+    """
+
+    def __init__(self, l1: SyncCachePort, l2: SyncCachePort) -> None:
+        """Initialize the cache.
+
+        Args:
+            l1: The small, fast level checked first.
+            l2: The larger level checked on L1 misses.
+        """
+        self._l1 = l1
+        self._l2 = l2
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> WeatherData | None:
+        """Retrieve cached weather data from the first level that has it.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData or None if not found/expired.
+        """
+        hit = self.get_with_ttl(key)
+        return hit[0] if hit is not None else None
+
+    def get_with_ttl(self, key: str) -> tuple[WeatherData, float] | None:
+        """Retrieve cached weather data and its remaining TTL.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData and remaining seconds, or None if not found/expired.
+        """
+        hit = self._l1.get_with_ttl(key)
+        if hit is not None:
+            self.l1_hits += 1
+            return hit
+        hit = self._l2.get_with_ttl(key)
+        if hit is None:
+            self.misses += 1
+            return None
+        self.l2_hits += 1
+        value, remaining = hit
+        self._l1.set(key, value, max(int(remaining), 1))
+        return hit
+
+    def get_many_with_ttl(self, keys: Sequence[str]) -> dict[str, tuple[WeatherData, float]]:
+        """Retrieve several entries, asking L2 once for all L1 misses.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData and remaining seconds of each key that was
+            found and not expired.
+        """
+        found = self._l1.get_many_with_ttl(keys)
+        self.l1_hits += len(found)
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if not missing:
+            return found
+        promoted = self._l2.get_many_with_ttl(missing)
+        self.l2_hits += len(promoted)
+        self.misses += len(missing) - len(promoted)
+        for key, (value, remaining) in promoted.items():
+            self._l1.set(key, value, max(int(remaining), 1))
+        found.update(promoted)
+        return found
+
+    def set(self, key: str, value: WeatherData, ttl_seconds: int) -> None:
+        """Store weather data in both levels.
+
+        Args:
+            key: The cache key.
+            value: The WeatherData to cache.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        self._l1.set(key, value, ttl_seconds)
+        self._l2.set(key, value, ttl_seconds)
+
+    def set_many(self, items: Mapping[str, WeatherData], ttl_seconds: int) -> None:
+        """Store several entries in both levels.
+
+        Args:
+            items: WeatherData to cache by cache key.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        self._l1.set_many(items, ttl_seconds)
+        self._l2.set_many(items, ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        """Remove an entry from both levels.
+
+        Args:
+            key: The cache key to delete.
+        """
+        self._l1.delete(key)
+        self._l2.delete(key)
+
+    def clear(self) -> None:
+        """Clear both levels."""
+        self._l1.clear()
+        self._l2.clear()
+
+
+class SharedTieredCache(CachePort):
+    """Local in-memory L1 in front of a Redis cache shared by every replica.
+
+    L1 is consulted inline; only its misses go over the network, and all of
+    a batch's misses share one round trip. L2 hits are copied into L1 with
+    their remaining TTL. Writes go to both levels, so an observation fetched
+    by one replica is served to the others from L2.
+    """
+
+    def __init__(self, l1: SyncCachePort, l2: RedisCache) -> None:
+        """Initialize the cache.
+
+        Args:
+            l1: The in-process level checked first.
+            l2: The shared level checked on L1 misses.
+        """
+        self._l1 = l1
+        self._l2 = l2
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> WeatherData | None:
+        """Retrieve cached weather data from the first level that has it.
+
+        Args:
+            key: The cache key.
+
+        Returns:
+            Cached WeatherData or None if not found/expired.
+        """
+        return (await self.get_many([key])).get(key)
+
+    async def get_many(self, keys: Sequence[str]) -> dict[str, WeatherData]:
+        """Retrieve several entries, asking L2 once for all L1 misses.
+
+        Args:
+            keys: The cache keys.
+
+        Returns:
+            The cached WeatherData of each key that was found and not expired.
+        """
+        found = self._l1.get_many(keys)
+        self.l1_hits += len(found)
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if not missing:
+            return found
+        promoted = await self._l2.get_many_with_ttl(missing)
+        self.l2_hits += len(promoted)
+        self.misses += len(missing) - len(promoted)
+        for key, (value, remaining) in promoted.items():
+            self._l1.set(key, value, max(int(remaining), 1))
+            found[key] = value
+        return found
+
+    async def set(self, key: str, value: WeatherData, ttl_seconds: int) -> None:
+        """Store weather data in both levels.
+
+        Args:
+            key: The cache key.
+            value: The WeatherData to cache.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        await self.set_many({key: value}, ttl_seconds)
+
+    async def set_many(self, items: Mapping[str, WeatherData], ttl_seconds: int) -> None:
+        """Store several entries in both levels.
+
+        Args:
+            items: WeatherData to cache by cache key.
+            ttl_seconds: Time-to-live in seconds.
+        """
+        self._l1.set_many(items, ttl_seconds)
+        await self._l2.set_many(items, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        """Remove an entry from both levels.
+
+        Args:
+            key: The cache key to delete.
+        """
+        self._l1.delete(key)
+        await self._l2.delete(key)
+
+    async def clear(self) -> None:
+        """Clear both levels."""
+        self._l1.clear()
+        await self._l2.clear()
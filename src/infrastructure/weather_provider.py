@@ -1,12 +1,13 @@
 """OpenWeatherMap API client implementation."""
 
+import sys
 from datetime import UTC, datetime
 from typing import Any
 
 import httpx
 
 from src.application.interfaces import WeatherProviderPort
-from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.entities import Forecast, ForecastPoint, WeatherData, WeatherRequest
 from src.domain.exceptions import (
     CityNotFoundError,
     RateLimitExceededError,
@@ -44,6 +45,34 @@ class OpenWeatherMapClient(WeatherProviderPort):
         Returns:
             WeatherData entity with current conditions.
 
+        Raises:
+            CityNotFoundError: If the city cannot be found.
+            WeatherProviderError: If the API request fails.
+            RateLimitExceededError: If rate limit is exceeded.
+        """
+        data = await self._fetch("weather", request)
+        return self._parse_response(data, request.units)
+
+    async def get_forecast(self, request: WeatherRequest) -> Forecast:
+        """Fetch the 5-day / 3-hour forecast from OpenWeatherMap.
+
+        Args:
+            request: The weather request.
+
+        Returns:
+            Forecast entity with time-ordered points.
+
+        Raises:
+            CityNotFoundError: If the city cannot be found.
+            WeatherProviderError: If the API request fails.
+            RateLimitExceededError: If rate limit is exceeded.
+        """
+        data = await self._fetch("forecast", request)
+        return self._parse_forecast(data, request.units)
+
+    async def _fetch(self, endpoint: str, request: WeatherRequest) -> dict[str, Any]:
+        """Call an OpenWeatherMap endpoint for a location and return its JSON body.
+
         Raises:
             CityNotFoundError: If the city cannot be found.
             WeatherProviderError: If the API request fails.
@@ -67,7 +96,7 @@ class OpenWeatherMapClient(WeatherProviderPort):
         try:
             async with httpx.AsyncClient(timeout=self._timeout) as client:
                 response = await client.get(
-                    f"{self._base_url}/weather",
+                    f"{self._base_url}/{endpoint}",
                     params=params,
                 )
 
@@ -84,8 +113,8 @@ class OpenWeatherMapClient(WeatherProviderPort):
                         f"API returned status {response.status_code}: {response.text}"
                     )
 
-                data = response.json()
-                return self._parse_response(data, request.units)
+                data: dict[str, Any] = response.json()
+                return data
 
         except httpx.TimeoutException as e:
             raise WeatherProviderError(f"Request timed out: {e}") from e
@@ -95,6 +124,9 @@ class OpenWeatherMapClient(WeatherProviderPort):
     def _parse_response(self, data: dict[str, Any], units: UnitSystem) -> WeatherData:
         """Parse OpenWeatherMap response into WeatherData entity.
 
+        The country, description and icon come from small vocabularies and
+        are interned, so every cached entry shares one copy of each.
+
         Args:
             data: Raw API response data.
             units: The unit system used.
@@ -109,7 +141,7 @@ class OpenWeatherMapClient(WeatherProviderPort):
 
         return WeatherData(
             city_name=data["name"],
-            country=(data.get("sys") or {}).get("country") or "",
+            country=sys.intern((data.get("sys") or {}).get("country") or ""),
             coordinates=Coordinates(
                 latitude=coord["lat"],
                 longitude=coord["lon"],
@@ -120,8 +152,50 @@ class OpenWeatherMapClient(WeatherProviderPort):
             wind_speed=wind.get("speed", 0.0),
             pressure=main["pressure"],
             visibility=data.get("visibility", 0),
-            description=weather.get("description", ""),
-            icon_code=weather.get("icon", ""),
+            description=sys.intern(weather.get("description", "")),
+            icon_code=sys.intern(weather.get("icon", "")),
             units=units,
             timestamp=datetime.now(UTC),
         )
+
+    def _parse_forecast(self, data: dict[str, Any], units: UnitSystem) -> Forecast:
+        """Parse an OpenWeatherMap forecast response into a Forecast entity.
+
+        Args:
+            data: Raw API response data.
+            units: The unit system used.
+
+        Returns:
+            Forecast entity.
+        """
+        city = data["city"]
+        points = []
+        for item in data.get("list", []):
+            main = item["main"]
+            weather = (item.get("weather") or [{}])[0]
+            points.append(
+                ForecastPoint(
+                    timestamp=datetime.fromtimestamp(item["dt"], UTC),
+                    temperature=main["temp"],
+                    feels_like=main["feels_like"],
+                    humidity=main["humidity"],
+                    wind_speed=(item.get("wind") or {}).get("speed", 0.0),
+                    pressure=main["pressure"],
+                    precipitation_probability=item.get("pop", 0.0),
+                    description=sys.intern(weather.get("description", "")),
+                    icon_code=sys.intern(weather.get("icon", "")),
+                )
+            )
+        points.sort(key=lambda point: point.timestamp)
+
+        return Forecast(
+            city_name=city.get("name", ""),
+            country=sys.intern(city.get("country") or ""),
+            coordinates=Coordinates(
+                latitude=city["coord"]["lat"],
+                longitude=city["coord"]["lon"],
+            ),
+            units=units,
+            utc_offset_seconds=city.get("timezone", 0),
+            points=tuple(points),
+        )
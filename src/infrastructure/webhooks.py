@@ -0,0 +1,321 @@
+"""Batched, persistent outbound webhook delivery."""
+
+import asyncio
+import contextlib
+import json
+import os
+import random
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from src.application.interfaces import LoggerPort
+from src.domain.entities import AlertEvent
+
+# Response codes worth retrying; other 4xx responses are treated as permanent
+_RETRYABLE_STATUS = frozenset({408, 425, 429, 500, 502, 503, 504})
+
+
+@dataclass
+class WebhookBatch:
+    """Events queued for one POST to one destination."""
+
+    url: str
+    events: list[dict[str, Any]]
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    attempts: int = 0
+    next_attempt_at: float = 0.0  # Unix time
+
+
+@dataclass
+class _Destination:
+    """Per-URL batching state."""
+
+    semaphore: asyncio.Semaphore
+    pending: list[dict[str, Any]] = field(default_factory=list)
+    flush_handle: asyncio.TimerHandle | None = None
+
+
+class WebhookDispatcher:
+    """Deliver webhook events in batches over a shared connection pool.
+
+    Events are buffered per destination and flushed as one JSON POST when a
+    batch fills up or the batch interval elapses, so a burst of triggers costs
+    a handful of requests instead of one per event. Every batch is written to
+    the spool directory before the first attempt and removed once delivered;
+    retries back off exponentially with jitter, and batches still in the spool
+    at shutdown are redelivered by ``start`` on the next run. Batches that
+    exhaust their attempts are kept as ``*.dead.json`` for inspection.
+    """
+
+    def __init__(
+        self,
+        logger: LoggerPort,
+        spool_dir: Path,
+        client: httpx.AsyncClient | None = None,
+        batch_size: int = 50,
+        batch_interval_seconds: float = 1.0,
+        max_concurrency_per_destination: int = 4,
+        max_connections: int = 100,
+        max_attempts: int = 8,
+        backoff_base_seconds: float = 1.0,
+        backoff_max_seconds: float = 300.0,
+        timeout_seconds: float = 10.0,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            logger: The logger implementation.
+            spool_dir: Directory persisting undelivered batches.
+            client: HTTP client to use; by default a pooled client is created.
+            batch_size: Maximum events per POST.
+            batch_interval_seconds: Longest an event waits for its batch to fill.
+            max_concurrency_per_destination: Concurrent POSTs per destination URL.
+            max_connections: Connection pool size of the default client.
+            max_attempts: Delivery attempts before a batch is dead-lettered.
+            backoff_base_seconds: Delay before the first retry.
+            backoff_max_seconds: Upper bound of the retry delay.
+            timeout_seconds: Request timeout of the default client.
+        """
+        self._logger = logger
+        self._spool_dir = spool_dir
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout_seconds,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
+        self._batch_size = batch_size
+        self._batch_interval = batch_interval_seconds
+        self._max_concurrency = max_concurrency_per_destination
+        self._max_attempts = max_attempts
+        self._backoff_base = backoff_base_seconds
+        self._backoff_max = backoff_max_seconds
+        self._destinations: dict[str, _Destination] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._started = False
+        self._closed = False
+        self.delivered_events = 0
+        self.dead_events = 0
+
+    async def start(self) -> None:
+        """Resume delivery of the batches left in the spool by a previous run."""
+        if self._started:
+            return
+        self._started = True
+        self._spool_dir.mkdir(parents=True, exist_ok=True)
+        resumed = 0
+        for path in sorted(self._spool_dir.glob("*.json")):
+            if path.name.endswith(".dead.json"):
+                continue
+            try:
+                batch = WebhookBatch(**json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, TypeError, ValueError) as e:
+                self._logger.error("Unreadable webhook spool file", path=str(path), error=str(e))
+                path.rename(path.with_suffix(".dead.json"))
+                continue
+            self._spawn(self._deliver(batch))
+            resumed += 1
+        if resumed:
+            self._logger.info("Resumed webhook backlog", batches=resumed)
+
+    def enqueue(self, url: str, event: dict[str, Any]) -> None:
+        """Queue one event for a destination without waiting for delivery.
+
+        Must be called from the event loop thread.
+
+        Args:
+            url: The destination URL.
+            event: JSON-serializable event payload.
+        """
+        if self._closed:
+            self._logger.warning("Webhook dispatcher closed, event dropped", url=url)
+            return
+        destination = self._destination(url)
+        destination.pending.append(event)
+        if len(destination.pending) >= self._batch_size:
+            self._flush(url)
+        elif destination.flush_handle is None:
+            loop = asyncio.get_running_loop()
+            destination.flush_handle = loop.call_later(self._batch_interval, self._flush, url)
+
+    def publish_alerts(self, events: list[AlertEvent]) -> None:
+        """Queue triggered alerts for the rules that have a webhook URL."""
+        for event in events:
+            if event.rule.webhook_url:
+                self.enqueue(event.rule.webhook_url, alert_payload(event))
+
+    @property
+    def backlog(self) -> int:
+        """Return the number of batches waiting in the spool."""
+        if not self._spool_dir.exists():
+            return 0
+        return sum(
+            1 for path in self._spool_dir.glob("*.json") if not path.name.endswith(".dead.json")
+        )
+
+    async def flush(self) -> None:
+        """Send all buffered events now and wait for the running deliveries."""
+        for url in list(self._destinations):
+            self._flush(url)
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    async def close(self) -> None:
+        """Stop delivering, leaving undelivered batches in the spool for the next run."""
+        self._closed = True
+        for url in list(self._destinations):
+            self._flush(url, send=False)
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*list(self._tasks), return_exceptions=True)
+        if self._owns_client:
+            await self._client.aclose()
+
+    def _destination(self, url: str) -> _Destination:
+        """Return the batching state of a URL, creating it on first use."""
+        destination = self._destinations.get(url)
+        if destination is None:
+            destination = _Destination(semaphore=asyncio.Semaphore(self._max_concurrency))
+            self._destinations[url] = destination
+        return destination
+
+    def _flush(self, url: str, send: bool = True) -> None:
+        """Cut the buffered events of a destination into spooled batches."""
+        destination = self._destinations[url]
+        if destination.flush_handle is not None:
+            destination.flush_handle.cancel()
+            destination.flush_handle = None
+        pending, destination.pending = destination.pending, []
+        for start in range(0, len(pending), self._batch_size):
+            batch = WebhookBatch(url=url, events=pending[start : start + self._batch_size])
+            self._spool(batch)
+            if send:
+                self._spawn(self._deliver(batch))
+
+    def _spawn(self, coroutine: Any) -> None:
+        """Run a delivery in the background, tracking it for shutdown."""
+        task = asyncio.create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _deliver(self, batch: WebhookBatch) -> None:
+        """Send a batch until it is delivered or its attempts run out."""
+        destination = self._destination(batch.url)
+        while True:
+            delay = batch.next_attempt_at - time.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            async with destination.semaphore:
+                retry_after, error = await self._post(batch)
+            batch.attempts += 1
+
+            if error is None:
+                self._spool_path(batch).unlink(missing_ok=True)
+                self.delivered_events += len(batch.events)
+                self._logger.debug(
+                    "Webhook batch delivered",
+                    url=batch.url,
+                    events=len(batch.events),
+                    attempts=batch.attempts,
+                )
+                return
+
+            if retry_after is None or batch.attempts >= self._max_attempts:
+                self._dead_letter(batch, error)
+                return
+
+            backoff = min(self._backoff_max, self._backoff_base * 2 ** (batch.attempts - 1))
+            delay = max(retry_after, random.uniform(backoff / 2, backoff))
+            batch.next_attempt_at = time.time() + delay
+            self._spool(batch)
+            self._logger.warning(
+                "Webhook delivery failed, retrying",
+                url=batch.url,
+                attempts=batch.attempts,
+                retry_in=round(delay, 2),
+                error=error,
+            )
+
+    async def _post(self, batch: WebhookBatch) -> tuple[float | None, str | None]:
+        """POST a batch once.
+
+        Returns:
+            ``(retry_after, error)``: ``error`` is None on success, and
+            ``retry_after`` is None when the failure is permanent.
+        """
+        try:
+            response = await self._client.post(
+                batch.url,
+                json={"events": batch.events},
+                headers={"X-Webhook-Batch-Id": batch.id},
+            )
+        except httpx.HTTPError as e:
+            return 0.0, f"{type(e).__name__}: {e}"
+        if response.is_success:
+            return None, None
+        error = f"HTTP {response.status_code}"
+        if response.status_code not in _RETRYABLE_STATUS:
+            return None, error
+        try:
+            retry_after = float(response.headers.get("Retry-After", 0))
+        except ValueError:
+            retry_after = 0.0
+        return retry_after, error
+
+    def _spool(self, batch: WebhookBatch) -> None:
+        """Atomically persist a batch."""
+        self._spool_dir.mkdir(parents=True, exist_ok=True)
+        path = self._spool_path(batch)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(asdict(batch)), encoding="utf-8")
+        os.replace(tmp_path, path)
+
+    def _dead_letter(self, batch: WebhookBatch, error: str) -> None:
+        """Keep a batch that cannot be delivered out of the retry queue."""
+        path = self._spool_path(batch)
+        with contextlib.suppress(FileNotFoundError):
+            path.rename(path.with_suffix(".dead.json"))
+        self.dead_events += len(batch.events)
+        self._logger.error(
+            "Webhook batch dropped",
+            url=batch.url,
+            events=len(batch.events),
+            attempts=batch.attempts,
+            error=error,
+        )
+
+    def _spool_path(self, batch: WebhookBatch) -> Path:
+        """Return the spool file of a batch."""
+        return self._spool_dir / f"{batch.id}.json"
+
+
+def alert_payload(event: AlertEvent) -> dict[str, Any]:
+    """Serialize a triggered alert for webhook delivery."""
+    rule = event.rule
+    weather_data = event.weather_data
+    return {
+        "type": "weather.alert",
+        "rule_id": rule.id,
+        "metric": rule.metric.value,
+        "direction": rule.direction.value,
+        "threshold": rule.threshold,
+        "value": event.value,
+        "previous_value": event.previous_value,
+        "units": weather_data.units.value,
+        "city": weather_data.city_name,
+        "country": weather_data.country,
+        "coordinates": {
+            "latitude": weather_data.coordinates.latitude,
+            "longitude": weather_data.coordinates.longitude,
+        },
+        "observed_at": weather_data.timestamp.isoformat(),
+        "triggered_at": event.triggered_at.isoformat(),
+    }
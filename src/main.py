@@ -16,13 +16,16 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     """
     from src.infrastructure.config import get_settings
     from src.infrastructure.logging import configure_logging
+    from src.presentation.dependencies import shutdown_dependencies, startup_dependencies
 
     settings = get_settings()
     configure_logging(
         log_level=settings.log_level,
         json_format=settings.environment != "dev",
     )
+    await startup_dependencies()
     yield
+    await shutdown_dependencies()
 
 
 def create_app() -> FastAPI:
@@ -32,9 +35,17 @@ def create_app() -> FastAPI:
         Configured FastAPI application instance.
     """
     from src.infrastructure.config import get_settings
+    from src.presentation.dependencies import get_client_request_limiter
     from src.presentation.exception_handlers import register_exception_handlers
-    from src.presentation.middleware import RequestLoggingMiddleware
-    from src.presentation.routers import health_router, weather_router
+    from src.presentation.middleware import ClientRateLimitMiddleware, RequestLoggingMiddleware
+    from src.presentation.routers import (
+        alerts_router,
+        cities_router,
+        health_router,
+        jobs_router,
+        peers_router,
+        weather_router,
+    )
 
     settings = get_settings()
 
@@ -48,7 +59,15 @@ def create_app() -> FastAPI:
         lifespan=lifespan,
     )
 
-    # Add middleware
+    # Add middleware (the last added runs first, so rejected requests are still logged)
+    app.add_middleware(
+        ClientRateLimitMiddleware,
+        limiter=get_client_request_limiter(),
+        path_prefix=f"/api/{settings.api_version}/",
+        api_key_header=settings.client_api_key_header,
+        api_keys=settings.client_api_keys,
+        proxy_hops=settings.client_proxy_hops,
+    )
     app.add_middleware(RequestLoggingMiddleware)
 
     # Register exception handlers
@@ -56,7 +75,11 @@ def create_app() -> FastAPI:
 
     # Include routers
     app.include_router(health_router)
+    app.include_router(peers_router)
     app.include_router(weather_router, prefix=f"/api/{settings.api_version}")
+    app.include_router(jobs_router, prefix=f"/api/{settings.api_version}")
+    app.include_router(alerts_router, prefix=f"/api/{settings.api_version}")
+    app.include_router(cities_router, prefix=f"/api/{settings.api_version}")
 
     # Serve static files (must be last, catches all unmatched routes)
     static_dir = Path(__file__).parent.parent / "static"
@@ -77,10 +100,15 @@ if __name__ == "__main__":
     from src.infrastructure.config import get_settings
 
     settings = get_settings()
-    uvicorn.run(
-        "src.main:get_app",
-        host="0.0.0.0",
-        port=8000,
-        reload=settings.environment == "dev",
-        factory=True,
-    )
+    if settings.environment == "dev":
+        uvicorn.run(
+            "src.main:get_app",
+            host="0.0.0.0",
+            port=8000,
+            reload=True,
+            factory=True,
+        )
+    else:
+        from src.server import main
+
+        raise SystemExit(main())
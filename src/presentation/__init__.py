@@ -1,26 +1,108 @@
 """Presentation layer exports."""
 
 from src.presentation.dependencies import (
+    get_alert_engine,
+    get_bulk_job_manager,
     get_cache,
+    get_cache_snapshotter,
+    get_cache_warmup,
+    get_city_index,
+    get_city_locator,
+    get_client_miss_limiter,
+    get_client_request_limiter,
+    get_compare_weather_use_case,
+    get_forecast_use_case,
+    get_gazetteer,
+    get_history_store,
+    get_inflight_tracker,
+    get_l2_cache,
     get_logger,
+    get_peer_cache_warmer,
+    get_peer_provider,
+    get_peer_weather_use_case,
+    get_route_weather_use_case,
+    get_upstream_provider,
+    get_warmup_requests,
+    get_weather_cache,
+    get_weather_grid_use_case,
     get_weather_provider,
+    get_weather_update_hub,
     get_weather_use_case,
+    get_webhook_dispatcher,
+    shutdown_dependencies,
+    startup_dependencies,
 )
 from src.presentation.exception_handlers import register_exception_handlers
-from src.presentation.middleware import RequestLoggingMiddleware
-from src.presentation.routers import health_router, weather_router
-from src.presentation.schemas import ErrorResponse, HealthResponse, WeatherResponse
+from src.presentation.middleware import ClientRateLimitMiddleware, RequestLoggingMiddleware
+from src.presentation.routers import (
+    alerts_router,
+    cities_router,
+    health_router,
+    jobs_router,
+    peers_router,
+    weather_router,
+)
+from src.presentation.schemas import (
+    AlertEventResponse,
+    AlertRuleResponse,
+    BulkJobResponse,
+    CacheStatsResponse,
+    CityAutocompleteResponse,
+    CompareWeatherResponse,
+    ErrorResponse,
+    HealthResponse,
+    WeatherGridResponse,
+    WeatherResponse,
+)
 
 __all__ = [
+    "AlertEventResponse",
+    "AlertRuleResponse",
+    "BulkJobResponse",
+    "CacheStatsResponse",
+    "CityAutocompleteResponse",
+    "ClientRateLimitMiddleware",
+    "CompareWeatherResponse",
     "ErrorResponse",
     "HealthResponse",
     "RequestLoggingMiddleware",
+    "WeatherGridResponse",
     "WeatherResponse",
+    "alerts_router",
+    "cities_router",
+    "get_alert_engine",
+    "get_bulk_job_manager",
     "get_cache",
+    "get_cache_snapshotter",
+    "get_cache_warmup",
+    "get_city_index",
+    "get_city_locator",
+    "get_client_miss_limiter",
+    "get_client_request_limiter",
+    "get_compare_weather_use_case",
+    "get_forecast_use_case",
+    "get_gazetteer",
+    "get_history_store",
+    "get_inflight_tracker",
+    "get_l2_cache",
     "get_logger",
+    "get_peer_cache_warmer",
+    "get_peer_provider",
+    "get_peer_weather_use_case",
+    "get_route_weather_use_case",
+    "get_upstream_provider",
+    "get_warmup_requests",
+    "get_weather_grid_use_case",
+    "get_weather_cache",
     "get_weather_provider",
+    "get_weather_update_hub",
     "get_weather_use_case",
+    "get_webhook_dispatcher",
     "health_router",
+    "jobs_router",
+    "peers_router",
     "register_exception_handlers",
+    "shutdown_dependencies",
+    "startup_dependencies",
     "weather_router",
 ]
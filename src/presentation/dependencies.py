@@ -2,25 +2,142 @@
 
 from functools import lru_cache
 
-from src.application.use_cases import GetWeatherUseCase
+from fastapi import Depends
+
+from src.application.alerts import AlertEngine
+from src.application.autocomplete import CityAutocompleteIndex
+from src.application.cache_warmup import CacheWarmup
+from src.application.inflight import InFlightTracker
+from src.application.interfaces import CachePort, CityLocatorPort, WeatherProviderPort
+from src.application.nearest_city import NearestCityIndex
+from src.application.use_cases import (
+    CompareWeatherUseCase,
+    GetForecastUseCase,
+    GetRouteWeatherUseCase,
+    GetWeatherGridUseCase,
+    GetWeatherUseCase,
+)
+from src.application.weather_updates import WeatherUpdateHub
+from src.domain.entities import City, WeatherRequest
+from src.domain.value_objects import UnitSystem
+from src.infrastructure.async_cache import AsyncCacheAdapter
 from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.cache_snapshot import CacheSnapshotter
 from src.infrastructure.config import get_settings
+from src.infrastructure.gazetteer import load_city_list, load_gazetteer
+from src.infrastructure.history import ObservationHistoryStore
+from src.infrastructure.jobs import BulkWeatherJobManager
 from src.infrastructure.logging import StructlogAdapter
+from src.infrastructure.peers import PeerCacheWarmer, PeerWeatherProvider
+from src.infrastructure.rate_limit import (
+    ClientBudgetedWeatherProvider,
+    RateLimitedWeatherProvider,
+    SlidingWindowLimiter,
+    TokenBucket,
+)
+from src.infrastructure.redis_cache import RedisCache
+from src.infrastructure.shm_cache import SharedMemoryCache
+from src.infrastructure.sqlite_cache import SQLiteCache
+from src.infrastructure.tiered_cache import SharedTieredCache, TieredCache
 from src.infrastructure.weather_provider import OpenWeatherMapClient
+from src.infrastructure.webhooks import WebhookDispatcher
 
 # Singleton instances
 _cache: InMemoryCache | None = None
+_weather_cache: CachePort | None = None
+_l2_cache: SQLiteCache | SharedMemoryCache | RedisCache | None = None
 _logger: StructlogAdapter | None = None
+_weather_update_hub: WeatherUpdateHub | None = None
+_bulk_job_manager: BulkWeatherJobManager | None = None
+_alert_engine: AlertEngine | None = None
+_webhook_dispatcher: WebhookDispatcher | None = None
+_history_store: ObservationHistoryStore | None = None
+_forecast_use_case: GetForecastUseCase | None = None
+_city_index: CityAutocompleteIndex | None = None
+_city_locator: NearestCityIndex | None = None
+_cache_snapshotter: CacheSnapshotter | None = None
+_peer_provider: PeerWeatherProvider | None = None
+_cache_warmup: CacheWarmup | None = None
+_inflight_tracker: InFlightTracker | None = None
 
 
 def get_cache() -> InMemoryCache:
-    """Get or create the cache singleton."""
+    """Get or create the in-memory (L1) cache singleton."""
     global _cache
     if _cache is None:
-        _cache = InMemoryCache()
+        settings = get_settings()
+        _cache = InMemoryCache(
+            max_entries=settings.cache_max_entries,
+            hot_entries=settings.cache_hot_entries,
+            admission=settings.cache_admission,
+        )
     return _cache
 
 
+def get_l2_cache() -> SQLiteCache | SharedMemoryCache | RedisCache | None:
+    """Get or create the second cache tier, or None if it is disabled."""
+    global _l2_cache
+    settings = get_settings()
+    if _l2_cache is None and settings.cache_l2_backend == "sqlite":
+        _l2_cache = SQLiteCache(
+            path=settings.cache_l2_sqlite_path or settings.data_dir / "cache.sqlite3",
+            logger=get_logger(),
+            batch_size=settings.cache_l2_batch_size,
+            flush_interval_seconds=settings.cache_l2_flush_interval_seconds,
+            cleanup_interval_seconds=settings.cache_l2_cleanup_interval_seconds,
+        )
+    elif _l2_cache is None and settings.cache_l2_backend == "shm":
+        _l2_cache = SharedMemoryCache(
+            name=settings.cache_l2_shm_name,
+            slots=settings.cache_l2_shm_slots,
+            slot_size=settings.cache_l2_shm_slot_size,
+        )
+    elif _l2_cache is None and settings.cache_l2_backend == "redis":
+        _l2_cache = RedisCache(
+            url=settings.cache_l2_redis_url,
+            logger=get_logger(),
+            pool_size=settings.cache_l2_redis_pool_size,
+            timeout_seconds=settings.cache_l2_redis_timeout_seconds,
+            key_prefix=settings.cache_l2_redis_key_prefix,
+        )
+    return _l2_cache
+
+
+def get_weather_cache() -> CachePort:
+    """Get the cache used for weather lookups: L1 alone, or L1 over the L2 tier.
+
+    The L1-only and shared-memory caches are called inline; with the SQLite
+    tier, which reads from disk, calls run in a worker thread, and the Redis
+    tier is awaited directly.
+    """
+    global _weather_cache
+    if _weather_cache is None:
+        l2 = get_l2_cache()
+        if l2 is None:
+            _weather_cache = AsyncCacheAdapter(get_cache())
+        elif isinstance(l2, RedisCache):
+            _weather_cache = SharedTieredCache(get_cache(), l2)
+        elif isinstance(l2, SharedMemoryCache):
+            _weather_cache = AsyncCacheAdapter(TieredCache(get_cache(), l2))
+        else:
+            _weather_cache = AsyncCacheAdapter(TieredCache(get_cache(), l2), offload=True)
+    return _weather_cache
+
+
+def get_cache_snapshotter() -> CacheSnapshotter | None:
+    """Get or create the cache snapshotter singleton, or None if snapshots are disabled."""
+    global _cache_snapshotter
+    settings = get_settings()
+    if _cache_snapshotter is None and settings.cache_snapshot_enabled:
+        _cache_snapshotter = CacheSnapshotter(
+            cache=get_cache(),
+            logger=get_logger(),
+            path=settings.cache_snapshot_path or settings.data_dir / "cache.snapshot",
+            interval_seconds=settings.cache_snapshot_interval_seconds,
+        )
+    return _cache_snapshotter
+
+
 def get_logger() -> StructlogAdapter:
     """Get or create the logger singleton."""
     global _logger
@@ -29,15 +146,144 @@ def get_logger() -> StructlogAdapter:
     return _logger
 
 
+def get_alert_engine() -> AlertEngine:
+    """Get or create the alert rule engine singleton."""
+    global _alert_engine
+    if _alert_engine is None:
+        _alert_engine = AlertEngine(
+            logger=get_logger(), history_size=get_settings().alert_history_size
+        )
+        _alert_engine.add_listener(get_webhook_dispatcher().publish_alerts)
+    return _alert_engine
+
+
+def get_history_store() -> ObservationHistoryStore:
+    """Get or create the observation history store singleton."""
+    global _history_store
+    if _history_store is None:
+        settings = get_settings()
+        _history_store = ObservationHistoryStore(
+            logger=get_logger(),
+            history_dir=settings.history_dir or settings.data_dir / "history",
+            capacity=settings.history_capacity,
+            max_open_files=settings.history_max_open_files,
+        )
+    return _history_store
+
+
+@lru_cache
+def get_gazetteer() -> tuple[City, ...]:
+    """Get the cities of the configured gazetteer, read once."""
+    return tuple(load_gazetteer(get_settings().gazetteer_path))
+
+
+def get_city_index() -> CityAutocompleteIndex:
+    """Get or create the city autocomplete index singleton."""
+    global _city_index
+    if _city_index is None:
+        _city_index = CityAutocompleteIndex(
+            get_gazetteer(), max_learned=get_settings().autocomplete_max_learned
+        )
+    return _city_index
+
+
+def get_city_locator() -> CityLocatorPort:
+    """Get or create the nearest-city spatial index singleton."""
+    global _city_locator
+    if _city_locator is None:
+        _city_locator = NearestCityIndex(get_gazetteer())
+    return _city_locator
+
+
+def get_webhook_dispatcher() -> WebhookDispatcher:
+    """Get or create the webhook dispatcher singleton."""
+    global _webhook_dispatcher
+    if _webhook_dispatcher is None:
+        settings = get_settings()
+        _webhook_dispatcher = WebhookDispatcher(
+            logger=get_logger(),
+            spool_dir=settings.webhook_spool_dir or settings.data_dir / "webhooks",
+            batch_size=settings.webhook_batch_size,
+            batch_interval_seconds=settings.webhook_batch_interval_seconds,
+            max_concurrency_per_destination=settings.webhook_max_concurrency,
+            max_connections=settings.webhook_max_connections,
+            max_attempts=settings.webhook_max_attempts,
+            timeout_seconds=settings.http_timeout_seconds,
+        )
+    return _webhook_dispatcher
+
+
 @lru_cache
-def get_weather_provider() -> OpenWeatherMapClient:
-    """Get cached weather provider instance."""
+def get_upstream_provider() -> WeatherProviderPort:
+    """Get cached OpenWeatherMap provider instance, paced by the upstream budget."""
     settings = get_settings()
-    return OpenWeatherMapClient(
+    client = OpenWeatherMapClient(
         api_key=settings.openweathermap_api_key,
         base_url=settings.openweathermap_base_url,
         timeout_seconds=settings.http_timeout_seconds,
     )
+    bucket = TokenBucket(
+        rate_per_second=settings.upstream_requests_per_minute / 60,
+        capacity=settings.upstream_burst,
+    )
+    return RateLimitedWeatherProvider(
+        client, bucket, max_wait_seconds=settings.upstream_max_wait_seconds
+    )
+
+
+def get_peer_provider() -> PeerWeatherProvider | None:
+    """Get or create the peer routing provider singleton, or None without peers.
+
+    Raises:
+        ValueError: If peers are configured without this replica's URL or a token.
+    """
+    global _peer_provider
+    settings = get_settings()
+    if _peer_provider is None and settings.peer_urls:
+        if settings.peer_self_url is None or not settings.peer_token:
+            msg = "PEER_URLS requires PEER_SELF_URL and PEER_TOKEN"
+            raise ValueError(msg)
+        _peer_provider = PeerWeatherProvider(
+            provider=get_upstream_provider(),
+            peers=settings.peer_urls,
+            self_url=settings.peer_self_url,
+            token=settings.peer_token,
+            logger=get_logger(),
+            timeout_seconds=settings.peer_timeout_seconds,
+        )
+    return _peer_provider
+
+
+@lru_cache
+def get_client_request_limiter() -> SlidingWindowLimiter | None:
+    """Get the per-client API request budget, or None if disabled."""
+    limit = get_settings().client_requests_per_minute
+    return SlidingWindowLimiter(limit) if limit else None
+
+
+@lru_cache
+def get_client_miss_limiter() -> SlidingWindowLimiter | None:
+    """Get the per-client budget of cache misses, or None if disabled."""
+    limit = get_settings().client_misses_per_minute
+    return SlidingWindowLimiter(limit) if limit else None
+
+
+def get_weather_provider() -> WeatherProviderPort:
+    """Get the weather provider: routed through the owning peer, or upstream directly.
+
+    Fetches are charged to the requesting client's miss budget when one is set.
+    """
+    provider = get_peer_provider() or get_upstream_provider()
+    limiter = get_client_miss_limiter()
+    return provider if limiter is None else ClientBudgetedWeatherProvider(provider, limiter)
+
+
+def get_inflight_tracker() -> InFlightTracker:
+    """Get or create the tracker of upstream fetches drained on shutdown."""
+    global _inflight_tracker
+    if _inflight_tracker is None:
+        _inflight_tracker = InFlightTracker()
+    return _inflight_tracker
 
 
 def get_weather_use_case() -> GetWeatherUseCase:
@@ -45,7 +291,225 @@ def get_weather_use_case() -> GetWeatherUseCase:
     settings = get_settings()
     return GetWeatherUseCase(
         weather_provider=get_weather_provider(),
-        cache=get_cache(),
+        cache=get_weather_cache(),
         logger=get_logger(),
         cache_ttl_seconds=settings.cache_ttl_seconds,
+        observers=[get_alert_engine(), get_history_store(), get_city_index()],
+        city_locator=get_city_locator(),
+        snap_max_distance_km=settings.coordinate_snap_max_distance_km,
+        tracker=get_inflight_tracker(),
     )
+
+
+def get_peer_weather_use_case() -> GetWeatherUseCase:
+    """Get the GetWeatherUseCase serving peers, which never forwards a fetch again."""
+    settings = get_settings()
+    peers = get_peer_provider()
+    return GetWeatherUseCase(
+        weather_provider=peers.owned if peers is not None else get_upstream_provider(),
+        cache=get_weather_cache(),
+        logger=get_logger(),
+        cache_ttl_seconds=settings.cache_ttl_seconds,
+        observers=[get_alert_engine(), get_history_store(), get_city_index()],
+        city_locator=get_city_locator(),
+        snap_max_distance_km=settings.coordinate_snap_max_distance_km,
+        tracker=get_inflight_tracker(),
+    )
+
+
+def get_forecast_use_case() -> GetForecastUseCase:
+    """Get or create the forecast use case singleton, which owns the forecast cache."""
+    global _forecast_use_case
+    if _forecast_use_case is None:
+        settings = get_settings()
+        _forecast_use_case = GetForecastUseCase(
+            weather_provider=get_weather_provider(),
+            logger=get_logger(),
+            cache_ttl_seconds=settings.forecast_cache_ttl_seconds,
+            max_entries=settings.forecast_cache_max_entries,
+        )
+    return _forecast_use_case
+
+
+def get_weather_grid_use_case(
+    weather_use_case: GetWeatherUseCase = Depends(get_weather_use_case),
+) -> GetWeatherGridUseCase:
+    """Get the GetWeatherGridUseCase with all dependencies."""
+    return GetWeatherGridUseCase(
+        weather_use_case=weather_use_case,
+        logger=get_logger(),
+        max_concurrency=get_settings().batch_max_concurrency,
+    )
+
+
+def get_route_weather_use_case(
+    weather_use_case: GetWeatherUseCase = Depends(get_weather_use_case),
+) -> GetRouteWeatherUseCase:
+    """Get the GetRouteWeatherUseCase with all dependencies."""
+    settings = get_settings()
+    return GetRouteWeatherUseCase(
+        weather_use_case=weather_use_case,
+        logger=get_logger(),
+        max_concurrency=settings.batch_max_concurrency,
+        max_samples=settings.route_max_samples,
+    )
+
+
+def get_compare_weather_use_case(
+    weather_use_case: GetWeatherUseCase = Depends(get_weather_use_case),
+) -> CompareWeatherUseCase:
+    """Get the CompareWeatherUseCase with all dependencies."""
+    return CompareWeatherUseCase(
+        weather_use_case=weather_use_case,
+        logger=get_logger(),
+        max_concurrency=get_settings().batch_max_concurrency,
+    )
+
+
+def get_weather_update_hub() -> WeatherUpdateHub:
+    """Get or create the live weather update hub singleton."""
+    global _weather_update_hub
+    if _weather_update_hub is None:
+        _weather_update_hub = WeatherUpdateHub(
+            use_case=get_weather_use_case(),
+            logger=get_logger(),
+            poll_interval_seconds=get_settings().sse_poll_interval_seconds,
+        )
+    return _weather_update_hub
+
+
+def get_bulk_job_manager() -> BulkWeatherJobManager:
+    """Get or create the bulk job manager singleton."""
+    global _bulk_job_manager
+    if _bulk_job_manager is None:
+        settings = get_settings()
+        _bulk_job_manager = BulkWeatherJobManager(
+            use_case=get_weather_use_case(),
+            logger=get_logger(),
+            jobs_dir=settings.jobs_dir or settings.data_dir / "jobs",
+            workers=settings.jobs_workers,
+            max_rows=settings.jobs_max_rows,
+            retention_seconds=settings.jobs_retention_seconds,
+            max_active_jobs=settings.jobs_max_active,
+        )
+    return _bulk_job_manager
+
+
+def get_peer_cache_warmer() -> PeerCacheWarmer | None:
+    """Create the startup cache copier, or None if no warm-up peer is configured.
+
+    Raises:
+        ValueError: If a warm-up peer is configured without a peer token.
+    """
+    settings = get_settings()
+    if settings.peer_warmup_url is None:
+        return None
+    if not settings.peer_token:
+        msg = "PEER_WARMUP_URL requires PEER_TOKEN"
+        raise ValueError(msg)
+    return PeerCacheWarmer(
+        cache=get_cache(),
+        peer_url=settings.peer_warmup_url,
+        token=settings.peer_token,
+        logger=get_logger(),
+        timeout_seconds=settings.peer_warmup_timeout_seconds,
+    )
+
+
+def get_cache_warmup() -> CacheWarmup:
+    """Get or create the startup cache warm-up singleton."""
+    global _cache_warmup
+    if _cache_warmup is None:
+        _cache_warmup = CacheWarmup(
+            use_case=get_weather_use_case(),
+            logger=get_logger(),
+            max_concurrency=get_settings().cache_warmup_concurrency,
+        )
+    return _cache_warmup
+
+
+def get_warmup_requests() -> list[WeatherRequest]:
+    """Build the requests for the configured warm-up cities, skipping invalid names."""
+    settings = get_settings()
+    cities = list(settings.cache_warmup_cities)
+    if settings.cache_warmup_file is not None:
+        cities.extend(load_city_list(settings.cache_warmup_file))
+    units = UnitSystem(settings.cache_warmup_units)
+    requests: dict[str, WeatherRequest] = {}
+    for city in cities:
+        try:
+            request = WeatherRequest(city=city, units=units)
+        except ValueError as e:
+            get_logger().warning("Invalid warm-up city skipped", city=city, error=str(e))
+            continue
+        requests.setdefault(request.cache_key, request)
+    return list(requests.values())
+
+
+async def startup_dependencies() -> None:
+    """Start background work, build in-memory indexes and warm the cache before serving."""
+    get_city_index()
+    get_city_locator()
+    snapshotter = get_cache_snapshotter()
+    if snapshotter is not None:
+        await snapshotter.start()
+    warmer = get_peer_cache_warmer()
+    if warmer is not None:
+        await warmer.warm()
+    requests = get_warmup_requests()
+    if requests:
+        settings = get_settings()
+        warmup = get_cache_warmup()
+        await warmup.start(requests)
+        if settings.cache_warmup_ready_fraction > 0:
+            await warmup.wait_ready(
+                settings.cache_warmup_ready_fraction, settings.cache_warmup_timeout_seconds
+            )
+    await get_webhook_dispatcher().start()
+
+
+async def shutdown_dependencies() -> None:
+    """Stop background work, drain in-flight fetches, then flush and close the singletons."""
+    global _weather_update_hub, _bulk_job_manager, _webhook_dispatcher, _history_store
+    global _cache_snapshotter, _weather_cache, _l2_cache, _peer_provider, _cache_warmup
+    global _inflight_tracker
+    if _cache_warmup is not None:
+        await _cache_warmup.close()
+        _cache_warmup = None
+    if _weather_update_hub is not None:
+        await _weather_update_hub.close()
+        _weather_update_hub = None
+    if _bulk_job_manager is not None:
+        await _bulk_job_manager.close()
+        _bulk_job_manager = None
+    if _inflight_tracker is not None:
+        # Producers (warm-up, live updates, bulk jobs) are stopped above; let the
+        # fetches already running land in the cache (and reach observers) before
+        # the caches and dispatchers close below.
+        report = await _inflight_tracker.drain(get_settings().shutdown_drain_timeout_seconds)
+        get_logger().info(
+            "In-flight work drained",
+            drained=report.drained,
+            abandoned=report.abandoned,
+            duration_ms=report.duration_ms,
+        )
+        _inflight_tracker = None
+    if _webhook_dispatcher is not None:
+        await _webhook_dispatcher.close()
+        _webhook_dispatcher = None
+    if _history_store is not None:
+        _history_store.close()
+        _history_store = None
+    if _cache_snapshotter is not None:
+        await _cache_snapshotter.close()
+        _cache_snapshotter = None
+    if _l2_cache is not None:
+        if isinstance(_l2_cache, RedisCache):
+            await _l2_cache.close()
+        else:
+            _l2_cache.close()
+        _l2_cache = None
+        _weather_cache = None
+    if _peer_provider is not None:
+        await _peer_provider.close()
+        _peer_provider = None
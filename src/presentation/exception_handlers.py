@@ -4,8 +4,11 @@ from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 
 from src.domain.exceptions import (
+    AlertRuleNotFoundError,
     CityNotFoundError,
     InvalidCityNameError,
+    JobNotFoundError,
+    JobQueueFullError,
     RateLimitExceededError,
     WeatherAppError,
     WeatherProviderError,
@@ -13,6 +16,28 @@ from src.domain.exceptions import (
 from src.presentation.dependencies import get_logger
 
 
+def rate_limit_response(exc: RateLimitExceededError) -> JSONResponse:
+    """Build the 429 response for a rate limit error.
+
+    Args:
+        exc: The rate limit error.
+
+    Returns:
+        The error body with a ``Retry-After`` header.
+    """
+    return JSONResponse(
+        status_code=429,
+        content={
+            "error": {
+                "code": exc.code,
+                "message": exc.message,
+                "retry_after": exc.retry_after_seconds,
+            }
+        },
+        headers={"Retry-After": str(exc.retry_after_seconds)},
+    )
+
+
 def register_exception_handlers(app: FastAPI) -> None:
     """Register all exception handlers on the FastAPI app.
 
@@ -54,16 +79,27 @@ def register_exception_handlers(app: FastAPI) -> None:
             },
         )
 
-    @app.exception_handler(RateLimitExceededError)
-    async def rate_limit_handler(request: Request, exc: RateLimitExceededError) -> JSONResponse:
-        """Handle rate limit exceeded errors."""
-        get_logger().warning(
-            "Rate limit exceeded",
-            retry_after=exc.retry_after_seconds,
-            path=request.url.path,
+    @app.exception_handler(JobNotFoundError)
+    async def job_not_found_handler(request: Request, exc: JobNotFoundError) -> JSONResponse:
+        """Handle unknown bulk job errors."""
+        get_logger().warning("Job not found", job_id=exc.job_id, path=request.url.path)
+        return JSONResponse(
+            status_code=404,
+            content={
+                "error": {
+                    "code": exc.code,
+                    "message": exc.message,
+                    "retry_after": None,
+                }
+            },
         )
+
+    @app.exception_handler(JobQueueFullError)
+    async def job_queue_full_handler(request: Request, exc: JobQueueFullError) -> JSONResponse:
+        """Handle bulk job submissions beyond the active job limit."""
+        get_logger().warning("Bulk job queue full", max_jobs=exc.max_jobs, path=request.url.path)
         return JSONResponse(
-            status_code=429,
+            status_code=503,
             content={
                 "error": {
                     "code": exc.code,
@@ -74,6 +110,33 @@ def register_exception_handlers(app: FastAPI) -> None:
             headers={"Retry-After": str(exc.retry_after_seconds)},
         )
 
+    @app.exception_handler(AlertRuleNotFoundError)
+    async def alert_rule_not_found_handler(
+        request: Request, exc: AlertRuleNotFoundError
+    ) -> JSONResponse:
+        """Handle unknown alert rule errors."""
+        get_logger().warning("Alert rule not found", rule_id=exc.rule_id, path=request.url.path)
+        return JSONResponse(
+            status_code=404,
+            content={
+                "error": {
+                    "code": exc.code,
+                    "message": exc.message,
+                    "retry_after": None,
+                }
+            },
+        )
+
+    @app.exception_handler(RateLimitExceededError)
+    async def rate_limit_handler(request: Request, exc: RateLimitExceededError) -> JSONResponse:
+        """Handle rate limit exceeded errors."""
+        get_logger().warning(
+            "Rate limit exceeded",
+            retry_after=exc.retry_after_seconds,
+            path=request.url.path,
+        )
+        return rate_limit_response(exc)
+
     @app.exception_handler(WeatherProviderError)
     async def weather_provider_handler(request: Request, exc: WeatherProviderError) -> JSONResponse:
         """Handle weather provider errors."""
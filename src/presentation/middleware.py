@@ -1,11 +1,17 @@
-"""Request logging middleware."""
+"""Request logging and inbound rate limiting middleware."""
 
+import hashlib
 import time
+from collections.abc import Iterable
 
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.types import ASGIApp, Receive, Scope, Send
 
+from src.domain.exceptions import RateLimitExceededError
+from src.infrastructure.rate_limit import SlidingWindowLimiter, current_client
 from src.presentation.dependencies import get_logger
+from src.presentation.exception_handlers import rate_limit_response
 
 
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
@@ -60,3 +66,96 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
                 duration_ms=round(duration_ms, 2),
             )
             raise
+
+
+class ClientRateLimitMiddleware:
+    """ASGI middleware identifying the client and enforcing its request budget.
+
+    Written against raw ASGI rather than BaseHTTPMiddleware so a rejected
+    request costs no request parsing or extra task. The client is its API
+    key when the header carries one of the configured keys, otherwise its IP
+    address; unknown keys are ignored, so inventing keys cannot buy a fresh
+    budget. The identity is stored in ``current_client`` for the rest of the
+    request, so cache misses deeper in the stack are charged to the same
+    client's miss budget.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        limiter: SlidingWindowLimiter | None,
+        path_prefix: str = "/api/",
+        api_key_header: str = "X-API-Key",
+        api_keys: Iterable[str] = (),
+        proxy_hops: int = 0,
+    ) -> None:
+        """Initialize the middleware.
+
+        Args:
+            app: The wrapped ASGI application.
+            limiter: Per-client request budget; None only identifies clients.
+            path_prefix: Only requests under this path are identified and limited.
+            api_key_header: Header identifying a client.
+            api_keys: Keys accepted in ``api_key_header``; with none, clients are
+                always identified by IP.
+            proxy_hops: Trusted proxies appending to ``X-Forwarded-For``.
+        """
+        self._app = app
+        self._limiter = limiter
+        self._prefix = path_prefix
+        self._api_key_header = api_key_header.lower().encode("latin-1")
+        # Identities carry a digest of the key so the key itself never reaches the logs
+        self._api_keys = {
+            key.encode("latin-1"): f"key:{hashlib.sha256(key.encode('latin-1')).hexdigest()[:16]}"
+            for key in api_keys
+        }
+        self._proxy_hops = proxy_hops
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Reject the request with a 429 if its client is over budget."""
+        if scope["type"] != "http" or not scope["path"].startswith(self._prefix):
+            await self._app(scope, receive, send)
+            return
+        client = self.client_key(scope)
+        token = current_client.set(client)
+        try:
+            if self._limiter is not None:
+                try:
+                    self._limiter.hit(client)
+                except RateLimitExceededError as e:
+                    get_logger().warning(
+                        "Client rate limit exceeded",
+                        client=client,
+                        retry_after=e.retry_after_seconds,
+                        path=scope["path"],
+                    )
+                    await rate_limit_response(e)(scope, receive, send)
+                    return
+            await self._app(scope, receive, send)
+        finally:
+            current_client.reset(token)
+
+    def client_key(self, scope: Scope) -> str:
+        """Return the identity a request is limited under.
+
+        Args:
+            scope: The ASGI connection scope.
+
+        Returns:
+            ``key:<digest>`` when the API key header carries a configured key,
+            otherwise ``ip:<address>``.
+        """
+        forwarded = b""
+        for name, value in scope["headers"]:
+            if name == self._api_key_header and value in self._api_keys:
+                return self._api_keys[value]
+            if name == b"x-forwarded-for":
+                forwarded = value
+        if self._proxy_hops and forwarded:
+            addresses = [address.strip() for address in forwarded.decode("latin-1").split(",")]
+            # A shorter list did not pass through every trusted proxy; its leftmost
+            # entries are whatever the client sent, so use the connection instead
+            if len(addresses) >= self._proxy_hops:
+                return f"ip:{addresses[-self._proxy_hops]}"
+        client = scope.get("client")
+        return f"ip:{client[0] if client else 'unknown'}"
@@ -1,6 +1,17 @@
 """API routers."""
 
+from src.presentation.routers.alerts import router as alerts_router
+from src.presentation.routers.cities import router as cities_router
 from src.presentation.routers.health import router as health_router
+from src.presentation.routers.jobs import router as jobs_router
+from src.presentation.routers.peers import router as peers_router
 from src.presentation.routers.weather import router as weather_router
 
-__all__ = ["health_router", "weather_router"]
+__all__ = [
+    "alerts_router",
+    "cities_router",
+    "health_router",
+    "jobs_router",
+    "peers_router",
+    "weather_router",
+]
@@ -0,0 +1,139 @@
+"""Weather alert rule API router."""
+
+from fastapi import APIRouter, Depends, Response
+
+from src.application.alerts import AlertEngine
+from src.application.use_cases import GetWeatherUseCase
+from src.presentation.dependencies import get_alert_engine, get_weather_use_case
+from src.presentation.schemas import AlertEventResponse, AlertRuleRequest, AlertRuleResponse
+
+router = APIRouter(prefix="/alerts", tags=["Alerts"])
+
+
+@router.post(
+    "",
+    response_model=AlertRuleResponse,
+    status_code=201,
+    summary="Create an alert rule",
+    description=(
+        "Register a threshold rule for one metric at a city or coordinates. Rules are "
+        "evaluated whenever fresh weather data for the location is fetched and fire "
+        "when the value crosses the threshold in the given direction, optionally "
+        "notifying a webhook URL."
+    ),
+    responses={
+        201: {"description": "Rule created"},
+        404: {"description": "City not found"},
+        422: {"description": "Validation error"},
+        429: {"description": "Rate limit exceeded"},
+    },
+)
+async def create_alert_rule(
+    body: AlertRuleRequest,
+    engine: AlertEngine = Depends(get_alert_engine),
+    use_case: GetWeatherUseCase = Depends(get_weather_use_case),
+) -> AlertRuleResponse:
+    """Create an alert rule.
+
+    Args:
+        body: The rule definition.
+        engine: Injected AlertEngine.
+        use_case: Injected GetWeatherUseCase.
+
+    Returns:
+        AlertRuleResponse describing the new rule.
+    """
+    # Watch the location the use case publishes under, which may be a nearby city
+    request = use_case.snap(body.to_weather_request())
+    # Resolve the location first so rules for unknown cities are rejected
+    await use_case.execute(request)
+    rule = engine.add_rule(
+        request,
+        body.metric,
+        body.direction,
+        body.threshold,
+        webhook_url=str(body.webhook_url) if body.webhook_url else None,
+    )
+    return AlertRuleResponse.from_rule(rule)
+
+
+@router.get("", response_model=list[AlertRuleResponse], summary="List alert rules")
+async def list_alert_rules(
+    engine: AlertEngine = Depends(get_alert_engine),
+) -> list[AlertRuleResponse]:
+    """List all alert rules, oldest first.
+
+    Args:
+        engine: Injected AlertEngine.
+
+    Returns:
+        The registered rules.
+    """
+    return [AlertRuleResponse.from_rule(rule) for rule in engine.list_rules()]
+
+
+@router.get(
+    "/{rule_id}",
+    response_model=AlertRuleResponse,
+    summary="Get an alert rule",
+    responses={404: {"description": "Rule not found"}},
+)
+async def get_alert_rule(
+    rule_id: str,
+    engine: AlertEngine = Depends(get_alert_engine),
+) -> AlertRuleResponse:
+    """Return an alert rule.
+
+    Args:
+        rule_id: The rule id.
+        engine: Injected AlertEngine.
+
+    Returns:
+        AlertRuleResponse for the rule.
+    """
+    return AlertRuleResponse.from_rule(engine.get_rule(rule_id))
+
+
+@router.delete(
+    "/{rule_id}",
+    status_code=204,
+    summary="Delete an alert rule",
+    responses={404: {"description": "Rule not found"}},
+)
+async def delete_alert_rule(
+    rule_id: str,
+    engine: AlertEngine = Depends(get_alert_engine),
+) -> Response:
+    """Delete an alert rule.
+
+    Args:
+        rule_id: The rule id.
+        engine: Injected AlertEngine.
+
+    Returns:
+        Empty 204 response.
+    """
+    engine.remove_rule(rule_id)
+    return Response(status_code=204)
+
+
+@router.get(
+    "/{rule_id}/events",
+    response_model=list[AlertEventResponse],
+    summary="List recent alert events",
+    responses={404: {"description": "Rule not found"}},
+)
+async def list_alert_events(
+    rule_id: str,
+    engine: AlertEngine = Depends(get_alert_engine),
+) -> list[AlertEventResponse]:
+    """Return the recent events of a rule, newest first.
+
+    Args:
+        rule_id: The rule id.
+        engine: Injected AlertEngine.
+
+    Returns:
+        The rule's recent events.
+    """
+    return [AlertEventResponse.from_event(event) for event in engine.events(rule_id)]
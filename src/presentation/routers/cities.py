@@ -0,0 +1,41 @@
+"""City lookup API router."""
+
+from fastapi import APIRouter, Depends, Query
+
+from src.application.autocomplete import CityAutocompleteIndex
+from src.presentation.dependencies import get_city_index
+from src.presentation.schemas import CityAutocompleteResponse, CitySuggestionResponse
+
+router = APIRouter(prefix="/cities", tags=["Cities"])
+
+
+@router.get(
+    "/autocomplete",
+    response_model=CityAutocompleteResponse,
+    summary="Suggest city names",
+    description=(
+        "Return cities with a name or name word starting with the given prefix, "
+        "ranked by population and how often they are looked up. Served from an "
+        "in-memory index without calling the weather provider."
+    ),
+    responses={422: {"description": "Validation error"}},
+)
+async def autocomplete_cities(
+    q: str = Query(..., min_length=1, max_length=100, description="Typed prefix"),
+    limit: int = Query(default=10, ge=1, le=50, description="Maximum suggestions"),
+    index: CityAutocompleteIndex = Depends(get_city_index),
+) -> CityAutocompleteResponse:
+    """Suggest city names for a prefix.
+
+    Args:
+        q: Text typed so far.
+        limit: Maximum number of suggestions.
+        index: Injected CityAutocompleteIndex.
+
+    Returns:
+        CityAutocompleteResponse with the best matches first.
+    """
+    return CityAutocompleteResponse(
+        query=q,
+        results=[CitySuggestionResponse.from_city(city) for city in index.search(q, limit)],
+    )
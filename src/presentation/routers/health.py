@@ -1,9 +1,11 @@
 """Health check router."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
+from src.infrastructure.cache import InMemoryCache
 from src.infrastructure.config import get_settings
-from src.presentation.schemas import HealthResponse
+from src.presentation.dependencies import get_cache
+from src.presentation.schemas import CacheStatsResponse, HealthResponse
 
 router = APIRouter(tags=["Health"])
 
@@ -26,3 +28,21 @@ async def health_check() -> HealthResponse:
         version=settings.api_version,
         environment=settings.environment,
     )
+
+
+@router.get(
+    "/health/cache",
+    response_model=CacheStatsResponse,
+    summary="Cache statistics",
+    description="Hit ratio, size and admission counters of the in-memory weather cache.",
+)
+async def cache_stats(cache: InMemoryCache = Depends(get_cache)) -> CacheStatsResponse:
+    """Return statistics of the in-memory cache.
+
+    Args:
+        cache: The in-memory cache.
+
+    Returns:
+        CacheStatsResponse with the cache's counters.
+    """
+    return CacheStatsResponse.from_cache(cache)
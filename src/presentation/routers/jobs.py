@@ -0,0 +1,116 @@
+"""Bulk weather job API router."""
+
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import StreamingResponse
+
+from src.domain.value_objects import UnitSystem
+from src.infrastructure.jobs import BulkWeatherJobManager
+from src.presentation.dependencies import get_bulk_job_manager
+from src.presentation.schemas import BulkJobResponse
+
+router = APIRouter(prefix="/weather/jobs", tags=["Jobs"])
+
+_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+@router.post(
+    "",
+    response_model=BulkJobResponse,
+    status_code=202,
+    summary="Submit a bulk weather job",
+    description=(
+        "Upload a CSV (request body, Content-Type text/csv) with a 'city' column or "
+        "'lat' and 'lon' columns, plus optional 'id' and 'units' columns. Rows are "
+        "processed in the background; poll the returned job for progress."
+    ),
+    responses={
+        202: {"description": "Job accepted"},
+        422: {"description": "Invalid CSV upload"},
+        503: {"description": "Too many bulk jobs in progress"},
+    },
+)
+async def create_job(
+    request: Request,
+    units: UnitSystem = Query(
+        default=UnitSystem.METRIC, description="Units for rows without a 'units' value"
+    ),
+    manager: BulkWeatherJobManager = Depends(get_bulk_job_manager),
+) -> BulkJobResponse:
+    """Create a bulk job from a streamed CSV upload.
+
+    Args:
+        request: The incoming request whose body is the CSV.
+        units: Default temperature unit system.
+        manager: Injected BulkWeatherJobManager.
+
+    Returns:
+        BulkJobResponse describing the new job.
+
+    Raises:
+        HTTPException: If the CSV cannot be used.
+    """
+    try:
+        job = await manager.create_job(request.stream(), units=units)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return BulkJobResponse.from_job(job)
+
+
+@router.get(
+    "/{job_id}",
+    response_model=BulkJobResponse,
+    summary="Get bulk job progress",
+    responses={404: {"description": "Job not found"}},
+)
+async def get_job(
+    job_id: str,
+    manager: BulkWeatherJobManager = Depends(get_bulk_job_manager),
+) -> BulkJobResponse:
+    """Return the status and progress of a bulk job.
+
+    Args:
+        job_id: The job id.
+        manager: Injected BulkWeatherJobManager.
+
+    Returns:
+        BulkJobResponse with progress counters.
+    """
+    return BulkJobResponse.from_job(manager.get(job_id))
+
+
+@router.get(
+    "/{job_id}/results",
+    summary="Download bulk job results",
+    description="Stream the results written so far as NDJSON (default) or CSV.",
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"application/x-ndjson": {}, "text/csv": {}}},
+        404: {"description": "Job not found"},
+    },
+)
+async def get_job_results(
+    job_id: str,
+    format: Literal["ndjson", "csv"] = Query(default="ndjson", description="Result format"),
+    manager: BulkWeatherJobManager = Depends(get_bulk_job_manager),
+) -> StreamingResponse:
+    """Stream a bulk job's results from disk.
+
+    Args:
+        job_id: The job id.
+        format: ``ndjson`` or ``csv``.
+        manager: Injected BulkWeatherJobManager.
+
+    Returns:
+        StreamingResponse over the results file.
+    """
+    job = manager.get(job_id)
+    return StreamingResponse(
+        manager.iter_results(job.id, fmt=format),
+        media_type=_MEDIA_TYPES[format],
+        headers={
+            "Content-Disposition": f'attachment; filename="weather-{job.id}.{format}"',
+            "X-Job-Status": job.status.value,
+        },
+    )
@@ -0,0 +1,83 @@
+"""Internal router serving other replicas of the peer cache."""
+
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+
+from src.application.use_cases import GetWeatherUseCase
+from src.domain.entities import WeatherRequest
+from src.domain.value_objects import Coordinates, UnitSystem
+from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.cache_codec import encode_weather
+from src.infrastructure.config import get_settings
+from src.presentation.dependencies import get_cache, get_peer_weather_use_case
+
+router = APIRouter(prefix="/internal/peer", tags=["Internal"], include_in_schema=False)
+
+
+def verify_peer_token(x_peer_token: str | None = Header(default=None)) -> None:
+    """Reject requests that do not carry the fleet's shared peer token.
+
+    Args:
+        x_peer_token: The ``X-Peer-Token`` request header.
+
+    Raises:
+        HTTPException: 404 if no peer token is configured, 403 if it does not match.
+    """
+    token = get_settings().peer_token
+    if not token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if x_peer_token is None or not hmac.compare_digest(x_peer_token.encode(), token.encode()):
+        raise HTTPException(status_code=403, detail="Invalid peer token")
+
+
+@router.get("/weather", dependencies=[Depends(verify_peer_token)])
+async def peer_weather(
+    city: str | None = Query(default=None, min_length=1, max_length=100),
+    lat: float | None = Query(default=None, ge=-90, le=90),
+    lon: float | None = Query(default=None, ge=-180, le=180),
+    units: UnitSystem = Query(default=UnitSystem.METRIC),
+    use_case: GetWeatherUseCase = Depends(get_peer_weather_use_case),
+) -> Response:
+    """Serve an observation this replica owns, from its cache or upstream.
+
+    Args:
+        city: The city name to query.
+        lat: Latitude coordinate.
+        lon: Longitude coordinate.
+        units: The temperature unit system.
+        use_case: Injected GetWeatherUseCase that never forwards to another peer.
+
+    Returns:
+        The observation in the compact binary cache encoding.
+
+    Raises:
+        HTTPException: If the location parameters are invalid.
+    """
+    try:
+        coordinates = (
+            Coordinates(latitude=lat, longitude=lon)
+            if lat is not None and lon is not None
+            else None
+        )
+        request = WeatherRequest(city=city or "", units=units, coordinates=coordinates)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    result = await use_case.execute(request)
+    return Response(
+        content=encode_weather(result.weather_data), media_type="application/octet-stream"
+    )
+
+
+@router.get("/cache", dependencies=[Depends(verify_peer_token)])
+async def peer_cache(cache: InMemoryCache = Depends(get_cache)) -> StreamingResponse:
+    """Stream every live cache entry to a replica warming up.
+
+    Args:
+        cache: The in-memory cache.
+
+    Returns:
+        The entries in the cache snapshot format, streamed in chunks.
+    """
+    return StreamingResponse(cache.snapshot_chunks(), media_type="application/octet-stream")
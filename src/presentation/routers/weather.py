@@ -1,12 +1,52 @@
 """Weather API router."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, timedelta
+from typing import Literal
 
-from src.application.use_cases import GetWeatherUseCase
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from fastapi.responses import JSONResponse, StreamingResponse
+
+from src.application.use_cases import (
+    CompareWeatherUseCase,
+    GetForecastUseCase,
+    GetRouteWeatherUseCase,
+    GetWeatherGridUseCase,
+    GetWeatherUseCase,
+    InterpolationMethod,
+)
+from src.application.weather_updates import WeatherUpdateHub
 from src.domain.entities import WeatherRequest
-from src.domain.value_objects import Coordinates, UnitSystem
-from src.presentation.dependencies import get_weather_use_case
-from src.presentation.schemas import WeatherResponse
+from src.domain.value_objects import BoundingBox, Coordinates, UnitSystem, WeatherMetric
+from src.infrastructure.config import get_settings
+from src.infrastructure.history import (
+    AggregatedSeries,
+    ObservationHistoryStore,
+    ObservationSeries,
+)
+from src.presentation.dependencies import (
+    get_compare_weather_use_case,
+    get_forecast_use_case,
+    get_history_store,
+    get_route_weather_use_case,
+    get_weather_grid_use_case,
+    get_weather_update_hub,
+    get_weather_use_case,
+)
+from src.presentation.schemas import (
+    CompareWeatherRequest,
+    CompareWeatherResponse,
+    ForecastResponse,
+    RouteWeatherRequest,
+    RouteWeatherResponse,
+    WeatherGridResponse,
+    WeatherHistoryResponse,
+    WeatherResponse,
+)
+
+# Reconnection delay advertised to EventSource clients
+_SSE_RETRY_MS = 3000
 
 router = APIRouter(prefix="/weather", tags=["Weather"])
 
@@ -63,6 +103,478 @@ async def get_weather(
     Returns:
         WeatherResponse with current conditions.
 
+    Raises:
+        HTTPException: If validation fails or coordinates are incomplete.
+    """
+    request = _build_request(city, lat, lon, units)
+    result = await use_case.execute(request)
+    return WeatherResponse.from_result(result)
+
+
+@router.get(
+    "/stream",
+    summary="Stream live weather updates",
+    description=(
+        "Server-Sent Events stream that pushes an event whenever the cached weather "
+        "for a city or coordinates changes. Supports resuming with Last-Event-ID."
+    ),
+    response_class=StreamingResponse,
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Event stream"},
+        404: {"description": "City not found"},
+        422: {"description": "Validation error"},
+        429: {"description": "Rate limit exceeded"},
+    },
+)
+async def stream_weather(
+    city: str | None = Query(
+        default=None,
+        min_length=1,
+        max_length=100,
+        description="City name to follow",
+    ),
+    lat: float | None = Query(default=None, ge=-90, le=90, description="Latitude coordinate"),
+    lon: float | None = Query(default=None, ge=-180, le=180, description="Longitude coordinate"),
+    units: UnitSystem = Query(default=UnitSystem.METRIC, description="Temperature units"),
+    last_event_id: int | None = Header(default=None, alias="Last-Event-ID"),
+    use_case: GetWeatherUseCase = Depends(get_weather_use_case),
+    hub: WeatherUpdateHub = Depends(get_weather_update_hub),
+) -> StreamingResponse:
+    """Stream weather changes for a city or coordinates as Server-Sent Events.
+
+    Args:
+        city: The city name to follow.
+        lat: Latitude coordinate.
+        lon: Longitude coordinate.
+        units: The temperature unit system.
+        last_event_id: Id of the last event received before reconnecting.
+        use_case: Injected GetWeatherUseCase.
+        hub: Injected WeatherUpdateHub.
+
+    Returns:
+        StreamingResponse emitting ``weather`` events and heartbeat comments.
+    """
+    request = _build_request(city, lat, lon, units)
+    # Resolve the location up front so unknown cities fail with a normal error
+    # response instead of an empty stream; this also primes the cache.
+    await use_case.execute(request)
+
+    return StreamingResponse(
+        sse_event_stream(
+            hub,
+            request,
+            last_event_id=last_event_id,
+            heartbeat_seconds=get_settings().sse_heartbeat_seconds,
+        ),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+async def sse_event_stream(
+    hub: WeatherUpdateHub,
+    request: WeatherRequest,
+    last_event_id: int | None = None,
+    heartbeat_seconds: float = 15.0,
+) -> AsyncIterator[str]:
+    """Yield Server-Sent Events frames for a location's weather updates.
+
+    Args:
+        hub: The hub sharing refreshes between listeners.
+        request: The location to follow.
+        last_event_id: Id of the last event the client received.
+        heartbeat_seconds: Idle time before a heartbeat comment is sent.
+
+    Yields:
+        Encoded SSE frames.
+    """
+    yield f"retry: {_SSE_RETRY_MS}\n\n"
+    async with hub.subscribe(request, last_event_id=last_event_id) as updates:
+        while True:
+            try:
+                update = await asyncio.wait_for(updates.get(), timeout=heartbeat_seconds)
+            except TimeoutError:
+                yield ": heartbeat\n\n"
+                continue
+            payload = WeatherResponse.from_result(update.result).model_dump_json()
+            yield f"id: {update.event_id}\nevent: weather\ndata: {payload}\n\n"
+
+
+@router.get(
+    "/forecast",
+    response_model=ForecastResponse,
+    summary="Get the forecast for the next hours",
+    description=(
+        "Return the 3-hourly forecast steps covering the next `hours` hours for a city "
+        "or coordinates. One upstream forecast per location is cached and sliced locally."
+    ),
+    responses={
+        200: {"description": "Forecast retrieved successfully"},
+        404: {"description": "City not found"},
+        422: {"description": "Validation error"},
+        429: {"description": "Rate limit exceeded"},
+    },
+)
+async def get_forecast(
+    city: str | None = Query(default=None, min_length=1, max_length=100, description="City name"),
+    lat: float | None = Query(default=None, ge=-90, le=90, description="Latitude coordinate"),
+    lon: float | None = Query(default=None, ge=-180, le=180, description="Longitude coordinate"),
+    units: UnitSystem = Query(default=UnitSystem.METRIC, description="Temperature units"),
+    hours: int = Query(default=120, ge=1, le=120, description="Hours ahead to return"),
+    use_case: GetForecastUseCase = Depends(get_forecast_use_case),
+) -> ForecastResponse:
+    """Get the upcoming forecast steps for a city or coordinates.
+
+    Args:
+        city: The city name.
+        lat: Latitude coordinate.
+        lon: Longitude coordinate.
+        units: The temperature unit system.
+        hours: How far ahead to look.
+        use_case: Injected GetForecastUseCase.
+
+    Returns:
+        ForecastResponse with the selected steps.
+    """
+    request = _build_request(city, lat, lon, units)
+    return ForecastResponse.from_series(await use_case.hourly(request, hours))
+
+
+@router.get(
+    "/forecast/at",
+    response_model=ForecastResponse,
+    summary="Get the forecast for a specific time",
+    description="Return the forecast at one moment, interpolated between 3-hourly steps.",
+    responses={
+        200: {"description": "Forecast retrieved successfully"},
+        404: {"description": "City not found"},
+        422: {"description": "Validation error or time outside the forecast"},
+        429: {"description": "Rate limit exceeded"},
+    },
+)
+async def get_forecast_at(
+    time: datetime = Query(..., description="Moment to forecast (ISO 8601, UTC if naive)"),
+    city: str | None = Query(default=None, min_length=1, max_length=100, description="City name"),
+    lat: float | None = Query(default=None, ge=-90, le=90, description="Latitude coordinate"),
+    lon: float | None = Query(default=None, ge=-180, le=180, description="Longitude coordinate"),
+    units: UnitSystem = Query(default=UnitSystem.METRIC, description="Temperature units"),
+    use_case: GetForecastUseCase = Depends(get_forecast_use_case),
+) -> ForecastResponse:
+    """Get the forecast conditions at one moment.
+
+    Args:
+        time: The moment to forecast.
+        city: The city name.
+        lat: Latitude coordinate.
+        lon: Longitude coordinate.
+        units: The temperature unit system.
+        use_case: Injected GetForecastUseCase.
+
+    Returns:
+        ForecastResponse with a single point.
+
+    Raises:
+        HTTPException: If the time is outside the forecast range.
+    """
+    request = _build_request(city, lat, lon, units)
+    try:
+        point = await use_case.at(request, _as_utc(time))
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return ForecastResponse.from_series(await use_case.execute(request), points=[point])
+
+
+@router.get(
+    "/forecast/daily",
+    response_model=ForecastResponse,
+    summary="Get daily forecast summaries",
+    description=(
+        "Return min/max temperature, mean humidity, peak wind and precipitation "
+        "probability per local day, or for a single `date`."
+    ),
+    responses={
+        200: {"description": "Forecast retrieved successfully"},
+        404: {"description": "City not found"},
+        422: {"description": "Validation error or date outside the forecast"},
+        429: {"description": "Rate limit exceeded"},
+    },
+)
+async def get_forecast_daily(
+    city: str | None = Query(default=None, min_length=1, max_length=100, description="City name"),
+    lat: float | None = Query(default=None, ge=-90, le=90, description="Latitude coordinate"),
+    lon: float | None = Query(default=None, ge=-180, le=180, description="Longitude coordinate"),
+    units: UnitSystem = Query(default=UnitSystem.METRIC, description="Temperature units"),
+    day: date | None = Query(default=None, alias="date", description="Local date to summarize"),
+    use_case: GetForecastUseCase = Depends(get_forecast_use_case),
+) -> ForecastResponse:
+    """Get per-day forecast summaries.
+
+    Args:
+        city: The city name.
+        lat: Latitude coordinate.
+        lon: Longitude coordinate.
+        units: The temperature unit system.
+        day: Optional local date to restrict the summary to.
+        use_case: Injected GetForecastUseCase.
+
+    Returns:
+        ForecastResponse with day summaries.
+
+    Raises:
+        HTTPException: If the date is not covered by the forecast.
+    """
+    request = _build_request(city, lat, lon, units)
+    try:
+        days = await use_case.daily(request, day)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return ForecastResponse.from_series(await use_case.execute(request), days=days)
+
+
+@router.get(
+    "/history",
+    response_model=WeatherHistoryResponse,
+    summary="Get observation history",
+    description=(
+        "Return the observations fetched for a city or coordinates in a time range, "
+        "optionally reduced to min/max/mean per bucket of bucket_seconds. History is "
+        "recorded from every upstream fetch, per unit system."
+    ),
+    responses={
+        200: {"description": "History retrieved successfully"},
+        422: {"description": "Validation error"},
+    },
+)
+async def get_weather_history(
+    city: str | None = Query(default=None, min_length=1, max_length=100, description="City name"),
+    lat: float | None = Query(default=None, ge=-90, le=90, description="Latitude coordinate"),
+    lon: float | None = Query(default=None, ge=-180, le=180, description="Longitude coordinate"),
+    units: UnitSystem = Query(default=UnitSystem.METRIC, description="Temperature units"),
+    start: datetime | None = Query(default=None, description="Range start, default end - 24h"),
+    end: datetime | None = Query(default=None, description="Range end, default now"),
+    bucket_seconds: int | None = Query(
+        default=None, ge=60, le=31_536_000, description="Aggregate into buckets of this width"
+    ),
+    metric: list[WeatherMetric] | None = Query(
+        default=None, description="Metrics to return (repeatable); all by default"
+    ),
+    store: ObservationHistoryStore = Depends(get_history_store),
+    use_case: GetWeatherUseCase = Depends(get_weather_use_case),
+) -> WeatherHistoryResponse:
+    """Get the recorded observations for a city or coordinates.
+
+    Args:
+        city: The city name.
+        lat: Latitude coordinate.
+        lon: Longitude coordinate.
+        units: The temperature unit system.
+        start: Inclusive range start.
+        end: Inclusive range end.
+        bucket_seconds: Optional aggregation bucket width.
+        metric: Metrics to include.
+        store: Injected ObservationHistoryStore.
+        use_case: Injected GetWeatherUseCase, resolving the key history is recorded under.
+
+    Returns:
+        WeatherHistoryResponse with columnar values.
+
+    Raises:
+        HTTPException: If the location or time range is invalid.
+    """
+    request = use_case.snap(_build_request(city, lat, lon, units))
+    end = _as_utc(end) if end else datetime.now(UTC)
+    start = _as_utc(start) if start else end - timedelta(hours=24)
+    if start > end:
+        raise HTTPException(status_code=422, detail="start must not be after end")
+
+    series: ObservationSeries | AggregatedSeries = (
+        store.aggregate(request.cache_key, start, end, bucket_seconds, metric)
+        if bucket_seconds
+        else store.query(request.cache_key, start, end, metric)
+    )
+    return WeatherHistoryResponse.from_series(series, units=units, start=start, end=end)
+
+
+@router.get(
+    "/grid",
+    response_model=WeatherGridResponse,
+    summary="Get an interpolated weather grid",
+    description=(
+        "Interpolate a dense grid of one weather metric over a bounding box from a "
+        "sparse lattice of cached anchor observations. Use format=binary for a "
+        "row-major little-endian float32 payload."
+    ),
+    responses={
+        200: {
+            "description": "Grid computed successfully",
+            "content": {"application/octet-stream": {}},
+        },
+        422: {"description": "Validation error"},
+        429: {"description": "Rate limit exceeded"},
+        502: {"description": "No anchor observation could be fetched"},
+    },
+)
+async def get_weather_grid(
+    south: float = Query(..., ge=-90, le=90, description="Southern edge latitude"),
+    west: float = Query(..., ge=-180, le=180, description="Western edge longitude"),
+    north: float = Query(..., ge=-90, le=90, description="Northern edge latitude"),
+    east: float = Query(..., ge=-180, le=180, description="Eastern edge longitude"),
+    rows: int = Query(default=64, ge=2, le=512, description="Grid rows (north to south)"),
+    cols: int = Query(default=64, ge=2, le=512, description="Grid columns (west to east)"),
+    metric: WeatherMetric = Query(default=WeatherMetric.TEMPERATURE, description="Metric"),
+    units: UnitSystem = Query(default=UnitSystem.METRIC, description="Temperature units"),
+    method: InterpolationMethod = Query(
+        default=InterpolationMethod.IDW, description="Interpolation method"
+    ),
+    anchors: int = Query(default=4, ge=2, le=8, description="Anchors along each axis"),
+    format: Literal["json", "binary"] = Query(default="json", description="Payload format"),
+    use_case: GetWeatherGridUseCase = Depends(get_weather_grid_use_case),
+) -> Response:
+    """Get an interpolated weather field for a bounding box.
+
+    Args:
+        south: Southern edge latitude.
+        west: Western edge longitude.
+        north: Northern edge latitude.
+        east: Eastern edge longitude.
+        rows: Number of grid rows.
+        cols: Number of grid columns.
+        metric: The observation to interpolate.
+        units: The temperature unit system.
+        method: The interpolation method.
+        anchors: Anchor lattice size along each axis.
+        format: ``json`` or ``binary``.
+        use_case: Injected GetWeatherGridUseCase.
+
+    Returns:
+        JSON grid or a binary float32 payload described by ``X-Grid-*`` headers.
+
+    Raises:
+        HTTPException: If the bounding box is invalid.
+    """
+    try:
+        bbox = BoundingBox(south=south, west=west, north=north, east=east)
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+
+    grid = await use_case.execute(
+        bbox,
+        rows=rows,
+        cols=cols,
+        metric=metric,
+        units=units,
+        method=method,
+        anchors_per_side=anchors,
+    )
+
+    if format == "binary":
+        return Response(
+            content=grid.values.astype("<f4").tobytes(),
+            media_type="application/octet-stream",
+            headers={
+                "X-Grid-Rows": str(rows),
+                "X-Grid-Cols": str(cols),
+                "X-Grid-Dtype": "float32-le",
+                "X-Grid-Bbox": f"{south},{west},{north},{east}",
+                "X-Grid-Metric": grid.metric.value,
+                "X-Grid-Units": grid.units.value,
+                "X-Grid-Method": grid.method,
+            },
+        )
+    return JSONResponse(WeatherGridResponse.from_grid(grid).model_dump(mode="json"))
+
+
+@router.post(
+    "/route",
+    response_model=RouteWeatherResponse,
+    summary="Get weather along a route",
+    description=(
+        "Sample an encoded polyline at a fixed spacing and return the conditions for "
+        "each stretch of the route. Samples sharing a cache cell are collapsed into one "
+        "segment and looked up once."
+    ),
+    responses={
+        200: {"description": "Route conditions retrieved successfully"},
+        422: {"description": "Invalid polyline or too many samples"},
+        429: {"description": "Rate limit exceeded"},
+        502: {"description": "No segment could be resolved"},
+    },
+)
+async def get_route_weather(
+    body: RouteWeatherRequest,
+    use_case: GetRouteWeatherUseCase = Depends(get_route_weather_use_case),
+) -> RouteWeatherResponse:
+    """Get weather conditions along an encoded polyline.
+
+    Args:
+        body: The route and sampling parameters.
+        use_case: Injected GetRouteWeatherUseCase.
+
+    Returns:
+        RouteWeatherResponse with per-segment conditions.
+
+    Raises:
+        HTTPException: If the polyline is invalid or too long for the spacing.
+    """
+    try:
+        route = await use_case.execute(
+            body.polyline,
+            spacing_km=body.spacing_km,
+            units=body.units,
+            precision=body.precision,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e)) from e
+    return RouteWeatherResponse.from_route(route)
+
+
+@router.post(
+    "/compare",
+    response_model=CompareWeatherResponse,
+    summary="Compare and rank cities",
+    description=(
+        "Resolve many cities (cache-first) and rank them by current conditions or by "
+        "derived metrics such as heat index, wind chill or a 0-100 comfort score."
+    ),
+    responses={
+        200: {"description": "Cities ranked successfully"},
+        422: {"description": "Validation error"},
+        429: {"description": "Rate limit exceeded"},
+        502: {"description": "No city could be resolved"},
+    },
+)
+async def compare_weather(
+    body: CompareWeatherRequest,
+    use_case: CompareWeatherUseCase = Depends(get_compare_weather_use_case),
+) -> CompareWeatherResponse:
+    """Rank cities by current or derived weather conditions.
+
+    Args:
+        body: Cities and ranking options.
+        use_case: Injected CompareWeatherUseCase.
+
+    Returns:
+        CompareWeatherResponse with ranked cities and per-city errors.
+    """
+    comparison = await use_case.execute(
+        body.cities,
+        units=body.units,
+        rank_by=body.rank_by,
+        descending=body.order == "desc",
+    )
+    return CompareWeatherResponse.from_comparison(comparison)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive datetimes as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def _build_request(
+    city: str | None, lat: float | None, lon: float | None, units: UnitSystem
+) -> WeatherRequest:
+    """Validate location query parameters and build a WeatherRequest.
+
     Raises:
         HTTPException: If validation fails or coordinates are incomplete.
     """
@@ -89,26 +601,4 @@ async def get_weather(
         )
 
     # Create request with coordinates or city
-    request = WeatherRequest(city=city or "", units=units, coordinates=coordinates)
-    result = await use_case.execute(request)
-    weather_data = result.weather_data
-
-    return WeatherResponse(
-        city=weather_data.city_name,
-        country=weather_data.country,
-        coordinates={
-            "latitude": weather_data.coordinates.latitude,
-            "longitude": weather_data.coordinates.longitude,
-        },
-        temperature=weather_data.temperature,
-        feels_like=weather_data.feels_like,
-        humidity=weather_data.humidity,
-        wind_speed=weather_data.wind_speed,
-        pressure=weather_data.pressure,
-        visibility=weather_data.visibility,
-        description=weather_data.description,
-        icon_code=weather_data.icon_code,
-        units=weather_data.units,
-        timestamp=weather_data.timestamp,
-        easter_egg=result.easter_egg,
-    )
+    return WeatherRequest(city=city or "", units=units, coordinates=coordinates)
@@ -1,10 +1,32 @@
 """Pydantic schemas for API request/response models."""
 
-from datetime import datetime
+from datetime import UTC, date, datetime
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import (
+    AnyHttpUrl,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    model_validator,
+)
 
-from src.domain.value_objects import UnitSystem
+from src.application.dto import (
+    CityComparison,
+    ForecastDay,
+    RouteWeather,
+    WeatherGrid,
+    WeatherResult,
+)
+from src.application.forecast_series import ForecastSeries
+from src.application.use_cases import RankingMetric
+from src.domain.entities import AlertEvent, AlertRule, City, ForecastPoint, WeatherRequest
+from src.domain.exceptions import WeatherAppError
+from src.domain.value_objects import AlertDirection, Coordinates, UnitSystem, WeatherMetric
+from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.history import AggregatedSeries, ObservationSeries
+from src.infrastructure.jobs import BulkJob, JobStatus
 
 
 class WeatherResponse(BaseModel):
@@ -51,6 +73,627 @@ class WeatherResponse(BaseModel):
         description="Easter egg identifier if triggered (e.g. 'zidane'), otherwise null",
     )
 
+    @classmethod
+    def from_result(cls, result: WeatherResult) -> "WeatherResponse":
+        """Build a response from a use case result.
+
+        Args:
+            result: The WeatherResult returned by GetWeatherUseCase.
+
+        Returns:
+            WeatherResponse mirroring the result's weather data.
+        """
+        weather_data = result.weather_data
+        return cls(
+            city=weather_data.city_name,
+            country=weather_data.country,
+            coordinates={
+                "latitude": weather_data.coordinates.latitude,
+                "longitude": weather_data.coordinates.longitude,
+            },
+            temperature=weather_data.temperature,
+            feels_like=weather_data.feels_like,
+            humidity=weather_data.humidity,
+            wind_speed=weather_data.wind_speed,
+            pressure=weather_data.pressure,
+            visibility=weather_data.visibility,
+            description=weather_data.description,
+            icon_code=weather_data.icon_code,
+            units=weather_data.units,
+            timestamp=weather_data.timestamp,
+            easter_egg=result.easter_egg,
+        )
+
+
+class ForecastPointResponse(BaseModel):
+    """Forecast conditions for one moment."""
+
+    timestamp: datetime = Field(..., description="Forecast time (UTC)")
+    temperature: float = Field(..., description="Temperature")
+    feels_like: float = Field(..., description="Feels like temperature")
+    humidity: int = Field(..., ge=0, le=100, description="Humidity percentage")
+    wind_speed: float = Field(..., ge=0, description="Wind speed")
+    pressure: int = Field(..., description="Atmospheric pressure in hPa")
+    precipitation_probability: float = Field(
+        ..., ge=0, le=1, description="Probability of precipitation (0..1)"
+    )
+    description: str = Field(..., description="Weather condition description")
+    icon_code: str = Field(..., description="Weather icon code")
+
+    @classmethod
+    def from_point(cls, point: ForecastPoint) -> "ForecastPointResponse":
+        """Build a response from a forecast point."""
+        return cls(
+            timestamp=point.timestamp,
+            temperature=point.temperature,
+            feels_like=point.feels_like,
+            humidity=point.humidity,
+            wind_speed=point.wind_speed,
+            pressure=point.pressure,
+            precipitation_probability=point.precipitation_probability,
+            description=point.description,
+            icon_code=point.icon_code,
+        )
+
+
+class ForecastDayResponse(BaseModel):
+    """Summary of one local day of a forecast."""
+
+    day: date = Field(..., description="Local calendar date")
+    temperature_min: float = Field(..., description="Lowest forecast temperature")
+    temperature_max: float = Field(..., description="Highest forecast temperature")
+    humidity_mean: float = Field(..., description="Mean humidity percentage")
+    wind_speed_max: float = Field(..., description="Highest forecast wind speed")
+    precipitation_probability_max: float = Field(
+        ..., description="Highest probability of precipitation (0..1)"
+    )
+    description: str = Field(..., description="Prevailing weather condition")
+    icon_code: str = Field(..., description="Prevailing weather icon code")
+    steps: int = Field(..., description="Forecast steps covering the day")
+
+    @classmethod
+    def from_day(cls, day: ForecastDay) -> "ForecastDayResponse":
+        """Build a response from a day summary."""
+        return cls(
+            day=day.date,
+            temperature_min=round(day.temperature_min, 2),
+            temperature_max=round(day.temperature_max, 2),
+            humidity_mean=round(day.humidity_mean, 1),
+            wind_speed_max=round(day.wind_speed_max, 2),
+            precipitation_probability_max=round(day.precipitation_probability_max, 2),
+            description=day.description,
+            icon_code=day.icon_code,
+            steps=day.steps,
+        )
+
+
+class ForecastResponse(BaseModel):
+    """Forecast response schema; carries points, day summaries or both."""
+
+    city: str = Field(..., description="City name")
+    country: str = Field(..., description="Country code (ISO 3166)")
+    coordinates: dict[str, float] = Field(
+        ..., description="Geographic coordinates (latitude, longitude)"
+    )
+    units: UnitSystem = Field(..., description="Temperature units (metric/imperial)")
+    utc_offset_seconds: int = Field(..., description="Location offset from UTC")
+    points: list[ForecastPointResponse] = Field(
+        default_factory=list, description="Forecast steps, oldest first"
+    )
+    days: list[ForecastDayResponse] = Field(default_factory=list, description="Per-day summaries")
+
+    @classmethod
+    def from_series(
+        cls,
+        series: ForecastSeries,
+        points: list[ForecastPoint] | None = None,
+        days: list[ForecastDay] | None = None,
+    ) -> "ForecastResponse":
+        """Build a response for a location's forecast.
+
+        Args:
+            series: The forecast series describing the location.
+            points: Points to include; defaults to every step of ``series``.
+            days: Day summaries to include.
+
+        Returns:
+            ForecastResponse for the location.
+        """
+        if points is None and days is None:
+            points = series.points()
+        return cls(
+            city=series.city_name,
+            country=series.country,
+            coordinates={
+                "latitude": series.coordinates.latitude,
+                "longitude": series.coordinates.longitude,
+            },
+            units=series.units,
+            utc_offset_seconds=series.utc_offset_seconds,
+            points=[ForecastPointResponse.from_point(point) for point in points or []],
+            days=[ForecastDayResponse.from_day(day) for day in days or []],
+        )
+
+
+class GridAnchorResponse(BaseModel):
+    """Observation used as an interpolation anchor."""
+
+    latitude: float = Field(..., description="Anchor latitude")
+    longitude: float = Field(..., description="Anchor longitude")
+    value: float = Field(..., description="Observed value of the gridded metric")
+
+
+class WeatherGridResponse(BaseModel):
+    """Dense interpolated weather field response schema."""
+
+    metric: WeatherMetric = Field(..., description="Interpolated observation")
+    units: UnitSystem = Field(..., description="Unit system of the values")
+    method: str = Field(..., description="Interpolation method used")
+    rows: int = Field(..., description="Number of rows (north to south)")
+    cols: int = Field(..., description="Number of columns (west to east)")
+    latitudes: list[float] = Field(..., description="Row latitudes, north to south")
+    longitudes: list[float] = Field(..., description="Column longitudes, west to east")
+    values: list[list[float]] = Field(..., description="Row-major grid values")
+    anchors: list[GridAnchorResponse] = Field(..., description="Anchor observations")
+
+    @classmethod
+    def from_grid(cls, grid: WeatherGrid) -> "WeatherGridResponse":
+        """Build a response from a computed grid."""
+        return cls(
+            metric=grid.metric,
+            units=grid.units,
+            method=grid.method,
+            rows=grid.values.shape[0],
+            cols=grid.values.shape[1],
+            latitudes=grid.latitudes.round(6).tolist(),
+            longitudes=grid.longitudes.round(6).tolist(),
+            values=grid.values.round(3).tolist(),
+            anchors=[
+                GridAnchorResponse(
+                    latitude=anchor.coordinates.latitude,
+                    longitude=anchor.coordinates.longitude,
+                    value=anchor.metric(grid.metric),
+                )
+                for anchor in grid.anchors
+            ],
+        )
+
+
+class RouteWeatherRequest(BaseModel):
+    """Route weather request schema."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "polyline": "_p~iF~ps|U_ulLnnqC_mqNvxq`@",
+                "spacing_km": 10.0,
+                "units": "metric",
+                "precision": 5,
+            }
+        }
+    )
+
+    polyline: str = Field(
+        ..., min_length=2, max_length=100_000, description="Encoded polyline of the route"
+    )
+    spacing_km: float = Field(
+        default=10.0, ge=0.5, le=500.0, description="Distance between samples in kilometres"
+    )
+    units: UnitSystem = Field(default=UnitSystem.METRIC, description="Temperature units")
+    precision: int = Field(
+        default=5, ge=5, le=6, description="Polyline precision (5 Google, 6 OSRM/Valhalla)"
+    )
+
+
+class RouteSegmentResponse(BaseModel):
+    """Conditions for one stretch of a route."""
+
+    start_km: float = Field(..., description="Distance from route start where the segment begins")
+    end_km: float = Field(..., description="Distance from route start where the segment ends")
+    start: dict[str, float] = Field(..., description="Segment start coordinates")
+    end: dict[str, float] = Field(..., description="Segment end coordinates")
+    weather: WeatherResponse | None = Field(
+        default=None, description="Conditions for the segment, null if lookup failed"
+    )
+    error: dict[str, str] | None = Field(
+        default=None, description="Error code and message if the lookup failed"
+    )
+
+
+class RouteWeatherResponse(BaseModel):
+    """Route weather response schema."""
+
+    units: UnitSystem = Field(..., description="Temperature units")
+    length_km: float = Field(..., description="Total route length in kilometres")
+    sample_count: int = Field(..., description="Number of points sampled along the route")
+    segments: list[RouteSegmentResponse] = Field(..., description="Per-segment conditions")
+
+    @classmethod
+    def from_route(cls, route: RouteWeather) -> "RouteWeatherResponse":
+        """Build a response from a resolved route."""
+        segments = []
+        for segment in route.segments:
+            outcome = segment.outcome
+            segments.append(
+                RouteSegmentResponse(
+                    start_km=round(segment.start_km, 3),
+                    end_km=round(segment.end_km, 3),
+                    start={
+                        "latitude": segment.start.latitude,
+                        "longitude": segment.start.longitude,
+                    },
+                    end={"latitude": segment.end.latitude, "longitude": segment.end.longitude},
+                    weather=(
+                        WeatherResponse.from_result(outcome)
+                        if isinstance(outcome, WeatherResult)
+                        else None
+                    ),
+                    error=(
+                        {"code": outcome.code, "message": outcome.message}
+                        if isinstance(outcome, WeatherAppError)
+                        else None
+                    ),
+                )
+            )
+        return cls(
+            units=route.units,
+            length_km=round(route.length_km, 3),
+            sample_count=route.sample_count,
+            segments=segments,
+        )
+
+
+class CompareWeatherRequest(BaseModel):
+    """Multi-city comparison request schema."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "cities": ["Lisbon", "Barcelona", "Nice", "Split"],
+                "units": "metric",
+                "rank_by": "comfort_score",
+                "order": "desc",
+            }
+        }
+    )
+
+    cities: list[
+        Annotated[str, StringConstraints(strip_whitespace=True, min_length=1, max_length=100)]
+    ] = Field(..., min_length=1, max_length=500, description="City names to compare")
+    units: UnitSystem = Field(default=UnitSystem.METRIC, description="Units of returned values")
+    rank_by: RankingMetric = Field(
+        default=RankingMetric.COMFORT_SCORE, description="Field to rank cities by"
+    )
+    order: Literal["asc", "desc"] = Field(default="desc", description="Ranking order")
+
+
+class ComparedCityResponse(BaseModel):
+    """A ranked city in a comparison."""
+
+    rank: int = Field(..., description="1-based rank")
+    city: str = Field(..., description="City name")
+    country: str = Field(..., description="Country code (ISO 3166)")
+    coordinates: dict[str, float] = Field(..., description="Geographic coordinates")
+    temperature: float = Field(..., description="Current temperature")
+    feels_like: float = Field(..., description="Feels like temperature")
+    heat_index: float = Field(..., description="NWS heat index")
+    wind_chill: float = Field(..., description="NWS wind chill")
+    humidity: int = Field(..., ge=0, le=100, description="Humidity percentage")
+    wind_speed: float = Field(..., ge=0, description="Wind speed")
+    pressure: int = Field(..., description="Atmospheric pressure in hPa")
+    comfort_score: float = Field(..., ge=0, le=100, description="Outdoor comfort score (0-100)")
+    description: str = Field(..., description="Weather condition description")
+    icon_code: str = Field(..., description="Weather icon code")
+    timestamp: datetime = Field(..., description="Data timestamp (UTC)")
+
+
+class CompareWeatherResponse(BaseModel):
+    """Multi-city comparison response schema."""
+
+    units: UnitSystem = Field(..., description="Units of returned values")
+    rank_by: RankingMetric = Field(..., description="Field cities are ranked by")
+    results: list[ComparedCityResponse] = Field(..., description="Ranked cities")
+    errors: list[dict[str, str]] = Field(
+        ..., description="Cities that could not be resolved, with error code and message"
+    )
+
+    @classmethod
+    def from_comparison(cls, comparison: CityComparison) -> "CompareWeatherResponse":
+        """Build a response from a comparison."""
+        results = []
+        for entry in comparison.ranked:
+            data = entry.result.weather_data
+            results.append(
+                ComparedCityResponse(
+                    rank=entry.rank,
+                    city=data.city_name,
+                    country=data.country,
+                    coordinates={
+                        "latitude": data.coordinates.latitude,
+                        "longitude": data.coordinates.longitude,
+                    },
+                    temperature=round(entry.temperature, 2),
+                    feels_like=round(entry.feels_like, 2),
+                    heat_index=round(entry.heat_index, 2),
+                    wind_chill=round(entry.wind_chill, 2),
+                    humidity=data.humidity,
+                    wind_speed=round(entry.wind_speed, 2),
+                    pressure=data.pressure,
+                    comfort_score=round(entry.comfort_score, 1),
+                    description=data.description,
+                    icon_code=data.icon_code,
+                    timestamp=data.timestamp,
+                )
+            )
+        return cls(
+            units=comparison.units,
+            rank_by=RankingMetric(comparison.rank_by),
+            results=results,
+            errors=[
+                {"city": city, "code": error.code, "message": error.message}
+                for city, error in comparison.failures
+            ],
+        )
+
+
+class MetricHistoryResponse(BaseModel):
+    """Values of one metric over time; raw values or per-bucket aggregates."""
+
+    values: list[float] | None = Field(default=None, description="Raw observed values")
+    min: list[float] | None = Field(default=None, description="Minimum per bucket")
+    max: list[float] | None = Field(default=None, description="Maximum per bucket")
+    mean: list[float] | None = Field(default=None, description="Mean per bucket")
+
+
+class WeatherHistoryResponse(BaseModel):
+    """Columnar observation history response schema."""
+
+    location: str = Field(..., description="Location name, empty if no history exists")
+    units: UnitSystem = Field(..., description="Unit system of the values")
+    start: datetime = Field(..., description="Range start (UTC)")
+    end: datetime = Field(..., description="Range end (UTC)")
+    bucket_seconds: int | None = Field(
+        default=None, description="Bucket width, or null for raw observations"
+    )
+    timestamps: list[datetime] = Field(
+        ..., description="Observation times, or bucket start times when aggregated"
+    )
+    counts: list[int] | None = Field(default=None, description="Observations per bucket")
+    series: dict[WeatherMetric, MetricHistoryResponse] = Field(
+        ..., description="Values per metric, aligned with timestamps"
+    )
+
+    @classmethod
+    def from_series(
+        cls,
+        series: ObservationSeries | AggregatedSeries,
+        units: UnitSystem,
+        start: datetime,
+        end: datetime,
+    ) -> "WeatherHistoryResponse":
+        """Build a response from raw or aggregated history."""
+        if isinstance(series, AggregatedSeries):
+            return cls(
+                location=series.location,
+                units=units,
+                start=start,
+                end=end,
+                bucket_seconds=series.bucket_seconds,
+                timestamps=_utc_datetimes(series.bucket_starts.tolist()),
+                counts=series.counts.tolist(),
+                series={
+                    metric: MetricHistoryResponse(
+                        min=series.minimum[metric].round(3).tolist(),
+                        max=series.maximum[metric].round(3).tolist(),
+                        mean=series.mean[metric].round(3).tolist(),
+                    )
+                    for metric in series.mean
+                },
+            )
+        return cls(
+            location=series.location,
+            units=units,
+            start=start,
+            end=end,
+            timestamps=_utc_datetimes(series.timestamps.tolist()),
+            series={
+                metric: MetricHistoryResponse(values=values.round(3).tolist())
+                for metric, values in series.columns.items()
+            },
+        )
+
+
+def _utc_datetimes(timestamps: list[int]) -> list[datetime]:
+    """Convert Unix timestamps to aware UTC datetimes."""
+    return [datetime.fromtimestamp(timestamp, UTC) for timestamp in timestamps]
+
+
+class BulkJobResponse(BaseModel):
+    """Bulk job status response schema."""
+
+    id: str = Field(..., description="Job id")
+    status: JobStatus = Field(..., description="Job status")
+    units: UnitSystem = Field(..., description="Default temperature units")
+    total_rows: int = Field(..., description="Data rows in the upload")
+    processed: int = Field(..., description="Rows processed so far")
+    succeeded: int = Field(..., description="Rows resolved successfully")
+    failed: int = Field(..., description="Rows that failed")
+    progress: float = Field(..., ge=0, le=1, description="Fraction of rows processed")
+    created_at: datetime = Field(..., description="Creation time (UTC)")
+    finished_at: datetime | None = Field(default=None, description="Completion time (UTC)")
+    error: str | None = Field(default=None, description="Why the job failed, if it did")
+
+    @classmethod
+    def from_job(cls, job: BulkJob) -> "BulkJobResponse":
+        """Build a response from a job."""
+        return cls(
+            id=job.id,
+            status=job.status,
+            units=job.units,
+            total_rows=job.total_rows,
+            processed=job.processed,
+            succeeded=job.succeeded,
+            failed=job.failed,
+            progress=job.processed / job.total_rows if job.total_rows else 1.0,
+            created_at=job.created_at,
+            finished_at=job.finished_at,
+            error=job.error,
+        )
+
+
+class AlertRuleRequest(BaseModel):
+    """Alert rule creation request schema."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "city": "Rotterdam",
+                "units": "metric",
+                "metric": "wind_speed",
+                "direction": "above",
+                "threshold": 15.0,
+                "webhook_url": "https://example.com/hooks/weather",
+            }
+        }
+    )
+
+    city: str | None = Field(
+        default=None, min_length=1, max_length=100, description="City name to watch"
+    )
+    lat: float | None = Field(default=None, ge=-90, le=90, description="Latitude coordinate")
+    lon: float | None = Field(default=None, ge=-180, le=180, description="Longitude coordinate")
+    units: UnitSystem = Field(default=UnitSystem.METRIC, description="Units of the threshold")
+    metric: WeatherMetric = Field(..., description="Observation to watch")
+    direction: AlertDirection = Field(..., description="Fire above or below the threshold")
+    threshold: float = Field(..., description="Threshold value")
+    webhook_url: AnyHttpUrl | None = Field(
+        default=None, description="URL receiving a POST whenever the rule fires"
+    )
+
+    @model_validator(mode="after")
+    def _check_location(self) -> "AlertRuleRequest":
+        """Require a city or a complete pair of coordinates."""
+        if (self.lat is None) != (self.lon is None):
+            msg = "Both lat and lon must be provided together, or neither"
+            raise ValueError(msg)
+        if self.lat is None and not self.city:
+            msg = "Either city or coordinates (lat and lon) must be provided"
+            raise ValueError(msg)
+        return self
+
+    def to_weather_request(self) -> WeatherRequest:
+        """Return the watched location as a WeatherRequest."""
+        coordinates = None
+        if self.lat is not None and self.lon is not None:
+            coordinates = Coordinates(latitude=self.lat, longitude=self.lon)
+        return WeatherRequest(city=self.city or "", units=self.units, coordinates=coordinates)
+
+
+class AlertRuleResponse(BaseModel):
+    """Alert rule response schema."""
+
+    id: str = Field(..., description="Rule id")
+    city: str | None = Field(default=None, description="Watched city name")
+    coordinates: dict[str, float] | None = Field(
+        default=None, description="Watched coordinates (latitude, longitude)"
+    )
+    units: UnitSystem = Field(..., description="Units of the threshold")
+    metric: WeatherMetric = Field(..., description="Watched observation")
+    direction: AlertDirection = Field(..., description="Fire above or below the threshold")
+    threshold: float = Field(..., description="Threshold value")
+    webhook_url: str | None = Field(default=None, description="Notified webhook URL")
+    created_at: datetime = Field(..., description="Creation time (UTC)")
+
+    @classmethod
+    def from_rule(cls, rule: AlertRule) -> "AlertRuleResponse":
+        """Build a response from a rule."""
+        request = rule.request
+        coordinates = None
+        if request.coordinates is not None:
+            coordinates = {
+                "latitude": request.coordinates.latitude,
+                "longitude": request.coordinates.longitude,
+            }
+        return cls(
+            id=rule.id,
+            city=None if coordinates else request.city,
+            coordinates=coordinates,
+            units=request.units,
+            metric=rule.metric,
+            direction=rule.direction,
+            threshold=rule.threshold,
+            webhook_url=rule.webhook_url,
+            created_at=rule.created_at,
+        )
+
+
+class AlertEventResponse(BaseModel):
+    """Triggered alert event response schema."""
+
+    rule_id: str = Field(..., description="Id of the rule that fired")
+    value: float = Field(..., description="Observed value that crossed the threshold")
+    previous_value: float | None = Field(
+        default=None, description="Previous observed value, if any"
+    )
+    triggered_at: datetime = Field(..., description="Trigger time (UTC)")
+    weather: WeatherResponse = Field(..., description="Observation that triggered the rule")
+
+    @classmethod
+    def from_event(cls, event: AlertEvent) -> "AlertEventResponse":
+        """Build a response from an event."""
+        return cls(
+            rule_id=event.rule.id,
+            value=event.value,
+            previous_value=event.previous_value,
+            triggered_at=event.triggered_at,
+            weather=WeatherResponse.from_result(WeatherResult(weather_data=event.weather_data)),
+        )
+
+
+class CitySuggestionResponse(BaseModel):
+    """One autocomplete suggestion."""
+
+    name: str = Field(..., description="City name")
+    country: str = Field(..., description="Country code (ISO 3166)")
+    latitude: float = Field(..., description="City latitude")
+    longitude: float = Field(..., description="City longitude")
+    population: int = Field(..., description="Population, 0 when unknown")
+
+    @classmethod
+    def from_city(cls, city: City) -> "CitySuggestionResponse":
+        """Build a response from a city."""
+        return cls(
+            name=city.name,
+            country=city.country,
+            latitude=city.coordinates.latitude,
+            longitude=city.coordinates.longitude,
+            population=city.population,
+        )
+
+
+class CityAutocompleteResponse(BaseModel):
+    """City autocomplete response schema."""
+
+    model_config = ConfigDict(
+        json_schema_extra={
+            "example": {
+                "query": "lon",
+                "results": [
+                    {
+                        "name": "London",
+                        "country": "GB",
+                        "latitude": 51.5085,
+                        "longitude": -0.1257,
+                        "population": 9300000,
+                    }
+                ],
+            }
+        }
+    )
+
+    query: str = Field(..., description="The prefix that was searched")
+    results: list[CitySuggestionResponse] = Field(..., description="Suggestions, best first")
+
 
 class ErrorResponse(BaseModel):
     """Error response schema."""
@@ -79,3 +722,30 @@ class HealthResponse(BaseModel):
     status: str = Field(..., description="Health status")
     version: str = Field(..., description="API version")
     environment: str = Field(..., description="Deployment environment")
+
+
+class CacheStatsResponse(BaseModel):
+    """In-memory cache statistics response schema."""
+
+    admission: str = Field(..., description="Admission policy: lru or tinylfu")
+    entries: int = Field(..., description="Entries currently cached")
+    hot_entries: int = Field(..., description="Entries kept decoded")
+    cold_entries: int = Field(..., description="Entries kept packed until read")
+    hits: int = Field(..., description="Lookups served from cache")
+    misses: int = Field(..., description="Lookups not found or expired")
+    hit_ratio: float = Field(..., description="Hits divided by lookups")
+    rejections: int = Field(..., description="Writes refused by the admission policy")
+
+    @classmethod
+    def from_cache(cls, cache: InMemoryCache) -> "CacheStatsResponse":
+        """Build a response from the cache's counters."""
+        return cls(
+            admission=cache.admission,
+            entries=cache.size,
+            hot_entries=cache.hot_size,
+            cold_entries=cache.cold_size,
+            hits=cache.hits,
+            misses=cache.misses,
+            hit_ratio=round(cache.hit_ratio, 4),
+            rejections=cache.rejections,
+        )
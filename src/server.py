@@ -0,0 +1,258 @@
+"""Production server: a pre-forking uvicorn launcher sharing one listening socket."""
+
+import contextlib
+import gc
+import math
+import os
+import signal
+import socket
+import threading
+import time
+from collections.abc import Callable
+from pathlib import Path
+from types import FrameType
+
+from src.application.interfaces import LoggerPort
+
+# Exit code of a worker whose application failed to start; restarting would only repeat it
+WORKER_BOOT_FAILURE = 3
+CGROUP_ROOT = Path("/sys/fs/cgroup")
+
+
+def cgroup_cpu_limit(root: Path = CGROUP_ROOT) -> float | None:
+    """Return the CPU quota of the current cgroup, in CPUs.
+
+    Reads ``cpu.max`` (cgroup v2) or ``cpu/cpu.cfs_quota_us`` and
+    ``cpu/cpu.cfs_period_us`` (cgroup v1).
+
+    Args:
+        root: Mount point of the cgroup filesystem.
+
+    Returns:
+        The quota, e.g. 1.5 for a container limited to one and a half CPUs,
+        or None if no quota is set or it cannot be read.
+    """
+    try:
+        quota, period = (root / "cpu.max").read_text().split()[:2]
+        if quota == "max":
+            return None
+        return int(quota) / int(period)
+    except (OSError, ValueError):
+        pass
+    try:
+        quota_us = int((root / "cpu" / "cpu.cfs_quota_us").read_text())
+        period_us = int((root / "cpu" / "cpu.cfs_period_us").read_text())
+    except (OSError, ValueError):
+        return None
+    return quota_us / period_us if quota_us > 0 and period_us > 0 else None
+
+
+def detect_worker_count(root: Path = CGROUP_ROOT) -> int:
+    """Return one worker per CPU this process may use.
+
+    Args:
+        root: Mount point of the cgroup filesystem.
+
+    Returns:
+        The CPUs in the process's affinity mask, capped by the cgroup quota
+        rounded up, and at least 1.
+    """
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count() or 1
+    limit = cgroup_cpu_limit(root)
+    if limit is not None:
+        cpus = min(cpus, math.ceil(limit))
+    return max(1, cpus)
+
+
+def bind_socket(host: str, port: int, backlog: int) -> socket.socket:
+    """Open the listening socket every worker accepts connections from.
+
+    Args:
+        host: Interface to listen on.
+        port: Port to listen on.
+        backlog: Queue length for connections not yet accepted.
+
+    Returns:
+        The bound, listening socket.
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class PreforkSupervisor:
+    """Fork worker processes and restart any that exit until told to stop.
+
+    Workers are forked from a parent that has already imported and built
+    the application, so they share its memory copy-on-write. A worker
+    exiting unexpectedly is replaced, after ``restart_delay_seconds`` if it
+    died soon after starting, so a crash loop cannot fork continuously. A
+    worker exiting with ``WORKER_BOOT_FAILURE`` stops the whole server.
+    SIGTERM and SIGINT are forwarded to the workers as SIGTERM.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[], int],
+        workers: int,
+        logger: LoggerPort,
+        restart_delay_seconds: float = 1.0,
+    ) -> None:
+        """Initialize the supervisor.
+
+        Args:
+            target: Function run in each worker; its return value is the exit code.
+            workers: Number of workers to keep running.
+            logger: The logger implementation.
+            restart_delay_seconds: Pause before replacing a worker that died this young.
+        """
+        self._target = target
+        self._worker_count = workers
+        self._logger = logger
+        self._restart_delay = restart_delay_seconds
+        self._workers: dict[int, float] = {}
+        self._stopping = False
+        self.restarts = 0
+
+    def run(self) -> int:
+        """Start the workers and supervise them until they have all exited.
+
+        Returns:
+            0 after a requested stop, 1 if a worker failed to boot.
+        """
+        previous = {}
+        if threading.current_thread() is threading.main_thread():
+            for signum in (signal.SIGTERM, signal.SIGINT):
+                previous[signum] = signal.signal(signum, self._handle_signal)
+        exit_code = 0
+        try:
+            for _ in range(self._worker_count):
+                self._spawn()
+            while self._workers:
+                try:
+                    pid, status = os.wait()
+                except ChildProcessError:
+                    break
+                started = self._workers.pop(pid, None)
+                if started is None or self._stopping:
+                    continue
+                code = os.waitstatus_to_exitcode(status)
+                if code == WORKER_BOOT_FAILURE:
+                    self._logger.error("Worker failed to start, stopping server", pid=pid)
+                    exit_code = 1
+                    self.stop()
+                    continue
+                self._logger.warning("Worker exited, restarting", pid=pid, exit_code=code)
+                if time.monotonic() - started < self._restart_delay:
+                    time.sleep(self._restart_delay)
+                if not self._stopping:
+                    self.restarts += 1
+                    self._spawn()
+        finally:
+            for signum, handler in previous.items():
+                signal.signal(signum, handler)
+        return exit_code
+
+    def stop(self) -> None:
+        """Ask every worker to shut down gracefully and stop restarting them."""
+        self._stopping = True
+        for pid in list(self._workers):
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    def _handle_signal(self, signum: int, _frame: FrameType | None) -> None:
+        """Stop the server on SIGTERM or SIGINT."""
+        self._logger.info("Stopping workers", signal=signal.Signals(signum).name)
+        self.stop()
+
+    def _spawn(self) -> None:
+        """Fork one worker; the child never returns from this call."""
+        pid = os.fork()
+        if pid == 0:
+            code = 1
+            try:
+                signal.signal(signal.SIGTERM, signal.SIG_DFL)
+                signal.signal(signal.SIGINT, signal.SIG_DFL)
+                code = self._target()
+            except Exception as e:
+                self._logger.error("Worker crashed", pid=os.getpid(), error=str(e))
+            finally:
+                os._exit(code)
+        self._workers[pid] = time.monotonic()
+        self._logger.info("Worker started", pid=pid)
+
+
+def main() -> int:
+    """Build the application once, then serve it from pre-forked uvicorn workers.
+
+    Garbage collection is disabled while the application and its read-only
+    indexes are built, and everything built is frozen before forking, so
+    collections in the workers never write to (and un-share) those pages.
+
+    Returns:
+        The process exit code.
+    """
+    gc.disable()
+
+    import uvicorn
+
+    from src.infrastructure.config import get_settings
+    from src.infrastructure.logging import StructlogAdapter, configure_logging
+    from src.main import create_app
+    from src.presentation.dependencies import get_city_index, get_city_locator
+
+    settings = get_settings()
+    configure_logging(log_level=settings.log_level, json_format=settings.environment != "dev")
+    logger = StructlogAdapter("weatherapp.server")
+
+    app = create_app()
+    get_city_index()
+    get_city_locator()
+    sock = bind_socket(settings.server_host, settings.server_port, settings.server_backlog)
+    workers = settings.server_workers or detect_worker_count()
+    config = uvicorn.Config(
+        app,
+        host=settings.server_host,
+        port=settings.server_port,
+        loop="uvloop",
+        http="httptools",
+        lifespan="on",
+        backlog=settings.server_backlog,
+        timeout_keep_alive=int(settings.server_keepalive_seconds),
+        timeout_graceful_shutdown=settings.server_graceful_timeout_seconds,
+        access_log=False,
+    )
+
+    def serve() -> int:
+        gc.set_threshold(settings.server_gc_threshold)
+        gc.enable()
+        server = uvicorn.Server(config)
+        server.run(sockets=[sock])
+        return 0 if server.started else WORKER_BOOT_FAILURE
+
+    if workers > 1:
+        logger.warning(
+            "Running several workers; bulk jobs, alerts, live updates, the webhook spool, "
+            "observation history and rate limits are per worker and will be inconsistent",
+            workers=workers,
+        )
+    gc.collect()
+    gc.freeze()
+    logger.info(
+        "Starting server",
+        host=settings.server_host,
+        port=settings.server_port,
+        workers=workers,
+    )
+    try:
+        return PreforkSupervisor(serve, workers, logger).run()
+    finally:
+        sock.close()
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
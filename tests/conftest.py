@@ -1,13 +1,13 @@
 """Shared test fixtures for Weather App tests."""
 
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
 from src.application.dto import WeatherResult
-from src.domain.entities import WeatherData
+from src.domain.entities import Forecast, ForecastPoint, WeatherData
 from src.domain.value_objects import Coordinates, UnitSystem
 
 
@@ -59,8 +59,10 @@ def mock_cache() -> MagicMock:
     from src.application.interfaces import CachePort
 
     cache = MagicMock(spec=CachePort)
-    cache.get = MagicMock(return_value=None)
-    cache.set = MagicMock()
+    cache.get = AsyncMock(return_value=None)
+    cache.get_many = AsyncMock(return_value={})
+    cache.set = AsyncMock()
+    cache.set_many = AsyncMock()
     return cache
 
 
@@ -102,3 +104,64 @@ def openweathermap_response() -> dict[str, Any]:
         "name": "London",
         "cod": 200,
     }
+
+
+@pytest.fixture
+def sample_forecast(sample_coordinates: Coordinates) -> Forecast:
+    """Sample two-day, 3-hourly forecast starting 2024-01-01 00:00 UTC."""
+    start = datetime(2024, 1, 1, tzinfo=UTC)
+    return Forecast(
+        city_name="London",
+        country="GB",
+        coordinates=sample_coordinates,
+        units=UnitSystem.METRIC,
+        utc_offset_seconds=0,
+        points=tuple(
+            ForecastPoint(
+                timestamp=start + timedelta(hours=3 * step),
+                temperature=float(step),
+                feels_like=float(step) - 1,
+                humidity=60 + step,
+                wind_speed=2.0 + step / 2,
+                pressure=1010,
+                precipitation_probability=step / 20,
+                description="light rain" if step % 4 == 0 else "overcast clouds",
+                icon_code="10d" if step % 4 == 0 else "04d",
+            )
+            for step in range(16)
+        ),
+    )
+
+
+@pytest.fixture
+def openweathermap_forecast_response() -> dict[str, Any]:
+    """Sample OpenWeatherMap 5-day forecast API response (two steps)."""
+    return {
+        "cod": "200",
+        "cnt": 2,
+        "list": [
+            {
+                "dt": 1705687200,
+                "main": {"temp": 9.1, "feels_like": 7.0, "pressure": 1015, "humidity": 80},
+                "weather": [{"id": 500, "description": "light rain", "icon": "10n"}],
+                "wind": {"speed": 5.2, "deg": 240},
+                "visibility": 10000,
+                "pop": 0.6,
+            },
+            {
+                "dt": 1705676400,
+                "main": {"temp": 10.4, "feels_like": 8.9, "pressure": 1014, "humidity": 76},
+                "weather": [{"id": 804, "description": "overcast clouds", "icon": "04d"}],
+                "wind": {"speed": 4.8, "deg": 230},
+                "visibility": 10000,
+                "pop": 0.2,
+            },
+        ],
+        "city": {
+            "id": 2643743,
+            "name": "London",
+            "coord": {"lat": 51.5074, "lon": -0.1278},
+            "country": "GB",
+            "timezone": 0,
+        },
+    }
@@ -1,5 +1,6 @@
 """Integration tests for the weather API endpoint."""
 
+import asyncio
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -7,7 +8,7 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from src.application.dto import WeatherResult
-from src.domain.entities import WeatherData
+from src.domain.entities import WeatherData, WeatherRequest
 from src.domain.value_objects import Coordinates, UnitSystem
 
 
@@ -63,6 +64,16 @@ class TestHealthEndpoint:
         assert "version" in data
         assert "environment" in data
 
+    @pytest.mark.asyncio
+    async def test_cache_stats(self, test_client: AsyncClient) -> None:
+        """Test cache statistics endpoint reports counters."""
+        response = await test_client.get("/health/cache")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["admission"] in ("lru", "tinylfu")
+        assert {"entries", "hits", "misses", "hit_ratio", "rejections"} <= data.keys()
+
 
 class TestWeatherEndpoint:
     """Tests for the weather endpoint."""
@@ -403,3 +414,856 @@ class TestWeatherEndpoint:
                 assert data["easter_egg"] is None
 
             app.dependency_overrides.clear()
+
+
+class TestWeatherStreamEndpoint:
+    """Tests for the live weather stream endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_stream_requires_location(self, test_client: AsyncClient) -> None:
+        """Test stream request without city or coords returns 422."""
+        response = await test_client.get("/api/v1/weather/stream")
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_stream_unknown_city(self) -> None:
+        """Test that unknown cities fail before the stream is opened."""
+        from src.domain.exceptions import CityNotFoundError
+
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(side_effect=CityNotFoundError("Atlantis"))
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import (
+                get_weather_update_hub,
+                get_weather_use_case,
+            )
+
+            app = create_app()
+            app.dependency_overrides[get_weather_use_case] = lambda: mock_use_case
+            app.dependency_overrides[get_weather_update_hub] = lambda: MagicMock()
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get("/api/v1/weather/stream?city=Atlantis")
+
+                assert response.status_code == 404
+                assert response.json()["error"]["code"] == "CITY_NOT_FOUND"
+
+            app.dependency_overrides.clear()
+
+
+class TestWeatherGridEndpoint:
+    """Tests for the interpolated weather grid endpoint."""
+
+    @pytest.fixture
+    def grid(self, sample_weather_data: WeatherData):
+        """Create a small precomputed grid."""
+        import numpy as np
+
+        from src.application.dto import WeatherGrid
+        from src.domain.value_objects import WeatherMetric
+
+        return WeatherGrid(
+            metric=WeatherMetric.TEMPERATURE,
+            units=UnitSystem.METRIC,
+            method="idw",
+            latitudes=np.array([52.0, 51.0, 50.0]),
+            longitudes=np.array([0.0, 1.0]),
+            values=np.arange(6, dtype=np.float32).reshape(3, 2),
+            anchors=(sample_weather_data,),
+        )
+
+    async def _get(self, grid, url: str):
+        """Call the grid endpoint with a mocked use case."""
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(return_value=grid)
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import get_weather_grid_use_case
+
+            app = create_app()
+            app.dependency_overrides[get_weather_grid_use_case] = lambda: mock_use_case
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(url)
+
+            app.dependency_overrides.clear()
+        return response
+
+    @pytest.mark.asyncio
+    async def test_grid_json(self, grid) -> None:
+        """Test the JSON grid payload."""
+        response = await self._get(
+            grid, "/api/v1/weather/grid?south=50&west=0&north=52&east=1&rows=3&cols=2"
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["rows"] == 3
+        assert data["cols"] == 2
+        assert data["values"] == [[0.0, 1.0], [2.0, 3.0], [4.0, 5.0]]
+        assert data["anchors"][0]["value"] == 15.2
+
+    @pytest.mark.asyncio
+    async def test_grid_binary(self, grid) -> None:
+        """Test the binary float32 grid payload."""
+        import numpy as np
+
+        response = await self._get(
+            grid,
+            "/api/v1/weather/grid?south=50&west=0&north=52&east=1&rows=3&cols=2&format=binary",
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/octet-stream"
+        assert response.headers["X-Grid-Rows"] == "3"
+        values = np.frombuffer(response.content, dtype="<f4").reshape(3, 2)
+        np.testing.assert_array_equal(values, grid.values)
+
+    @pytest.mark.asyncio
+    async def test_grid_invalid_bbox(self, test_client: AsyncClient) -> None:
+        """Test that an inverted bounding box returns 422."""
+        response = await test_client.get("/api/v1/weather/grid?south=52&west=0&north=50&east=1")
+        assert response.status_code == 422
+
+
+class TestRouteWeatherEndpoint:
+    """Tests for the route weather endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_route_weather(self, sample_weather_data: WeatherData) -> None:
+        """Test that segments are resolved through the weather use case."""
+        from src.application.use_cases import GetWeatherUseCase
+        from src.infrastructure.async_cache import AsyncCacheAdapter
+        from src.infrastructure.cache import InMemoryCache
+
+        mock_provider = MagicMock()
+        mock_provider.get_weather = AsyncMock(return_value=sample_weather_data)
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=AsyncCacheAdapter(InMemoryCache()),
+            logger=MagicMock(),
+        )
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import get_weather_use_case
+
+            app = create_app()
+            app.dependency_overrides[get_weather_use_case] = lambda: use_case
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post(
+                    "/api/v1/weather/route",
+                    json={"polyline": "_p~iF~ps|U_ulLnnqC_mqNvxq`@", "spacing_km": 100},
+                )
+
+                assert response.status_code == 200
+                data = response.json()
+                assert data["sample_count"] == 9
+                assert len(data["segments"]) == 9
+                assert data["segments"][0]["weather"]["city"] == "London"
+                assert data["segments"][0]["error"] is None
+                assert mock_provider.get_weather.await_count == 9
+
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_route_invalid_polyline(self, test_client: AsyncClient) -> None:
+        """Test that an undecodable polyline returns 422."""
+        response = await test_client.post(
+            "/api/v1/weather/route", json={"polyline": "_p~iF~ps|U_ulLnnqC_mqNvxq"}
+        )
+        assert response.status_code == 422
+        assert "polyline" in response.json()["detail"].lower()
+
+
+class TestBulkJobEndpoints:
+    """Tests for the bulk job endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_job_lifecycle(self, sample_weather_result: WeatherResult, tmp_path) -> None:
+        """Test submitting a CSV, polling progress and downloading results."""
+        from src.infrastructure.jobs import BulkWeatherJobManager
+
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(return_value=sample_weather_result)
+        manager = BulkWeatherJobManager(mock_use_case, MagicMock(), jobs_dir=tmp_path)
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import get_bulk_job_manager
+
+            app = create_app()
+            app.dependency_overrides[get_bulk_job_manager] = lambda: manager
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post(
+                    "/api/v1/weather/jobs",
+                    content=b"city\nLondon\nParis\n",
+                    headers={"Content-Type": "text/csv"},
+                )
+                assert response.status_code == 202
+                job_id = response.json()["id"]
+                assert response.json()["total_rows"] == 2
+
+                await manager.wait(job_id)
+
+                status = (await client.get(f"/api/v1/weather/jobs/{job_id}")).json()
+                assert status["status"] == "completed"
+                assert status["progress"] == 1.0
+
+                results = await client.get(f"/api/v1/weather/jobs/{job_id}/results?format=csv")
+                assert results.status_code == 200
+                assert results.headers["content-type"].startswith("text/csv")
+                assert len(results.text.strip().splitlines()) == 3
+
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_job_invalid_csv(self, tmp_path) -> None:
+        """Test that a CSV without location columns returns 422."""
+        from src.infrastructure.jobs import BulkWeatherJobManager
+
+        manager = BulkWeatherJobManager(MagicMock(), MagicMock(), jobs_dir=tmp_path)
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import get_bulk_job_manager
+
+            app = create_app()
+            app.dependency_overrides[get_bulk_job_manager] = lambda: manager
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post("/api/v1/weather/jobs", content=b"name\nLondon\n")
+                assert response.status_code == 422
+
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_job_queue_full(self, tmp_path) -> None:
+        """Test that uploads beyond the active job limit return 503 with Retry-After."""
+        from src.infrastructure.jobs import BulkWeatherJobManager
+
+        async def execute(_request: WeatherRequest) -> None:
+            await asyncio.Event().wait()
+
+        mock_use_case = MagicMock()
+        mock_use_case.execute = AsyncMock(side_effect=execute)
+        manager = BulkWeatherJobManager(
+            mock_use_case, MagicMock(), jobs_dir=tmp_path, max_active_jobs=1
+        )
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import get_bulk_job_manager
+
+            app = create_app()
+            app.dependency_overrides[get_bulk_job_manager] = _returning(manager)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                first = await client.post("/api/v1/weather/jobs", content=b"city\nLondon\n")
+                assert first.status_code == 202
+                response = await client.post("/api/v1/weather/jobs", content=b"city\nParis\n")
+                assert response.status_code == 503
+                assert response.json()["error"]["code"] == "JOB_QUEUE_FULL"
+                assert response.headers["Retry-After"] == "30"
+
+            await manager.close()
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_job_not_found(self, test_client: AsyncClient) -> None:
+        """Test that unknown job ids return 404 with the error shape."""
+        response = await test_client.get("/api/v1/weather/jobs/missing")
+        assert response.status_code == 404
+        assert response.json()["error"]["code"] == "JOB_NOT_FOUND"
+
+
+class TestCompareWeatherEndpoint:
+    """Tests for the multi-city comparison endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_compare(self, sample_weather_data: WeatherData) -> None:
+        """Test ranking a list of cities."""
+        from src.application.use_cases import GetWeatherUseCase
+        from src.infrastructure.async_cache import AsyncCacheAdapter
+        from src.infrastructure.cache import InMemoryCache
+
+        mock_provider = MagicMock()
+        mock_provider.get_weather = AsyncMock(return_value=sample_weather_data)
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=AsyncCacheAdapter(InMemoryCache()),
+            logger=MagicMock(),
+        )
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import get_weather_use_case
+
+            app = create_app()
+            app.dependency_overrides[get_weather_use_case] = lambda: use_case
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post(
+                    "/api/v1/weather/compare",
+                    json={"cities": ["London", "london", "Paris"], "units": "imperial"},
+                )
+
+                assert response.status_code == 200
+                data = response.json()
+                assert data["rank_by"] == "comfort_score"
+                assert len(data["results"]) == 3
+                assert data["results"][0]["temperature"] == pytest.approx(59.36)
+                assert data["errors"] == []
+                assert mock_provider.get_weather.await_count == 2
+
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_compare_requires_cities(self, test_client: AsyncClient) -> None:
+        """Test that an empty city list returns 422."""
+        response = await test_client.post("/api/v1/weather/compare", json={"cities": []})
+        assert response.status_code == 422
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("blank", ["", "   ", "\t\n"])
+    async def test_compare_rejects_blank_city(self, test_client: AsyncClient, blank: str) -> None:
+        """Test that empty or whitespace-only city names return 422, not 500."""
+        response = await test_client.post(
+            "/api/v1/weather/compare", json={"cities": ["London", blank]}
+        )
+        assert response.status_code == 422
+
+
+class TestAlertEndpoints:
+    """Tests for the alert rule endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_alert_lifecycle(self, sample_weather_data: WeatherData) -> None:
+        """Test creating a rule, triggering it on refresh and deleting it."""
+        import dataclasses
+
+        from src.application.alerts import AlertEngine
+        from src.application.use_cases import GetWeatherUseCase
+        from src.infrastructure.async_cache import AsyncCacheAdapter
+        from src.infrastructure.cache import InMemoryCache
+
+        engine = AlertEngine(logger=MagicMock())
+        cache = InMemoryCache()
+        mock_provider = MagicMock()
+        mock_provider.get_weather = AsyncMock(return_value=sample_weather_data)
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=AsyncCacheAdapter(cache),
+            logger=MagicMock(),
+            observers=[engine],
+        )
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import get_alert_engine, get_weather_use_case
+
+            app = create_app()
+            app.dependency_overrides[get_alert_engine] = lambda: engine
+            app.dependency_overrides[get_weather_use_case] = lambda: use_case
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post(
+                    "/api/v1/alerts",
+                    json={
+                        "city": "London",
+                        "metric": "wind_speed",
+                        "direction": "above",
+                        "threshold": 15,
+                    },
+                )
+                assert response.status_code == 201
+                rule_id = response.json()["id"]
+                assert response.json()["city"] == "London"
+
+                # The next refresh brings a gust above the threshold
+                cache.clear()
+                mock_provider.get_weather.return_value = dataclasses.replace(
+                    sample_weather_data, wind_speed=16.5
+                )
+                await client.get("/api/v1/weather", params={"city": "London"})
+
+                events = (await client.get(f"/api/v1/alerts/{rule_id}/events")).json()
+                assert len(events) == 1
+                assert events[0]["value"] == 16.5
+                assert events[0]["weather"]["wind_speed"] == 16.5
+
+                listed = (await client.get("/api/v1/alerts")).json()
+                assert [rule["id"] for rule in listed] == [rule_id]
+
+                assert (await client.delete(f"/api/v1/alerts/{rule_id}")).status_code == 204
+                response = await client.get(f"/api/v1/alerts/{rule_id}")
+                assert response.status_code == 404
+                assert response.json()["error"]["code"] == "ALERT_RULE_NOT_FOUND"
+
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_coordinate_rule_near_city_follows_snapped_key(
+        self, sample_weather_data: WeatherData, tmp_path
+    ) -> None:
+        """Test that rules and history for a point near a city see the city's observations."""
+        import dataclasses
+
+        from src.application.alerts import AlertEngine
+        from src.application.nearest_city import NearestCityIndex
+        from src.application.use_cases import GetWeatherUseCase
+        from src.domain.entities import City
+        from src.infrastructure.async_cache import AsyncCacheAdapter
+        from src.infrastructure.cache import InMemoryCache
+        from src.infrastructure.history import ObservationHistoryStore
+
+        engine = AlertEngine(logger=MagicMock())
+        store = ObservationHistoryStore(logger=MagicMock(), history_dir=tmp_path)
+        cache = InMemoryCache()
+        mock_provider = MagicMock()
+        mock_provider.get_weather = AsyncMock(return_value=sample_weather_data)
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=AsyncCacheAdapter(cache),
+            logger=MagicMock(),
+            observers=[engine, store],
+            city_locator=NearestCityIndex(
+                [City(name="London", country="GB", coordinates=sample_weather_data.coordinates)]
+            ),
+            snap_max_distance_km=10,
+        )
+        point = {"lat": 51.55, "lon": -0.2}
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import (
+                get_alert_engine,
+                get_history_store,
+                get_weather_use_case,
+            )
+
+            app = create_app()
+            app.dependency_overrides[get_alert_engine] = _returning(engine)
+            app.dependency_overrides[get_history_store] = _returning(store)
+            app.dependency_overrides[get_weather_use_case] = _returning(use_case)
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.post(
+                    "/api/v1/alerts",
+                    json={**point, "metric": "wind_speed", "direction": "above", "threshold": 15},
+                )
+                assert response.status_code == 201
+                rule_id = response.json()["id"]
+
+                cache.clear()
+                mock_provider.get_weather.return_value = dataclasses.replace(
+                    sample_weather_data, wind_speed=16.5
+                )
+                await client.get("/api/v1/weather", params=point)
+
+                events = (await client.get(f"/api/v1/alerts/{rule_id}/events")).json()
+                assert [event["value"] for event in events] == [16.5]
+
+                # Recorded under London's key when the rule's location was resolved
+                response = await client.get(
+                    "/api/v1/weather/history", params={**point, "metric": "wind_speed"}
+                )
+                assert response.json()["series"]["wind_speed"]["values"] == [4.5]
+
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_alert_requires_location(self, test_client: AsyncClient) -> None:
+        """Test that a rule without city or coordinates returns 422."""
+        response = await test_client.post(
+            "/api/v1/alerts",
+            json={"metric": "temperature", "direction": "below", "threshold": 0, "lat": 10},
+        )
+        assert response.status_code == 422
+
+
+class TestWeatherHistoryEndpoint:
+    """Tests for the observation history endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_history_records_fetches(
+        self, sample_weather_data: WeatherData, tmp_path
+    ) -> None:
+        """Test that fetched observations can be read back raw and aggregated."""
+        from src.application.use_cases import GetWeatherUseCase
+        from src.infrastructure.async_cache import AsyncCacheAdapter
+        from src.infrastructure.cache import InMemoryCache
+        from src.infrastructure.history import ObservationHistoryStore
+
+        store = ObservationHistoryStore(logger=MagicMock(), history_dir=tmp_path)
+        mock_provider = MagicMock()
+        mock_provider.get_weather = AsyncMock(return_value=sample_weather_data)
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=AsyncCacheAdapter(InMemoryCache()),
+            logger=MagicMock(),
+            observers=[store],
+        )
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import get_history_store, get_weather_use_case
+
+            app = create_app()
+            app.dependency_overrides[get_history_store] = lambda: store
+            app.dependency_overrides[get_weather_use_case] = lambda: use_case
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                await client.get("/api/v1/weather", params={"city": "London"})
+
+                response = await client.get(
+                    "/api/v1/weather/history", params={"city": "London", "metric": "temperature"}
+                )
+                assert response.status_code == 200
+                data = response.json()
+                assert data["location"] == "London, GB"
+                assert data["series"]["temperature"]["values"] == [15.2]
+                assert list(data["series"]) == ["temperature"]
+
+                response = await client.get(
+                    "/api/v1/weather/history", params={"city": "London", "bucket_seconds": 3600}
+                )
+                data = response.json()
+                assert data["counts"] == [1]
+                assert data["series"]["humidity"]["mean"] == [72.0]
+
+            app.dependency_overrides.clear()
+
+    @pytest.mark.asyncio
+    async def test_history_rejects_inverted_range(self, test_client: AsyncClient) -> None:
+        """Test that start after end returns 422."""
+        response = await test_client.get(
+            "/api/v1/weather/history",
+            params={
+                "city": "London",
+                "start": "2024-01-02T00:00:00Z",
+                "end": "2024-01-01T00:00:00Z",
+            },
+        )
+        assert response.status_code == 422
+
+
+class TestForecastEndpoints:
+    """Tests for the forecast endpoints."""
+
+    @pytest.mark.asyncio
+    async def test_forecast_queries(self, sample_forecast) -> None:
+        """Test point and daily queries answered from one upstream forecast."""
+        from src.application.use_cases import GetForecastUseCase
+
+        mock_provider = MagicMock()
+        mock_provider.get_forecast = AsyncMock(return_value=sample_forecast)
+        use_case = GetForecastUseCase(weather_provider=mock_provider, logger=MagicMock())
+
+        with patch.dict("os.environ", {"OPENWEATHERMAP_API_KEY": "test_key"}):
+            from src.main import create_app
+            from src.presentation.dependencies import get_forecast_use_case
+
+            app = create_app()
+            app.dependency_overrides[get_forecast_use_case] = lambda: use_case
+
+            transport = ASGITransport(app=app)
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                response = await client.get(
+                    "/api/v1/weather/forecast/at",
+                    params={"city": "London", "time": "2024-01-01T15:00:00Z"},
+                )
+                assert response.status_code == 200
+                data = response.json()
+                assert data["city"] == "London"
+                assert data["points"][0]["temperature"] == 5.0
+
+                response = await client.get(
+                    "/api/v1/weather/forecast/daily",
+                    params={"city": "London", "date": "2024-01-02"},
+                )
+                assert response.status_code == 200
+                days = response.json()["days"]
+                assert len(days) == 1
+                assert days[0]["temperature_max"] == 15.0
+
+                response = await client.get(
+                    "/api/v1/weather/forecast/at",
+                    params={"city": "London", "time": "2031-01-01T00:00:00Z"},
+                )
+                assert response.status_code == 422
+                assert mock_provider.get_forecast.await_count == 1
+
+            app.dependency_overrides.clear()
+
+
+class TestCityAutocompleteEndpoint:
+    """Tests for the city autocomplete endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_autocomplete_ranks_bundled_cities(self, test_client: AsyncClient) -> None:
+        """Test that suggestions come from the bundled gazetteer, largest first."""
+        response = await test_client.get(
+            "/api/v1/cities/autocomplete", params={"q": "lon", "limit": 2}
+        )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["query"] == "lon"
+        assert [(c["name"], c["country"]) for c in data["results"]] == [
+            ("London", "GB"),
+            ("London", "CA"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_autocomplete_requires_query(self, test_client: AsyncClient) -> None:
+        """Test that an empty prefix returns 422."""
+        response = await test_client.get("/api/v1/cities/autocomplete", params={"q": ""})
+        assert response.status_code == 422
+
+
+def _returning(value):
+    """Return a dependency override that provides ``value``."""
+    return lambda: value
+
+
+class TestPeerCache:
+    """Tests for replicas cooperating through the peer cache."""
+
+    PEERS = ["http://peer-0", "http://peer-1", "http://peer-2"]
+    CITIES = ["London", "Paris", "Tokyo", "Berlin", "Madrid", "Rome", "Oslo", "Lima"]
+
+    @pytest.fixture
+    async def replicas(self, sample_weather_data: WeatherData):
+        """Start three in-process replicas that reach each other through one client."""
+        import dataclasses
+
+        from src.application.use_cases import GetWeatherUseCase
+        from src.infrastructure.async_cache import AsyncCacheAdapter
+        from src.infrastructure.cache import InMemoryCache
+        from src.infrastructure.peers import PeerWeatherProvider
+
+        with patch.dict(
+            "os.environ", {"OPENWEATHERMAP_API_KEY": "test_key", "PEER_TOKEN": "s3cret"}
+        ):
+            from src.infrastructure.config import get_settings
+            from src.main import create_app
+            from src.presentation.dependencies import (
+                get_cache,
+                get_peer_weather_use_case,
+                get_weather_use_case,
+            )
+
+            get_settings.cache_clear()
+            apps = [create_app() for _ in self.PEERS]
+            mounts = {
+                url: ASGITransport(app=app) for url, app in zip(self.PEERS, apps, strict=True)
+            }
+            async with AsyncClient(mounts=mounts) as client:
+                upstreams = []
+                for url, app in zip(self.PEERS, apps, strict=True):
+                    upstream = MagicMock()
+                    upstream.get_weather = AsyncMock(
+                        side_effect=lambda request: dataclasses.replace(
+                            sample_weather_data, city_name=request.city
+                        )
+                    )
+                    peer = PeerWeatherProvider(
+                        upstream, self.PEERS, url, "s3cret", MagicMock(), client=client
+                    )
+                    l1 = InMemoryCache()
+                    cache = AsyncCacheAdapter(l1)
+                    use_case = GetWeatherUseCase(peer, cache, MagicMock())
+                    peer_use_case = GetWeatherUseCase(peer.owned, cache, MagicMock())
+                    app.dependency_overrides[get_cache] = _returning(l1)
+                    app.dependency_overrides[get_weather_use_case] = _returning(use_case)
+                    app.dependency_overrides[get_peer_weather_use_case] = _returning(peer_use_case)
+                    upstreams.append((peer, upstream))
+                yield client, upstreams
+        get_settings.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_each_location_is_fetched_upstream_once(self, replicas) -> None:
+        """Test that every replica serves every city with one upstream call per city."""
+        client, upstreams = replicas
+
+        for city in self.CITIES:
+            for url in self.PEERS:
+                response = await client.get(f"{url}/api/v1/weather", params={"city": city})
+                assert response.status_code == 200
+                assert response.json()["city"] == city
+
+        assert sum(upstream.get_weather.await_count for _, upstream in upstreams) == len(
+            self.CITIES
+        )
+        peer = upstreams[0][0]
+        for url, (_, upstream) in zip(self.PEERS, upstreams, strict=True):
+            fetched = {call.args[0].city for call in upstream.get_weather.await_args_list}
+            assert fetched == {
+                city for city in self.CITIES if peer.owner(WeatherRequest(city=city)) == url
+            }
+
+    @pytest.mark.asyncio
+    async def test_peer_endpoint_requires_token(self, replicas) -> None:
+        """Test that the internal endpoint rejects requests without the shared token."""
+        client, _ = replicas
+
+        response = await client.get(f"{self.PEERS[0]}/internal/peer/weather?city=London")
+        assert response.status_code == 403
+
+    @pytest.mark.asyncio
+    async def test_new_replica_warms_from_peer_cache(self, replicas) -> None:
+        """Test that a new replica copies a running peer's cache over HTTP."""
+        from src.infrastructure.cache import InMemoryCache
+        from src.infrastructure.peers import PeerCacheWarmer
+
+        client, _ = replicas
+        for city in self.CITIES:
+            await client.get(f"{self.PEERS[0]}/api/v1/weather", params={"city": city})
+
+        cache = InMemoryCache()
+        warmer = PeerCacheWarmer(cache, self.PEERS[0], "s3cret", MagicMock(), client=client)
+
+        assert await warmer.warm() == len(self.CITIES)
+        assert cache.get(WeatherRequest(city="Tokyo").cache_key) is not None
+        response = await client.get(
+            f"{self.PEERS[0]}/internal/peer/weather?city=London",
+            headers={"X-Peer-Token": "wrong"},
+        )
+        assert response.status_code == 403
+
+
+class TestClientRateLimit:
+    """Tests for the inbound per-client request and miss budgets."""
+
+    @pytest.fixture
+    async def limited_client(self, sample_weather_data: WeatherData):
+        """Create a client for an app with small per-client budgets."""
+        import dataclasses
+
+        from src.application.use_cases import GetWeatherUseCase
+        from src.infrastructure.async_cache import AsyncCacheAdapter
+        from src.infrastructure.cache import InMemoryCache
+        from src.infrastructure.rate_limit import ClientBudgetedWeatherProvider
+
+        env = {
+            "OPENWEATHERMAP_API_KEY": "test_key",
+            "CLIENT_REQUESTS_PER_MINUTE": "5",
+            "CLIENT_MISSES_PER_MINUTE": "2",
+            "CLIENT_API_KEYS": '["partner"]',
+        }
+        with patch.dict("os.environ", env):
+            from src.infrastructure.config import get_settings
+            from src.main import create_app
+            from src.presentation.dependencies import (
+                get_client_miss_limiter,
+                get_client_request_limiter,
+                get_weather_use_case,
+            )
+
+            caches = (get_settings, get_client_request_limiter, get_client_miss_limiter)
+            for cached in caches:
+                cached.cache_clear()
+            app = create_app()
+            upstream = MagicMock()
+            upstream.get_weather = AsyncMock(
+                side_effect=lambda request: dataclasses.replace(
+                    sample_weather_data, city_name=request.city
+                )
+            )
+            provider = ClientBudgetedWeatherProvider(upstream, get_client_miss_limiter())
+            use_case = GetWeatherUseCase(provider, AsyncCacheAdapter(InMemoryCache()), MagicMock())
+            app.dependency_overrides[get_weather_use_case] = _returning(use_case)
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as c:
+                yield c
+        for cached in caches:
+            cached.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_request_budget_is_per_client(self, limited_client: AsyncClient) -> None:
+        """Test that a client over its request budget gets a 429 while others do not."""
+        for _ in range(5):
+            response = await limited_client.get("/api/v1/weather", params={"city": "London"})
+            assert response.status_code == 200
+
+        response = await limited_client.get("/api/v1/weather", params={"city": "London"})
+
+        assert response.status_code == 429
+        retry_after = int(response.headers["Retry-After"])
+        assert 1 <= retry_after <= 60
+        assert response.json() == {
+            "error": {
+                "code": "RATE_LIMIT_EXCEEDED",
+                "message": f"Rate limit exceeded. Retry after {retry_after} seconds.",
+                "retry_after": retry_after,
+            }
+        }
+        other = await limited_client.get(
+            "/api/v1/weather", params={"city": "London"}, headers={"X-API-Key": "partner"}
+        )
+        assert other.status_code == 200
+        assert (await limited_client.get("/health")).status_code == 200
+
+    @pytest.mark.asyncio
+    async def test_unknown_api_keys_share_the_ip_budget(self, limited_client: AsyncClient) -> None:
+        """Test that inventing a new API key per request does not escape the limit."""
+        statuses = [
+            (
+                await limited_client.get(
+                    "/api/v1/weather", params={"city": "London"}, headers={"X-API-Key": f"k{n}"}
+                )
+            ).status_code
+            for n in range(6)
+        ]
+
+        assert statuses == [200] * 5 + [429]
+
+    @pytest.mark.parametrize(
+        ("forwarded", "expected"),
+        [
+            ("203.0.113.7, 10.0.0.2", "ip:203.0.113.7"),
+            ("198.51.100.1, 203.0.113.7, 10.0.0.2", "ip:203.0.113.7"),
+            # Fewer entries than trusted hops: the leftmost one is client-controlled
+            ("198.51.100.1", "ip:10.0.0.9"),
+        ],
+    )
+    def test_forwarded_for_needs_every_trusted_hop(self, forwarded: str, expected: str) -> None:
+        """Test that a short X-Forwarded-For falls back to the connection's address."""
+        from src.presentation.middleware import ClientRateLimitMiddleware
+
+        middleware = ClientRateLimitMiddleware(MagicMock(), limiter=None, proxy_hops=2)
+        scope = {
+            "headers": [(b"x-forwarded-for", forwarded.encode())],
+            "client": ("10.0.0.9", 50_000),
+        }
+
+        assert middleware.client_key(scope) == expected
+
+    @pytest.mark.asyncio
+    async def test_misses_have_a_smaller_budget(self, limited_client: AsyncClient) -> None:
+        """Test that uncached lookups are limited before cached ones."""
+        for city in ("London", "Paris"):
+            response = await limited_client.get("/api/v1/weather", params={"city": city})
+            assert response.status_code == 200
+
+        miss = await limited_client.get("/api/v1/weather", params={"city": "Tokyo"})
+        hit = await limited_client.get("/api/v1/weather", params={"city": "London"})
+
+        assert miss.status_code == 429
+        assert miss.json()["error"]["code"] == "RATE_LIMIT_EXCEEDED"
+        assert hit.status_code == 200
@@ -0,0 +1,139 @@
+"""Unit tests for the threshold alert rule engine."""
+
+import dataclasses
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.application.alerts import AlertEngine
+from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.exceptions import AlertRuleNotFoundError
+from src.domain.value_objects import AlertDirection, UnitSystem, WeatherMetric
+
+LONDON = WeatherRequest(city="London")
+
+
+def _with_wind(weather_data: WeatherData, wind_speed: float) -> WeatherData:
+    """Return a copy of the observation with another wind speed."""
+    return dataclasses.replace(weather_data, wind_speed=wind_speed)
+
+
+class TestAlertEngine:
+    """Tests for AlertEngine."""
+
+    @pytest.fixture
+    def engine(self) -> AlertEngine:
+        """Create an engine with a mock logger."""
+        return AlertEngine(logger=MagicMock())
+
+    def _fired(
+        self, engine: AlertEngine, weather_data: WeatherData, wind_speed: float
+    ) -> set[float]:
+        """Feed a wind observation for London and return the thresholds that fired."""
+        before = {rule.id: len(engine.events(rule.id)) for rule in engine.list_rules()}
+        engine.on_weather_refreshed(LONDON.cache_key, _with_wind(weather_data, wind_speed))
+        return {
+            rule.threshold
+            for rule in engine.list_rules()
+            if len(engine.events(rule.id)) > before[rule.id]
+        }
+
+    def test_first_observation_fires_met_rules(
+        self, engine: AlertEngine, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that rules already met on the first observation fire."""
+        for threshold in (5.0, 10.0, 15.0):
+            engine.add_rule(LONDON, WeatherMetric.WIND_SPEED, AlertDirection.ABOVE, threshold)
+        engine.add_rule(LONDON, WeatherMetric.WIND_SPEED, AlertDirection.BELOW, 20.0)
+
+        assert self._fired(engine, sample_weather_data, 12.0) == {5.0, 10.0, 20.0}
+
+    def test_only_crossed_thresholds_fire(
+        self, engine: AlertEngine, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a rising value fires ABOVE rules between old and new value."""
+        for threshold in (5.0, 10.0, 15.0, 20.0):
+            engine.add_rule(LONDON, WeatherMetric.WIND_SPEED, AlertDirection.ABOVE, threshold)
+        self._fired(engine, sample_weather_data, 7.0)
+
+        assert self._fired(engine, sample_weather_data, 16.0) == {10.0, 15.0}
+        assert self._fired(engine, sample_weather_data, 17.0) == set()
+
+    def test_falling_value_fires_below_rules(
+        self, engine: AlertEngine, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a falling value fires BELOW rules between new and old value."""
+        for threshold in (2.0, 5.0, 8.0):
+            engine.add_rule(LONDON, WeatherMetric.WIND_SPEED, AlertDirection.BELOW, threshold)
+        self._fired(engine, sample_weather_data, 9.0)
+
+        assert self._fired(engine, sample_weather_data, 5.0) == {8.0}
+        assert self._fired(engine, sample_weather_data, 1.0) == {5.0, 2.0}
+
+    def test_boundary_matches_is_met(
+        self, engine: AlertEngine, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that reaching a threshold exactly does not count as above it."""
+        rule = engine.add_rule(LONDON, WeatherMetric.WIND_SPEED, AlertDirection.ABOVE, 10.0)
+        self._fired(engine, sample_weather_data, 5.0)
+
+        assert self._fired(engine, sample_weather_data, 10.0) == set()
+        assert not rule.is_met(10.0)
+        assert self._fired(engine, sample_weather_data, 10.5) == {10.0}
+
+    def test_rules_are_isolated_by_location_and_units(
+        self, engine: AlertEngine, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that observations only reach rules for the same cache key."""
+        engine.add_rule(
+            WeatherRequest(city="London", units=UnitSystem.IMPERIAL),
+            WeatherMetric.WIND_SPEED,
+            AlertDirection.ABOVE,
+            1.0,
+        )
+        engine.add_rule(
+            WeatherRequest(city="Paris"), WeatherMetric.WIND_SPEED, AlertDirection.ABOVE, 1.0
+        )
+
+        assert self._fired(engine, sample_weather_data, 30.0) == set()
+
+    def test_events_recorded_newest_first(
+        self, engine: AlertEngine, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that each rule keeps its recent events."""
+        rule = engine.add_rule(LONDON, WeatherMetric.WIND_SPEED, AlertDirection.ABOVE, 10.0)
+        for wind_speed in (12.0, 4.0, 14.0):
+            engine.on_weather_refreshed(
+                LONDON.cache_key, _with_wind(sample_weather_data, wind_speed)
+            )
+
+        events = engine.events(rule.id)
+        assert [event.value for event in events] == [14.0, 12.0]
+        assert events[0].previous_value == 4.0
+        assert events[1].previous_value is None
+
+    def test_remove_rule(self, engine: AlertEngine, sample_weather_data: WeatherData) -> None:
+        """Test that removed rules no longer fire or resolve."""
+        rule = engine.add_rule(LONDON, WeatherMetric.WIND_SPEED, AlertDirection.ABOVE, 1.0)
+        engine.add_rule(LONDON, WeatherMetric.WIND_SPEED, AlertDirection.ABOVE, 1.0)
+        engine.remove_rule(rule.id)
+
+        assert engine.rule_count == 1
+        assert self._fired(engine, sample_weather_data, 5.0) == {1.0}
+        with pytest.raises(AlertRuleNotFoundError):
+            engine.get_rule(rule.id)
+        with pytest.raises(AlertRuleNotFoundError):
+            engine.remove_rule(rule.id)
+
+    def test_failing_listener_is_isolated(
+        self, engine: AlertEngine, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a listener error does not stop other listeners."""
+        rule = engine.add_rule(LONDON, WeatherMetric.WIND_SPEED, AlertDirection.ABOVE, 1.0)
+        received: list[str] = []
+        engine.add_listener(MagicMock(side_effect=RuntimeError("boom")))
+        engine.add_listener(lambda events: received.extend(e.rule.id for e in events))
+
+        engine.on_weather_refreshed(LONDON.cache_key, sample_weather_data)
+
+        assert received == [rule.id]
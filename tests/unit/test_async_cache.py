@@ -0,0 +1,56 @@
+"""Unit tests for the async cache adapter."""
+
+import threading
+
+import pytest
+
+from src.domain.entities import WeatherData
+from src.infrastructure.async_cache import AsyncCacheAdapter
+from src.infrastructure.cache import InMemoryCache
+
+
+class _ThreadRecordingCache(InMemoryCache):
+    """In-memory cache remembering which thread served each read."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.threads: list[int] = []
+
+    def get(self, key: str) -> WeatherData | None:
+        self.threads.append(threading.get_ident())
+        return super().get(key)
+
+
+class TestAsyncCacheAdapter:
+    """Tests for AsyncCacheAdapter."""
+
+    @pytest.mark.parametrize("offload", [False, True])
+    @pytest.mark.asyncio
+    async def test_operations_reach_backend(
+        self, offload: bool, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that every port operation is applied to the backend."""
+        backend = InMemoryCache()
+        cache = AsyncCacheAdapter(backend, offload=offload)
+
+        await cache.set("london", sample_weather_data, ttl_seconds=300)
+        await cache.set_many({"paris": sample_weather_data}, ttl_seconds=300)
+
+        assert await cache.get("london") == sample_weather_data
+        assert set(await cache.get_many(["london", "paris", "tokyo"])) == {"london", "paris"}
+        await cache.delete("london")
+        assert backend.get("london") is None
+        await cache.clear()
+        assert backend.size == 0
+
+    @pytest.mark.asyncio
+    async def test_offload_runs_in_worker_thread(self) -> None:
+        """Test that offloaded calls leave the event loop thread."""
+        backend = _ThreadRecordingCache()
+
+        await AsyncCacheAdapter(backend).get("london")
+        await AsyncCacheAdapter(backend, offload=True).get("london")
+
+        inline, offloaded = backend.threads
+        assert inline == threading.get_ident()
+        assert offloaded != threading.get_ident()
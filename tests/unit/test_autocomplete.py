@@ -0,0 +1,89 @@
+"""Unit tests for the city autocomplete index."""
+
+import pytest
+
+from src.application.autocomplete import CityAutocompleteIndex, normalize_name
+from src.domain.entities import City, WeatherData
+from src.domain.value_objects import Coordinates
+from src.infrastructure.gazetteer import load_gazetteer
+
+ORIGIN = Coordinates(latitude=0.0, longitude=0.0)
+
+
+def _city(name: str, country: str = "XX", population: int = 0) -> City:
+    """Create a city at the origin."""
+    return City(name=name, country=country, coordinates=ORIGIN, population=population)
+
+
+def _names(cities: list[City]) -> list[str]:
+    """Return the display names of cities."""
+    return [city.location_display for city in cities]
+
+
+class TestCityAutocompleteIndex:
+    """Tests for CityAutocompleteIndex."""
+
+    @pytest.fixture
+    def index(self) -> CityAutocompleteIndex:
+        """Create an index over a few cities."""
+        return CityAutocompleteIndex(
+            [
+                _city("London", "GB", 9_000_000),
+                _city("London", "CA", 400_000),
+                _city("Londrina", "BR", 500_000),
+                _city("New York", "US", 18_000_000),
+                _city("São Paulo", "BR", 21_000_000),
+            ]
+        )
+
+    def test_prefix_matches_ranked_by_population(self, index: CityAutocompleteIndex) -> None:
+        """Test that matches are ordered by population."""
+        assert _names(index.search("Lon")) == ["London, GB", "Londrina, BR", "London, CA"]
+        assert _names(index.search("lon", limit=1)) == ["London, GB"]
+
+    def test_later_words_and_accents_match(self, index: CityAutocompleteIndex) -> None:
+        """Test that any word start matches and accents are ignored."""
+        assert _names(index.search("york")) == ["New York, US"]
+        assert _names(index.search("sao p")) == ["São Paulo, BR"]
+
+    def test_no_match_or_blank_prefix(self, index: CityAutocompleteIndex) -> None:
+        """Test that unknown and blank prefixes return nothing."""
+        assert index.search("xyz") == []
+        assert index.search("  ") == []
+
+    def test_popularity_lifts_ranking(self, index: CityAutocompleteIndex) -> None:
+        """Test that frequently fetched cities move up."""
+        for _ in range(20):
+            index.learn(_city("London", "CA"))
+
+        assert _names(index.search("lon"))[0] == "London, CA"
+        assert len(index) == 5
+
+    def test_learned_names_are_bounded(self) -> None:
+        """Test that learned names are evicted least recently seen first."""
+        index = CityAutocompleteIndex([_city("Paris", "FR", 2_000_000)], max_learned=2)
+        for name in ("Pau", "Parma", "Patras"):
+            index.learn(_city(name))
+
+        assert len(index) == 3
+        assert _names(index.search("pa")) == ["Paris, FR", "Parma, XX", "Patras, XX"]
+
+    def test_learns_from_weather_responses(self, sample_weather_data: WeatherData) -> None:
+        """Test that provider responses add new names to the index."""
+        index = CityAutocompleteIndex([])
+        index.on_weather_refreshed("london:metric", sample_weather_data)
+
+        assert _names(index.search("lo")) == ["London, GB"]
+
+
+def test_normalize_name() -> None:
+    """Test accent, case and punctuation folding."""
+    assert normalize_name("  Saint-Étienne ") == "saint etienne"
+    assert normalize_name("St. Louis") == "st louis"
+
+
+def test_bundled_gazetteer_loads() -> None:
+    """Test that the bundled gazetteer is readable and indexable."""
+    cities = load_gazetteer()
+    assert len(cities) > 200
+    assert _names(CityAutocompleteIndex(cities).search("tok", limit=1)) == ["Tokyo, JP"]
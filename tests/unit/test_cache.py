@@ -1,12 +1,16 @@
 """Unit tests for the cache implementation."""
 
-from datetime import UTC, datetime
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.domain.entities import WeatherData
 from src.domain.value_objects import Coordinates, UnitSystem
-from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.cache import InMemoryCache, SnapshotStreamReader
+from src.infrastructure.config import Settings
 
 
 class TestInMemoryCache:
@@ -125,3 +129,241 @@ class TestInMemoryCache:
         assert result is not None
         assert result.temperature == 20.0
         assert result.description == "sunny"
+
+    def test_snapshot_round_trip(
+        self, cache: InMemoryCache, weather_data: WeatherData, tmp_path: Path
+    ) -> None:
+        """Test that a snapshot restores every entry into a new cache."""
+        cache.set("weather:london:metric", weather_data, ttl_seconds=300)
+        cache.set("weather:são paulo:metric", weather_data, ttl_seconds=300)
+        path = tmp_path / "cache.snapshot"
+
+        assert cache.save_snapshot(path) == 2
+
+        restored = InMemoryCache()
+        assert restored.load_snapshot(path) == 2
+        assert restored.get("weather:london:metric") == weather_data
+        assert restored.get("weather:são paulo:metric") == weather_data
+
+    def test_snapshot_skips_expired_entries(
+        self, cache: InMemoryCache, weather_data: WeatherData, tmp_path: Path
+    ) -> None:
+        """Test that entries expired since the snapshot are not restored."""
+        cache.set("short", weather_data, ttl_seconds=60)
+        cache.set("long", weather_data, ttl_seconds=3600)
+        path = tmp_path / "cache.snapshot"
+        cache.save_snapshot(path)
+
+        restored = InMemoryCache()
+        later = datetime.now(UTC) + timedelta(minutes=10)
+        with patch("src.infrastructure.cache.datetime") as mock_datetime:
+            mock_datetime.now.return_value = later
+            mock_datetime.fromtimestamp = datetime.fromtimestamp
+            assert restored.load_snapshot(path) == 1
+        assert restored.get("long") == weather_data
+        assert restored.get("short") is None
+
+    def test_snapshot_keeps_newer_entries(
+        self, cache: InMemoryCache, weather_data: WeatherData, tmp_path: Path
+    ) -> None:
+        """Test that restoring does not overwrite entries cached since startup."""
+        path = tmp_path / "cache.snapshot"
+        cache.set("london", weather_data, ttl_seconds=300)
+        cache.save_snapshot(path)
+
+        restored = InMemoryCache()
+        newer = replace(weather_data, temperature=30.0)
+        restored.set("london", newer, ttl_seconds=300)
+        restored.load_snapshot(path)
+
+        assert restored.get("london") == newer
+
+    def test_snapshot_temp_file_is_per_process(
+        self, cache: InMemoryCache, weather_data: WeatherData, tmp_path: Path
+    ) -> None:
+        """Test that processes sharing a snapshot path write through different temp files."""
+        path = tmp_path / "cache.snapshot"
+        cache.set("london", weather_data, ttl_seconds=300)
+        # Another process mid-write must not be truncated or moved by this one
+        other = tmp_path / "cache.snapshot.1.tmp"
+        other.write_bytes(b"partial")
+
+        assert cache.save_snapshot(path) == 1
+        assert other.read_bytes() == b"partial"
+        assert sorted(p.name for p in tmp_path.iterdir()) == [path.name, other.name]
+
+    def test_invalid_snapshot_is_rejected(self, cache: InMemoryCache, tmp_path: Path) -> None:
+        """Test that a file that is not a snapshot raises ValueError."""
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"not a snapshot at all")
+
+        with pytest.raises(ValueError):
+            cache.load_snapshot(path)
+        assert cache.size == 0
+
+    def test_restored_entries_count_and_resave(
+        self, cache: InMemoryCache, weather_data: WeatherData, tmp_path: Path
+    ) -> None:
+        """Test that restored entries not read yet are kept by the next snapshot."""
+        first, second = tmp_path / "first.snapshot", tmp_path / "second.snapshot"
+        cache.set("london", weather_data, ttl_seconds=300)
+        cache.save_snapshot(first)
+
+        restored = InMemoryCache()
+        restored.load_snapshot(first)
+        assert restored.size == 1
+        assert restored.save_snapshot(second) == 1
+
+        again = InMemoryCache()
+        again.load_snapshot(second)
+        assert again.get("london") == weather_data
+
+    def test_max_entries_evicts_least_recently_used(self, weather_data: WeatherData) -> None:
+        """Test that a bounded cache drops the entry read least recently."""
+        cache = InMemoryCache(max_entries=2)
+        cache.set("a", weather_data, ttl_seconds=300)
+        cache.set("b", weather_data, ttl_seconds=300)
+        cache.get("a")
+        cache.set("c", weather_data, ttl_seconds=300)
+
+        assert cache.size == 2
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+
+    def test_hot_entries_demotes_least_recently_used(self, weather_data: WeatherData) -> None:
+        """Test that entries beyond the hot limit are packed and decoded on read."""
+        cache = InMemoryCache(hot_entries=1)
+        cache.set("a", weather_data, ttl_seconds=300)
+        cache.set("b", weather_data, ttl_seconds=300)
+
+        assert cache.size == 2
+        assert cache.hot_size == 1
+        assert cache.cold_size == 1
+
+        hit = cache.get_with_ttl("a")
+        assert hit is not None
+        assert hit[0] == weather_data
+        assert 0 < hit[1] <= 300
+        assert cache.cold_size == 1
+        assert cache.demotions == 2
+        assert cache.promotions == 1
+
+    def test_cold_entries_expire(self, weather_data: WeatherData) -> None:
+        """Test that packed entries are dropped by cleanup once expired."""
+        cache = InMemoryCache(hot_entries=1)
+        cache.set("a", weather_data, ttl_seconds=300)
+        cache.set("b", weather_data, ttl_seconds=300)
+
+        later = datetime.now(UTC) + timedelta(seconds=600)
+        with patch("src.infrastructure.cache.datetime") as mock_datetime:
+            mock_datetime.now.return_value = later
+            assert cache.cleanup_expired() == 2
+
+        assert cache.size == 0
+
+    def test_snapshot_includes_cold_entries(
+        self, weather_data: WeatherData, tmp_path: Path
+    ) -> None:
+        """Test that packed entries are saved and restored like decoded ones."""
+        cache = InMemoryCache(hot_entries=1)
+        cache.set("a", weather_data, ttl_seconds=300)
+        cache.set("b", weather_data, ttl_seconds=300)
+        path = tmp_path / "cache.snapshot"
+
+        assert cache.save_snapshot(path) == 2
+
+        restored = InMemoryCache()
+        assert restored.load_snapshot(path) == 2
+        assert restored.get("a") == weather_data
+        assert restored.get("b") == weather_data
+
+    def test_tinylfu_rejects_keys_less_popular_than_victim(self, weather_data: WeatherData) -> None:
+        """Test that a full TinyLFU cache keeps popular entries over one-off keys."""
+        cache = InMemoryCache(max_entries=2, admission="tinylfu")
+        for key in ("a", "b"):
+            cache.get(key)
+            cache.set(key, weather_data, ttl_seconds=300)
+        for _ in range(3):
+            cache.get("a")
+            cache.get("b")
+
+        cache.get("scan")
+        cache.set("scan", weather_data, ttl_seconds=300)
+
+        assert cache.get("scan") is None
+        assert cache.get("a") is not None
+        assert cache.get("b") is not None
+        assert cache.rejections == 1
+
+    def test_tinylfu_admits_keys_more_popular_than_victim(self, weather_data: WeatherData) -> None:
+        """Test that a frequently requested key displaces the eviction victim."""
+        cache = InMemoryCache(max_entries=1, admission="tinylfu")
+        cache.set("a", weather_data, ttl_seconds=300)
+        for _ in range(2):
+            cache.get("b")
+        cache.set("b", weather_data, ttl_seconds=300)
+
+        assert cache.get("b") is not None
+        assert cache.get("a") is None
+
+    def test_hit_ratio(self, cache: InMemoryCache, weather_data: WeatherData) -> None:
+        """Test that lookups are counted as hits and misses."""
+        assert cache.hit_ratio == 0.0
+        cache.set("a", weather_data, ttl_seconds=300)
+        cache.get("a")
+        cache.get("a")
+        cache.get("b")
+
+        assert cache.hits == 2
+        assert cache.misses == 1
+        assert cache.hit_ratio == pytest.approx(2 / 3)
+
+    def test_get_many_and_set_many(self, cache: InMemoryCache, weather_data: WeatherData) -> None:
+        """Test that bulk operations store and return several entries."""
+        cache.set_many({"a": weather_data, "b": weather_data}, ttl_seconds=300)
+
+        assert cache.get_many(["a", "b", "c"]) == {"a": weather_data, "b": weather_data}
+        assert (cache.hits, cache.misses) == (2, 1)
+
+
+class TestSnapshotStreamReader:
+    """Tests for SnapshotStreamReader."""
+
+    def test_reassembles_records_split_across_chunks(
+        self, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a snapshot fed a few bytes at a time restores every entry."""
+        cache = InMemoryCache(hot_entries=1)
+        cache.set_many({f"city-{i}": sample_weather_data for i in range(5)}, ttl_seconds=300)
+        stream = b"".join(cache.snapshot_chunks(chunk_size=100))
+        reader = SnapshotStreamReader()
+
+        records = []
+        for start in range(0, len(stream), 7):
+            records.extend(reader.feed(stream[start : start + 7]))
+
+        assert reader.finished
+        restored = InMemoryCache()
+        assert restored.restore_records(records) == 5
+        assert restored.get("city-3") == sample_weather_data
+
+    def test_rejects_other_data(self) -> None:
+        """Test that a stream without the snapshot magic raises ValueError."""
+        with pytest.raises(ValueError, match="Not a cache snapshot"):
+            SnapshotStreamReader().feed(b"<html>not a snapshot</html>")
+
+
+class TestCacheSettings:
+    """Tests for the in-memory cache settings."""
+
+    def test_tinylfu_requires_size_bound(self) -> None:
+        """Test that tinylfu admission is rejected on a cache that never evicts."""
+        with pytest.raises(ValueError, match="requires cache_max_entries"):
+            Settings(openweathermap_api_key="key", cache_max_entries=None)
+
+    def test_unbounded_lru_allowed(self) -> None:
+        """Test that an unbounded cache is accepted with lru admission."""
+        settings = Settings(
+            openweathermap_api_key="key", cache_max_entries=None, cache_admission="lru"
+        )
+        assert settings.cache_max_entries is None
@@ -0,0 +1,64 @@
+"""Unit tests for the cache codec and snapshotter."""
+
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities import WeatherData
+from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.cache_codec import decode_weather, encode_weather
+from src.infrastructure.cache_snapshot import CacheSnapshotter
+
+
+def test_codec_round_trip(sample_weather_data: WeatherData) -> None:
+    """Test that an observation survives encoding unchanged."""
+    encoded = encode_weather(sample_weather_data)
+    decoded, end = decode_weather(b"xx" + encoded, 2)
+
+    assert decoded == sample_weather_data
+    assert end == len(encoded) + 2
+
+
+def test_codec_rejects_truncated_record(sample_weather_data: WeatherData) -> None:
+    """Test that a cut-off record raises ValueError."""
+    with pytest.raises(ValueError):
+        decode_weather(encode_weather(sample_weather_data)[:-3])
+
+
+class TestCacheSnapshotter:
+    """Tests for CacheSnapshotter."""
+
+    @pytest.mark.asyncio
+    async def test_close_saves_and_start_restores(
+        self, tmp_path: Path, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a new replica starts with the entries of the previous one."""
+        path = tmp_path / "cache.snapshot"
+        cache = InMemoryCache()
+        cache.set("london", sample_weather_data, ttl_seconds=300)
+        await CacheSnapshotter(cache, MagicMock(), path, interval_seconds=0).close()
+
+        restored = InMemoryCache()
+        snapshotter = CacheSnapshotter(restored, MagicMock(), path, interval_seconds=0)
+        await snapshotter.start()
+
+        assert restored.get("london") == sample_weather_data
+
+    @pytest.mark.asyncio
+    async def test_corrupt_snapshot_is_ignored(self, tmp_path: Path) -> None:
+        """Test that an unreadable snapshot is logged and startup continues."""
+        path = tmp_path / "cache.snapshot"
+        path.write_bytes(b"\\x00" * 4)
+        logger = MagicMock()
+
+        assert CacheSnapshotter(InMemoryCache(), logger, path).restore() == 0
+        logger.warning.assert_called_once()
+
+    def test_missing_snapshot_restores_nothing(self, tmp_path: Path) -> None:
+        """Test that the first start without a snapshot is silent."""
+        logger = MagicMock()
+        snapshotter = CacheSnapshotter(InMemoryCache(), logger, tmp_path / "none")
+
+        assert snapshotter.restore() == 0
+        logger.warning.assert_not_called()
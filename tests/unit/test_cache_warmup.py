@@ -0,0 +1,116 @@
+"""Unit tests for the startup cache warm-up."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.cache_warmup import CacheWarmup
+from src.application.dto import WeatherResult
+from src.domain.entities import WeatherRequest
+from src.domain.exceptions import CityNotFoundError, RateLimitExceededError
+from src.infrastructure.gazetteer import load_city_list
+
+CITIES = [f"City {index}" for index in range(20)]
+
+
+def _requests(cities: list[str] = CITIES) -> list[WeatherRequest]:
+    return [WeatherRequest(city=city) for city in cities]
+
+
+class TestCacheWarmup:
+    """Tests for CacheWarmup."""
+
+    @pytest.mark.asyncio
+    async def test_loads_every_location_and_counts_failures(
+        self, sample_weather_result: WeatherResult
+    ) -> None:
+        """Test that failures are counted by error code without stopping the rest."""
+
+        async def execute(request: WeatherRequest) -> WeatherResult:
+            if request.city == "City 3":
+                raise CityNotFoundError(request.city)
+            if request.city == "City 4":
+                raise RateLimitExceededError(retry_after_seconds=5)
+            return sample_weather_result
+
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(side_effect=execute)
+        logger = MagicMock()
+        warmup = CacheWarmup(use_case, logger)
+
+        await warmup.start(_requests())
+        await warmup.wait_ready(1.0, timeout_seconds=5)
+
+        assert warmup.done
+        assert (warmup.total, warmup.loaded, warmup.failed) == (20, 18, 2)
+        assert warmup.failures == {"CITY_NOT_FOUND": 1, "RATE_LIMIT_EXCEEDED": 1}
+        await warmup.close()
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, sample_weather_result: WeatherResult) -> None:
+        """Test that at most max_concurrency locations are fetched at once."""
+        active = peak = 0
+
+        async def execute(_request: WeatherRequest) -> WeatherResult:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.001)
+            active -= 1
+            return sample_weather_result
+
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(side_effect=execute)
+        warmup = CacheWarmup(use_case, MagicMock(), max_concurrency=3)
+
+        await warmup.start(_requests())
+        await warmup.wait_ready(1.0, timeout_seconds=5)
+
+        assert warmup.loaded == 20
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_ready_once_fraction_is_loaded(
+        self, sample_weather_result: WeatherResult
+    ) -> None:
+        """Test that readiness only waits for the required share of locations."""
+        release = asyncio.Event()
+
+        async def execute(request: WeatherRequest) -> WeatherResult:
+            if request.city >= "City 5":
+                await release.wait()
+            return sample_weather_result
+
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(side_effect=execute)
+        warmup = CacheWarmup(use_case, MagicMock(), max_concurrency=20)
+        await warmup.start(_requests([f"City {index}" for index in range(10)]))
+
+        assert await warmup.wait_ready(0.5, timeout_seconds=5)
+        assert not warmup.done
+
+        release.set()
+        await warmup.close()
+
+    @pytest.mark.asyncio
+    async def test_ready_wait_times_out(self, sample_weather_result: WeatherResult) -> None:
+        """Test that a slow warm-up logs a warning and lets startup continue."""
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(side_effect=asyncio.Event().wait)
+        logger = MagicMock()
+        warmup = CacheWarmup(use_case, logger)
+        await warmup.start(_requests())
+
+        assert not await warmup.wait_ready(0.5, timeout_seconds=0.05)
+        logger.warning.assert_called_once()
+        await warmup.close()
+
+
+def test_load_city_list(tmp_path: Path) -> None:
+    """Test that comments, blank lines and duplicates are skipped."""
+    path = tmp_path / "cities.txt"
+    path.write_text("# Top cities\nLondon,GB\n\nParis\n  Tokyo  \nParis\n", encoding="utf-8")
+
+    assert load_city_list(path) == ["London,GB", "Paris", "Tokyo"]
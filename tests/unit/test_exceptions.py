@@ -1,9 +1,11 @@
 """Unit tests for domain exceptions."""
 
 from src.domain.exceptions import (
+    AlertRuleNotFoundError,
     CacheError,
     CityNotFoundError,
     InvalidCityNameError,
+    JobNotFoundError,
     RateLimitExceededError,
     WeatherAppError,
     WeatherProviderError,
@@ -90,3 +92,25 @@ class TestCacheError:
         assert error.code == "CACHE_ERROR"
         assert "get" in error.message
         assert "Connection refused" in error.message
+
+
+class TestJobNotFoundError:
+    """Tests for JobNotFoundError."""
+
+    def test_job_not_found(self) -> None:
+        """Test job not found error."""
+        error = JobNotFoundError("abc123")
+        assert error.job_id == "abc123"
+        assert error.code == "JOB_NOT_FOUND"
+        assert "abc123" in error.message
+
+
+class TestAlertRuleNotFoundError:
+    """Tests for AlertRuleNotFoundError."""
+
+    def test_alert_rule_not_found(self) -> None:
+        """Test alert rule not found error."""
+        error = AlertRuleNotFoundError("rule42")
+        assert error.rule_id == "rule42"
+        assert error.code == "ALERT_RULE_NOT_FOUND"
+        assert "rule42" in error.message
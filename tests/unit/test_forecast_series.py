@@ -0,0 +1,75 @@
+"""Unit tests for the compact forecast series."""
+
+from datetime import UTC, date, datetime, timedelta
+
+import pytest
+
+from src.application.forecast_series import ForecastSeries
+from src.domain.entities import Forecast
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+class TestForecastSeries:
+    """Tests for ForecastSeries."""
+
+    @pytest.fixture
+    def series(self, sample_forecast: Forecast) -> ForecastSeries:
+        """Pack the sample forecast."""
+        return ForecastSeries.from_forecast(sample_forecast)
+
+    def test_conditions_are_deduplicated(self, series: ForecastSeries) -> None:
+        """Test that each distinct condition is stored once."""
+        assert len(series) == 16
+        assert len(series.conditions) == 2
+        assert series.values.nbytes == 16 * 6 * 4
+
+    def test_points_round_trip(self, series: ForecastSeries, sample_forecast: Forecast) -> None:
+        """Test that unpacked points match the provider forecast."""
+        assert series.points() == list(sample_forecast.points)
+
+    def test_next_hours_includes_current_step(self, series: ForecastSeries) -> None:
+        """Test that the step in effect now is returned with the following ones."""
+        window = series.next_hours(START + timedelta(hours=4), hours=6)
+
+        assert [point.temperature for point in window.points()] == [1.0, 2.0, 3.0]
+        assert window.values.base is not None
+
+    def test_at_interpolates_between_steps(self, series: ForecastSeries) -> None:
+        """Test that a time between two steps is linearly interpolated."""
+        point = series.at(START + timedelta(hours=4))
+
+        assert point is not None
+        assert point.temperature == pytest.approx(1.33, abs=0.01)
+        assert point.description == "overcast clouds"
+
+    def test_at_outside_range(self, series: ForecastSeries) -> None:
+        """Test that times outside the forecast return None."""
+        assert series.at(START - timedelta(hours=1)) is None
+        assert series.at(START + timedelta(days=3)) is None
+
+    def test_days_summarize_local_days(self, series: ForecastSeries) -> None:
+        """Test per-day aggregates."""
+        days = series.days()
+
+        assert [day.date for day in days] == [date(2024, 1, 1), date(2024, 1, 2)]
+        assert days[0].steps == 8
+        assert days[0].temperature_min == 0.0
+        assert days[0].temperature_max == 7.0
+        assert days[1].precipitation_probability_max == pytest.approx(0.75)
+        assert days[0].description == "overcast clouds"
+
+    def test_days_respect_utc_offset(self, sample_forecast: Forecast) -> None:
+        """Test that days are cut at local midnight."""
+        shifted = Forecast(
+            city_name=sample_forecast.city_name,
+            country=sample_forecast.country,
+            coordinates=sample_forecast.coordinates,
+            units=sample_forecast.units,
+            utc_offset_seconds=-5 * 3600,
+            points=sample_forecast.points,
+        )
+        days = ForecastSeries.from_forecast(shifted).days()
+
+        assert days[0].date == date(2023, 12, 31)
+        assert days[0].steps == 2
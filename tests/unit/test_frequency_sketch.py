@@ -0,0 +1,44 @@
+"""Unit tests for the frequency sketch."""
+
+import pytest
+
+from src.infrastructure.frequency_sketch import FrequencySketch
+
+
+class TestFrequencySketch:
+    """Tests for FrequencySketch."""
+
+    def test_estimate_counts_increments(self) -> None:
+        """Test that estimates follow the number of increments."""
+        sketch = FrequencySketch(width=256)
+        for _ in range(3):
+            sketch.increment("weather:london:metric")
+        sketch.increment("weather:paris:metric")
+
+        assert sketch.estimate("weather:london:metric") == 3
+        assert sketch.estimate("weather:paris:metric") == 1
+        assert sketch.estimate("weather:tokyo:metric") == 0
+
+    def test_counters_saturate(self) -> None:
+        """Test that counts stop at 15."""
+        sketch = FrequencySketch(width=256)
+        for _ in range(40):
+            sketch.increment("hot")
+
+        assert sketch.estimate("hot") == 15
+
+    def test_aging_halves_counts(self) -> None:
+        """Test that counters are halved after the sample size is reached."""
+        sketch = FrequencySketch(width=256, sample_size=10)
+        for _ in range(8):
+            sketch.increment("old")
+        for index in range(2):
+            sketch.increment(f"new-{index}")
+
+        assert sketch.agings == 1
+        assert sketch.estimate("old") == 4
+
+    def test_invalid_size_rejected(self) -> None:
+        """Test that a sketch without counters cannot be created."""
+        with pytest.raises(ValueError, match="positive"):
+            FrequencySketch(width=0)
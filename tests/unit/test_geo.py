@@ -0,0 +1,88 @@
+"""Unit tests for the geodesic helpers."""
+
+import pytest
+
+from src.domain.geo import (
+    count_polyline_samples,
+    decode_polyline,
+    encode_polyline,
+    haversine_km,
+    sample_polyline,
+)
+from src.domain.value_objects import Coordinates
+
+# Reference polyline from the Google polyline algorithm documentation
+REFERENCE_POLYLINE = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+REFERENCE_POINTS = [(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)]
+
+
+class TestHaversine:
+    """Tests for haversine_km."""
+
+    def test_same_point(self) -> None:
+        """Test that the distance from a point to itself is zero."""
+        point = Coordinates(latitude=51.5, longitude=-0.12)
+        assert haversine_km(point, point) == 0.0
+
+    def test_london_paris(self) -> None:
+        """Test a well-known city distance."""
+        london = Coordinates(latitude=51.5074, longitude=-0.1278)
+        paris = Coordinates(latitude=48.8566, longitude=2.3522)
+        assert haversine_km(london, paris) == pytest.approx(343.5, abs=1.0)
+
+
+class TestPolyline:
+    """Tests for polyline encoding and decoding."""
+
+    def test_decode_reference(self) -> None:
+        """Test decoding the documented reference polyline."""
+        points = decode_polyline(REFERENCE_POLYLINE)
+        assert [(p.latitude, p.longitude) for p in points] == REFERENCE_POINTS
+
+    def test_round_trip(self) -> None:
+        """Test that encoding reverses decoding."""
+        points = decode_polyline(REFERENCE_POLYLINE)
+        assert encode_polyline(points) == REFERENCE_POLYLINE
+
+    def test_precision_six(self) -> None:
+        """Test round-tripping with OSRM precision."""
+        points = [Coordinates(latitude=52.370216, longitude=4.895168)]
+        assert decode_polyline(encode_polyline(points, 6), 6) == points
+
+    def test_truncated_polyline(self) -> None:
+        """Test that a truncated polyline raises ValueError."""
+        with pytest.raises(ValueError, match="Truncated"):
+            decode_polyline(REFERENCE_POLYLINE[:-1])
+
+    def test_invalid_character(self) -> None:
+        """Test that characters outside the alphabet raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid polyline character"):
+            decode_polyline("_p~iF ")
+
+
+class TestSamplePolyline:
+    """Tests for sample_polyline."""
+
+    def test_samples_are_evenly_spaced(self) -> None:
+        """Test spacing and inclusion of both endpoints."""
+        points = decode_polyline(REFERENCE_POLYLINE)
+        samples = sample_polyline(points, 50.0)
+
+        assert samples[0] == (0.0, points[0])
+        assert samples[-1][1] == points[-1]
+        distances = [distance for distance, _ in samples[:-1]]
+        assert distances == pytest.approx([50.0 * i for i in range(len(distances))])
+
+    def test_single_point(self) -> None:
+        """Test that a single point yields a single sample."""
+        point = Coordinates(latitude=1.0, longitude=1.0)
+        assert sample_polyline([point], 10.0) == [(0.0, point)]
+
+    @pytest.mark.parametrize("spacing_km", [0.5, 7.0, 50.0, 333.0, 5000.0])
+    def test_count_matches_samples(self, spacing_km: float) -> None:
+        """Test that the count computed up front matches the samples built."""
+        points = decode_polyline(REFERENCE_POLYLINE)
+
+        assert count_polyline_samples(points, spacing_km) == len(
+            sample_polyline(points, spacing_km)
+        )
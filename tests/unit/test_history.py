@@ -0,0 +1,118 @@
+"""Unit tests for the memory-mapped observation history store."""
+
+import dataclasses
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import numpy as np
+import pytest
+
+from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.value_objects import WeatherMetric
+from src.infrastructure.history import ObservationHistoryStore
+
+KEY = WeatherRequest(city="London").cache_key
+T0 = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _observation(weather_data: WeatherData, minutes: int, temperature: float) -> WeatherData:
+    """Return a copy of the observation taken ``minutes`` after T0."""
+    return dataclasses.replace(
+        weather_data, timestamp=T0 + timedelta(minutes=minutes), temperature=temperature
+    )
+
+
+class TestObservationHistoryStore:
+    """Tests for ObservationHistoryStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path: Path) -> ObservationHistoryStore:
+        """Create a store with a small ring."""
+        return ObservationHistoryStore(logger=MagicMock(), history_dir=tmp_path, capacity=16)
+
+    def test_query_returns_range(
+        self, store: ObservationHistoryStore, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a range query returns only the matching observations."""
+        for minute in range(0, 100, 10):
+            store.on_weather_refreshed(KEY, _observation(sample_weather_data, minute, minute))
+
+        series = store.query(KEY, T0 + timedelta(minutes=20), T0 + timedelta(minutes=50))
+
+        assert series.location == "London, GB"
+        assert series.columns[WeatherMetric.TEMPERATURE].tolist() == [20, 30, 40, 50]
+        assert series.columns[WeatherMetric.HUMIDITY].tolist() == [72] * 4
+        assert series.timestamps[0] == int((T0 + timedelta(minutes=20)).timestamp())
+
+    def test_ring_overwrites_oldest(
+        self, store: ObservationHistoryStore, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that the ring keeps the newest observations in order."""
+        for minute in range(40):
+            store.on_weather_refreshed(KEY, _observation(sample_weather_data, minute, minute))
+
+        series = store.query(KEY, T0, T0 + timedelta(hours=1))
+
+        assert series.columns[WeatherMetric.TEMPERATURE].tolist() == list(range(24, 40))
+
+    def test_duplicate_observation_is_skipped(
+        self, store: ObservationHistoryStore, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that re-fetching the same upstream observation is not recorded twice."""
+        observation = _observation(sample_weather_data, 0, 10)
+        store.on_weather_refreshed(KEY, observation)
+        store.on_weather_refreshed(KEY, observation)
+
+        assert store.query(KEY, T0, T0 + timedelta(hours=1)).timestamps.size == 1
+
+    def test_history_persists_across_instances(
+        self, tmp_path: Path, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a new store reads the files written by a previous one."""
+        first = ObservationHistoryStore(logger=MagicMock(), history_dir=tmp_path, capacity=16)
+        first.on_weather_refreshed(KEY, _observation(sample_weather_data, 0, 12.5))
+        first.close()
+
+        second = ObservationHistoryStore(logger=MagicMock(), history_dir=tmp_path, capacity=64)
+        series = second.query(KEY, T0, T0 + timedelta(hours=1))
+
+        assert series.columns[WeatherMetric.TEMPERATURE].tolist() == [12.5]
+
+    def test_unknown_location_is_empty(self, store: ObservationHistoryStore) -> None:
+        """Test that querying a location without history returns no rows."""
+        series = store.query(KEY, T0, T0 + timedelta(hours=1))
+        assert series.location == ""
+        assert series.timestamps.size == 0
+
+    def test_aggregate_buckets(
+        self, store: ObservationHistoryStore, sample_weather_data: WeatherData
+    ) -> None:
+        """Test min/max/mean per bucket, skipping empty buckets."""
+        for minute, temperature in ((0, 10), (20, 14), (40, 12), (130, 20), (150, 30)):
+            store.on_weather_refreshed(KEY, _observation(sample_weather_data, minute, temperature))
+
+        series = store.aggregate(
+            KEY, T0, T0 + timedelta(hours=3), 3600, [WeatherMetric.TEMPERATURE]
+        )
+
+        assert series.counts.tolist() == [3, 2]
+        assert series.bucket_starts.tolist() == [
+            int(T0.timestamp()),
+            int((T0 + timedelta(hours=2)).timestamp()),
+        ]
+        assert series.minimum[WeatherMetric.TEMPERATURE].tolist() == [10, 20]
+        assert series.maximum[WeatherMetric.TEMPERATURE].tolist() == [14, 30]
+        np.testing.assert_allclose(series.mean[WeatherMetric.TEMPERATURE], [12, 25])
+
+    def test_open_files_are_bounded(self, tmp_path: Path, sample_weather_data: WeatherData) -> None:
+        """Test that evicted locations stay readable from disk."""
+        store = ObservationHistoryStore(
+            logger=MagicMock(), history_dir=tmp_path, capacity=16, max_open_files=2
+        )
+        keys = [WeatherRequest(city=city).cache_key for city in ("a", "b", "c")]
+        for key in keys:
+            store.on_weather_refreshed(key, _observation(sample_weather_data, 0, 1))
+
+        assert len(list(tmp_path.glob("*.obs"))) == 3
+        assert store.query(keys[0], T0, T0 + timedelta(hours=1)).timestamps.size == 1
@@ -0,0 +1,68 @@
+"""Unit tests for the in-flight work tracker."""
+
+import asyncio
+
+import pytest
+
+from src.application.inflight import InFlightTracker
+
+
+class TestInFlightTracker:
+    """Tests for InFlightTracker."""
+
+    @pytest.mark.asyncio
+    async def test_finished_tasks_are_forgotten(self) -> None:
+        """Test that only running tasks are pending."""
+        tracker = InFlightTracker()
+
+        assert await tracker.track(asyncio.sleep(0, result=42)) == 42
+        assert tracker.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_drain_waits_for_running_tasks(self) -> None:
+        """Test that drain lets tasks finish, including ones they start."""
+        tracker = InFlightTracker()
+        finished: list[str] = []
+
+        async def work(name: str, follow_up: bool = False) -> None:
+            await asyncio.sleep(0.01)
+            if follow_up:
+                tracker.track(work(f"{name}-follow-up"))
+            finished.append(name)
+
+        tracker.track(work("a", follow_up=True))
+        tracker.track(work("b"))
+
+        report = await tracker.drain(timeout_seconds=5)
+
+        assert sorted(finished) == ["a", "a-follow-up", "b"]
+        assert (report.drained, report.abandoned) == (3, 0)
+
+    @pytest.mark.asyncio
+    async def test_drain_abandons_tasks_past_deadline(self) -> None:
+        """Test that tasks still running at the deadline are cancelled and counted."""
+        tracker = InFlightTracker()
+        quick = tracker.track(asyncio.sleep(0))
+        slow = tracker.track(asyncio.sleep(30))
+
+        report = await tracker.drain(timeout_seconds=0.05)
+
+        assert (report.drained, report.abandoned) == (1, 1)
+        assert quick.done() and not quick.cancelled()
+        assert slow.cancelled()
+        assert tracker.pending == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_tasks_count_as_drained(self) -> None:
+        """Test that a task ending in an error is finished, not abandoned."""
+        tracker = InFlightTracker()
+
+        async def fail() -> None:
+            raise RuntimeError("boom")
+
+        task = tracker.track(fail())
+
+        report = await tracker.drain(timeout_seconds=5)
+
+        assert (report.drained, report.abandoned) == (1, 0)
+        assert isinstance(task.exception(), RuntimeError)
@@ -0,0 +1,94 @@
+"""Unit tests for the grid interpolation helpers."""
+
+from unittest.mock import patch
+
+import numpy as np
+
+from src.application.interpolation import (
+    bilinear_grid,
+    inverse_distance_grid,
+    inverse_distance_points,
+)
+
+
+class TestInverseDistance:
+    """Tests for inverse distance weighting."""
+
+    def test_constant_field(self) -> None:
+        """Test that a constant field interpolates to the same constant."""
+        values = inverse_distance_grid(
+            np.array([50.0, 51.0, 50.5]),
+            np.array([0.0, 0.0, 1.0]),
+            np.array([12.0, 12.0, 12.0]),
+            np.linspace(51.0, 50.0, 5),
+            np.linspace(0.0, 1.0, 7),
+        )
+        assert values.shape == (5, 7)
+        np.testing.assert_allclose(values, 12.0)
+
+    def test_exact_anchor_hit(self) -> None:
+        """Test that points on an anchor take its value."""
+        values = inverse_distance_points(
+            np.array([50.0, 51.0]),
+            np.array([0.0, 1.0]),
+            np.array([10.0, 20.0]),
+            np.array([50.0, 51.0, 50.5]),
+            np.array([0.0, 1.0, 0.5]),
+        )
+        assert values[0] == 10.0
+        assert values[1] == 20.0
+        assert 10.0 < values[2] < 20.0
+
+    def test_closer_anchor_dominates(self) -> None:
+        """Test that values lean towards the nearest anchor."""
+        values = inverse_distance_points(
+            np.array([50.0, 51.0]),
+            np.array([0.0, 0.0]),
+            np.array([0.0, 100.0]),
+            np.array([50.1]),
+            np.array([0.0]),
+        )
+        assert values[0] < 10.0
+
+    def test_chunking_matches_single_pass(self) -> None:
+        """Test that points split into chunks (including anchor hits) match one pass."""
+        rng = np.random.default_rng(7)
+        anchor_lats = rng.uniform(50, 52, 64)
+        anchor_lons = rng.uniform(-1, 1, 64)
+        anchor_values = rng.uniform(0, 30, 64)
+        lats = np.concatenate([rng.uniform(50, 52, 500), anchor_lats[:3]])
+        lons = np.concatenate([rng.uniform(-1, 1, 500), anchor_lons[:3]])
+
+        expected = inverse_distance_points(anchor_lats, anchor_lons, anchor_values, lats, lons)
+        with patch("src.application.interpolation._CHUNK_ELEMENTS", 64 * 7):
+            chunked = inverse_distance_points(anchor_lats, anchor_lons, anchor_values, lats, lons)
+
+        np.testing.assert_allclose(chunked, expected)
+        np.testing.assert_array_equal(chunked[-3:], anchor_values[:3])
+
+
+class TestBilinear:
+    """Tests for bilinear interpolation."""
+
+    def test_reproduces_plane(self) -> None:
+        """Test that a linear field is reproduced exactly."""
+        lats = np.array([50.0, 51.0, 52.0])
+        lons = np.array([0.0, 2.0])
+        lattice = 3 * lats[:, None] + 0.5 * lons[None, :]
+        grid_lats = np.linspace(52.0, 50.0, 9)
+        grid_lons = np.linspace(0.0, 2.0, 5)
+
+        values = bilinear_grid(lats, lons, lattice, grid_lats, grid_lons)
+
+        expected = 3 * grid_lats[:, None] + 0.5 * grid_lons[None, :]
+        np.testing.assert_allclose(values, expected)
+
+    def test_clamps_outside_lattice(self) -> None:
+        """Test that points outside the lattice take edge values."""
+        lats = np.array([50.0, 51.0])
+        lons = np.array([0.0, 1.0])
+        lattice = np.array([[1.0, 2.0], [3.0, 4.0]])
+
+        values = bilinear_grid(lats, lons, lattice, np.array([49.0, 52.0]), np.array([-1.0]))
+
+        np.testing.assert_allclose(values, [[1.0], [3.0]])
@@ -0,0 +1,246 @@
+"""Unit tests for bulk weather jobs."""
+
+import asyncio
+import csv
+import io
+import json
+import threading
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import TextIO
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.application.dto import WeatherResult
+from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.exceptions import (
+    CityNotFoundError,
+    JobNotFoundError,
+    JobQueueFullError,
+    RateLimitExceededError,
+)
+from src.infrastructure import jobs
+from src.infrastructure.jobs import BulkWeatherJobManager, JobStatus
+
+
+async def upload(*chunks: str | bytes) -> AsyncIterator[bytes]:
+    """Stream text or raw chunks as an upload body."""
+    for chunk in chunks:
+        yield chunk.encode() if isinstance(chunk, str) else chunk
+
+
+class TestBulkWeatherJobManager:
+    """Tests for BulkWeatherJobManager."""
+
+    @pytest.fixture
+    def use_case(self, sample_weather_data: WeatherData) -> MagicMock:
+        """Create a use case mock failing for 'Atlantis'."""
+
+        async def execute(request: WeatherRequest) -> WeatherResult:
+            if request.city == "Atlantis":
+                raise CityNotFoundError(request.city)
+            return WeatherResult(weather_data=sample_weather_data)
+
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(side_effect=execute)
+        return use_case
+
+    @pytest.fixture
+    def manager(self, use_case: MagicMock, tmp_path: Path) -> BulkWeatherJobManager:
+        """Create a manager writing to a temporary directory."""
+        return BulkWeatherJobManager(use_case, MagicMock(), jobs_dir=tmp_path, workers=2)
+
+    @pytest.mark.asyncio
+    async def test_job_processes_every_row(
+        self, manager: BulkWeatherJobManager, use_case: MagicMock
+    ) -> None:
+        """Test progress counters and per-row results."""
+        job = await manager.create_job(upload("id,city\n1,London\n2,Atl", "antis\n\n3,Paris\n4,\n"))
+        assert job.total_rows == 4
+
+        await manager.wait(job.id)
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.processed == 4
+        assert job.succeeded == 2
+        assert job.failed == 2
+        assert job.finished_at is not None
+
+        lines = b"".join([chunk async for chunk in manager.iter_results(job.id)]).splitlines()
+        records = sorted((json.loads(line) for line in lines), key=lambda r: r["row"])
+        assert [record["id"] for record in records] == ["1", "2", "3", "4"]
+        assert records[0]["weather"]["city"] == "London"
+        assert records[1]["error"]["code"] == "CITY_NOT_FOUND"
+        assert records[3]["error"]["code"] == "INVALID_ROW"
+
+    @pytest.mark.asyncio
+    async def test_coordinate_rows(
+        self, manager: BulkWeatherJobManager, use_case: MagicMock
+    ) -> None:
+        """Test rows given as coordinates with per-row units."""
+        job = await manager.create_job(upload("lat,lon,units\n51.5,-0.12,imperial\n"))
+        await manager.wait(job.id)
+
+        request = use_case.execute.call_args[0][0]
+        assert request.coordinates.latitude == 51.5
+        assert request.units == "imperial"
+
+    @pytest.mark.asyncio
+    async def test_csv_results(self, manager: BulkWeatherJobManager) -> None:
+        """Test the flattened CSV export."""
+        job = await manager.create_job(upload("city\nLondon\nAtlantis\n"))
+        await manager.wait(job.id)
+
+        body = b"".join([chunk async for chunk in manager.iter_results(job.id, fmt="csv")])
+        rows = list(csv.DictReader(io.StringIO(body.decode())))
+        assert {row["status"] for row in rows} == {"ok", "error"}
+        ok = next(row for row in rows if row["status"] == "ok")
+        assert ok["city"] == "London"
+        assert ok["temperature"] == "15.2"
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_rows_are_retried(
+        self, manager: BulkWeatherJobManager, use_case: MagicMock, sample_weather_data
+    ) -> None:
+        """Test that rows hitting the upstream budget are retried."""
+        use_case.execute.side_effect = [
+            RateLimitExceededError(1),
+            WeatherResult(weather_data=sample_weather_data),
+        ]
+        with patch("src.infrastructure.jobs.asyncio.sleep", new=AsyncMock()) as sleep:
+            job = await manager.create_job(upload("city\nLondon\n"))
+            await manager.wait(job.id)
+
+        assert job.succeeded == 1
+        sleep.assert_any_await(1)
+
+    @pytest.mark.asyncio
+    async def test_invalid_header_rejected(
+        self, manager: BulkWeatherJobManager, tmp_path: Path
+    ) -> None:
+        """Test that uploads without a location column are rejected and removed."""
+        with pytest.raises(ValueError, match="'city' column"):
+            await manager.create_job(upload("name,country\nLondon,GB\n"))
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_empty_upload_rejected(self, manager: BulkWeatherJobManager) -> None:
+        """Test that an empty upload is rejected."""
+        with pytest.raises(ValueError, match="empty"):
+            await manager.create_job(upload(""))
+
+    @pytest.mark.asyncio
+    async def test_max_rows_enforced(self, use_case: MagicMock, tmp_path: Path) -> None:
+        """Test that uploads above the row limit are rejected."""
+        manager = BulkWeatherJobManager(use_case, MagicMock(), jobs_dir=tmp_path, max_rows=2)
+        with pytest.raises(ValueError, match="maximum of 2 rows"):
+            await manager.create_job(upload("city\nA\nB\nC\n"))
+
+    @pytest.mark.asyncio
+    async def test_long_line_rejected(self, manager: BulkWeatherJobManager) -> None:
+        """Test that a line without an end is not buffered indefinitely."""
+        with (
+            patch("src.infrastructure.jobs._MAX_LINE_BYTES", 16),
+            pytest.raises(ValueError, match="longer than 16 bytes"),
+        ):
+            await manager.create_job(upload("city\n", "x" * 40, "y" * 40))
+
+    @pytest.mark.asyncio
+    async def test_undecodable_upload_fails_job(self, manager: BulkWeatherJobManager) -> None:
+        """Test that an unreadable upload marks the job failed instead of running forever."""
+        job = await manager.create_job(upload(b"city\nLondon\n\xff\xfeParis\n"))
+
+        await asyncio.wait_for(manager.wait(job.id), timeout=5)
+
+        assert job.status == JobStatus.FAILED
+        assert "utf-8" in (job.error or "")
+        assert job.finished_at is not None
+
+    @pytest.mark.asyncio
+    async def test_file_io_runs_off_the_event_loop(self, manager: BulkWeatherJobManager) -> None:
+        """Test that rows are read and results written in worker threads."""
+        threads: set[int] = set()
+        read_rows, append = jobs._read_rows, jobs._append
+
+        def tracked_read_rows(source: TextIO) -> Iterator[tuple[int, dict[str, str]]]:
+            for item in read_rows(source):
+                threads.add(threading.get_ident())
+                yield item
+
+        def tracked_append(output: TextIO, text: str) -> None:
+            threads.add(threading.get_ident())
+            append(output, text)
+
+        with (
+            patch("src.infrastructure.jobs._read_rows", tracked_read_rows),
+            patch("src.infrastructure.jobs._append", tracked_append),
+        ):
+            job = await manager.create_job(upload("city\nLondon\nParis\n"))
+            await manager.wait(job.id)
+
+        assert job.status == JobStatus.COMPLETED
+        assert threads
+        assert threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_unexpected_row_error_recorded_on_row(
+        self, manager: BulkWeatherJobManager, use_case: MagicMock, sample_weather_data
+    ) -> None:
+        """Test that an unexpected error fails its row and the job carries on."""
+        use_case.execute.side_effect = [
+            KeyError("boom"),
+            WeatherResult(weather_data=sample_weather_data),
+        ]
+        job = await manager.create_job(upload("city\nLondon\nParis\n"))
+        await manager.wait(job.id)
+
+        assert job.status == JobStatus.COMPLETED
+        assert (job.succeeded, job.failed) == (1, 1)
+        lines = b"".join([chunk async for chunk in manager.iter_results(job.id)]).splitlines()
+        codes = {json.loads(line).get("error", {}).get("code") for line in lines}
+        assert "INTERNAL_ERROR" in codes
+
+    @pytest.mark.asyncio
+    async def test_active_jobs_capped(self, use_case: MagicMock, tmp_path: Path) -> None:
+        """Test that uploads beyond the active job limit are refused until one finishes."""
+        release = asyncio.Event()
+
+        async def execute(_request: WeatherRequest) -> WeatherResult:
+            await release.wait()
+            raise CityNotFoundError("Nowhere")
+
+        use_case.execute.side_effect = execute
+        manager = BulkWeatherJobManager(use_case, MagicMock(), jobs_dir=tmp_path, max_active_jobs=2)
+        first = await manager.create_job(upload("city\nLondon\n"))
+        await manager.create_job(upload("city\nParis\n"))
+
+        with pytest.raises(JobQueueFullError):
+            await manager.create_job(upload("city\nTokyo\n"))
+        assert len(list(tmp_path.iterdir())) == 2
+
+        release.set()
+        await manager.wait(first.id)
+        assert (await manager.create_job(upload("city\nTokyo\n"))).status == JobStatus.PENDING
+        await manager.close()
+
+    def test_unknown_job(self, manager: BulkWeatherJobManager) -> None:
+        """Test that unknown job ids raise JobNotFoundError."""
+        with pytest.raises(JobNotFoundError):
+            manager.get("missing")
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_running_jobs(
+        self, manager: BulkWeatherJobManager, use_case: MagicMock
+    ) -> None:
+        """Test that shutdown cancels in-progress jobs."""
+
+        async def execute(_request: WeatherRequest) -> None:
+            await asyncio.Event().wait()
+
+        use_case.execute.side_effect = execute
+        job = await manager.create_job(upload("city\nLondon\n"))
+
+        await manager.close()
+
+        assert job.status == JobStatus.CANCELLED
@@ -0,0 +1,61 @@
+"""Unit tests for the nearest-city spatial index."""
+
+import pytest
+
+from src.application.nearest_city import NearestCityIndex
+from src.domain.entities import City
+from src.domain.value_objects import Coordinates
+from src.infrastructure.gazetteer import load_gazetteer
+
+
+def _city(name: str, latitude: float, longitude: float) -> City:
+    """Create a city at a point."""
+    return City(
+        name=name, country="XX", coordinates=Coordinates(latitude=latitude, longitude=longitude)
+    )
+
+
+def _nearest_name(index: NearestCityIndex, latitude: float, longitude: float, km: float) -> str:
+    """Return the name of the nearest city, or an empty string."""
+    city = index.nearest(Coordinates(latitude=latitude, longitude=longitude), km)
+    return city.name if city else ""
+
+
+class TestNearestCityIndex:
+    """Tests for NearestCityIndex."""
+
+    @pytest.fixture
+    def index(self) -> NearestCityIndex:
+        """Create an index over a few cities."""
+        return NearestCityIndex(
+            [
+                _city("North", 10.0, 0.0),
+                _city("Middle", 0.0, 0.0),
+                _city("East", 0.0, 0.5),
+                _city("Dateline", 0.0, 179.95),
+            ]
+        )
+
+    def test_returns_nearest_city(self, index: NearestCityIndex) -> None:
+        """Test that the closest city wins."""
+        assert _nearest_name(index, 0.05, 0.2, 100) == "Middle"
+        assert _nearest_name(index, 0.0, 0.3, 100) == "East"
+
+    def test_respects_max_distance(self, index: NearestCityIndex) -> None:
+        """Test that cities farther than the limit are not returned."""
+        assert _nearest_name(index, 5.0, 0.0, 100) == ""
+        assert _nearest_name(index, 0.0, 0.0, 0) == ""
+
+    def test_wraps_across_antimeridian(self, index: NearestCityIndex) -> None:
+        """Test that longitudes either side of 180 degrees are close."""
+        assert _nearest_name(index, 0.0, -179.95, 20) == "Dateline"
+
+    def test_empty_index(self) -> None:
+        """Test that an empty index never matches."""
+        assert _nearest_name(NearestCityIndex([]), 0.0, 0.0, 50) == ""
+
+
+def test_bundled_gazetteer_snaps_city_centres() -> None:
+    """Test snapping against the bundled gazetteer."""
+    index = NearestCityIndex(load_gazetteer())
+    assert _nearest_name(index, 48.86, 2.34, 10) == "Paris"
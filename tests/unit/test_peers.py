@@ -0,0 +1,220 @@
+"""Unit tests for the peer cache's hash ring and routing provider."""
+
+import asyncio
+from collections import Counter
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.exceptions import CityNotFoundError
+from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.cache_codec import encode_weather
+from src.infrastructure.peers import ConsistentHashRing, PeerCacheWarmer, PeerWeatherProvider
+
+PEERS = ["http://peer-a:8000", "http://peer-b:8000", "http://peer-c:8000"]
+CITIES = [f"city-{index}" for index in range(3000)]
+
+
+class TestConsistentHashRing:
+    """Tests for ConsistentHashRing."""
+
+    def test_keys_spread_evenly(self) -> None:
+        """Test that each node owns roughly an equal share of keys."""
+        ring = ConsistentHashRing(PEERS)
+
+        shares = Counter(ring.owner(key) for key in CITIES)
+
+        assert set(shares) == set(PEERS)
+        assert all(0.25 < count / len(CITIES) < 0.42 for count in shares.values())
+
+    def test_adding_a_node_moves_few_keys(self) -> None:
+        """Test that a fourth node takes about a quarter of the keys from the others."""
+        before = ConsistentHashRing(PEERS)
+        after = ConsistentHashRing([*PEERS, "http://peer-d:8000"])
+
+        moved = [key for key in CITIES if before.owner(key) != after.owner(key)]
+
+        assert 0.15 < len(moved) / len(CITIES) < 0.35
+        assert all(after.owner(key) == "http://peer-d:8000" for key in moved)
+
+    def test_owner_is_independent_of_node_order(self) -> None:
+        """Test that replicas listing peers in another order agree on owners."""
+        ring = ConsistentHashRing(PEERS)
+        reordered = ConsistentHashRing(list(reversed(PEERS)))
+
+        assert all(ring.owner(key) == reordered.owner(key) for key in CITIES[:200])
+
+    def test_requires_nodes(self) -> None:
+        """Test that an empty ring is rejected."""
+        with pytest.raises(ValueError):
+            ConsistentHashRing([])
+
+
+class TestPeerWeatherProvider:
+    """Tests for PeerWeatherProvider."""
+
+    @pytest.fixture
+    def upstream(self, sample_weather_data: WeatherData) -> MagicMock:
+        """Create an upstream provider returning sample data."""
+        provider = MagicMock()
+        provider.get_weather = AsyncMock(return_value=sample_weather_data)
+        return provider
+
+    def _provider(
+        self, upstream: MagicMock, handler, logger: MagicMock | None = None
+    ) -> PeerWeatherProvider:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return PeerWeatherProvider(
+            upstream, PEERS, PEERS[0], "s3cret", logger or MagicMock(), client=client
+        )
+
+    def _request(self, provider: PeerWeatherProvider, owned: bool) -> WeatherRequest:
+        """Return a request this replica owns, or one another peer owns."""
+        for city in CITIES:
+            request = WeatherRequest(city=city)
+            if (provider.owner(request) == PEERS[0]) == owned:
+                return request
+        raise AssertionError("no such city")
+
+    @pytest.mark.asyncio
+    async def test_owned_key_is_fetched_upstream(self, upstream: MagicMock) -> None:
+        """Test that keys this replica owns never leave it."""
+        handler = MagicMock(side_effect=AssertionError("no peer call expected"))
+        provider = self._provider(upstream, handler)
+
+        await provider.get_weather(self._request(provider, owned=True))
+
+        upstream.get_weather.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_other_keys_are_fetched_from_owner(
+        self, upstream: MagicMock, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that the owner is asked with the token and its answer is decoded."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, content=encode_weather(sample_weather_data))
+
+        provider = self._provider(upstream, handler)
+        request = self._request(provider, owned=False)
+
+        result = await provider.get_weather(request)
+
+        assert result == sample_weather_data
+        upstream.get_weather.assert_not_awaited()
+        assert str(seen[0].url).startswith(f"{provider.owner(request)}/internal/peer/weather")
+        assert seen[0].url.params["city"] == request.city
+        assert seen[0].headers["X-Peer-Token"] == "s3cret"
+
+    @pytest.mark.asyncio
+    async def test_unreachable_owner_falls_back_to_upstream(self, upstream: MagicMock) -> None:
+        """Test that a dead peer costs an upstream call, not a failed request."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("connection refused", request=request)
+
+        logger = MagicMock()
+        provider = self._provider(upstream, handler, logger)
+
+        await provider.get_weather(self._request(provider, owned=False))
+
+        upstream.get_weather.assert_awaited_once()
+        logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_owner_not_found_is_raised(self, upstream: MagicMock) -> None:
+        """Test that the owner's 404 surfaces as CityNotFoundError without fallback."""
+        provider = self._provider(upstream, lambda _: httpx.Response(404))
+
+        with pytest.raises(CityNotFoundError):
+            await provider.get_weather(self._request(provider, owned=False))
+        upstream.get_weather.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_fetches_share_one_call(
+        self, upstream: MagicMock, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that simultaneous misses for one key reach upstream once."""
+
+        async def slow_fetch(_request: WeatherRequest) -> WeatherData:
+            await asyncio.sleep(0.01)
+            return sample_weather_data
+
+        upstream.get_weather = AsyncMock(side_effect=slow_fetch)
+        provider = self._provider(upstream, MagicMock())
+        request = self._request(provider, owned=True)
+
+        results = await asyncio.gather(*(provider.get_weather(request) for _ in range(10)))
+
+        assert all(result == sample_weather_data for result in results)
+        assert upstream.get_weather.await_count == 1
+
+    def test_requires_own_url_in_peer_list(self, upstream: MagicMock) -> None:
+        """Test that a replica missing from its own peer list is rejected."""
+        with pytest.raises(ValueError, match="not in the peer list"):
+            PeerWeatherProvider(upstream, PEERS, "http://elsewhere:8000", "s3cret", MagicMock())
+
+
+class TestPeerCacheWarmer:
+    """Tests for PeerCacheWarmer."""
+
+    @pytest.fixture
+    def peer_cache(self, sample_weather_data: WeatherData) -> InMemoryCache:
+        """Create the running peer's cache."""
+        cache = InMemoryCache()
+        cache.set_many({city: sample_weather_data for city in CITIES[:2500]}, ttl_seconds=300)
+        return cache
+
+    def _warmer(self, cache: InMemoryCache, handler, logger: MagicMock) -> PeerCacheWarmer:
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return PeerCacheWarmer(cache, PEERS[1], "s3cret", logger, client=client)
+
+    @pytest.mark.asyncio
+    async def test_copies_peer_entries(
+        self, peer_cache: InMemoryCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that the peer's entries are streamed into the new cache."""
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, content=b"".join(peer_cache.snapshot_chunks()))
+
+        cache = InMemoryCache()
+        logger = MagicMock()
+
+        assert await self._warmer(cache, handler, logger).warm() == 2500
+        assert cache.get(CITIES[42]) == sample_weather_data
+        assert str(seen[0].url) == f"{PEERS[1]}/internal/peer/cache"
+        assert seen[0].headers["X-Peer-Token"] == "s3cret"
+        logger.info.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_truncated_stream_keeps_received_entries(self, peer_cache: InMemoryCache) -> None:
+        """Test that a transfer cut short is logged and keeps what arrived."""
+        stream = b"".join(peer_cache.snapshot_chunks())
+        cache = InMemoryCache()
+        logger = MagicMock()
+        warmer = self._warmer(
+            cache, lambda _: httpx.Response(200, content=stream[: len(stream) // 2]), logger
+        )
+
+        added = await warmer.warm()
+
+        assert 0 < added < 2500
+        assert cache.size == added
+        logger.warning.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rejected_request_leaves_cache_empty(self) -> None:
+        """Test that a peer refusing the token only logs a warning."""
+        cache = InMemoryCache()
+        logger = MagicMock()
+
+        assert await self._warmer(cache, lambda _: httpx.Response(403), logger).warm() == 0
+        assert cache.size == 0
+        logger.warning.assert_called_once()
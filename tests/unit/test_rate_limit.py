@@ -0,0 +1,272 @@
+"""Unit tests for the upstream and per-client request budgets."""
+
+import asyncio
+import dataclasses
+from collections.abc import AsyncIterator
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.application.use_cases import GetWeatherUseCase
+from src.application.weather_updates import WeatherUpdateHub
+from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.exceptions import RateLimitExceededError
+from src.infrastructure.async_cache import AsyncCacheAdapter
+from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.jobs import BulkWeatherJobManager, JobStatus
+from src.infrastructure.rate_limit import (
+    ClientBudgetedWeatherProvider,
+    RateLimitedWeatherProvider,
+    SlidingWindowLimiter,
+    TokenBucket,
+    current_client,
+)
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_served_immediately(self) -> None:
+        """Test that up to capacity calls do not wait."""
+        bucket = TokenBucket(rate_per_second=1.0, capacity=3, clock=FakeClock())
+        with patch("src.infrastructure.rate_limit.asyncio.sleep", new=AsyncMock()) as sleep:
+            for _ in range(3):
+                await bucket.acquire()
+        sleep.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_callers_queue_in_order(self) -> None:
+        """Test that callers beyond the burst wait increasingly long."""
+        bucket = TokenBucket(rate_per_second=2.0, capacity=1, clock=FakeClock())
+        with patch("src.infrastructure.rate_limit.asyncio.sleep", new=AsyncMock()) as sleep:
+            for _ in range(3):
+                await bucket.acquire()
+        assert [call.args[0] for call in sleep.await_args_list] == [0.5, 1.0]
+
+    @pytest.mark.asyncio
+    async def test_refill_over_time(self) -> None:
+        """Test that tokens refill at the configured rate."""
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_second=1.0, capacity=2, clock=clock)
+        await bucket.acquire()
+        await bucket.acquire()
+        assert bucket.available == 0
+
+        clock.now = 1.5
+        assert bucket.available == pytest.approx(1.5)
+
+    @pytest.mark.asyncio
+    async def test_max_wait_exceeded(self) -> None:
+        """Test that waits beyond the limit raise without consuming budget."""
+        bucket = TokenBucket(rate_per_second=0.1, capacity=1, clock=FakeClock())
+        await bucket.acquire()
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            await bucket.acquire(max_wait_seconds=1.0)
+
+        assert exc_info.value.retry_after_seconds == 10
+        assert bucket.available == 0
+
+
+class TestRateLimitedWeatherProvider:
+    """Tests for RateLimitedWeatherProvider."""
+
+    @pytest.mark.asyncio
+    async def test_delegates_within_budget(self, sample_weather_data: WeatherData) -> None:
+        """Test that calls pass through when budget is available."""
+        inner = MagicMock()
+        inner.get_weather = AsyncMock(return_value=sample_weather_data)
+        provider = RateLimitedWeatherProvider(inner, TokenBucket(1.0, 1, clock=FakeClock()))
+
+        result = await provider.get_weather(WeatherRequest(city="London"))
+
+        assert result is sample_weather_data
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_budget_exhausted(self, sample_weather_data: WeatherData) -> None:
+        """Test that the provider is not called once the budget is spent."""
+        inner = MagicMock()
+        inner.get_weather = AsyncMock(return_value=sample_weather_data)
+        provider = RateLimitedWeatherProvider(
+            inner, TokenBucket(0.01, 1, clock=FakeClock()), max_wait_seconds=1.0
+        )
+
+        await provider.get_weather(WeatherRequest(city="London"))
+        with pytest.raises(RateLimitExceededError):
+            await provider.get_weather(WeatherRequest(city="Paris"))
+
+        assert inner.get_weather.await_count == 1
+
+
+class TestSlidingWindowLimiter:
+    """Tests for SlidingWindowLimiter."""
+
+    def test_limit_per_key(self) -> None:
+        """Test that each key gets its own limit and rejections carry a retry delay."""
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(3, window_seconds=60, clock=clock)
+        for _ in range(3):
+            limiter.hit("a")
+
+        with pytest.raises(RateLimitExceededError) as exc_info:
+            limiter.hit("a")
+
+        assert exc_info.value.retry_after_seconds == 60
+        limiter.hit("b")
+
+    def test_previous_window_decays(self) -> None:
+        """Test that the previous window's count is weighted by its remaining overlap."""
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(4, window_seconds=60, clock=clock)
+        for _ in range(4):
+            limiter.hit("a")
+
+        def admitted() -> int:
+            count = 0
+            while True:
+                try:
+                    limiter.hit("a")
+                except RateLimitExceededError as e:
+                    assert e.retry_after_seconds == 1
+                    return count
+                count += 1
+
+        # Each quarter of the next window frees one of the previous window's 4 requests
+        clock.now = 75.0
+        assert admitted() == 1
+        clock.now = 90.0
+        assert admitted() == 1
+        clock.now = 120.0
+        assert admitted() == 2
+
+    def test_rejected_requests_are_not_counted(self) -> None:
+        """Test that a client hammering while limited is not locked out for longer."""
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(2, window_seconds=60, clock=clock)
+        limiter.hit("a")
+        limiter.hit("a")
+        for _ in range(100):
+            with pytest.raises(RateLimitExceededError):
+                limiter.hit("a")
+
+        clock.now = 121.0
+        limiter.hit("a")
+
+    def test_idle_clients_are_dropped(self) -> None:
+        """Test that keys idle for two windows stop taking memory."""
+        clock = FakeClock()
+        limiter = SlidingWindowLimiter(10, window_seconds=60, clock=clock)
+        for index in range(1000):
+            limiter.hit(f"client-{index}")
+        assert limiter.clients == 1000
+
+        clock.now = 70.0
+        limiter.hit("active")
+        assert limiter.clients == 1001
+
+        clock.now = 130.0
+        limiter.hit("active")
+        assert limiter.clients == 1
+
+    def test_limit_must_fit_counter(self) -> None:
+        """Test that limits beyond the packed counter size are rejected."""
+        with pytest.raises(ValueError):
+            SlidingWindowLimiter(70_000)
+
+
+class TestClientBudgetedWeatherProvider:
+    """Tests for ClientBudgetedWeatherProvider."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_are_charged_to_current_client(
+        self, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a client's fetches stop at its budget while others continue."""
+        inner = MagicMock()
+        inner.get_weather = AsyncMock(return_value=sample_weather_data)
+        provider = ClientBudgetedWeatherProvider(inner, SlidingWindowLimiter(1, clock=FakeClock()))
+        request = WeatherRequest(city="London")
+
+        token = current_client.set("ip:10.0.0.1")
+        try:
+            await provider.get_weather(request)
+            with pytest.raises(RateLimitExceededError):
+                await provider.get_weather(request)
+        finally:
+            current_client.reset(token)
+
+        await provider.get_weather(request)
+        assert inner.get_weather.await_count == 2
+
+
+class TestBackgroundFetchesAreNotCharged:
+    """Tests that work started by a request but outliving it is not charged to its client."""
+
+    CLIENT = "ip:10.0.0.1"
+
+    @pytest.fixture
+    def limiter(self) -> SlidingWindowLimiter:
+        """Create a miss budget of a single fetch."""
+        return SlidingWindowLimiter(1, clock=FakeClock())
+
+    @pytest.fixture
+    def use_case(
+        self, limiter: SlidingWindowLimiter, sample_weather_data: WeatherData
+    ) -> GetWeatherUseCase:
+        """Create a use case whose fetches are charged to the current client."""
+        inner = MagicMock()
+        inner.get_weather = AsyncMock(
+            side_effect=lambda request: dataclasses.replace(
+                sample_weather_data, city_name=request.city
+            )
+        )
+        provider = ClientBudgetedWeatherProvider(inner, limiter)
+        return GetWeatherUseCase(provider, AsyncCacheAdapter(InMemoryCache()), MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_live_update_refreshes(
+        self, use_case: GetWeatherUseCase, limiter: SlidingWindowLimiter
+    ) -> None:
+        """Test that a channel's refresh loop does not spend its first subscriber's budget."""
+        hub = WeatherUpdateHub(use_case=use_case, logger=MagicMock(), poll_interval_seconds=60)
+        token = current_client.set(self.CLIENT)
+        try:
+            async with hub.subscribe(WeatherRequest(city="London")) as updates:
+                await asyncio.wait_for(updates.get(), timeout=1)
+        finally:
+            current_client.reset(token)
+
+        limiter.hit(self.CLIENT)
+
+    @pytest.mark.asyncio
+    async def test_bulk_job_rows(
+        self, use_case: GetWeatherUseCase, limiter: SlidingWindowLimiter, tmp_path: Path
+    ) -> None:
+        """Test that an upload's rows do not spend the uploader's budget."""
+
+        async def upload() -> AsyncIterator[bytes]:
+            yield b"city\nLondon\nParis\nTokyo\n"
+
+        manager = BulkWeatherJobManager(use_case, MagicMock(), jobs_dir=tmp_path)
+        token = current_client.set(self.CLIENT)
+        try:
+            job = await manager.create_job(upload())
+        finally:
+            current_client.reset(token)
+        await manager.wait(job.id)
+
+        assert job.status == JobStatus.COMPLETED
+        assert job.succeeded == 3
+        limiter.hit(self.CLIENT)
@@ -0,0 +1,314 @@
+"""Unit tests for the Redis cache tier, run against a local stand-in server."""
+
+import asyncio
+import fnmatch
+import time
+from collections.abc import AsyncIterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities import WeatherData
+from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.cache_codec import decode_entry
+from src.infrastructure.redis_cache import RedisCache
+from src.infrastructure.tiered_cache import SharedTieredCache
+
+
+class _FakeRedisProtocol(asyncio.Protocol):
+    """One client connection to the stand-in server."""
+
+    def __init__(self, server: "FakeRedisServer") -> None:
+        self._server = server
+        self._buffer = b""
+        self._authenticated = server.password is None
+        self._transport: asyncio.Transport | None = None
+
+    def connection_made(self, transport: asyncio.BaseTransport) -> None:
+        assert isinstance(transport, asyncio.Transport)
+        self._transport = transport
+        self._server.connections += 1
+
+    def data_received(self, data: bytes) -> None:
+        self._server.reads += 1
+        self._buffer += data
+        while (parsed := self._parse()) is not None:
+            command, self._buffer = parsed
+            assert self._transport is not None
+            self._transport.write(self._execute(command))
+
+    def _parse(self) -> tuple[list[bytes], bytes] | None:
+        """Split one complete command off the buffer."""
+        buffer = self._buffer
+        end = buffer.find(b"\r\n")
+        if end < 0:
+            return None
+        count, position = int(buffer[1:end]), end + 2
+        arguments = []
+        for _ in range(count):
+            end = buffer.find(b"\r\n", position)
+            if end < 0:
+                return None
+            length = int(buffer[position + 1 : end])
+            start = end + 2
+            if len(buffer) < start + length + 2:
+                return None
+            arguments.append(buffer[start : start + length])
+            position = start + length + 2
+        return arguments, buffer[position:]
+
+    def _execute(self, command: list[bytes]) -> bytes:
+        """Apply a command and return the encoded reply."""
+        server = self._server
+        name = command[0].upper()
+        server.commands.append(name)
+        if name == b"AUTH":
+            if command[1].decode() != server.password:
+                return b"-WRONGPASS invalid password\r\n"
+            self._authenticated = True
+            return b"+OK\r\n"
+        if not self._authenticated:
+            return b"-NOAUTH Authentication required.\r\n"
+        if name == b"SELECT":
+            server.selected_db = int(command[1])
+            return b"+OK\r\n"
+        if name == b"SET":
+            ttl_ms = int(command[4]) if len(command) > 4 else None
+            server.set(command[1], command[2], ttl_ms)
+            return b"+OK\r\n"
+        if name == b"MGET":
+            values = [server.get(key) for key in command[1:]]
+            return b"*%d\r\n" % len(values) + b"".join(_bulk(value) for value in values)
+        if name == b"DEL":
+            removed = sum(server.data.pop(key, None) is not None for key in command[1:])
+            return b":%d\r\n" % removed
+        if name == b"SCAN":
+            pattern = command[command.index(b"MATCH") + 1].decode()
+            keys = [key for key in list(server.data) if fnmatch.fnmatch(key.decode(), pattern)]
+            return b"*2\r\n" + _bulk(b"0") + b"*%d\r\n" % len(keys) + b"".join(map(_bulk, keys))
+        return b"-ERR unknown command\r\n"
+
+
+def _bulk(value: bytes | None) -> bytes:
+    """Encode a bulk string reply."""
+    if value is None:
+        return b"$-1\r\n"
+    return b"$%d\r\n%s\r\n" % (len(value), value)
+
+
+class FakeRedisServer:
+    """Redis stand-in implementing the commands RedisCache sends."""
+
+    def __init__(self, password: str | None = None) -> None:
+        self.password = password
+        self.data: dict[bytes, tuple[bytes, float | None]] = {}
+        self.commands: list[bytes] = []
+        self.connections = 0
+        self.reads = 0
+        self.selected_db = 0
+        self.port = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> None:
+        loop = asyncio.get_running_loop()
+        self._server = await loop.create_server(lambda: _FakeRedisProtocol(self), "127.0.0.1", 0)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    def set(self, key: bytes, value: bytes, ttl_ms: int | None) -> None:
+        expires_at = time.monotonic() + ttl_ms / 1000 if ttl_ms is not None else None
+        self.data[key] = (value, expires_at)
+
+    def get(self, key: bytes) -> bytes | None:
+        entry = self.data.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.monotonic():
+            del self.data[key]
+            return None
+        return value
+
+
+@pytest.fixture
+async def redis_server() -> AsyncIterator[FakeRedisServer]:
+    """Start a stand-in Redis server on a free local port."""
+    server = FakeRedisServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def redis_cache(redis_server: FakeRedisServer) -> AsyncIterator[RedisCache]:
+    """Create a Redis cache connected to the stand-in server."""
+    cache = RedisCache(f"redis://127.0.0.1:{redis_server.port}/0", MagicMock())
+    yield cache
+    await cache.close()
+
+
+class TestRedisCache:
+    """Tests for RedisCache."""
+
+    @pytest.mark.asyncio
+    async def test_set_and_get(
+        self, redis_cache: RedisCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that an entry is stored and read back with its remaining TTL."""
+        await redis_cache.set("weather:london:metric", sample_weather_data, ttl_seconds=300)
+
+        assert await redis_cache.get("weather:london:metric") == sample_weather_data
+        hit = await redis_cache.get_with_ttl("weather:london:metric")
+        assert hit is not None
+        assert 299 < hit[1] <= 300
+        assert await redis_cache.get("weather:paris:metric") is None
+
+    @pytest.mark.asyncio
+    async def test_values_are_compact_binary_with_server_expiry(
+        self,
+        redis_cache: RedisCache,
+        redis_server: FakeRedisServer,
+        sample_weather_data: WeatherData,
+    ) -> None:
+        """Test that values are packed records stored with a matching PX expiry."""
+        await redis_cache.set("weather:london:metric", sample_weather_data, ttl_seconds=300)
+
+        value, expires_at = redis_server.data[b"weatherapp:weather:london:metric"]
+        assert len(value) < 150
+        assert decode_entry(value)[0] == sample_weather_data
+        assert expires_at is not None
+
+    @pytest.mark.asyncio
+    async def test_bulk_operations_are_pipelined(
+        self,
+        redis_cache: RedisCache,
+        redis_server: FakeRedisServer,
+        sample_weather_data: WeatherData,
+    ) -> None:
+        """Test that a bulk write and a bulk read each take one round trip."""
+        items = {f"weather:city{i}:metric": sample_weather_data for i in range(50)}
+
+        await redis_cache.set_many(items, ttl_seconds=300)
+        reads_after_write = redis_server.reads
+        found = await redis_cache.get_many([*items, "weather:nowhere:metric"])
+
+        assert set(found) == set(items)
+        assert redis_server.commands.count(b"SET") == 50
+        assert redis_server.commands.count(b"MGET") == 1
+        assert reads_after_write <= 3
+        assert redis_server.connections == 1
+
+    @pytest.mark.asyncio
+    async def test_delete_and_clear_only_touch_own_keys(
+        self,
+        redis_cache: RedisCache,
+        redis_server: FakeRedisServer,
+        sample_weather_data: WeatherData,
+    ) -> None:
+        """Test that clearing leaves keys of other applications alone."""
+        redis_server.set(b"otherapp:key", b"value", None)
+        await redis_cache.set_many(
+            {"london": sample_weather_data, "paris": sample_weather_data}, ttl_seconds=300
+        )
+
+        await redis_cache.delete("london")
+        assert await redis_cache.get("london") is None
+        assert await redis_cache.get("paris") == sample_weather_data
+
+        await redis_cache.clear()
+        assert await redis_cache.get("paris") is None
+        assert b"otherapp:key" in redis_server.data
+
+    @pytest.mark.asyncio
+    async def test_pool_bounds_connections(
+        self, redis_server: FakeRedisServer, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that concurrent calls share at most pool_size connections."""
+        cache = RedisCache(f"redis://127.0.0.1:{redis_server.port}", MagicMock(), pool_size=2)
+        await cache.set("london", sample_weather_data, ttl_seconds=300)
+
+        results = await asyncio.gather(*(cache.get("london") for _ in range(20)))
+
+        assert all(result == sample_weather_data for result in results)
+        assert redis_server.connections <= 2
+        await cache.close()
+
+    @pytest.mark.asyncio
+    async def test_authenticates_and_selects_database(
+        self, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that the URL's password and database are applied per connection."""
+        server = FakeRedisServer(password="s3cret")
+        await server.start()
+        cache = RedisCache(f"redis://:s3cret@127.0.0.1:{server.port}/2", MagicMock())
+
+        await cache.set("london", sample_weather_data, ttl_seconds=300)
+
+        assert await cache.get("london") == sample_weather_data
+        assert server.selected_db == 2
+        await cache.close()
+        await server.stop()
+
+    @pytest.mark.asyncio
+    async def test_unreachable_server_degrades_to_misses(
+        self, redis_server: FakeRedisServer, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that failures are logged and never raised to the caller."""
+        port = redis_server.port
+        await redis_server.stop()
+        logger = MagicMock()
+        cache = RedisCache(f"redis://127.0.0.1:{port}", logger, timeout_seconds=0.5)
+
+        await cache.set("london", sample_weather_data, ttl_seconds=300)
+        assert await cache.get("london") is None
+        assert logger.warning.call_count == 2
+        # Restart the fixture's server so its teardown can stop it
+        await redis_server.start()
+
+    def test_rejects_unsupported_url(self) -> None:
+        """Test that only redis:// URLs are accepted."""
+        with pytest.raises(ValueError, match="Unsupported Redis URL"):
+            RedisCache("rediss://cache.example.com", MagicMock())
+
+
+class TestSharedTieredCache:
+    """Tests for SharedTieredCache."""
+
+    @pytest.mark.asyncio
+    async def test_replicas_share_entries_through_l2(
+        self, redis_cache: RedisCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that one replica's fetch is served to another from L2."""
+        first = SharedTieredCache(InMemoryCache(), redis_cache)
+        second_l1 = InMemoryCache()
+        second = SharedTieredCache(second_l1, redis_cache)
+
+        await first.set("london", sample_weather_data, ttl_seconds=300)
+
+        assert await second.get("london") == sample_weather_data
+        assert second_l1.get("london") == sample_weather_data
+        assert await second.get("london") == sample_weather_data
+        assert await second.get("paris") is None
+        assert (second.l1_hits, second.l2_hits, second.misses) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_get_many_asks_l2_once_for_l1_misses(
+        self,
+        redis_cache: RedisCache,
+        redis_server: FakeRedisServer,
+        sample_weather_data: WeatherData,
+    ) -> None:
+        """Test that a batch sends only its L1 misses, in one MGET."""
+        l1 = InMemoryCache()
+        tiered = SharedTieredCache(l1, redis_cache)
+        l1.set("london", sample_weather_data, ttl_seconds=300)
+        await redis_cache.set("paris", sample_weather_data, ttl_seconds=300)
+
+        found = await tiered.get_many(["london", "paris", "tokyo"])
+
+        assert set(found) == {"london", "paris"}
+        assert redis_server.commands.count(b"MGET") == 1
@@ -0,0 +1,108 @@
+"""Unit tests for the pre-forking production server."""
+
+import os
+import threading
+import time
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.server import (
+    WORKER_BOOT_FAILURE,
+    PreforkSupervisor,
+    cgroup_cpu_limit,
+    detect_worker_count,
+)
+
+
+class TestCpuLimit:
+    """Tests for the cgroup CPU quota detection."""
+
+    def test_cgroup_v2_quota(self, tmp_path: Path) -> None:
+        """Test that cpu.max is read as quota over period."""
+        (tmp_path / "cpu.max").write_text("150000 100000\n")
+
+        assert cgroup_cpu_limit(tmp_path) == 1.5
+
+    def test_cgroup_v2_unlimited(self, tmp_path: Path) -> None:
+        """Test that an unlimited cgroup has no quota."""
+        (tmp_path / "cpu.max").write_text("max 100000\n")
+
+        assert cgroup_cpu_limit(tmp_path) is None
+
+    def test_cgroup_v1_quota(self, tmp_path: Path) -> None:
+        """Test that the v1 CFS files are used when cpu.max is absent."""
+        (tmp_path / "cpu").mkdir()
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("200000\n")
+        (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+
+        assert cgroup_cpu_limit(tmp_path) == 2.0
+
+    def test_cgroup_v1_unlimited(self, tmp_path: Path) -> None:
+        """Test that a v1 quota of -1 means no quota."""
+        (tmp_path / "cpu").mkdir()
+        (tmp_path / "cpu" / "cpu.cfs_quota_us").write_text("-1\n")
+        (tmp_path / "cpu" / "cpu.cfs_period_us").write_text("100000\n")
+
+        assert cgroup_cpu_limit(tmp_path) is None
+
+    def test_workers_follow_quota_rounded_up(self, tmp_path: Path) -> None:
+        """Test that a fractional quota gets a worker for its remainder."""
+        (tmp_path / "cpu.max").write_text("150000 100000\n")
+
+        assert detect_worker_count(tmp_path) == min(2, len(os.sched_getaffinity(0)))
+
+    def test_workers_without_cgroup(self, tmp_path: Path) -> None:
+        """Test that every available CPU gets a worker when there is no quota."""
+        assert detect_worker_count(tmp_path) == len(os.sched_getaffinity(0))
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+class TestPreforkSupervisor:
+    """Tests for PreforkSupervisor."""
+
+    def _stop_when(self, supervisor: PreforkSupervisor, condition) -> threading.Thread:
+        """Stop the supervisor from another thread once a condition holds."""
+
+        def watch() -> None:
+            deadline = time.monotonic() + 10
+            while not condition() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            supervisor.stop()
+
+        thread = threading.Thread(target=watch, daemon=True)
+        thread.start()
+        return thread
+
+    def test_crashed_workers_are_restarted(self, tmp_path: Path) -> None:
+        """Test that workers exiting unexpectedly are replaced until stopped."""
+        starts = tmp_path / "starts"
+
+        def target() -> int:
+            with starts.open("a") as f:
+                f.write(f"{os.getpid()}\n")
+            if starts.read_text().split().index(str(os.getpid())) < 3:
+                return 1
+            time.sleep(30)
+            return 0
+
+        supervisor = PreforkSupervisor(target, 2, MagicMock(), restart_delay_seconds=0.01)
+        watcher = self._stop_when(
+            supervisor,
+            lambda: starts.exists() and len(starts.read_text().splitlines()) >= 5,
+        )
+
+        assert supervisor.run() == 0
+        watcher.join()
+        assert supervisor.restarts == 3
+        assert len(set(starts.read_text().split())) == 5
+
+    def test_boot_failure_stops_server(self) -> None:
+        """Test that a worker failing to start is not restarted."""
+        logger = MagicMock()
+        supervisor = PreforkSupervisor(lambda: WORKER_BOOT_FAILURE, 1, logger)
+
+        assert supervisor.run() == 1
+        assert supervisor.restarts == 0
+        logger.error.assert_called_once()
@@ -0,0 +1,165 @@
+"""Unit tests for the shared-memory cache."""
+
+import dataclasses
+import multiprocessing
+import time
+import uuid
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+
+from src.domain.entities import WeatherData
+from src.infrastructure.shm_cache import _LAYOUT_VERSION, SharedMemoryCache
+
+
+def _store_from_child(name: str, slots: int, data: WeatherData) -> None:
+    """Attach to the segment from another process and store an entry."""
+    cache = SharedMemoryCache(name, slots=slots)
+    cache.set("weather:paris:metric", data, ttl_seconds=300)
+    cache.close()
+
+
+@pytest.fixture
+def shm_cache() -> Iterator[SharedMemoryCache]:
+    """Create a small shared-memory cache under a unique name."""
+    cache = SharedMemoryCache(f"test-{uuid.uuid4().hex[:12]}", slots=64)
+    yield cache
+    cache.close()
+    cache.unlink()
+
+
+class TestSharedMemoryCache:
+    """Tests for SharedMemoryCache."""
+
+    def test_set_and_get(
+        self, shm_cache: SharedMemoryCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that an entry is read back with its remaining TTL."""
+        shm_cache.set("weather:london:metric", sample_weather_data, ttl_seconds=300)
+
+        assert shm_cache.get("weather:london:metric") == sample_weather_data
+        hit = shm_cache.get_with_ttl("weather:london:metric")
+        assert hit is not None
+        assert 299 < hit[1] <= 300
+        assert shm_cache.get("weather:paris:metric") is None
+        assert shm_cache.size == 1
+
+    def test_overwrite_reuses_slot(
+        self, shm_cache: SharedMemoryCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that storing a key again replaces its entry."""
+        updated = dataclasses.replace(sample_weather_data, temperature=21.0)
+        shm_cache.set("london", sample_weather_data, ttl_seconds=300)
+        shm_cache.set("london", updated, ttl_seconds=300)
+
+        assert shm_cache.get("london") == updated
+        assert shm_cache.size == 1
+
+    def test_expired_entry_is_a_miss(
+        self, shm_cache: SharedMemoryCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that an entry past its TTL is not returned."""
+        shm_cache.set("london", sample_weather_data, ttl_seconds=0)
+        time.sleep(0.01)
+
+        assert shm_cache.get("london") is None
+        assert shm_cache.size == 0
+
+    def test_delete_and_clear(
+        self, shm_cache: SharedMemoryCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that entries can be removed one at a time or all at once."""
+        shm_cache.set_many({"london": sample_weather_data, "paris": sample_weather_data}, 300)
+
+        shm_cache.delete("london")
+        assert shm_cache.get("london") is None
+        assert shm_cache.get("paris") == sample_weather_data
+
+        shm_cache.clear()
+        assert shm_cache.get("paris") is None
+
+    def test_full_probe_window_evicts_soonest_to_expire(
+        self, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a full table replaces the entry closest to expiry."""
+        cache = SharedMemoryCache(f"test-{uuid.uuid4().hex[:12]}", slots=2, probe_limit=2)
+        try:
+            cache.set("a", sample_weather_data, ttl_seconds=100)
+            cache.set("b", sample_weather_data, ttl_seconds=300)
+            cache.set("c", sample_weather_data, ttl_seconds=300)
+
+            assert cache.get("a") is None
+            assert cache.get("b") == sample_weather_data
+            assert cache.get("c") == sample_weather_data
+        finally:
+            cache.close()
+            cache.unlink()
+
+    def test_oversized_entry_is_not_cached(self, sample_weather_data: WeatherData) -> None:
+        """Test that an entry larger than a slot is skipped."""
+        cache = SharedMemoryCache(f"test-{uuid.uuid4().hex[:12]}", slots=8, slot_size=64)
+        try:
+            cache.set("london", sample_weather_data, ttl_seconds=300)
+
+            assert cache.get("london") is None
+        finally:
+            cache.close()
+            cache.unlink()
+
+    def test_attached_instances_share_entries(
+        self, shm_cache: SharedMemoryCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a second instance opened by name sees the same table."""
+        other = SharedMemoryCache(shm_cache.name, slots=64)
+        try:
+            other.set("london", sample_weather_data, ttl_seconds=300)
+
+            assert shm_cache.get("london") == sample_weather_data
+        finally:
+            other.close()
+
+    def test_entries_are_shared_across_processes(
+        self, shm_cache: SharedMemoryCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that an entry stored by another process is served here."""
+        process = multiprocessing.get_context("fork").Process(
+            target=_store_from_child, args=(shm_cache.name, 64, sample_weather_data)
+        )
+        process.start()
+        process.join(timeout=30)
+
+        assert process.exitcode == 0
+        assert shm_cache.get("weather:paris:metric") == sample_weather_data
+
+    def test_replaces_segment_with_different_layout(
+        self, shm_cache: SharedMemoryCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a start with another slot count gets a fresh segment."""
+        shm_cache.set("london", sample_weather_data, ttl_seconds=300)
+
+        replacement = SharedMemoryCache(shm_cache.name, slots=128)
+        attached = SharedMemoryCache(shm_cache.name, slots=128)
+        try:
+            assert replacement.get("london") is None
+            replacement.set("paris", sample_weather_data, ttl_seconds=300)
+
+            assert attached.get("paris") == sample_weather_data
+            # The process still on the old segment keeps working
+            assert shm_cache.get("london") == sample_weather_data
+        finally:
+            attached.close()
+            replacement.close()
+
+    def test_replaces_segment_from_older_layout_version(
+        self, shm_cache: SharedMemoryCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a segment written by another build is not attached to."""
+        shm_cache.set("london", sample_weather_data, ttl_seconds=300)
+
+        with patch("src.infrastructure.shm_cache._LAYOUT_VERSION", _LAYOUT_VERSION + 1):
+            replacement = SharedMemoryCache(shm_cache.name, slots=64)
+        try:
+            assert replacement.get("london") is None
+        finally:
+            replacement.close()
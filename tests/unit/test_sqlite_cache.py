@@ -0,0 +1,159 @@
+"""Unit tests for the SQLite cache tier and the tiered cache."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.domain.entities import WeatherData
+from src.infrastructure.cache import InMemoryCache
+from src.infrastructure.sqlite_cache import SQLiteCache
+from src.infrastructure.tiered_cache import TieredCache
+
+
+@pytest.fixture
+def sqlite_cache(tmp_path: Path) -> Iterator[SQLiteCache]:
+    """Create a SQLite cache that only commits when flushed."""
+    cache = SQLiteCache(tmp_path / "cache.sqlite3", MagicMock(), flush_interval_seconds=60)
+    yield cache
+    cache.close()
+
+
+class TestSQLiteCache:
+    """Tests for SQLiteCache."""
+
+    def test_get_many_reads_buffered_and_committed_entries(
+        self, sqlite_cache: SQLiteCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a bulk read merges buffered writes with committed rows."""
+        sqlite_cache.set_many(
+            {"london": sample_weather_data, "paris": sample_weather_data}, ttl_seconds=300
+        )
+        sqlite_cache.flush(timeout=5)
+        sqlite_cache.set("tokyo", sample_weather_data, ttl_seconds=300)
+        sqlite_cache.delete("paris")
+
+        found = sqlite_cache.get_many(["london", "paris", "tokyo", "nowhere"])
+
+        assert found == {"london": sample_weather_data, "tokyo": sample_weather_data}
+
+    def test_buffered_write_is_readable_before_commit(
+        self, sqlite_cache: SQLiteCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that reads see writes still waiting for the batch commit."""
+        sqlite_cache.set("london", sample_weather_data, ttl_seconds=300)
+
+        assert sqlite_cache.size == 0
+        assert sqlite_cache.get("london") == sample_weather_data
+
+    def test_flush_commits_batch(
+        self, sqlite_cache: SQLiteCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that flushed entries are read back from the database."""
+        for number in range(5):
+            sqlite_cache.set(f"key{number}", sample_weather_data, ttl_seconds=300)
+        sqlite_cache.delete("key0")
+        sqlite_cache.flush()
+
+        assert sqlite_cache.size == 4
+        assert sqlite_cache.get("key0") is None
+        hit = sqlite_cache.get_with_ttl("key1")
+        assert hit is not None
+        assert hit[0] == sample_weather_data
+        assert 299 < hit[1] <= 300
+
+    def test_entries_survive_reopen(self, tmp_path: Path, sample_weather_data: WeatherData) -> None:
+        """Test that close commits pending writes for the next process."""
+        path = tmp_path / "cache.sqlite3"
+        first = SQLiteCache(path, MagicMock(), flush_interval_seconds=60)
+        first.set("london", sample_weather_data, ttl_seconds=300)
+        first.close()
+
+        second = SQLiteCache(path, MagicMock())
+        try:
+            assert second.get("london") == sample_weather_data
+        finally:
+            second.close()
+
+    def test_expired_entries_are_hidden_and_cleaned(
+        self, tmp_path: Path, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that expired rows are not returned and are deleted by cleanup."""
+        path = tmp_path / "cache.sqlite3"
+        cache = SQLiteCache(path, MagicMock(), cleanup_interval_seconds=0)
+        cache.set("old", sample_weather_data, ttl_seconds=-1)
+        cache.set("new", sample_weather_data, ttl_seconds=300)
+        assert cache.get("old") is None
+        cache.close()
+
+        reopened = SQLiteCache(path, MagicMock())
+        try:
+            assert reopened.size == 1
+            assert reopened.get("new") == sample_weather_data
+        finally:
+            reopened.close()
+
+    def test_clear(self, sqlite_cache: SQLiteCache, sample_weather_data: WeatherData) -> None:
+        """Test that clear drops committed and buffered entries."""
+        sqlite_cache.set("a", sample_weather_data, ttl_seconds=300)
+        sqlite_cache.flush()
+        sqlite_cache.set("b", sample_weather_data, ttl_seconds=300)
+
+        sqlite_cache.clear()
+
+        assert sqlite_cache.get("a") is None
+        assert sqlite_cache.get("b") is None
+
+
+class TestTieredCache:
+    """Tests for TieredCache."""
+
+    def test_l2_hit_is_promoted_with_remaining_ttl(
+        self, sqlite_cache: SQLiteCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that an L1 miss served by L2 is copied into L1."""
+        l1 = InMemoryCache(max_entries=1)
+        tiered = TieredCache(l1, sqlite_cache)
+        tiered.set("london", sample_weather_data, ttl_seconds=120)
+        tiered.set("paris", sample_weather_data, ttl_seconds=120)
+
+        assert l1.get("london") is None
+        assert tiered.get("london") == sample_weather_data
+        hit = l1.get_with_ttl("london")
+        assert hit is not None
+        assert hit[1] <= 120
+        assert (tiered.l1_hits, tiered.l2_hits, tiered.misses) == (0, 1, 0)
+
+    def test_get_many_promotes_l2_hits(
+        self, sqlite_cache: SQLiteCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a bulk read asks L2 only for L1 misses and promotes its hits."""
+        l1 = InMemoryCache()
+        tiered = TieredCache(l1, sqlite_cache)
+        l1.set("london", sample_weather_data, ttl_seconds=300)
+        sqlite_cache.set("paris", sample_weather_data, ttl_seconds=300)
+
+        found = tiered.get_many(["london", "paris", "nowhere"])
+
+        assert set(found) == {"london", "paris"}
+        assert l1.get("paris") == sample_weather_data
+        assert (tiered.l1_hits, tiered.l2_hits, tiered.misses) == (1, 1, 1)
+
+    def test_miss_in_both_levels(self, sqlite_cache: SQLiteCache) -> None:
+        """Test that a key in neither level is a miss."""
+        tiered = TieredCache(InMemoryCache(), sqlite_cache)
+
+        assert tiered.get("nowhere") is None
+        assert tiered.misses == 1
+
+    def test_delete_removes_from_both_levels(
+        self, sqlite_cache: SQLiteCache, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that deleted entries are not resurrected from L2."""
+        tiered = TieredCache(InMemoryCache(), sqlite_cache)
+        tiered.set("london", sample_weather_data, ttl_seconds=300)
+
+        tiered.delete("london")
+
+        assert tiered.get("london") is None
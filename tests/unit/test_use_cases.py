@@ -1,14 +1,29 @@
 """Unit tests for the GetWeatherUseCase."""
 
+import asyncio
+import time
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 
-from src.application.use_cases import GetWeatherUseCase
-from src.domain.entities import WeatherData, WeatherRequest
-from src.domain.exceptions import CityNotFoundError
-from src.domain.value_objects import Coordinates, UnitSystem
+from src.application.dto import WeatherResult
+from src.application.inflight import InFlightTracker
+from src.application.nearest_city import NearestCityIndex
+from src.application.use_cases import (
+    CompareWeatherUseCase,
+    GetForecastUseCase,
+    GetRouteWeatherUseCase,
+    GetWeatherGridUseCase,
+    GetWeatherUseCase,
+    InterpolationMethod,
+    RankingMetric,
+)
+from src.domain.entities import City, Forecast, WeatherData, WeatherRequest
+from src.domain.exceptions import CityNotFoundError, RateLimitExceededError
+from src.domain.geo import encode_polyline
+from src.domain.value_objects import BoundingBox, Coordinates, UnitSystem
 
 
 class TestGetWeatherUseCase:
@@ -25,8 +40,10 @@ class TestGetWeatherUseCase:
     def mock_cache(self) -> MagicMock:
         """Create a mock cache."""
         cache = MagicMock()
-        cache.get = MagicMock(return_value=None)
-        cache.set = MagicMock()
+        cache.get = AsyncMock(return_value=None)
+        cache.get_many = AsyncMock(return_value={})
+        cache.set = AsyncMock()
+        cache.set_many = AsyncMock()
         return cache
 
     @pytest.fixture
@@ -171,3 +188,611 @@ class TestGetWeatherUseCase:
 
         assert result.easter_egg == expected_easter_egg
         assert result.weather_data.country == country_code
+
+    @pytest.mark.asyncio
+    async def test_execute_many_deduplicates_cache_keys(
+        self,
+        use_case: GetWeatherUseCase,
+        mock_provider: MagicMock,
+        weather_data: WeatherData,
+    ) -> None:
+        """Test that requests sharing a cache key are resolved once."""
+        mock_provider.get_weather.return_value = weather_data
+
+        requests = [
+            WeatherRequest(city="London"),
+            WeatherRequest(city=" london "),
+            WeatherRequest(city="Paris"),
+        ]
+        results = await use_case.execute_many(requests)
+
+        assert len(results) == 3
+        assert results[0] is results[1]
+        assert mock_provider.get_weather.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_execute_many_reads_and_writes_cache_in_bulk(
+        self,
+        use_case: GetWeatherUseCase,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        weather_data: WeatherData,
+    ) -> None:
+        """Test that one bulk lookup serves hits and one bulk write stores misses."""
+        london = WeatherRequest(city="London")
+        paris = WeatherRequest(city="Paris")
+        mock_cache.get_many.return_value = {london.cache_key: weather_data}
+        mock_provider.get_weather.return_value = weather_data
+
+        results = await use_case.execute_many([london, paris])
+
+        assert all(isinstance(result, WeatherResult) for result in results)
+        mock_cache.get_many.assert_awaited_once()
+        assert sorted(mock_cache.get_many.await_args.args[0]) == [
+            london.cache_key,
+            paris.cache_key,
+        ]
+        mock_provider.get_weather.assert_awaited_once_with(paris)
+        mock_cache.set_many.assert_awaited_once_with({paris.cache_key: weather_data}, 900)
+        mock_cache.get.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_many_captures_errors(
+        self,
+        use_case: GetWeatherUseCase,
+        mock_provider: MagicMock,
+        weather_data: WeatherData,
+    ) -> None:
+        """Test that per-request failures are returned, not raised."""
+
+        async def fake_get_weather(request: WeatherRequest) -> WeatherData:
+            if request.city == "Atlantis":
+                raise CityNotFoundError(request.city)
+            return weather_data
+
+        mock_provider.get_weather.side_effect = fake_get_weather
+
+        results = await use_case.execute_many(
+            [WeatherRequest(city="Atlantis"), WeatherRequest(city="London")]
+        )
+
+        assert isinstance(results[0], CityNotFoundError)
+        assert isinstance(results[1], WeatherResult)
+
+    @pytest.mark.asyncio
+    async def test_observers_notified_on_refresh_only(
+        self,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        mock_logger: MagicMock,
+        weather_data: WeatherData,
+    ) -> None:
+        """Test that observers see fetched data but not cache hits."""
+        observer = MagicMock()
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=mock_cache,
+            logger=mock_logger,
+            observers=[observer],
+        )
+        mock_provider.get_weather.return_value = weather_data
+
+        request = WeatherRequest(city="London")
+        await use_case.execute(request)
+        observer.on_weather_refreshed.assert_called_once_with(request.cache_key, weather_data)
+
+        mock_cache.get.return_value = weather_data
+        await use_case.execute(request)
+        observer.on_weather_refreshed.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_failing_observer_does_not_fail_request(
+        self,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        mock_logger: MagicMock,
+        weather_data: WeatherData,
+    ) -> None:
+        """Test that observer errors are logged and swallowed."""
+        observer = MagicMock()
+        observer.on_weather_refreshed.side_effect = RuntimeError("boom")
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=mock_cache,
+            logger=mock_logger,
+            observers=[observer],
+        )
+        mock_provider.get_weather.return_value = weather_data
+
+        result = await use_case.execute(WeatherRequest(city="London"))
+
+        assert result.weather_data == weather_data
+        mock_logger.error.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_still_caches_tracked_fetch(
+        self,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        mock_logger: MagicMock,
+        weather_data: WeatherData,
+    ) -> None:
+        """Test that a fetch outlives its cancelled request and is drained into the cache."""
+        tracker = InFlightTracker()
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=mock_cache,
+            logger=mock_logger,
+            tracker=tracker,
+        )
+
+        async def slow_fetch(_request: WeatherRequest) -> WeatherData:
+            await asyncio.sleep(0.02)
+            return weather_data
+
+        mock_provider.get_weather.side_effect = slow_fetch
+        request = asyncio.create_task(use_case.execute(WeatherRequest(city="London")))
+        await asyncio.sleep(0)
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+        report = await tracker.drain(timeout_seconds=5)
+
+        assert (report.drained, report.abandoned) == (1, 0)
+        mock_cache.set.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_batch_still_caches_tracked_fetches(
+        self,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        mock_logger: MagicMock,
+        weather_data: WeatherData,
+    ) -> None:
+        """Test that batch fetches are tracked and cached even if the batch is cancelled."""
+        tracker = InFlightTracker()
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=mock_cache,
+            logger=mock_logger,
+            tracker=tracker,
+        )
+
+        async def slow_fetch(_request: WeatherRequest) -> WeatherData:
+            await asyncio.sleep(0.02)
+            return weather_data
+
+        mock_provider.get_weather.side_effect = slow_fetch
+        batch = asyncio.create_task(
+            use_case.execute_many([WeatherRequest(city="London"), WeatherRequest(city="Paris")])
+        )
+        await asyncio.sleep(0)
+        assert tracker.pending == 1
+        batch.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await batch
+
+        report = await tracker.drain(timeout_seconds=5)
+
+        assert (report.drained, report.abandoned) == (1, 0)
+        assert mock_provider.get_weather.await_count == 2
+        mock_cache.set_many.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_nearby_coordinates_share_city_entry(
+        self,
+        mock_provider: MagicMock,
+        mock_cache: MagicMock,
+        mock_logger: MagicMock,
+        weather_data: WeatherData,
+    ) -> None:
+        """Test that coordinates near a known city are fetched and cached as that city."""
+        london = Coordinates(latitude=51.5085, longitude=-0.1257)
+        use_case = GetWeatherUseCase(
+            weather_provider=mock_provider,
+            cache=mock_cache,
+            logger=mock_logger,
+            city_locator=NearestCityIndex([City(name="London", country="GB", coordinates=london)]),
+            snap_max_distance_km=10,
+        )
+        mock_provider.get_weather.return_value = weather_data
+
+        results = await use_case.execute_many(
+            [
+                WeatherRequest(coordinates=Coordinates(latitude=51.52, longitude=-0.10)),
+                WeatherRequest(coordinates=Coordinates(latitude=51.49, longitude=-0.15)),
+                WeatherRequest(coordinates=Coordinates(latitude=48.85, longitude=2.35)),
+            ]
+        )
+
+        assert len(results) == 3
+        fetched = [call.args[0] for call in mock_provider.get_weather.await_args_list]
+        assert sorted(r.coordinates.latitude for r in fetched) == [48.85, 51.5085]
+        mock_cache.set_many.assert_awaited_once()
+        stored, ttl = mock_cache.set_many.await_args.args
+        assert stored[WeatherRequest(coordinates=london).cache_key] == weather_data
+        assert ttl == 900
+
+
+class TestGetWeatherGridUseCase:
+    """Tests for GetWeatherGridUseCase."""
+
+    @staticmethod
+    def _anchor(latitude: float, longitude: float) -> WeatherData:
+        """Create an anchor whose temperature equals its latitude."""
+        return WeatherData(
+            city_name="",
+            country="",
+            coordinates=Coordinates(latitude=latitude, longitude=longitude),
+            temperature=latitude,
+            feels_like=latitude,
+            humidity=50,
+            wind_speed=1.0,
+            pressure=1013,
+            visibility=10000,
+            description="clear sky",
+            icon_code="01d",
+            units=UnitSystem.METRIC,
+            timestamp=datetime.now(UTC),
+        )
+
+    @pytest.fixture
+    def weather_use_case(self) -> MagicMock:
+        """Create a weather use case mock resolving anchors by coordinates."""
+
+        async def execute_many(requests, max_concurrency=8):
+            return [
+                WeatherResult(
+                    weather_data=self._anchor(
+                        request.coordinates.latitude, request.coordinates.longitude
+                    )
+                )
+                for request in requests
+            ]
+
+        use_case = MagicMock()
+        use_case.execute_many = AsyncMock(side_effect=execute_many)
+        return use_case
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method", list(InterpolationMethod))
+    async def test_execute_grid_shape_and_orientation(
+        self, weather_use_case: MagicMock, method: InterpolationMethod
+    ) -> None:
+        """Test grid dimensions and north-to-south row ordering."""
+        grid_use_case = GetWeatherGridUseCase(weather_use_case, MagicMock())
+        bbox = BoundingBox(south=50.0, west=0.0, north=52.0, east=2.0)
+
+        grid = await grid_use_case.execute(bbox, rows=10, cols=6, method=method)
+
+        assert grid.values.shape == (10, 6)
+        assert grid.values.dtype == np.float32
+        assert grid.method == method
+        assert grid.latitudes[0] == 52.0
+        assert grid.values[0].mean() > grid.values[-1].mean()
+        assert len(grid.anchors) == 16
+
+    @pytest.mark.asyncio
+    async def test_execute_anchors_snap_to_cache_cells(self, weather_use_case: MagicMock) -> None:
+        """Test that anchors are requested on the 0.01 degree cache grid."""
+        grid_use_case = GetWeatherGridUseCase(weather_use_case, MagicMock())
+        bbox = BoundingBox(south=50.001, west=0.123, north=50.999, east=1.456)
+
+        await grid_use_case.execute(bbox, rows=4, cols=4, anchors_per_side=3)
+
+        requests = weather_use_case.execute_many.call_args[0][0]
+        for request in requests:
+            assert request.coordinates.latitude == round(request.coordinates.latitude, 2)
+            assert request.coordinates.longitude == round(request.coordinates.longitude, 2)
+
+    @pytest.mark.asyncio
+    async def test_execute_bilinear_fills_missing_anchors(
+        self, weather_use_case: MagicMock
+    ) -> None:
+        """Test that failed anchors are filled before bilinear interpolation."""
+        execute_many = weather_use_case.execute_many.side_effect
+
+        async def lossy_execute_many(requests, max_concurrency=8):
+            results = await execute_many(requests, max_concurrency)
+            results[0] = CityNotFoundError("ocean")
+            return results
+
+        weather_use_case.execute_many.side_effect = lossy_execute_many
+        grid_use_case = GetWeatherGridUseCase(weather_use_case, MagicMock())
+        bbox = BoundingBox(south=50.0, west=0.0, north=52.0, east=2.0)
+
+        grid = await grid_use_case.execute(
+            bbox, rows=5, cols=5, method=InterpolationMethod.BILINEAR
+        )
+
+        assert not np.isnan(grid.values).any()
+        assert len(grid.anchors) == 15
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_when_no_anchor_resolves(self) -> None:
+        """Test that the first anchor error is raised if none resolved."""
+        weather_use_case = MagicMock()
+        weather_use_case.execute_many = AsyncMock(
+            side_effect=lambda requests, max_concurrency=8: [
+                RateLimitExceededError(30) for _ in requests
+            ]
+        )
+        grid_use_case = GetWeatherGridUseCase(weather_use_case, MagicMock())
+        bbox = BoundingBox(south=50.0, west=0.0, north=52.0, east=2.0)
+
+        with pytest.raises(RateLimitExceededError):
+            await grid_use_case.execute(bbox, rows=4, cols=4)
+
+
+class TestGetRouteWeatherUseCase:
+    """Tests for GetRouteWeatherUseCase."""
+
+    @pytest.fixture
+    def weather_use_case(self, sample_weather_data: WeatherData) -> MagicMock:
+        """Create a weather use case mock resolving every request."""
+        use_case = MagicMock()
+        use_case.execute_many = AsyncMock(
+            side_effect=lambda requests, max_concurrency=8: [
+                WeatherResult(weather_data=sample_weather_data) for _ in requests
+            ]
+        )
+        return use_case
+
+    @pytest.mark.asyncio
+    async def test_execute_collapses_samples_in_same_cell(
+        self, weather_use_case: MagicMock
+    ) -> None:
+        """Test that dense samples within one cache cell become one segment."""
+        polyline = encode_polyline(
+            [
+                Coordinates(latitude=51.5000, longitude=-0.1200),
+                Coordinates(latitude=51.5040, longitude=-0.1200),
+            ]
+        )
+        use_case = GetRouteWeatherUseCase(weather_use_case, MagicMock())
+
+        route = await use_case.execute(polyline, spacing_km=0.1)
+
+        assert route.sample_count > 3
+        assert len(route.segments) == 1
+        assert route.segments[0].end_km == pytest.approx(route.length_km)
+        assert len(weather_use_case.execute_many.call_args[0][0]) == 1
+
+    @pytest.mark.asyncio
+    async def test_execute_segments_cover_route(self, weather_use_case: MagicMock) -> None:
+        """Test that segments are contiguous from start to end."""
+        polyline = encode_polyline(
+            [
+                Coordinates(latitude=51.50, longitude=-0.12),
+                Coordinates(latitude=52.20, longitude=0.12),
+            ]
+        )
+        use_case = GetRouteWeatherUseCase(weather_use_case, MagicMock())
+
+        route = await use_case.execute(polyline, spacing_km=5.0)
+
+        assert route.segments[0].start_km == 0.0
+        for previous, current in zip(route.segments, route.segments[1:], strict=False):
+            assert previous.end_km == current.start_km
+        assert route.segments[-1].end_km == pytest.approx(route.length_km)
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_too_many_samples(self, weather_use_case: MagicMock) -> None:
+        """Test that routes exceeding the sample budget are rejected."""
+        polyline = encode_polyline(
+            [Coordinates(latitude=0.0, longitude=0.0), Coordinates(latitude=1.0, longitude=0.0)]
+        )
+        use_case = GetRouteWeatherUseCase(weather_use_case, MagicMock(), max_samples=10)
+
+        with pytest.raises(ValueError, match="increase spacing_km"):
+            await use_case.execute(polyline, spacing_km=1.0)
+
+    @pytest.mark.asyncio
+    async def test_execute_rejects_huge_route_before_sampling(
+        self, weather_use_case: MagicMock
+    ) -> None:
+        """Test that a route of millions of samples is rejected without building them."""
+        polyline = encode_polyline(
+            [
+                Coordinates(latitude=lat, longitude=lon)
+                for lat in (-80.0, 80.0) * 300
+                for lon in (-179.0, 179.0)
+            ]
+        )
+        use_case = GetRouteWeatherUseCase(weather_use_case, MagicMock(), max_samples=500)
+
+        started = time.perf_counter()
+        with pytest.raises(ValueError, match="increase spacing_km"):
+            await use_case.execute(polyline, spacing_km=0.1)
+
+        assert time.perf_counter() - started < 0.5
+        weather_use_case.execute_many.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_execute_keeps_partial_failures(
+        self, weather_use_case: MagicMock, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that failed cells are reported per segment."""
+        weather_use_case.execute_many.side_effect = lambda requests, max_concurrency=8: [
+            CityNotFoundError("sea") if i % 2 else WeatherResult(weather_data=sample_weather_data)
+            for i, _ in enumerate(requests)
+        ]
+        polyline = encode_polyline(
+            [
+                Coordinates(latitude=51.5, longitude=-0.12),
+                Coordinates(latitude=51.6, longitude=-0.12),
+            ]
+        )
+        use_case = GetRouteWeatherUseCase(weather_use_case, MagicMock())
+
+        route = await use_case.execute(polyline, spacing_km=2.0)
+
+        outcomes = [segment.outcome for segment in route.segments]
+        assert any(isinstance(outcome, CityNotFoundError) for outcome in outcomes)
+        assert any(isinstance(outcome, WeatherResult) for outcome in outcomes)
+
+
+class TestCompareWeatherUseCase:
+    """Tests for CompareWeatherUseCase."""
+
+    CITY_TEMPERATURES = {"Oslo": -5.0, "Lisbon": 21.0, "Dubai": 38.0}
+
+    @pytest.fixture
+    def weather_use_case(self) -> MagicMock:
+        """Create a weather use case mock with one temperature per city."""
+
+        async def execute_many(requests, max_concurrency=8):
+            outcomes = []
+            for request in requests:
+                if request.city not in self.CITY_TEMPERATURES:
+                    outcomes.append(CityNotFoundError(request.city))
+                    continue
+                temperature = self.CITY_TEMPERATURES[request.city]
+                outcomes.append(
+                    WeatherResult(
+                        weather_data=WeatherData(
+                            city_name=request.city,
+                            country="",
+                            coordinates=Coordinates(latitude=0.0, longitude=0.0),
+                            temperature=temperature,
+                            feels_like=temperature,
+                            humidity=45,
+                            wind_speed=2.0,
+                            pressure=1013,
+                            visibility=10000,
+                            description="clear sky",
+                            icon_code="01d",
+                            units=UnitSystem.METRIC,
+                            timestamp=datetime.now(UTC),
+                        )
+                    )
+                )
+            return outcomes
+
+        use_case = MagicMock()
+        use_case.execute_many = AsyncMock(side_effect=execute_many)
+        return use_case
+
+    @pytest.mark.asyncio
+    async def test_execute_ranks_by_comfort(self, weather_use_case: MagicMock) -> None:
+        """Test that the mildest city ranks first by comfort score."""
+        use_case = CompareWeatherUseCase(weather_use_case, MagicMock())
+
+        comparison = await use_case.execute(["Oslo", "Dubai", "Lisbon"])
+
+        names = [entry.result.weather_data.city_name for entry in comparison.ranked]
+        assert names[0] == "Lisbon"
+        assert [entry.rank for entry in comparison.ranked] == [1, 2, 3]
+
+    @pytest.mark.asyncio
+    async def test_execute_ranks_ascending_in_imperial(self, weather_use_case: MagicMock) -> None:
+        """Test ascending ranking and vectorized conversion to imperial."""
+        use_case = CompareWeatherUseCase(weather_use_case, MagicMock())
+
+        comparison = await use_case.execute(
+            ["Lisbon", "Oslo", "Dubai"],
+            units=UnitSystem.IMPERIAL,
+            rank_by=RankingMetric.TEMPERATURE,
+            descending=False,
+        )
+
+        assert [entry.temperature for entry in comparison.ranked] == pytest.approx(
+            [23.0, 69.8, 100.4]
+        )
+        requests = weather_use_case.execute_many.call_args[0][0]
+        assert {request.units for request in requests} == {UnitSystem.METRIC}
+
+    @pytest.mark.asyncio
+    async def test_execute_reports_failures(self, weather_use_case: MagicMock) -> None:
+        """Test that unresolved cities are reported separately."""
+        use_case = CompareWeatherUseCase(weather_use_case, MagicMock())
+
+        comparison = await use_case.execute(["Lisbon", "Atlantis"])
+
+        assert len(comparison.ranked) == 1
+        assert comparison.failures[0][0] == "Atlantis"
+        assert isinstance(comparison.failures[0][1], CityNotFoundError)
+
+    @pytest.mark.asyncio
+    async def test_execute_raises_when_nothing_resolves(self, weather_use_case: MagicMock) -> None:
+        """Test that the first error is raised if no city resolved."""
+        use_case = CompareWeatherUseCase(weather_use_case, MagicMock())
+
+        with pytest.raises(CityNotFoundError):
+            await use_case.execute(["Atlantis"])
+
+
+class TestGetForecastUseCase:
+    """Tests for GetForecastUseCase."""
+
+    @pytest.fixture
+    def mock_provider(self, sample_forecast: Forecast) -> MagicMock:
+        """Create a mock provider returning the sample forecast."""
+        provider = MagicMock()
+        provider.get_forecast = AsyncMock(return_value=sample_forecast)
+        return provider
+
+    @pytest.fixture
+    def use_case(self, mock_provider: MagicMock) -> GetForecastUseCase:
+        """Create the use case with a mock provider."""
+        return GetForecastUseCase(weather_provider=mock_provider, logger=MagicMock())
+
+    @pytest.mark.asyncio
+    async def test_queries_share_one_upstream_call(
+        self, use_case: GetForecastUseCase, mock_provider: MagicMock
+    ) -> None:
+        """Test that hourly, point and daily queries slice one cached forecast."""
+        request = WeatherRequest(city="London")
+
+        point = await use_case.at(request, datetime(2024, 1, 1, 6, tzinfo=UTC))
+        days = await use_case.daily(request)
+        await use_case.hourly(request, hours=12)
+        await use_case.execute(WeatherRequest(city=" london "))
+
+        assert point.temperature == 2.0
+        assert len(days) == 2
+        mock_provider.get_forecast.assert_awaited_once_with(request)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_fetch(
+        self, use_case: GetForecastUseCase, mock_provider: MagicMock
+    ) -> None:
+        """Test that simultaneous requests for a location cost one upstream call."""
+        request = WeatherRequest(city="London")
+        await asyncio.gather(*(use_case.execute(request) for _ in range(5)))
+
+        assert mock_provider.get_forecast.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_forecast_is_refetched(self, mock_provider: MagicMock) -> None:
+        """Test that the forecast is fetched again after its TTL."""
+        use_case = GetForecastUseCase(
+            weather_provider=mock_provider, logger=MagicMock(), cache_ttl_seconds=0
+        )
+        request = WeatherRequest(city="London")
+        await use_case.execute(request)
+        await use_case.execute(request)
+
+        assert mock_provider.get_forecast.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_is_bounded(self, mock_provider: MagicMock) -> None:
+        """Test that the least recently used location is evicted."""
+        use_case = GetForecastUseCase(
+            weather_provider=mock_provider, logger=MagicMock(), max_entries=1
+        )
+        await use_case.execute(WeatherRequest(city="London"))
+        await use_case.execute(WeatherRequest(city="Paris"))
+        await use_case.execute(WeatherRequest(city="London"))
+
+        assert mock_provider.get_forecast.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_out_of_range_queries_raise(self, use_case: GetForecastUseCase) -> None:
+        """Test that times and dates outside the forecast raise ValueError."""
+        request = WeatherRequest(city="London")
+        with pytest.raises(ValueError, match="outside"):
+            await use_case.at(request, datetime(2030, 1, 1, tzinfo=UTC))
+        with pytest.raises(ValueError, match="2030-01-01"):
+            await use_case.daily(request, datetime(2030, 1, 1).date())
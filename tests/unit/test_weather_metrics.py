@@ -0,0 +1,72 @@
+"""Unit tests for vectorized weather metrics."""
+
+import numpy as np
+import pytest
+
+from src.application.weather_metrics import (
+    celsius_to_fahrenheit,
+    comfort_score,
+    fahrenheit_to_celsius,
+    heat_index_f,
+    mph_to_ms,
+    ms_to_mph,
+    wind_chill_f,
+)
+
+
+class TestConversions:
+    """Tests for unit conversions."""
+
+    def test_temperature_round_trip(self) -> None:
+        """Test °C/°F conversions on arrays."""
+        celsius = np.array([-40.0, 0.0, 100.0])
+        np.testing.assert_allclose(celsius_to_fahrenheit(celsius), [-40.0, 32.0, 212.0])
+        np.testing.assert_allclose(fahrenheit_to_celsius(celsius_to_fahrenheit(celsius)), celsius)
+
+    def test_speed_round_trip(self) -> None:
+        """Test m/s and mph conversions on arrays."""
+        speeds = np.array([0.0, 4.4704, 10.0])
+        np.testing.assert_allclose(ms_to_mph(speeds)[:2], [0.0, 10.0])
+        np.testing.assert_allclose(mph_to_ms(ms_to_mph(speeds)), speeds)
+
+
+class TestHeatIndex:
+    """Tests for the NWS heat index."""
+
+    @pytest.mark.parametrize(
+        ("temp_f", "humidity", "expected"),
+        [(90.0, 70.0, 106.0), (100.0, 40.0, 109.0), (80.0, 40.0, 80.0), (70.0, 50.0, 69.6)],
+    )
+    def test_reference_values(self, temp_f: float, humidity: float, expected: float) -> None:
+        """Test against NWS heat index table values."""
+        result = heat_index_f(np.array([temp_f]), np.array([humidity]))
+        assert result[0] == pytest.approx(expected, abs=1.0)
+
+
+class TestWindChill:
+    """Tests for the NWS wind chill."""
+
+    def test_reference_value(self) -> None:
+        """Test against the NWS wind chill table."""
+        result = wind_chill_f(np.array([0.0]), np.array([15.0]))
+        assert result[0] == pytest.approx(-19.0, abs=0.5)
+
+    def test_undefined_conditions_return_air_temperature(self) -> None:
+        """Test that warm or calm conditions keep the air temperature."""
+        result = wind_chill_f(np.array([60.0, 30.0]), np.array([20.0, 1.0]))
+        np.testing.assert_array_equal(result, [60.0, 30.0])
+
+
+class TestComfortScore:
+    """Tests for the comfort score."""
+
+    def test_ideal_conditions_score_highest(self) -> None:
+        """Test the score peaks at mild, moderately humid, light-breeze conditions."""
+        scores = comfort_score(
+            np.array([21.0, 35.0, 21.0, 21.0]),
+            np.array([45.0, 45.0, 95.0, 45.0]),
+            np.array([2.0, 2.0, 2.0, 20.0]),
+        )
+        assert scores[0] == pytest.approx(100.0)
+        assert scores[0] > scores[1:].max()
+        assert ((scores >= 0) & (scores <= 100)).all()
@@ -1,5 +1,6 @@
 """Unit tests for OpenWeatherMapProvider."""
 
+import json
 from typing import Any
 
 import pytest
@@ -58,3 +59,35 @@ class TestOpenWeatherMapClientParsing:
         openweathermap_response["sys"] = {}
         weather_data = client._parse_response(openweathermap_response, UnitSystem.METRIC)
         assert weather_data.country == ""
+
+    def test_parse_response_shares_repeated_strings(
+        self, client: OpenWeatherMapClient, openweathermap_response: dict[str, Any]
+    ) -> None:
+        """Test that parsed entries share one copy of low-cardinality strings."""
+        first = client._parse_response(
+            json.loads(json.dumps(openweathermap_response)), UnitSystem.METRIC
+        )
+        second = client._parse_response(
+            json.loads(json.dumps(openweathermap_response)), UnitSystem.METRIC
+        )
+        assert first.country is second.country
+        assert first.description is second.description
+        assert first.icon_code is second.icon_code
+        assert not hasattr(first, "__dict__")
+
+
+class TestOpenWeatherMapClientForecastParsing:
+    """Tests for OpenWeatherMap forecast response parsing."""
+
+    def test_parse_forecast_orders_points(
+        self, openweathermap_forecast_response: dict[str, Any]
+    ) -> None:
+        """Test that forecast steps are parsed and sorted by time."""
+        client = OpenWeatherMapClient(api_key="test_api_key")
+        forecast = client._parse_forecast(openweathermap_forecast_response, UnitSystem.METRIC)
+
+        assert forecast.city_name == "London"
+        assert forecast.country == "GB"
+        assert [point.temperature for point in forecast.points] == [10.4, 9.1]
+        assert forecast.points[1].precipitation_probability == 0.6
+        assert forecast.points[1].description == "light rain"
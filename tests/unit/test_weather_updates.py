@@ -0,0 +1,150 @@
+"""Unit tests for the live weather update hub."""
+
+import asyncio
+import dataclasses
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.application.dto import WeatherResult
+from src.application.weather_updates import WeatherUpdateHub
+from src.domain.entities import WeatherData, WeatherRequest
+from src.domain.exceptions import WeatherProviderError
+from src.presentation.routers.weather import sse_event_stream
+
+
+class TestWeatherUpdateHub:
+    """Tests for WeatherUpdateHub."""
+
+    @pytest.fixture
+    def use_case(self, sample_weather_data: WeatherData) -> MagicMock:
+        """Create a use case mock returning the sample weather."""
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(return_value=WeatherResult(weather_data=sample_weather_data))
+        use_case.snap.side_effect = lambda request: request
+        return use_case
+
+    @pytest.fixture
+    def hub(self, use_case: MagicMock) -> WeatherUpdateHub:
+        """Create a hub with a short poll interval."""
+        return WeatherUpdateHub(use_case=use_case, logger=MagicMock(), poll_interval_seconds=0.01)
+
+    @pytest.mark.asyncio
+    async def test_first_refresh_is_published(
+        self, hub: WeatherUpdateHub, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that subscribers receive the current weather."""
+        async with hub.subscribe(WeatherRequest(city="London")) as updates:
+            update = await asyncio.wait_for(updates.get(), timeout=1)
+
+        assert update.event_id == 1
+        assert update.result.weather_data == sample_weather_data
+
+    @pytest.mark.asyncio
+    async def test_unchanged_data_is_not_republished(self, hub: WeatherUpdateHub) -> None:
+        """Test that polls returning the same data emit nothing."""
+        async with hub.subscribe(WeatherRequest(city="London")) as updates:
+            await asyncio.wait_for(updates.get(), timeout=1)
+            await asyncio.sleep(0.05)
+            assert updates.empty()
+
+    @pytest.mark.asyncio
+    async def test_listeners_share_one_refresh_loop(self, use_case: MagicMock) -> None:
+        """Test that several listeners on one city cost a single poll."""
+        hub = WeatherUpdateHub(use_case=use_case, logger=MagicMock(), poll_interval_seconds=60)
+        request = WeatherRequest(city="London")
+        async with hub.subscribe(request) as first, hub.subscribe(request) as second:
+            assert hub.channel_count == 1
+            first_update = await asyncio.wait_for(first.get(), timeout=1)
+            second_update = await asyncio.wait_for(second.get(), timeout=1)
+
+        assert first_update is second_update
+        assert use_case.execute.await_count == 1
+        assert hub.channel_count == 0
+
+    @pytest.mark.asyncio
+    async def test_change_is_fanned_out(
+        self, hub: WeatherUpdateHub, use_case: MagicMock, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that a changed observation reaches every listener."""
+        request = WeatherRequest(city="London")
+        async with hub.subscribe(request) as first, hub.subscribe(request) as second:
+            await asyncio.wait_for(first.get(), timeout=1)
+            changed = dataclasses.replace(sample_weather_data, temperature=21.0)
+            use_case.execute.return_value = WeatherResult(weather_data=changed)
+
+            update = await asyncio.wait_for(first.get(), timeout=1)
+            assert update.result.weather_data.temperature == 21.0
+            received = [await asyncio.wait_for(second.get(), timeout=1) for _ in range(2)]
+            assert received[-1].event_id == update.event_id
+
+    @pytest.mark.asyncio
+    async def test_resume_replays_missed_updates(
+        self, hub: WeatherUpdateHub, use_case: MagicMock, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that Last-Event-ID resume replays only newer updates."""
+        request = WeatherRequest(city="London")
+        async with hub.subscribe(request) as keeper:
+            first = await asyncio.wait_for(keeper.get(), timeout=1)
+            use_case.execute.return_value = WeatherResult(
+                weather_data=dataclasses.replace(sample_weather_data, temperature=22.0)
+            )
+            second = await asyncio.wait_for(keeper.get(), timeout=1)
+
+            async with hub.subscribe(request, last_event_id=first.event_id) as resumed:
+                replayed = resumed.get_nowait()
+                assert replayed.event_id == second.event_id
+                assert resumed.empty()
+
+    @pytest.mark.asyncio
+    async def test_resume_after_restart_sends_current_state(
+        self, hub: WeatherUpdateHub, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that an id issued before a restart is answered with the latest update."""
+        request = WeatherRequest(city="London")
+        async with hub.subscribe(request) as keeper:
+            latest = await asyncio.wait_for(keeper.get(), timeout=1)
+
+            async with hub.subscribe(request, last_event_id=5000) as resumed:
+                replayed = resumed.get_nowait()
+
+        assert replayed is latest
+        assert replayed.result.weather_data == sample_weather_data
+
+    @pytest.mark.asyncio
+    async def test_refresh_errors_are_logged(self, use_case: MagicMock) -> None:
+        """Test that provider failures keep the loop alive."""
+        logger = MagicMock()
+        use_case.execute.side_effect = WeatherProviderError("down")
+        hub = WeatherUpdateHub(use_case=use_case, logger=logger, poll_interval_seconds=0.01)
+
+        async with hub.subscribe(WeatherRequest(city="London")) as updates:
+            await asyncio.sleep(0.05)
+            assert updates.empty()
+
+        assert logger.warning.called
+        assert use_case.execute.await_count > 1
+
+
+class TestSseEventStream:
+    """Tests for the Server-Sent Events framing."""
+
+    @pytest.mark.asyncio
+    async def test_stream_frames(self, sample_weather_data: WeatherData) -> None:
+        """Test retry hint, weather events and heartbeat comments."""
+        use_case = MagicMock()
+        use_case.execute = AsyncMock(return_value=WeatherResult(weather_data=sample_weather_data))
+        hub = WeatherUpdateHub(use_case=use_case, logger=MagicMock(), poll_interval_seconds=0.01)
+
+        stream = sse_event_stream(hub, WeatherRequest(city="London"), heartbeat_seconds=0.05)
+        frames = [await anext(stream) for _ in range(3)]
+        await stream.aclose()
+
+        assert frames[0].startswith("retry: ")
+        lines = frames[1].splitlines()
+        assert lines[0] == "id: 1"
+        assert lines[1] == "event: weather"
+        assert json.loads(lines[2].removeprefix("data: "))["city"] == "London"
+        assert frames[2] == ": heartbeat\n\n"
+        assert hub.channel_count == 0
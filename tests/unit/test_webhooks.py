@@ -0,0 +1,175 @@
+"""Unit tests for the webhook dispatcher."""
+
+import json
+from datetime import UTC, datetime
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from src.domain.entities import AlertEvent, AlertRule, WeatherData, WeatherRequest
+from src.domain.value_objects import AlertDirection, WeatherMetric
+from src.infrastructure.webhooks import WebhookBatch, WebhookDispatcher, alert_payload
+
+RECEIVER_URL = "http://receiver.test/hooks"
+
+
+class _Receiver:
+    """Stand-in webhook receiver failing a configurable number of requests."""
+
+    def __init__(self, failures: int = 0, status_code: int = 503) -> None:
+        self.failures = failures
+        self.status_code = status_code
+        self.batches: list[list[dict[str, object]]] = []
+        self.attempts = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.attempts += 1
+        if self.failures > 0:
+            self.failures -= 1
+            return httpx.Response(self.status_code)
+        self.batches.append(json.loads(request.content)["events"])
+        return httpx.Response(204)
+
+
+def _dispatcher(receiver: _Receiver, spool_dir: Path, **kwargs: object) -> WebhookDispatcher:
+    """Create a dispatcher posting to the stand-in receiver."""
+    options: dict[str, object] = {
+        "batch_size": 3,
+        "batch_interval_seconds": 0.01,
+        "backoff_base_seconds": 0.001,
+        "backoff_max_seconds": 0.001,
+    }
+    options.update(kwargs)
+    return WebhookDispatcher(
+        logger=MagicMock(),
+        spool_dir=spool_dir,
+        client=httpx.AsyncClient(transport=httpx.MockTransport(receiver)),
+        **options,  # type: ignore[arg-type]
+    )
+
+
+class TestWebhookDispatcher:
+    """Tests for WebhookDispatcher."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_batched_per_destination(self, tmp_path: Path) -> None:
+        """Test that queued events are sent in batches of at most batch_size."""
+        receiver = _Receiver()
+        dispatcher = _dispatcher(receiver, tmp_path)
+
+        for number in range(7):
+            dispatcher.enqueue(RECEIVER_URL, {"n": number})
+        await dispatcher.flush()
+
+        assert [len(batch) for batch in receiver.batches] == [3, 3, 1]
+        assert dispatcher.delivered_events == 7
+        assert dispatcher.backlog == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_delivery_is_retried(self, tmp_path: Path) -> None:
+        """Test that retryable failures are retried until delivered."""
+        receiver = _Receiver(failures=2)
+        dispatcher = _dispatcher(receiver, tmp_path)
+
+        dispatcher.enqueue(RECEIVER_URL, {"n": 1})
+        await dispatcher.flush()
+
+        assert receiver.attempts == 3
+        assert receiver.batches == [[{"n": 1}]]
+
+    @pytest.mark.asyncio
+    async def test_permanent_failure_is_dead_lettered(self, tmp_path: Path) -> None:
+        """Test that non-retryable responses are not retried."""
+        receiver = _Receiver(failures=1, status_code=410)
+        dispatcher = _dispatcher(receiver, tmp_path)
+
+        dispatcher.enqueue(RECEIVER_URL, {"n": 1})
+        await dispatcher.flush()
+
+        assert receiver.attempts == 1
+        assert dispatcher.dead_events == 1
+        assert len(list(tmp_path.glob("*.dead.json"))) == 1
+        assert dispatcher.backlog == 0
+
+    @pytest.mark.asyncio
+    async def test_attempts_are_bounded(self, tmp_path: Path) -> None:
+        """Test that a batch is dropped after max_attempts."""
+        receiver = _Receiver(failures=10)
+        dispatcher = _dispatcher(receiver, tmp_path, max_attempts=3)
+
+        dispatcher.enqueue(RECEIVER_URL, {"n": 1})
+        await dispatcher.flush()
+
+        assert receiver.attempts == 3
+        assert dispatcher.dead_events == 1
+
+    @pytest.mark.asyncio
+    async def test_backlog_survives_restart(self, tmp_path: Path) -> None:
+        """Test that undelivered batches are resent by the next dispatcher."""
+        first = _dispatcher(_Receiver(), tmp_path, batch_interval_seconds=60)
+        first.enqueue(RECEIVER_URL, {"n": 1})
+        await first.close()
+        assert first.backlog == 1
+
+        receiver = _Receiver()
+        second = _dispatcher(receiver, tmp_path)
+        await second.start()
+        await second.flush()
+
+        assert receiver.batches == [[{"n": 1}]]
+        assert second.backlog == 0
+
+    @pytest.mark.asyncio
+    async def test_corrupt_spool_file_is_set_aside(self, tmp_path: Path) -> None:
+        """Test that an unreadable spool file does not block startup."""
+        (tmp_path / "broken.json").write_text("{not json", encoding="utf-8")
+        dispatcher = _dispatcher(_Receiver(), tmp_path)
+
+        await dispatcher.start()
+
+        assert (tmp_path / "broken.dead.json").exists()
+        assert dispatcher.backlog == 0
+
+    @pytest.mark.asyncio
+    async def test_publish_alerts_only_for_rules_with_webhooks(
+        self, tmp_path: Path, sample_weather_data: WeatherData
+    ) -> None:
+        """Test that alert events are routed to their rule's webhook URL."""
+        receiver = _Receiver()
+        dispatcher = _dispatcher(receiver, tmp_path)
+        rules = [
+            AlertRule(
+                id=rule_id,
+                request=WeatherRequest(city="London"),
+                metric=WeatherMetric.TEMPERATURE,
+                direction=AlertDirection.ABOVE,
+                threshold=10.0,
+                created_at=datetime.now(UTC),
+                webhook_url=url,
+            )
+            for rule_id, url in (("with", RECEIVER_URL), ("without", None))
+        ]
+        events = [
+            AlertEvent(
+                rule=rule,
+                value=15.2,
+                previous_value=None,
+                weather_data=sample_weather_data,
+                triggered_at=datetime.now(UTC),
+            )
+            for rule in rules
+        ]
+
+        dispatcher.publish_alerts(events)
+        await dispatcher.flush()
+
+        assert receiver.batches == [[alert_payload(events[0])]]
+        assert receiver.batches[0][0]["rule_id"] == "with"
+
+
+def test_batch_round_trips_through_json() -> None:
+    """Test that spooled batches can be rebuilt from their JSON form."""
+    batch = WebhookBatch(url=RECEIVER_URL, events=[{"n": 1}], attempts=2)
+    assert WebhookBatch(**json.loads(json.dumps(batch.__dict__))) == batch